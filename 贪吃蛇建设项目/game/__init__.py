@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 """
 贪吃蛇游戏包
+各模块按需导入；模拟核心（world、arena、autopilot、replay 等）不依赖 pygame，可以在无界面环境中单独导入。
 """
-from .link_game import LinkGamePage 
-from .twentyfour_game import TwentyFourPage 
\ No newline at end of file
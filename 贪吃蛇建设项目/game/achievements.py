@@ -2,6 +2,7 @@ import json
 import os
 import pygame
 from game.constants import FONT_NAME
+from game.fonts import get_font, render_text
 
 class Achievement:
     def __init__(self, id, name, description, icon=None, secret=False):
@@ -19,8 +20,8 @@ class AchievementSystem:
         self.achievements = []
         self.notification_queue = []
         self.notification_time = 0
-        self.font_title = pygame.font.Font(FONT_NAME, 24)
-        self.font_desc = pygame.font.Font(FONT_NAME, 18)
+        self.font_title = get_font(FONT_NAME, 24)
+        self.font_desc = get_font(FONT_NAME, 18)
         self.save_file = "achievements.json"
         
         # 初始化成就列表
@@ -150,11 +151,11 @@ class AchievementSystem:
         
         # 绘制标题
         title_text = f"🏆 成就解锁: {achievement.name}"
-        title_surface = self.font_title.render(title_text, True, (255, 215, 0))
+        title_surface = render_text(self.font_title, title_text, True, (255, 215, 0))
         self.screen.blit(title_surface, (x + 20, y + 15))
         
         # 绘制描述
-        desc_surface = self.font_desc.render(achievement.description, True, (200, 200, 200))
+        desc_surface = render_text(self.font_desc, achievement.description, True, (200, 200, 200))
         self.screen.blit(desc_surface, (x + 20, y + 45))
     
     def draw_achievements_page(self):
@@ -163,8 +164,8 @@ class AchievementSystem:
         self.screen.fill((20, 30, 40))
         
         # 绘制标题
-        title_font = pygame.font.Font(FONT_NAME, 36)
-        title_surface = title_font.render("游戏成就", True, (255, 255, 255))
+        title_font = get_font(FONT_NAME, 36)
+        title_surface = render_text(title_font, "游戏成就", True, (255, 255, 255))
         title_rect = title_surface.get_rect(center=(self.screen.get_width()//2, 50))
         self.screen.blit(title_surface, title_rect)
         
@@ -199,13 +200,13 @@ class AchievementSystem:
                 pygame.draw.rect(self.screen, (100, 100, 100), icon_rect, border_radius=5)
                 text = "🔒"
             
-            icon_font = pygame.font.Font(FONT_NAME, 24)
-            icon_surface = icon_font.render(text, True, (255, 255, 255))
+            icon_font = get_font(FONT_NAME, 24)
+            icon_surface = render_text(icon_font, text, True, (255, 255, 255))
             icon_text_rect = icon_surface.get_rect(center=icon_rect.center)
             self.screen.blit(icon_surface, icon_text_rect)
             
             # 绘制成就名称
-            name_surface = self.font_title.render(achievement.name, True, (255, 255, 255))
+            name_surface = render_text(self.font_title, achievement.name, True, (255, 255, 255))
             self.screen.blit(name_surface, (x_margin + 80, y + 15))
             
             # 绘制成就描述
@@ -214,20 +215,20 @@ class AchievementSystem:
             else:
                 desc_text = achievement.description
                 
-            desc_surface = self.font_desc.render(desc_text, True, (200, 200, 200))
+            desc_surface = render_text(self.font_desc, desc_text, True, (200, 200, 200))
             self.screen.blit(desc_surface, (x_margin + 80, y + 45))
             
             # 如果已解锁，显示解锁时间
             if achievement.unlocked and achievement.unlock_time:
                 import time
                 unlock_time_str = time.strftime("%Y-%m-%d %H:%M", time.localtime(achievement.unlock_time))
-                time_surface = self.font_desc.render(f"解锁于: {unlock_time_str}", True, (150, 150, 150))
+                time_surface = render_text(self.font_desc, f"解锁于: {unlock_time_str}", True, (150, 150, 150))
                 time_rect = time_surface.get_rect(right=x_margin + width - 20, centery=y + height//2)
                 self.screen.blit(time_surface, time_rect)
         
         # 绘制返回提示
         back_text = "按ESC返回"
-        back_surface = self.font_desc.render(back_text, True, (150, 150, 150))
+        back_surface = render_text(self.font_desc, back_text, True, (150, 150, 150))
         back_rect = back_surface.get_rect(center=(self.screen.get_width()//2, self.screen.get_height() - 30))
         self.screen.blit(back_surface, back_rect)
     
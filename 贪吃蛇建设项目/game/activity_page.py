@@ -1,10 +1,83 @@
 import pygame
 from .constants import *
+from .fonts import get_font, render_text
+from . import layers
 from .player import player_data
 import math
 import time
 import datetime
 
+# 小游戏类的延迟导入：第一次进入时才导入模块（写成静态导入，打包工具和 IDE 都能找到这些模块）
+def _whack_a_mole():
+    from .whack_a_mole import WhackAMolePage
+    return WhackAMolePage
+
+def _minesweeper():
+    from .minesweeper import MinesweeperGame
+    return MinesweeperGame
+
+def _pong_game():
+    from .pong_game import PongGame
+    return PongGame
+
+def _link_game():
+    from .link_game import LinkGamePage
+    return LinkGamePage
+
+def _twentyfour_game():
+    from .twentyfour_game import TwentyFourPage
+    return TwentyFourPage
+
+def _maze_game():
+    from .maze_game import MazeGame
+    return MazeGame
+
+def _piano_tiles():
+    from .piano_tiles import PianoTilesGame
+    return PianoTilesGame
+
+def _tetris_game():
+    from .tetris_game import TetrisGame
+    return TetrisGame
+
+def _game_2048():
+    from .game_2048 import Game2048
+    return Game2048
+
+def _pintu_game():
+    from .pintu_game import PintuGame
+    return PintuGame
+
+def _sudoku_game():
+    from .sudoku_game import SudokuGame
+    return SudokuGame
+
+def _sokoban_game():
+    from .sokoban_game import SokobanGame
+    return SokobanGame
+
+# 小游戏页面：页面名 -> (实例属性名, 返回类的导入函数, 构造时是否传入活动页)，第一次进入时才导入和创建
+SUB_GAMES = {
+    'whackamole': ('whackamole_page', _whack_a_mole, True),
+    'minesweeper': ('minesweeper_game', _minesweeper, False),
+    'pong': ('pong_game', _pong_game, False),
+    'linkgame': ('linkgame_page', _link_game, True),
+    'twentyfour': ('twentyfour_page', _twentyfour_game, True),
+    'maze': ('maze_game', _maze_game, False),
+    'piano': ('piano_game', _piano_tiles, False),
+    'tetris': ('tetris_game', _tetris_game, False),
+    'game2048': ('game2048', _game_2048, False),
+    'pintu': ('pintu_game', _pintu_game, True),
+    'sudoku': ('sudoku_game', _sudoku_game, True),
+    'sokoban': ('sokoban_game', _sokoban_game, False),
+}
+# 每次从卡片进入都重新创建的小游戏（自动回到难度选择等初始界面）
+FRESH_SUB_GAMES = {'linkgame', 'pintu', 'sudoku', 'sokoban'}
+# 按 ESC 直接返回活动页的小游戏（其余的自己处理 ESC）
+ESC_TO_MAIN_SUB_GAMES = {'minesweeper', 'sudoku', 'sokoban'}
+# 按固定逻辑帧率推进的小游戏（弹球按实际经过的时间移动，每个绘制帧更新一次）
+TICKED_SUB_GAMES = {'piano', 'tetris', 'game2048', 'pintu', 'sokoban'}
+
 def draw_rounded_rect(surface, rect, color, corner_radius, shadow=False):
     if not isinstance(rect, pygame.Rect):
         rect = pygame.Rect(rect)
@@ -51,6 +124,45 @@ class ActivityPage:
     def close(self):
         self.is_open = False
 
+    def release(self):
+        """释放所有小游戏实例（离开活动页时调用，下次进入再重新创建）"""
+        for attr, _, _ in SUB_GAMES.values():
+            if hasattr(self, attr):
+                delattr(self, attr)
+        self.page = "main"
+
+    def is_animating(self):
+        """活动大厅和签到页是静态的，只有进入小游戏后才需要全帧率"""
+        return self.page not in ("main", "signin")
+
+    def get_sub_game(self, page):
+        """取得小游戏实例，没有时导入模块并创建"""
+        attr, load_class, needs_parent = SUB_GAMES[page]
+        game = getattr(self, attr, None)
+        if game is None:
+            cls = load_class()
+            game = cls(self.surface, self) if needs_parent else cls(self.surface)
+            if page == 'pong':
+                # 弹球直接从选关界面开始
+                game.game_state = "level_select"
+                game.selected_level = 1
+            setattr(self, attr, game)
+        return game
+
+    def open_sub_game(self, page):
+        """从活动卡片进入小游戏"""
+        if page in FRESH_SUB_GAMES and hasattr(self, SUB_GAMES[page][0]):
+            delattr(self, SUB_GAMES[page][0])
+        self.page = page
+        self.get_sub_game(page)
+
+    def close_sub_game(self):
+        """小游戏结束（active 为 False）：回到活动页并丢弃实例"""
+        attr = SUB_GAMES[self.page][0]
+        self.page = 'main'
+        if hasattr(self, attr):
+            delattr(self, attr)
+
     def calculate_scroll_range(self, last_y, content_rect):
         """重新设计的滚动范围计算"""
         # 精确计算实际内容高度
@@ -90,20 +202,27 @@ class ActivityPage:
 
         return total_height
 
+    def update(self):
+        """推进当前小游戏的一个逻辑帧（由活动场景按固定的 SIM_TICK_RATE 调用，与绘制帧率无关）"""
+        if self.page not in TICKED_SUB_GAMES:
+            return
+        game = getattr(self, SUB_GAMES[self.page][0], None)
+        if game is None:
+            return
+        game.update()
+        if self.page == "tetris":
+            game.handle_key_repeat()
+
     def draw(self):
         if self.page == "main":
-            grad = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-            for y in range(WINDOW_HEIGHT):
-                c = 245 - int(60 * y / WINDOW_HEIGHT)
-                pygame.draw.line(grad, (c, c+8, 255, 255), (0, y), (WINDOW_WIDTH, y))
-            self.surface.blit(grad, (0, 0))
+            self.surface.blit(layers.gradient((WINDOW_WIDTH, WINDOW_HEIGHT), [(245, 253, 255), (185, 193, 255)]), (0, 0))
             panel_rect = pygame.Rect(self.panel_x, self.panel_y, self.panel_w, self.panel_h)
             draw_rounded_rect(self.surface, panel_rect, (255,255,255,230), 28, shadow=True)
             # 标题栏固定
             icon_center = (self.panel_x + self.panel_w // 2, self.panel_y + 40)
             self.draw_gift_icon(self.surface, icon_center, 44)
-            title_font = pygame.font.Font(FONT_NAME, 40)
-            title_text = title_font.render("活动", True, (66, 165, 245))
+            title_font = get_font(FONT_NAME, 40)
+            title_text = render_text(title_font, "活动", True, (66, 165, 245))
             title_rect = title_text.get_rect(center=(self.panel_x + self.panel_w // 2, self.panel_y + 90))
             self.surface.blit(title_text, title_rect)
             for i in range(4):
@@ -112,8 +231,8 @@ class ActivityPage:
             mouse_pos = pygame.mouse.get_pos()
             is_hover = close_rect.collidepoint(mouse_pos)
             pygame.draw.circle(self.surface, (220, 0, 0) if not is_hover else (255,80,80), close_rect.center, 18)
-            x_font = pygame.font.Font(FONT_NAME, 28)
-            x_text = x_font.render("×", True, (255,255,255))
+            x_font = get_font(FONT_NAME, 28)
+            x_text = render_text(x_font, "×", True, (255,255,255))
             x_rect = x_text.get_rect(center=close_rect.center)
             self.surface.blit(x_text, x_rect)
             # 滚动内容区
@@ -170,178 +289,87 @@ class ActivityPage:
 
                 # 滚动提示
                 if self.scroll_max > 0:
-                    hint_font = pygame.font.Font(FONT_NAME, 16)
-                    hint_text = hint_font.render("滚轮滚动", True, (150, 150, 150))
+                    hint_font = get_font(FONT_NAME, 16)
+                    hint_text = render_text(hint_font, "滚轮滚动", True, (150, 150, 150))
                     hint_rect = hint_text.get_rect(center=(self.panel_x + self.panel_w - 14, self.panel_y + self.panel_h - 30))
                     self.surface.blit(hint_text, hint_rect)
         # 其他页面
         if self.page == "signin":
             self.signin_page.draw()
-        elif self.page == "whackamole":
-            if not hasattr(self, 'whackamole_page'):
-                from .whack_a_mole import WhackAMolePage
-                self.whackamole_page = WhackAMolePage(self.surface, self)
-            self.whackamole_page.draw()
-            # 检查active状态，若为False则切回活动页
-            if hasattr(self, 'whackamole_page') and getattr(self.whackamole_page, 'active', True) is False:
-                self.page = 'main'
-                del self.whackamole_page
-        elif self.page == "minesweeper":
-            if not hasattr(self, 'minesweeper_game'):
-                from .minesweeper import MinesweeperGame
-                self.minesweeper_game = MinesweeperGame(self.surface)
-            self.minesweeper_game.draw()
-            # 只负责绘制难度按钮和重开按钮，点击判定交由handle_event处理
-            # 返回按钮 - 顶部布局，优先放在“笑脸-保护键”之间，其次“难度-笑脸”之间，否则退到顶栏下方
-            surface_w, surface_h = self.surface.get_size()
-            # 与 minesweeper 顶栏保持一致的参数
-            diff_names = ['初级', '中级', '高级', '全屏']
-            btn_gap = 8
-            diff_btn_w = 64
-            diff_start_x = 20
-            diff_right = diff_start_x + len(diff_names) * (diff_btn_w + btn_gap) - btn_gap
-            face_size = 32
-            face_left = (surface_w - face_size) // 2
-            face_right = face_left + face_size
-            # 右侧保护按钮与计时器的估算位置（需与 minesweeper.py 保持一致）
-            timer_w = 14*3 + 6*2
-            protect_w = 90
-            protect_left = surface_w - 20 - timer_w - 12 - protect_w
-            lane_left = diff_right + 12
-            lane_right = face_left - 12
-            lane_width_left = max(0, lane_right - lane_left)
-            lane2_left = face_right + 12
-            lane2_right = protect_left - 12
-            lane_width_right = max(0, lane2_right - lane2_left)
-            top_btn_min_w, top_btn_max_w = 90, 110
-            top_btn_h = 28
-            # 选择放置位置：优先右侧通道，其次左侧通道，否则退到顶栏下方
-            if lane_width_right >= top_btn_min_w:
-                top_btn_w = min(top_btn_max_w, lane_width_right)
-                btn_rect = pygame.Rect(lane2_left, 14, top_btn_w, top_btn_h)
-            elif lane_width_left >= top_btn_min_w:
-                top_btn_w = min(top_btn_max_w, lane_width_left)
-                btn_rect = pygame.Rect(lane_left, 14, top_btn_w, top_btn_h)
-            else:
-                # 顶栏下方退让布局
-                top_btn_w = 110
-                x = self.panel_x + self.panel_w - top_btn_w - 12
-                y = 60
-                btn_rect = pygame.Rect(x, y, top_btn_w, top_btn_h)
-            # 添加阴影效果 - 进一步透明
-            shadow_rect = pygame.Rect(btn_rect.x+2, btn_rect.y+2, btn_rect.width, btn_rect.height)
-            shadow_surface = pygame.Surface((shadow_rect.width, shadow_rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(shadow_surface, (0, 0, 0, 40), (0, 0, shadow_rect.width, shadow_rect.height), border_radius=12)
-            self.surface.blit(shadow_surface, shadow_rect)
-            # 主按钮背景 - 更透明
-            button_surface = pygame.Surface((btn_rect.width, btn_rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(button_surface, (66, 165, 245, 120), (0, 0, btn_rect.width, btn_rect.height), border_radius=12)
-            self.surface.blit(button_surface, btn_rect)
-            # 添加高光效果 - 更透明
-            highlight_rect = pygame.Rect(btn_rect.x+1, btn_rect.y+1, btn_rect.width-2, btn_rect.height//2)
-            highlight_surface = pygame.Surface((highlight_rect.width, highlight_rect.height), pygame.SRCALPHA)
-            pygame.draw.rect(highlight_surface, (100, 200, 255, 50), (0, 0, highlight_rect.width, highlight_rect.height), border_radius=12)
-            self.surface.blit(highlight_surface, highlight_rect)
-            # 按钮文字
-            font = pygame.font.Font(FONT_NAME, 20)
-            font.set_bold(True)
-            text = font.render("返回", True, (255,255,255))
-            text_rect = text.get_rect(center=btn_rect.center)
-            # 添加文字阴影 - 更透明
-            shadow_text = font.render("返回", True, (0, 0, 0, 60))
-            shadow_rect = shadow_text.get_rect(center=(text_rect.centerx+1, text_rect.centery+1))
-            self.surface.blit(shadow_text, shadow_rect)
-            self.surface.blit(text, text_rect)
-        elif self.page == "pong":
-            from .pong_game import PongGame
-            if not hasattr(self, 'pong_game'):
-                self.pong_game = PongGame(self.surface)
-                self.pong_game.game_state = "level_select"
-                self.pong_game.selected_level = 1
-            self.pong_game.draw()
+        elif self.page in SUB_GAMES:
+            game = self.get_sub_game(self.page)
+            game.draw()
+            if self.page == "minesweeper":
+                self.draw_minesweeper_back_button()
             # 检查active状态，若为False则切回活动页
-            if hasattr(self, 'pong_game') and getattr(self.pong_game, 'active', True) is False:
-                self.page = 'main'
-                del self.pong_game
-            # 删除弹球游戏返回按钮的绘制
-            # （原有返回按钮相关代码已移除）
-        elif self.page == "linkgame":
-            if not hasattr(self, 'linkgame_page'):
-                from .link_game import LinkGamePage
-                self.linkgame_page = LinkGamePage(self.surface, self)
-            self.linkgame_page.draw()
-        elif self.page == "twentyfour":
-            if not hasattr(self, 'twentyfour_page'):
-                from .twentyfour_game import TwentyFourPage
-                self.twentyfour_page = TwentyFourPage(self.surface, self)
-            self.twentyfour_page.draw()
-        elif self.page == "maze":
-            if not hasattr(self, 'maze_game'):
-                from .maze_game import MazeGame
-                self.maze_game = MazeGame(self.surface)
-            self.maze_game.draw()
-            # 检查active状态，若为False则切回活动页
-            if hasattr(self, 'maze_game') and getattr(self.maze_game, 'active', True) is False:
-                self.page = 'main'
-                del self.maze_game
-        elif self.page == "piano":
-            if not hasattr(self, 'piano_game'):
-                from .piano_tiles import PianoTilesGame
-                self.piano_game = PianoTilesGame(self.surface)
-            self.piano_game.update()
-            self.piano_game.draw()
-            # 检查active状态，若为False则切回活动页
-            if hasattr(self, 'piano_game') and getattr(self.piano_game, 'active', True) is False:
-                self.page = 'main'
-                del self.piano_game
-        elif self.page == "tetris":
-            if not hasattr(self, 'tetris_game'):
-                from .tetris_game import TetrisGame
-                self.tetris_game = TetrisGame(self.surface)
-            self.tetris_game.update()
-            self.tetris_game.handle_key_repeat()
-            self.tetris_game.draw()
-            # 检查active状态，若为False则切回活动页
-            if hasattr(self, 'tetris_game') and getattr(self.tetris_game, 'active', True) is False:
-                self.page = 'main'
-                del self.tetris_game
-        elif self.page == "game2048":
-            if not hasattr(self, 'game2048'):
-                from .game_2048 import Game2048
-                self.game2048 = Game2048(self.surface)
-            self.game2048.draw()
-            # 检查active状态，若为False则切回活动页
-            if hasattr(self, 'game2048') and getattr(self.game2048, 'active', True) is False:
-                self.page = 'main'
-                del self.game2048
-        elif self.page == "pintu":
-            if not hasattr(self, 'pintu_game'):
-                from .pintu_game import PintuGame
-                self.pintu_game = PintuGame(self.surface, self)
-            self.pintu_game.draw()
-            # 检查active状态，若为False则切回活动页
-            if hasattr(self, 'pintu_game') and getattr(self.pintu_game, 'active', True) is False:
-                self.page = 'main'
-                del self.pintu_game
-        elif self.page == "sudoku":
-            if not hasattr(self, 'sudoku_game'):
-                from .sudoku_game import SudokuGame
-                self.sudoku_game = SudokuGame(self.surface)
-            self.sudoku_game.draw()
-            # 检查active状态，若为False则切回活动页
-            if hasattr(self, 'sudoku_game') and getattr(self.sudoku_game, 'active', True) is False:
-                self.page = 'main'
-                del self.sudoku_game
-        elif self.page == "sokoban":
-            if not hasattr(self, 'sokoban_game'):
-                from .sokoban_game import SokobanGame
-                self.sokoban_game = SokobanGame(self.surface)
-            self.sokoban_game.update()
-            self.sokoban_game.draw()
-            # 检查active状态，若为False则切回活动页
-            if hasattr(self, 'sokoban_game') and getattr(self.sokoban_game, 'active', True) is False:
-                self.page = 'main'
-                del self.sokoban_game
+            if getattr(game, 'active', True) is False:
+                self.close_sub_game()
+
+    def _minesweeper_back_rect(self):
+        """扫雷返回按钮的位置：顶部优先放在“笑脸-保护键”之间，其次“难度-笑脸”之间，否则退到顶栏下方"""
+        surface_w, surface_h = self.surface.get_size()
+        # 与 minesweeper 顶栏保持一致的参数
+        diff_names = ['初级', '中级', '高级', '全屏']
+        btn_gap = 8
+        diff_btn_w = 64
+        diff_start_x = 20
+        diff_right = diff_start_x + len(diff_names) * (diff_btn_w + btn_gap) - btn_gap
+        face_size = 32
+        face_left = (surface_w - face_size) // 2
+        face_right = face_left + face_size
+        # 右侧保护按钮与计时器的估算位置（需与 minesweeper.py 保持一致）
+        timer_w = 14*3 + 6*2
+        protect_w = 90
+        protect_left = surface_w - 20 - timer_w - 12 - protect_w
+        lane_left = diff_right + 12
+        lane_right = face_left - 12
+        lane_width_left = max(0, lane_right - lane_left)
+        lane2_left = face_right + 12
+        lane2_right = protect_left - 12
+        lane_width_right = max(0, lane2_right - lane2_left)
+        top_btn_min_w, top_btn_max_w = 90, 110
+        top_btn_h = 28
+        # 选择放置位置：优先右侧通道，其次左侧通道，否则退到顶栏下方
+        if lane_width_right >= top_btn_min_w:
+            top_btn_w = min(top_btn_max_w, lane_width_right)
+            btn_rect = pygame.Rect(lane2_left, 14, top_btn_w, top_btn_h)
+        elif lane_width_left >= top_btn_min_w:
+            top_btn_w = min(top_btn_max_w, lane_width_left)
+            btn_rect = pygame.Rect(lane_left, 14, top_btn_w, top_btn_h)
+        else:
+            # 顶栏下方退让布局
+            top_btn_w = 110
+            x = self.panel_x + self.panel_w - top_btn_w - 12
+            y = 60
+            btn_rect = pygame.Rect(x, y, top_btn_w, top_btn_h)
+        return btn_rect
+
+    def draw_minesweeper_back_button(self):
+        """扫雷只负责绘制难度按钮和重开按钮，返回按钮由活动页绘制，点击判定交由handle_event处理"""
+        btn_rect = self._minesweeper_back_rect()
+        # 添加阴影效果 - 进一步透明
+        shadow_rect = pygame.Rect(btn_rect.x+2, btn_rect.y+2, btn_rect.width, btn_rect.height)
+        shadow_surface = pygame.Surface((shadow_rect.width, shadow_rect.height), pygame.SRCALPHA)
+        pygame.draw.rect(shadow_surface, (0, 0, 0, 40), (0, 0, shadow_rect.width, shadow_rect.height), border_radius=12)
+        self.surface.blit(shadow_surface, shadow_rect)
+        # 主按钮背景 - 更透明
+        button_surface = pygame.Surface((btn_rect.width, btn_rect.height), pygame.SRCALPHA)
+        pygame.draw.rect(button_surface, (66, 165, 245, 120), (0, 0, btn_rect.width, btn_rect.height), border_radius=12)
+        self.surface.blit(button_surface, btn_rect)
+        # 添加高光效果 - 更透明
+        highlight_rect = pygame.Rect(btn_rect.x+1, btn_rect.y+1, btn_rect.width-2, btn_rect.height//2)
+        highlight_surface = pygame.Surface((highlight_rect.width, highlight_rect.height), pygame.SRCALPHA)
+        pygame.draw.rect(highlight_surface, (100, 200, 255, 50), (0, 0, highlight_rect.width, highlight_rect.height), border_radius=12)
+        self.surface.blit(highlight_surface, highlight_rect)
+        # 按钮文字
+        font = get_font(FONT_NAME, 20, bold=True)
+        text = render_text(font, "返回", True, (255,255,255))
+        text_rect = text.get_rect(center=btn_rect.center)
+        # 添加文字阴影 - 更透明
+        shadow_text = render_text(font, "返回", True, (0, 0, 0, 60))
+        shadow_rect = shadow_text.get_rect(center=(text_rect.centerx+1, text_rect.centery+1))
+        self.surface.blit(shadow_text, shadow_rect)
+        self.surface.blit(text, text_rect)
 
     def draw_activity_card(self, y, content_rect, key, title, desc, color, bg_color, btn_text, icon_type):
         card_h = 150
@@ -406,8 +434,8 @@ class ActivityPage:
                 offset = i * 4
                 pygame.draw.rect(self.surface, (255,255,255), (icon_x-18+offset, icon_y-16+offset, card_w, card_h), border_radius=6)
                 pygame.draw.rect(self.surface, (200,200,200), (icon_x-18+offset, icon_y-16+offset, card_w, card_h), 2, border_radius=6)
-            font = pygame.font.Font(FONT_NAME, 22)
-            text = font.render('24', True, (255,87,34))
+            font = get_font(FONT_NAME, 22)
+            text = render_text(font, '24', True, (255,87,34))
             self.surface.blit(text, (icon_x-8, icon_y+8))
         elif icon_type == 'maze':
             # 迷宫图标 - 简化的迷宫路径
@@ -476,8 +504,8 @@ class ActivityPage:
                                (icon_x + grid_size//2, icon_y - grid_size//2 + i * (cell_size + margin)), 1)
             
             # 绘制2048数字
-            font = pygame.font.Font(FONT_NAME, 16)
-            text = font.render('2048', True, (119, 110, 101))
+            font = get_font(FONT_NAME, 16)
+            text = render_text(font, '2048', True, (119, 110, 101))
             text_rect = text.get_rect(center=(icon_x, icon_y))
             self.surface.blit(text, text_rect)
         elif icon_type == 'puzzle':
@@ -506,12 +534,12 @@ class ActivityPage:
             pygame.draw.rect(self.surface, (76,175,80), (icon_x+35, icon_y-8, 16, 16), border_radius=4)
             pygame.draw.rect(self.surface, (255,255,255), (icon_x+35, icon_y-8, 16, 16), 1, border_radius=4)
         # 标题
-        font = pygame.font.Font(FONT_NAME, 36)
-        title_text = font.render(title, True, color)
+        font = get_font(FONT_NAME, 36)
+        title_text = render_text(font, title, True, color)
         self.surface.blit(title_text, (icon_x+70, card_rect.y+38))
         # 描述
-        desc_font = pygame.font.Font(FONT_NAME, 24)
-        desc_text = desc_font.render(desc, True, (80,80,80))
+        desc_font = get_font(FONT_NAME, 24)
+        desc_text = render_text(desc_font, desc, True, (80,80,80))
         self.surface.blit(desc_text, (icon_x+70, card_rect.y+88))
         # 大按钮（判定区扩大，视觉更明显）
         if key != 'comingsoon':
@@ -519,8 +547,8 @@ class ActivityPage:
             btn_rect.centery = card_rect.centery
             btn_color = color if not is_hover else (min(color[0]+50,255), min(color[1]+50,255), min(color[2]+50,255))
             pygame.draw.rect(self.surface, btn_color, btn_rect, border_radius=20)
-            btn_font = pygame.font.Font(FONT_NAME, 32)
-            btn_text_surf = btn_font.render(btn_text, True, (255,255,255))
+            btn_font = get_font(FONT_NAME, 32)
+            btn_text_surf = render_text(btn_font, btn_text, True, (255,255,255))
             btn_text_rect = btn_text_surf.get_rect(center=btn_rect.center)
             self.surface.blit(btn_text_surf, btn_text_rect)
         # 只允许按钮区域可点击
@@ -543,124 +571,43 @@ class ActivityPage:
     def get_close_rect(self):
         return pygame.Rect(self.panel_x+self.panel_w-44, self.panel_y+24, 36, 36)
 
+    def handle_minesweeper_buttons(self, mouse_pos):
+        """扫雷顶部难度按钮、重开按钮和返回按钮的点击判定"""
+        game = getattr(self, 'minesweeper_game', None)
+        if game is None:
+            return
+        # 难度按钮区域与draw一致
+        surface_w, surface_h = self.surface.get_size()
+        diff_names = list(['初级','中级','高级'])
+        btn_gap = 30
+        btn_w = 100
+        btn_h = 48
+        total_btn_w = btn_w * len(diff_names) + btn_gap * (len(diff_names)-1)
+        btn_start_x = (surface_w - total_btn_w) // 2
+        for i, name in enumerate(diff_names):
+            rect = pygame.Rect(btn_start_x + i*(btn_w+btn_gap), 28, btn_w, btn_h)
+            if rect.collidepoint(mouse_pos):
+                game.set_difficulty(name)
+                return
+        # 重开按钮
+        reset_rect = pygame.Rect(game.cols*32-100, 20, 80, 36)
+        if reset_rect.collidepoint(mouse_pos):
+            game.reset()
+        if self._minesweeper_back_rect().collidepoint(mouse_pos):
+            self.page = 'main'
+
     def handle_event(self, event):
         if self.page == "signin":
             self.signin_page.handle_event(event)
             return
-        if self.page == "whackamole":
-            if hasattr(self, 'whackamole_page'):
-                self.whackamole_page.handle_event(event)
-            return
-        if self.page == "minesweeper":
-            if hasattr(self, 'minesweeper_game'):
-                self.minesweeper_game.handle_event(event)
-            # 扫雷顶部难度按钮点击判定
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                mouse_pos = event.pos
-                # 难度按钮区域与draw一致
-                surface_w, surface_h = self.surface.get_size()
-                diff_names = list(['初级','中级','高级'])
-                btn_gap = 30
-                btn_w = 100
-                btn_h = 48
-                total_btn_w = btn_w * len(diff_names) + btn_gap * (len(diff_names)-1)
-                btn_start_x = (surface_w - total_btn_w) // 2
-                for i, name in enumerate(diff_names):
-                    rect = pygame.Rect(btn_start_x + i*(btn_w+btn_gap), 28, btn_w, btn_h)
-                    if rect.collidepoint(mouse_pos):
-                        self.minesweeper_game.set_difficulty(name)
-                        return
-                # 重开按钮
-                reset_rect = pygame.Rect(self.minesweeper_game.cols*32-100, 20, 80, 36)
-                if reset_rect.collidepoint(mouse_pos):
-                    self.minesweeper_game.reset()
-                # 返回按钮（顶部优先，次选左侧通道，最后退到顶栏下方）
-                surface_w, surface_h = self.surface.get_size()
-                diff_names = ['初级', '中级', '高级', '全屏']
-                btn_gap = 8
-                diff_btn_w = 64
-                diff_start_x = 20
-                diff_right = diff_start_x + len(diff_names) * (diff_btn_w + btn_gap) - btn_gap
-                face_size = 32
-                face_left = (surface_w - face_size) // 2
-                face_right = face_left + face_size
-                timer_w = 14*3 + 6*2
-                protect_w = 90
-                protect_left = surface_w - 20 - timer_w - 12 - protect_w
-                lane_left = diff_right + 12
-                lane_right = face_left - 12
-                lane_width_left = max(0, lane_right - lane_left)
-                lane2_left = face_right + 12
-                lane2_right = protect_left - 12
-                lane_width_right = max(0, lane2_right - lane2_left)
-                top_btn_min_w, top_btn_max_w = 90, 110
-                top_btn_h = 28
-                if lane_width_right >= top_btn_min_w:
-                    top_btn_w = min(top_btn_max_w, lane_width_right)
-                    btn_rect = pygame.Rect(lane2_left, 14, top_btn_w, top_btn_h)
-                elif lane_width_left >= top_btn_min_w:
-                    top_btn_w = min(top_btn_max_w, lane_width_left)
-                    btn_rect = pygame.Rect(lane_left, 14, top_btn_w, top_btn_h)
-                else:
-                    top_btn_w = 110
-                    x = self.panel_x + self.panel_w - top_btn_w - 12
-                    y = 60
-                    btn_rect = pygame.Rect(x, y, top_btn_w, top_btn_h)
-                if btn_rect.collidepoint(mouse_pos):
-                    self.page = 'main'
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                self.page = 'main'
-            return
-        if self.page == "pong":
-            if hasattr(self, 'pong_game'):
-                self.pong_game.handle_event(event)
-            # 删除弹球游戏返回按钮的点击判定
-            # if event.type == pygame.MOUSEBUTTONDOWN:
-            #     mouse_pos = event.pos
-            #     btn_rect = pygame.Rect(self.panel_x+self.panel_w-130, self.panel_y+self.panel_h-60, 110, 45)
-            #     if btn_rect.collidepoint(mouse_pos):
-            #         self.page = 'main'
-            # if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-            #     self.page = 'main'
-            return
-        if self.page == "linkgame":
-            if hasattr(self, 'linkgame_page'):
-                self.linkgame_page.handle_event(event)
-            return
-        if self.page == "twentyfour":
-            if hasattr(self, 'twentyfour_page'):
-                self.twentyfour_page.handle_event(event)
-            return
-        if self.page == "maze":
-            if hasattr(self, 'maze_game'):
-                self.maze_game.handle_event(event)
-            return
-        if self.page == "piano":
-            if hasattr(self, 'piano_game'):
-                self.piano_game.handle_event(event)
-            return
-        if self.page == "tetris":
-            if hasattr(self, 'tetris_game'):
-                self.tetris_game.handle_event(event)
-            return
-        if self.page == "game2048":
-            if hasattr(self, 'game2048'):
-                self.game2048.handle_event(event)
-            return
-        if self.page == "pintu":
-            if hasattr(self, 'pintu_game'):
-                self.pintu_game.handle_event(event)
-            return
-        if self.page == "sudoku":
-            if hasattr(self, 'sudoku_game'):
-                self.sudoku_game.handle_event(event)
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
-                self.page = 'main'
-            return
-        if self.page == "sokoban":
-            if hasattr(self, 'sokoban_game'):
-                self.sokoban_game.handle_event(event)
-            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+        if self.page in SUB_GAMES:
+            page = self.page
+            game = getattr(self, SUB_GAMES[page][0], None)
+            if game is not None:
+                game.handle_event(event)
+            if page == "minesweeper" and event.type == pygame.MOUSEBUTTONDOWN:
+                self.handle_minesweeper_buttons(event.pos)
+            if page in ESC_TO_MAIN_SUB_GAMES and event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
                 self.page = 'main'
             return
         if event.type == pygame.KEYDOWN:
@@ -719,38 +666,8 @@ class ActivityPage:
                     if rect.collidepoint(event.pos):
                         if key == 'signin':
                             self.page = 'signin'
-                        elif key == 'whackamole':
-                            self.page = 'whackamole'
-                        elif key == 'minesweeper':
-                            self.page = 'minesweeper'
-                        elif key == 'pong':
-                            self.page = 'pong'
-                        elif key == 'linkgame':
-                            self.page = 'linkgame'
-                            from .link_game import LinkGamePage
-                            self.linkgame_page = LinkGamePage(self.surface, self)  # 每次都新建，自动弹出难度选择
-                        elif key == 'twentyfour':
-                            self.page = 'twentyfour'
-                        elif key == 'maze':
-                            self.page = 'maze'
-                        elif key == 'piano':
-                            self.page = 'piano'
-                        elif key == 'tetris':
-                            self.page = 'tetris'
-                        elif key == 'game2048':
-                            self.page = 'game2048'
-                        elif key == 'pintu':
-                            self.page = 'pintu'
-                            from .pintu_game import PintuGame
-                            self.pintu_game = PintuGame(self.surface, self)
-                        elif key == 'sudoku':
-                            self.page = 'sudoku'
-                            from .sudoku_game import SudokuGame
-                            self.sudoku_game = SudokuGame(self.surface, self)
-                        elif key == 'sokoban':
-                            self.page = 'sokoban'
-                            from .sokoban_game import SokobanGame
-                            self.sokoban_game = SokobanGame(self.surface)
+                        elif key in SUB_GAMES:
+                            self.open_sub_game(key)
                 self._mouse_down_pos = None
                 self._mouse_dragging = False
         elif event.type == pygame.MOUSEWHEEL:
@@ -788,13 +705,13 @@ class SignInPage:
         self.msg_time = 0
 
     def get_streak(self):
-        return player_data.data.get("sign_in_streak", 0)
+        return player_data.get_int(None, "sign_in_streak", 0)
 
     def get_max_streak(self):
-        return player_data.data.get("max_sign_in_streak", 0)
+        return player_data.get_int(None, "max_sign_in_streak", 0)
 
     def is_signed_today(self):
-        last_date = player_data.data.get("last_signin_date", "")
+        last_date = player_data.get_str(None, "last_signin_date")
         today = datetime.date.today().isoformat()
         return last_date == today
 
@@ -803,8 +720,8 @@ class SignInPage:
 
     def do_signin(self):
         today = datetime.date.today().isoformat()
-        last_date = player_data.data.get("last_signin_date", "")
-        last_streak = player_data.data.get("sign_in_streak", 0)
+        last_date = player_data.get_str(None, "last_signin_date")
+        last_streak = player_data.get_int(None, "sign_in_streak", 0)
         # 判断是否断签
         if last_date:
             last_dt = datetime.date.fromisoformat(last_date)
@@ -819,12 +736,12 @@ class SignInPage:
         else:
             streak = 1
         reward = self.calc_reward(streak)
-        player_data.data["last_signin_date"] = today
-        player_data.data["sign_in_streak"] = streak
-        if streak > player_data.data.get("max_sign_in_streak", 0):
-            player_data.data["max_sign_in_streak"] = streak
+        player_data.set_values(None, {
+            "last_signin_date": today,
+            "sign_in_streak": streak,
+            "max_sign_in_streak": max(streak, self.get_max_streak()),
+        })
         player_data.add_coins(reward)
-        player_data._save_data()
         self.msg = f"+{reward} 金币，连续{streak}天！"
         self.msg_time = time.time()
 
@@ -833,28 +750,26 @@ class SignInPage:
         card_rect = pygame.Rect(self.panel_x+60, self.panel_y+120, self.panel_w-120, 340)
         draw_rounded_rect(self.surface, card_rect, (187,222,251,230), 22, shadow=True)
         # 标题
-        font = pygame.font.Font(FONT_NAME, 34)
-        text = font.render("每日签到", True, (33, 150, 243))
+        font = get_font(FONT_NAME, 34)
+        text = render_text(font, "每日签到", True, (33, 150, 243))
         title_rect = text.get_rect(center=(card_rect.centerx, card_rect.y+38))
         self.surface.blit(text, title_rect)
         # 连续天数
         streak = self.get_streak()
         max_streak = self.get_max_streak()
-        streak_font = pygame.font.Font(FONT_NAME, 26)
-        streak_font.set_bold(True)
+        streak_font = get_font(FONT_NAME, 26, bold=True)
         streak_bg_rect = pygame.Rect(card_rect.x+40, card_rect.y+90, card_rect.width-80, 44)
         pygame.draw.rect(self.surface, (225,245,254), streak_bg_rect, border_radius=10)
-        streak_text = streak_font.render(f"连续签到：{streak} 天", True, (66, 165, 245))
+        streak_text = render_text(streak_font, f"连续签到：{streak} 天", True, (66, 165, 245))
         self.surface.blit(streak_text, (streak_bg_rect.x+18, streak_bg_rect.y+6))
-        max_text = streak_font.render(f"历史最高：{max_streak} 天", True, (120,120,120))
+        max_text = render_text(streak_font, f"历史最高：{max_streak} 天", True, (120,120,120))
         self.surface.blit(max_text, (streak_bg_rect.x+260, streak_bg_rect.y+6))
         # 今日奖励
         reward = self.calc_reward(streak+1 if not self.is_signed_today() else streak)
-        reward_font = pygame.font.Font(FONT_NAME, 26)
-        reward_font.set_bold(True)
+        reward_font = get_font(FONT_NAME, 26, bold=True)
         reward_bg_rect = pygame.Rect(card_rect.x+40, card_rect.y+150, card_rect.width-80, 54)
         pygame.draw.rect(self.surface, (255,243,224), reward_bg_rect, border_radius=10)
-        reward_text = reward_font.render(f"本次签到奖励：{reward} 金币", True, (255,140,0))
+        reward_text = render_text(reward_font, f"本次签到奖励：{reward} 金币", True, (255,140,0))
         self.surface.blit(reward_text, (reward_bg_rect.x+18, reward_bg_rect.y+10))
         # 签到按钮（更大更明显，靠下居中）
         btn_rect = pygame.Rect(card_rect.centerx-80, card_rect.y+230, 160, 56)
@@ -864,27 +779,25 @@ class SignInPage:
         if is_hover and not self.is_signed_today():
             btn_color = (33, 150, 243)
         pygame.draw.rect(self.surface, btn_color, btn_rect, border_radius=16)
-        btn_font = pygame.font.Font(FONT_NAME, 28)
-        btn_font.set_bold(True)
+        btn_font = get_font(FONT_NAME, 28, bold=True)
         btn_text = "已签到" if self.is_signed_today() else "签到"
         text_color = (255,255,255) if not self.is_signed_today() else (220,220,220)
-        text_surf = btn_font.render(btn_text, True, text_color)
+        text_surf = render_text(btn_font, btn_text, True, text_color)
         text_rect = text_surf.get_rect(center=btn_rect.center)
         self.surface.blit(text_surf, text_rect)
         self._signin_btn_rect = btn_rect
         # 返回按钮（更大，靠下居中，签到按钮下方）
         back_rect = pygame.Rect(card_rect.centerx-60, btn_rect.bottom+24, 120, 44)
         pygame.draw.rect(self.surface, (66, 165, 245), back_rect, border_radius=12)
-        back_font = pygame.font.Font(FONT_NAME, 24)
-        back_font.set_bold(True)
-        back_text = back_font.render("返回", True, (255,255,255))
+        back_font = get_font(FONT_NAME, 24, bold=True)
+        back_text = render_text(back_font, "返回", True, (255,255,255))
         back_text_rect = back_text.get_rect(center=back_rect.center)
         self.surface.blit(back_text, back_text_rect)
         self._back_btn_rect = back_rect
         # 签到提示
         if self.msg and time.time()-self.msg_time<2.5:
-            tip_font = pygame.font.Font(FONT_NAME, 26)
-            tip = tip_font.render(self.msg, True, (66, 165, 245))
+            tip_font = get_font(FONT_NAME, 26)
+            tip = render_text(tip_font, self.msg, True, (66, 165, 245))
             tip_rect = tip.get_rect(center=(self.panel_x+self.panel_w//2, card_rect.bottom+60))
             self.surface.blit(tip, tip_rect)
 
@@ -0,0 +1,177 @@
+# -*- coding: utf-8 -*-
+"""
+多蛇竞技场的无界面模拟（取代原来只支持两条蛇的双人模式规则）
+所有蛇共用一张占用表，另外每条蛇保留自己的占用表（允许穿过自己）；
+每个逻辑帧先让所有蛇移动，再按蛇头所在格子分组一次性结算碰撞，耗时与蛇的数量成正比：
+- 蛇头所在格子上有其他蛇的身体：该蛇死亡
+- 多个蛇头进入同一格：最长的一条存活，一样长则全部死亡
+死亡的蛇从棋盘上移除，只剩一条（或没有）蛇存活时本局结束。
+"""
+import random
+from collections import namedtuple
+from .core_constants import GRID_WIDTH, GRID_HEIGHT
+from .occupancy import OccupancyGrid
+from .world import SnakeState, FoodState, sample_food_cell, generate_obstacles
+
+# 每个食物的加分（与原双人模式的 Snake.grow() 默认值一致）
+ARENA_FOOD_SCORE = 10
+
+# step 的返回值：eaten 为 [(蛇编号, 食物)]，deaths 为 [(蛇编号, 原因)]，原因为 'self'/'body'/'head'/'wall'；
+# winner 为本局结束时唯一存活的蛇编号（没有则为 None），done 表示本局已结束
+ArenaStepResult = namedtuple('ArenaStepResult', ['eaten', 'deaths', 'winner', 'done'])
+
+def default_spawns(count, width=GRID_WIDTH, height=GRID_HEIGHT):
+    """把 count 条蛇沿水平方向均匀排开，相邻两条一上一下朝相反方向出发"""
+    spawns = []
+    for i in range(count):
+        x = (i + 1) * width // (count + 1)
+        if i % 2 == 0:
+            spawns.append(((x, height // 2 + 2), (0, -1)))
+        else:
+            spawns.append(((x, height // 2 - 2), (0, 1)))
+    return spawns
+
+class ArenaWorld:
+    """
+    N 条蛇的竞技场
+    spawns 为每条蛇的 (出生格子, 初始方向)；snake_factory / food_factory 与 SnakeWorld 的用法相同。
+    """
+
+    def __init__(self, num_snakes=2, seed=None, width=GRID_WIDTH, height=GRID_HEIGHT, spawns=None,
+                 food_count=None, obstacle_count=0, allow_cross_self=True,
+                 snake_factory=SnakeState, food_factory=FoodState):
+        self.num_snakes = num_snakes
+        self.seed = seed if seed is not None else random.getrandbits(64)
+        self.width = width
+        self.height = height
+        self.spawns = spawns or default_spawns(num_snakes, width, height)
+        # 默认每两条蛇一个食物，至少一个
+        self.food_count = food_count or max(1, num_snakes // 2)
+        self.obstacle_count = obstacle_count
+        self.allow_cross_self = allow_cross_self
+        self.snake_factory = snake_factory
+        self.food_factory = food_factory
+        self.reset()
+
+    def reset(self):
+        self.rng = random.Random(self.seed)
+        self.grid = OccupancyGrid(self.width, self.height)  # 所有蛇共用
+        self.snakes = []
+        for start, direction in self.spawns:
+            # 每条蛇有自己的占用表，用来从共用表中扣除自己的身体
+            snake = self.snake_factory(allow_cross_self=self.allow_cross_self,
+                                       grid=OccupancyGrid(self.width, self.height))
+            snake.reset_body([start])
+            snake.direction = snake.next_direction = direction
+            self.grid.add_body(start)
+            self.snakes.append(snake)
+        self.alive = [True] * len(self.snakes)
+        self.obstacles = generate_obstacles(self.grid, self.rng, None, self.obstacle_count)
+        self.foods = []
+        self._food_at = {}
+        self.tick = 0
+        self.done = False
+        self.winner = None
+        for _ in range(self.food_count):
+            self.spawn_food()
+
+    def spawn_food(self):
+        """在共用占用表的空闲格子上放一个食物；棋盘已满时返回 False"""
+        cell = sample_food_cell(self.grid.free, None, self.rng)
+        if cell is None:
+            return False
+        food = self.food_factory(level=1)
+        food.position = cell
+        self.grid.set_food(cell)
+        self.foods.append(food)
+        self._food_at[cell] = food
+        return True
+
+    def alive_count(self):
+        return sum(self.alive)
+
+    def leader(self):
+        """存活的蛇中最长的一条（一样长取分数高的），没有存活的蛇时返回 None"""
+        alive = [i for i, is_alive in enumerate(self.alive) if is_alive]
+        if not alive:
+            return None
+        return max(alive, key=lambda i: (self.snakes[i].length, self.snakes[i].score))
+
+    def step(self, actions=None):
+        """
+        推进一个逻辑帧
+        actions 为每条蛇本帧的方向指令序列组成的列表（None 或缺省表示不转向）
+        """
+        if self.done:
+            return ArenaStepResult([], [], self.winner, True)
+        self.tick += 1
+        grid = self.grid
+        deaths = {}
+
+        # 1. 所有存活的蛇先移动，同步更新共用占用表
+        for i, snake in enumerate(self.snakes):
+            if not self.alive[i]:
+                continue
+            if actions is not None and i < len(actions) and actions[i]:
+                for action in actions[i]:
+                    snake.change_direction(action)
+            positions = snake.positions
+            old_tail, old_len = positions[-1], len(positions)
+            if not snake.move():
+                deaths[i] = 'self'
+                continue
+            grid.add_body(snake.get_head_position())
+            if len(positions) == old_len:
+                grid.remove_body(old_tail)
+
+        # 2. 按蛇头所在格子分组
+        heads = {}
+        for i, snake in enumerate(self.snakes):
+            if self.alive[i] and i not in deaths:
+                heads.setdefault(snake.get_head_position(), []).append(i)
+
+        # 3. 一次遍历结算碰撞
+        for cell, group in heads.items():
+            if grid.is_obstacle(cell):
+                for i in group:
+                    deaths[i] = 'wall'
+                continue
+            total = grid.body_count(cell)
+            for i in group:
+                # 其他蛇在这一格的身体 = 共用计数 - 自己的计数 - 同格的其他蛇头
+                others = total - self.snakes[i].grid.body_count(cell) - (len(group) - 1)
+                if others > 0:
+                    deaths[i] = 'body'
+            if len(group) > 1:
+                longest = max(self.snakes[i].length for i in group)
+                survivors = [i for i in group if self.snakes[i].length == longest]
+                for i in group:
+                    if len(survivors) > 1 or i != survivors[0]:
+                        deaths.setdefault(i, 'head')
+
+        # 4. 移除死亡的蛇
+        for i in deaths:
+            self.alive[i] = False
+            for cell in self.snakes[i].positions:
+                grid.remove_body(cell)
+
+        # 5. 存活的蛇吃食物
+        eaten = []
+        for i, snake in enumerate(self.snakes):
+            if not self.alive[i]:
+                continue
+            head = snake.get_head_position()
+            food = self._food_at.pop(head, None)
+            if food is None:
+                continue
+            snake.grow(ARENA_FOOD_SCORE)
+            self.foods.remove(food)
+            grid.remove_food(head)
+            eaten.append((i, food))
+            self.spawn_food()
+
+        alive = [i for i, is_alive in enumerate(self.alive) if is_alive]
+        if len(alive) <= (1 if len(self.snakes) > 1 else 0):
+            self.done = True
+            self.winner = alive[0] if alive else None
+        return ArenaStepResult(eaten, sorted(deaths.items()), self.winner, self.done)
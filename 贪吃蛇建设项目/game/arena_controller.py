@@ -0,0 +1,163 @@
+# -*- coding: utf-8 -*-
+import pygame
+from .snake import Snake
+from .food import Food
+from .arena import ArenaWorld
+from .autopilot import Autopilot
+from .menu import GameOverMenuDual
+from .game_loop import FixedStepLoop
+from .constants import GRID_SIZE, WINDOW_WIDTH, WINDOW_HEIGHT, ARENA_TICK_RATE
+from .fonts import get_sysfont, render_text
+
+# 本地玩家的按键：玩家1 WASD，玩家2 方向键
+PLAYER_KEYS = [
+    {pygame.K_w: (0, -1), pygame.K_s: (0, 1), pygame.K_a: (-1, 0), pygame.K_d: (1, 0)},
+    {pygame.K_UP: (0, -1), pygame.K_DOWN: (0, 1), pygame.K_LEFT: (-1, 0), pygame.K_RIGHT: (1, 0)},
+]
+# 分数面板颜色，按蛇的编号循环使用
+PANEL_COLORS = [(0, 200, 0), (0, 120, 255), (255, 140, 0), (200, 60, 200),
+                (220, 20, 60), (0, 170, 170), (160, 120, 40), (100, 100, 100)]
+
+class ArenaController:
+    """
+    多蛇竞技场（取代原来的双人模式）：players 个本地玩家 + bots 个电脑
+    规则由 ArenaWorld 模拟，按固定的 ARENA_TICK_RATE 推进，与绘制帧率无关。
+    """
+
+    def __init__(self, screen, players=2, bots=0):
+        self.screen = screen
+        self.players = min(players, len(PLAYER_KEYS))
+        self.bots = bots
+        self.loop = FixedStepLoop(ARENA_TICK_RATE)
+        self.game_over_menu = GameOverMenuDual(self.screen)
+        self.font = get_sysfont('Microsoft YaHei', 24)
+        self.grid_surface = self.create_grid_surface()
+        self.reset()
+
+    def reset(self):
+        count = self.players + self.bots
+        self.world = ArenaWorld(num_snakes=count, snake_factory=Snake, food_factory=Food)
+        self.names = [f"玩家{i + 1}" for i in range(self.players)] + [f"电脑{i + 1}" for i in range(self.bots)]
+        self.pilots = {i: Autopilot(self.world, self.world.snakes[i]) for i in range(self.players, count)}
+        self.pending_actions = [[] for _ in range(count)]
+        self.loop.reset()
+        self.game_over = False
+        self.paused = False
+        self.winner = None
+
+    def create_grid_surface(self):
+        # 创建网格背景，风格与单人一致
+        grid_surface = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        grid_color = (180, 180, 180)
+        for x in range(0, WINDOW_WIDTH, GRID_SIZE):
+            pygame.draw.line(grid_surface, grid_color, (x, 0), (x, WINDOW_HEIGHT))
+        for y in range(0, WINDOW_HEIGHT, GRID_SIZE):
+            pygame.draw.line(grid_surface, grid_color, (0, y), (WINDOW_WIDTH, y))
+        return grid_surface
+
+    def handle_event(self, event):
+        """处理一个事件；离开竞技场时返回 'menu'"""
+        if event.type == pygame.QUIT:
+            return "menu"
+        if self.game_over:
+            result = self.game_over_menu.handle_event(event)
+            if result == "restart":
+                self.reset()
+            elif result == "main_menu":
+                return "menu"
+            return None
+        # ESC暂停
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.paused = not self.paused
+        if event.type == pygame.KEYDOWN and not self.paused:
+            for player, keys in enumerate(PLAYER_KEYS[:self.players]):
+                if event.key in keys:
+                    self.pending_actions[player].append(keys[event.key])
+        return None
+
+    def update(self):
+        """推进一个逻辑帧；本局结束时返回 False"""
+        world = self.world
+        for i, pilot in self.pilots.items():
+            if world.alive[i]:
+                self.pending_actions[i] = [pilot.next_action()]
+        result = world.step(self.pending_actions)
+        self.pending_actions = [[] for _ in self.pending_actions]
+        if result.done:
+            self.finish(result.winner)
+        elif self.players and self.bots and not any(world.alive[:self.players]):
+            # 本地玩家全部出局：存活的电脑中最长的一条获胜
+            self.finish(world.leader())
+        return not self.game_over
+
+    def finish(self, winner):
+        self.game_over = True
+        self.winner = winner
+
+    def result_text(self):
+        if self.winner is None:
+            return "平局！"
+        return f"{self.names[self.winner]}胜利！"
+
+    def draw_score_panel(self):
+        for i, snake in enumerate(self.world.snakes):
+            panel = pygame.Surface((180, 36), pygame.SRCALPHA)
+            color = PANEL_COLORS[i % len(PANEL_COLORS)]
+            panel.fill((*color, 180 if self.world.alive[i] else 70))
+            text = render_text(self.font, f"{self.names[i]}: {snake.score}", True, (255, 255, 255))
+            panel.blit(text, (12, (36 - text.get_height()) // 2))
+            # 两列排布，玩家1在左上，玩家2在右上
+            column, row = i % 2, i // 2
+            x = 10 if column == 0 else self.screen.get_width() - 190
+            self.screen.blit(panel, (x, 10 + row * 42))
+
+    def draw_game_over(self):
+        snakes = self.world.snakes
+        score2 = snakes[1].score if len(snakes) > 1 else 0
+        names = (self.names[0], self.names[1] if len(self.names) > 1 else "")
+        self.game_over_menu.draw(snakes[0].score, score2, names=names, result_text=self.result_text())
+        if len(snakes) > 2:
+            # 结算面板只有两个大分数框，其余蛇的分数按游戏中分数面板的布局画在遮罩上面
+            self.draw_score_panel()
+
+    def draw_pause(self):
+        overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+        overlay.fill((0,0,0,120))
+        self.screen.blit(overlay, (0,0))
+        font = get_sysfont('Microsoft YaHei', 56)
+        text = render_text(font, "暂停", True, (255,255,255))
+        rect = text.get_rect(center=(self.screen.get_width()//2, self.screen.get_height()//2))
+        self.screen.blit(text, rect)
+        tip = render_text(get_sysfont('Microsoft YaHei', 28), "按ESC继续", True, (255,255,255))
+        tip_rect = tip.get_rect(center=(self.screen.get_width()//2, self.screen.get_height()//2+60))
+        self.screen.blit(tip, tip_rect)
+
+    def draw(self):
+        self.screen.fill((230, 230, 230))
+        self.screen.blit(self.grid_surface, (0, 0))
+        for food in self.world.foods:
+            food.draw(self.screen)
+        # 用皮肤系统绘制存活的蛇
+        for i, snake in enumerate(self.world.snakes):
+            if self.world.alive[i]:
+                snake.draw(self.screen)
+        self.draw_score_panel()
+        if self.paused:
+            self.draw_pause()
+        if self.game_over:
+            self.draw_game_over()
+
+    def advance_frame(self, elapsed_ms):
+        """固定逻辑帧率：按本帧经过的时间补齐逻辑帧，绘制时在两帧之间插值"""
+        if self.paused:
+            return
+        if not self.game_over:
+            self.loop.run(elapsed_ms, self.update)
+        current_time = pygame.time.get_ticks()
+        for snake in self.world.snakes:
+            snake.render_alpha = self.loop.alpha
+        if not self.game_over:
+            for snake in self.world.snakes:
+                snake.animation_time = current_time
+            for food in self.world.foods:
+                food.update(current_time)
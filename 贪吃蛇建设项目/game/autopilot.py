@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+贪吃蛇自动驾驶
+在 SnakeWorld 上寻路：BFS 找最近的食物（避开障碍物和蛇身，支持穿墙），
+吃到之后若还能走到自己的蛇尾才采用这条路径，否则改为追着蛇尾走，再不行就往空间最大的方向走。
+同时提供无界面基准测试 run_benchmark，作为核心循环可重复的 CPU 负载。
+"""
+import random
+import time
+from collections import deque
+from .world import SnakeWorld
+
+# 与 replay.DIRECTION_CODES 相同的顺序：上、下、左、右
+DIRECTIONS = ((0, -1), (0, 1), (-1, 0), (1, 0))
+
+class Autopilot:
+    """
+    为 world.snake（或竞技场中指定的 snake）选择每一帧的方向
+    蛇身格子按“多少步之后会空出来”参与寻路：距蛇尾越近的格子越早可以通过；
+    竞技场中其他蛇的身体一律当作障碍物。
+    找到的安全路径会缓存下来，之后每帧直接沿路径走，直到吃到食物或局面变化。
+    """
+
+    def __init__(self, world, snake=None):
+        self.width = self.height = None
+        self.plan_time = 0.0  # 累计寻路耗时（秒）
+        self.reset(world, snake)
+
+    def reset(self, world=None, snake=None):
+        """
+        开始新的一局：world 为 None 时沿用原来的世界对象；
+        snake 为竞技场中要驾驶的蛇，为 None 时使用 world.snake（单人世界）
+        """
+        if world is not None:
+            self.world = world
+            self.snake = snake if snake is not None else world.snake
+        elif snake is not None:
+            self.snake = snake
+        width, height = self.world.grid.width, self.world.grid.height
+        if (width, height) != (self.width, self.height):
+            self.width, self.height = width, height
+            # 每个格子四个方向的邻居（穿墙），与 DIRECTIONS 顺序一致
+            self.neighbors = []
+            for index in range(width * height):
+                x, y = index % width, index // width
+                self.neighbors.append(tuple(((y + dy) % height) * width + (x + dx) % width
+                                            for dx, dy in DIRECTIONS))
+        self._path = []  # 缓存的路径（格子编号，不含当前蛇头）
+        self._blocked = frozenset()  # 本次寻路中其他蛇占用的格子
+
+    def next_action(self):
+        """返回本帧的方向 (dx, dy)"""
+        start = time.perf_counter()
+        snake = self.snake
+        x, y = snake.get_head_position()
+        head = y * self.width + x
+        if not (self._path and self._path[0] in self.neighbors[head] and self._path_still_valid()):
+            body = [y * self.width + x for x, y in snake.positions]
+            self._path = self._plan(body, snake.length - len(body))
+        self.plan_time += time.perf_counter() - start
+        if not self._path:
+            return snake.direction
+        step = self._path.pop(0)
+        return DIRECTIONS[self.neighbors[head].index(step)]
+
+    def _path_still_valid(self):
+        """缓存路径的终点必须仍然是食物，且下一格没有被其他蛇占住"""
+        foods = self._food_cells()
+        if not foods or self._path[-1] not in foods:
+            return False
+        if self.snake.grid is self.world.grid:
+            return True
+        step = self._path[0]
+        cell = (step % self.width, step // self.width)
+        return self.world.grid.body_count(cell) <= self.snake.grid.body_count(cell)
+
+    def _other_bodies(self):
+        """其他蛇身体所在的格子（只有竞技场中蛇有自己的占用表时才需要计算）"""
+        if self.snake.grid is self.world.grid:
+            return frozenset()
+        shared = self.world.grid.cells
+        own = self.snake.grid.cells
+        mask = self.world.grid.BODY_MASK
+        return {i for i in range(len(shared)) if (shared[i] & mask) > (own[i] & mask)}
+
+    def _food_cells(self):
+        return {y * self.width + x for (x, y) in (food.position for food in self.world.foods)}
+
+    def _plan(self, body, growth):
+        """按优先级制定路径：安全地吃食物 > 追蛇尾 > 去空间最大的相邻格子"""
+        self._blocked = self._other_bodies()
+        foods = self._food_cells()
+        path = self._bfs(body, growth, foods)
+        if path and self._safe_after(body, growth, path):
+            return path
+        if len(body) > 1:
+            step = self._tail_chase_step(body, growth, foods)
+            if step is not None:
+                return [step]
+        return self._largest_area_step(body, growth)
+
+    def _tail_chase_step(self, body, growth, foods):
+        """
+        追蛇尾：在走一步后仍能到达蛇尾的相邻格子中，选离蛇尾最远的一个（绕远路给身体腾出空间）
+        """
+        cells = self.world.grid.cells
+        obstacle = self.world.grid.OBSTACLE
+        free_after = self._free_after(body, growth)
+        best, best_distance = None, -1
+        for nxt in self.neighbors[body[0]]:
+            if cells[nxt] & obstacle or nxt in self._blocked or free_after.get(nxt, 0) > 1:
+                continue
+            virtual = [nxt] + body
+            length = len(body) + growth + (1 if nxt in foods else 0)
+            virtual = virtual[:length]
+            path = self._bfs(virtual, length - len(virtual), {virtual[-1]})
+            if path and len(path) > best_distance:
+                best, best_distance = nxt, len(path)
+        return best
+
+    def _free_after(self, body, growth):
+        """每个蛇身格子从第几步起可以进入（碰撞检测发生在去掉蛇尾之前，所以蛇尾也要等一步）"""
+        length = len(body)
+        return {cell: length - i + 1 + growth for i, cell in enumerate(body) if i > 0}
+
+    def _bfs(self, body, growth, targets):
+        """从蛇头出发的 BFS，返回到最近目标的路径（不含蛇头），找不到返回 []"""
+        if not targets:
+            return []
+        cells = self.world.grid.cells
+        obstacle = self.world.grid.OBSTACLE
+        free_after = self._free_after(body, growth)
+        blocked = self._blocked
+        head = body[0]
+        parent = {head: None}
+        queue = deque([(head, 0)])
+        while queue:
+            cell, dist = queue.popleft()
+            for nxt in self.neighbors[cell]:
+                if nxt in parent or cells[nxt] & obstacle or nxt in blocked:
+                    continue
+                if free_after.get(nxt, 0) > dist + 1:
+                    continue
+                parent[nxt] = cell
+                if nxt in targets:
+                    path = [nxt]
+                    while parent[path[-1]] != head:
+                        path.append(parent[path[-1]])
+                    path.reverse()
+                    return path
+                queue.append((nxt, dist + 1))
+        return []
+
+    def _safe_after(self, body, growth, path):
+        """沿 path 吃到食物后，是否还能走到自己的蛇尾"""
+        virtual = deque(body)
+        length = len(body) + growth
+        for cell in path:
+            virtual.appendleft(cell)
+            if len(virtual) > length:
+                virtual.pop()
+        length += 1  # 吃到食物后长度加一
+        if len(virtual) < 3:
+            return True
+        virtual = list(virtual)
+        return bool(self._bfs(virtual, length - len(virtual), {virtual[-1]}))
+
+    def _largest_area_step(self, body, growth):
+        """没有安全路径时，走向可达区域最大的相邻格子"""
+        cells = self.world.grid.cells
+        obstacle = self.world.grid.OBSTACLE
+        free_after = self._free_after(body, growth)
+        best, best_area = None, -1
+        for nxt in self.neighbors[body[0]]:
+            if cells[nxt] & obstacle or nxt in self._blocked or free_after.get(nxt, 0) > 1:
+                continue
+            area = self._flood_area(nxt, free_after, obstacle, cells)
+            if area > best_area:
+                best, best_area = nxt, area
+        return [best] if best is not None else []
+
+    def _flood_area(self, start, free_after, obstacle, cells):
+        seen = {start}
+        queue = deque([start])
+        while queue:
+            cell = queue.popleft()
+            for nxt in self.neighbors[cell]:
+                if (nxt not in seen and not cells[nxt] & obstacle and nxt not in free_after
+                        and nxt not in self._blocked):
+                    seen.add(nxt)
+                    queue.append(nxt)
+        return len(seen)
+
+def run_benchmark(games=20, seed=0, max_ticks=20000):
+    """
+    无界面地让自动驾驶连续玩 games 局（每局最多 max_ticks 帧，防止无限追尾），
+    返回总帧数、帧/秒、平均长度和每帧寻路耗时等统计
+    """
+    seeds = random.Random(seed)
+    total_ticks = 0
+    total_length = 0
+    plan_time = 0.0
+    deaths = {}
+    start = time.perf_counter()
+    for _ in range(games):
+        world = SnakeWorld(seed=seeds.getrandbits(64))
+        pilot = Autopilot(world)
+        while not world.done and world.tick < max_ticks:
+            world.step((pilot.next_action(),))
+        total_ticks += world.tick
+        total_length += world.snake.length
+        plan_time += pilot.plan_time
+        reason = 'board_full' if world.board_full else (world.death or 'timeout')
+        deaths[reason] = deaths.get(reason, 0) + 1
+    elapsed = time.perf_counter() - start
+    return {
+        'games': games,
+        'ticks': total_ticks,
+        'seconds': elapsed,
+        'ticks_per_second': total_ticks / elapsed if elapsed > 0 else float('inf'),
+        'average_length': total_length / games if games else 0,
+        'plan_ms_per_tick': plan_time * 1000 / total_ticks if total_ticks else 0,
+        'endings': deaths,
+    }
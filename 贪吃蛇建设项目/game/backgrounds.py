@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""
+主菜单背景图的延迟加载
+启动时只列出 backgrounds 目录下的图片文件，并只解码当前要显示的那一张；
+其余图片由后台线程依次解码、缩放到窗口大小并转换成显示格式（convert），下一张（切换按钮的预览图）最先加载。
+主线程取的图还没加载好时当场同步加载，不会显示空白；无法加载的图片在切换时跳过。
+"""
+import os
+import threading
+import pygame
+from .constants import WINDOW_WIDTH, WINDOW_HEIGHT
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.bmp')
+
+class BackgroundLoader:
+    """按编号取背景图（编号为目录中图片文件的顺序），解码和缩放在后台线程中完成"""
+
+    def __init__(self, size=(WINDOW_WIDTH, WINDOW_HEIGHT)):
+        self.size = size
+        self.paths = []
+        self._images = {}  # 路径 -> 缩放并转换好的 Surface，无法加载时为 None
+        self._pending = []  # 等待后台线程加载的路径，排在前面的先加载
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def __len__(self):
+        return len(self.paths)
+
+    def scan(self, bg_dir):
+        """重新列出 bg_dir 中的图片文件（已加载的图片保留），返回图片数量"""
+        paths = []
+        if os.path.exists(bg_dir):
+            for file in os.listdir(bg_dir):
+                if file.lower().endswith(IMAGE_EXTENSIONS):
+                    paths.append(os.path.join(bg_dir, file))
+        with self._lock:
+            self.paths = paths
+            self._pending = [path for path in self._pending if path in paths]
+        return len(paths)
+
+    def _load(self, path):
+        """解码一张图片并缩放到窗口大小，有窗口时转换成显示格式；失败时返回 None"""
+        try:
+            image = pygame.image.load(path)
+            image = pygame.transform.scale(image, self.size)
+            return image.convert() if pygame.display.get_surface() else image
+        except pygame.error as e:
+            print(f"错误：无法加载图片 {os.path.basename(path)}: {e}")
+            return None
+
+    def get(self, index):
+        """取得编号为 index 的背景图，还没加载时在当前线程同步加载；无法加载时返回 None"""
+        with self._lock:
+            if not 0 <= index < len(self.paths):
+                return None
+            path = self.paths[index]
+            if path in self._images:
+                return self._images[path]
+        image = self._load(path)
+        with self._lock:
+            # 后台线程可能同时加载好了同一张，保留先完成的那张
+            image = self._images.setdefault(path, image)
+            if path in self._pending:
+                self._pending.remove(path)
+        return image
+
+    def peek(self, index):
+        """取得编号为 index 的背景图，还没加载好时返回 None（不等待）"""
+        with self._lock:
+            if 0 <= index < len(self.paths):
+                return self._images.get(self.paths[index])
+        return None
+
+    def next_index(self, index):
+        """index 之后的下一张背景图的编号，跳过已知无法加载的图片；没有图片时返回 0"""
+        with self._lock:
+            count = len(self.paths)
+            for step in range(1, count + 1):
+                candidate = (index + step) % count
+                path = self.paths[candidate]
+                if path not in self._images or self._images[path] is not None:
+                    return candidate
+        return index if count else 0
+
+    def prefetch(self, start):
+        """从编号 start 开始按顺序排队加载其余图片，并按需启动后台线程"""
+        with self._lock:
+            count = len(self.paths)
+            order = [self.paths[(start + i) % count] for i in range(count)]
+            self._pending = [path for path in order if path not in self._images]
+            if self._pending and self._thread is None:
+                self._thread = threading.Thread(target=self._load_loop, name="BackgroundLoader", daemon=True)
+                self._thread.start()
+
+    def _load_loop(self):
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._thread = None
+                    return
+                path = self._pending.pop(0)
+                if path in self._images:
+                    continue
+            image = self._load(path)
+            with self._lock:
+                self._images.setdefault(path, image)
+
+    def wait(self, timeout=None):
+        """等待后台线程加载完所有图片（测试和基准用）"""
+        thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
@@ -0,0 +1,230 @@
+# -*- coding: utf-8 -*-
+"""
+批量贪吃蛇模拟：用 NumPy 数组让 N 个互不相关的单人棋盘同步推进
+规则与 world.SnakeWorld 相同（穿墙、撞自己、撞障碍物、吃食物、食物等级权重），
+用于平衡性调参等需要成百万局游戏的场景；单局 Python 对象的路径跑不了这么多。
+"""
+from collections import namedtuple
+from .core_constants import GRID_WIDTH, GRID_HEIGHT, OBSTACLE_COUNT
+from .world import FOOD_SCORES, FOOD_LEVEL_WEIGHTS
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# 动作编号对应的方向，-1 表示本帧没有输入
+DIRECTIONS = ((0, -1), (0, 1), (-1, 0), (1, 0))  # 上、下、左、右
+NO_ACTION = -1
+
+# 结束原因编号
+DEATH_NONE = 0
+DEATH_SELF = 1
+DEATH_WALL = 2
+DEATH_BOARD_FULL = 3
+
+# step 的返回值，每个字段都是长度为 N 的数组：
+# eaten 为本帧吃到的食物等级（0 表示没吃到），done 表示本帧结束的棋盘，
+# death 为结束原因编号，score / length 为本帧结束时的分数和长度（自动重开之前的值）
+BatchStepResult = namedtuple('BatchStepResult', ['eaten', 'done', 'death', 'score', 'length'])
+
+class BatchSnakeWorld:
+    """
+    N 个棋盘的批量模拟
+    占用表为 (N, H, W) 的蛇身计数数组，障碍物为同形状的布尔数组；
+    蛇头和方向为 (N, 2)；每个棋盘的蛇身存放在容量为 H*W+1 的环形缓冲区中。
+    auto_reset 为 True 时，结束的棋盘在 step 返回前自动开始新的一局。
+    """
+
+    def __init__(self, num_envs, seed=None, width=GRID_WIDTH, height=GRID_HEIGHT,
+                 obstacle_count=OBSTACLE_COUNT, level_weights=None, allow_cross_self=False, auto_reset=True):
+        if np is None:
+            raise ImportError("BatchSnakeWorld 需要安装 numpy")
+        self.num_envs = num_envs
+        self.width = width
+        self.height = height
+        self.obstacle_count = obstacle_count
+        self.allow_cross_self = allow_cross_self
+        self.auto_reset = auto_reset
+        self.rng = np.random.default_rng(seed)
+        self._set_level_weights(level_weights or FOOD_LEVEL_WEIGHTS)
+
+        n = num_envs
+        self.capacity = width * height + 1  # 移动时先加蛇头再去蛇尾，需要多一格
+        self.occupancy = np.zeros((n, height, width), dtype=np.int16)
+        self.obstacles = np.zeros((n, height, width), dtype=bool)
+        self.body = np.zeros((n, self.capacity, 2), dtype=np.int16)
+        self.head_index = np.zeros(n, dtype=np.int32)  # 蛇头在环形缓冲区中的下标
+        self.body_len = np.zeros(n, dtype=np.int32)    # 当前蛇身节数
+        self.length = np.zeros(n, dtype=np.int32)      # 目标长度（吃到食物后加一）
+        self.heads = np.zeros((n, 2), dtype=np.int32)
+        self.directions = np.zeros((n, 2), dtype=np.int32)
+        self.scores = np.zeros(n, dtype=np.int32)
+        self.food = np.zeros((n, 2), dtype=np.int32)
+        self.food_level = np.zeros(n, dtype=np.int8)
+        self.done = np.zeros(n, dtype=bool)
+        self.ticks = np.zeros(n, dtype=np.int64)
+        self.games_finished = 0
+
+        self._env_ids = np.arange(n)
+        self._directions = np.array(DIRECTIONS, dtype=np.int32)
+        self._food_scores = np.array([0] + [FOOD_SCORES[level] for level in (1, 2, 3)], dtype=np.int32)
+        self._board_size = np.array([width, height], dtype=np.int32)
+        self.reset()
+
+    def _set_level_weights(self, level_weights):
+        """把等级权重表转换成 (分数上限数组, 每档的累计概率) 便于向量化抽样"""
+        limits = []
+        cumulative = []
+        for max_score, levels, weights in level_weights:
+            probs = np.zeros(3)
+            for level, weight in zip(levels, weights):
+                probs[level - 1] += weight
+            cumulative.append(np.cumsum(probs / probs.sum()))
+            if max_score is None:
+                break
+            limits.append(max_score)
+        self._level_limits = np.array(limits, dtype=np.int64)
+        self._level_cumulative = np.array(cumulative)
+        self._level_cumulative[:, -1] = 1.0  # 避免浮点累加误差抽出不存在的等级
+
+    def reset(self, env_ids=None):
+        """重新开始指定棋盘（默认全部）"""
+        ids = self._env_ids if env_ids is None else np.asarray(env_ids)
+        if len(ids) == 0:
+            return
+        start = (self.width // 2, self.height // 2)
+        self.occupancy[ids] = 0
+        self.obstacles[ids] = False
+        self.head_index[ids] = 0
+        self.body[ids, 0] = start
+        self.body_len[ids] = 1
+        self.length[ids] = 1
+        self.heads[ids] = start
+        self.directions[ids] = (1, 0)
+        self.scores[ids] = 0
+        self.done[ids] = False
+        self.ticks[ids] = 0
+        self.occupancy[ids, start[1], start[0]] = 1
+        self._generate_obstacles(ids)
+        self._spawn_food(ids)
+
+    def _generate_obstacles(self, ids):
+        """与 world.generate_obstacles 相同的拒绝采样，每轮为所有未放满的棋盘各尝试一次"""
+        placed = np.zeros(len(ids), dtype=np.int32)
+        head_x, head_y = self.width // 2, self.height // 2
+        dy, dx = np.mgrid[-1:2, -1:2]
+        dy, dx = dy.ravel(), dx.ravel()
+        for _ in range(200):
+            pending = placed < self.obstacle_count
+            if not pending.any():
+                break
+            rows = np.nonzero(pending)[0]
+            env = ids[rows]
+            x = self.rng.integers(1, self.width - 1, len(rows))
+            y = self.rng.integers(1, self.height - 1, len(rows))
+            # 避开蛇头周围 5x5，以及与已有障碍物重叠或相邻的位置
+            ok = (np.abs(x - head_x) > 2) | (np.abs(y - head_y) > 2)
+            ok &= ~self.obstacles[env[:, None], y[:, None] + dy, x[:, None] + dx].any(axis=1)
+            self.obstacles[env[ok], y[ok], x[ok]] = True
+            placed[rows[ok]] += 1
+
+    def _spawn_food(self, ids):
+        """
+        为指定棋盘各放一个食物，返回没有空位（棋盘已满）的布尔数组
+        每个空格子取一个随机数，取最大者即为均匀抽样；蛇头3x3内的格子减1，只在别无空位时才会被选中。
+        """
+        free = (self.occupancy[ids] == 0) & ~self.obstacles[ids]
+        keys = self.rng.random(free.shape)
+        ys, xs = np.mgrid[0:self.height, 0:self.width]
+        near_head = ((np.abs(xs[None] - self.heads[ids, 0, None, None]) <= 1)
+                     & (np.abs(ys[None] - self.heads[ids, 1, None, None]) <= 1))
+        keys -= near_head
+        keys[~free] = -2.0
+        flat = keys.reshape(len(ids), -1).argmax(axis=1)
+        full = ~free.reshape(len(ids), -1).any(axis=1)
+        self.food[ids, 0] = flat % self.width
+        self.food[ids, 1] = flat // self.width
+        self.food_level[ids] = self._choose_levels(self.scores[ids])
+        self.food_level[ids[full]] = 0
+        return full
+
+    def _choose_levels(self, scores):
+        """按分数段权重为每个棋盘抽取食物等级"""
+        tier = np.searchsorted(self._level_limits, scores, side='right')
+        u = self.rng.random(len(scores))
+        return 1 + (u[:, None] >= self._level_cumulative[tier]).sum(axis=1)
+
+    def step(self, actions=None):
+        """
+        所有未结束的棋盘同步推进一帧
+        actions 为长度 N 的动作编号数组（DIRECTIONS 的下标，NO_ACTION 表示不转向），None 表示都不转向
+        """
+        n = self.num_envs
+        active = ~self.done
+        body_len_before = self.body_len.copy()
+
+        # 转向：与 SnakeState.change_direction 一样禁止180度掉头（只有一节时除外）
+        if actions is not None:
+            actions = np.asarray(actions)
+            turning = active & (actions >= 0)
+            new_dirs = self._directions[np.clip(actions, 0, 3)]
+            reverse = (new_dirs == -self.directions).all(axis=1) & (body_len_before > 1)
+            turning &= ~reverse
+            self.directions[turning] = new_dirs[turning]
+
+        # 计算新蛇头位置（穿墙）
+        new_heads = (self.heads + self.directions) % self._board_size
+        nx, ny = new_heads[:, 0], new_heads[:, 1]
+        death = np.zeros(n, dtype=np.int8)
+
+        # 撞自己：新位置上有蛇身（不含当前蛇头）
+        if not self.allow_cross_self:
+            count = self.occupancy[self._env_ids, ny, nx] - (new_heads == self.heads).all(axis=1)
+            hit_self = active & (body_len_before > 2) & (count > 0)
+            death[hit_self] = DEATH_SELF
+        moving = active & (death == 0)
+        ids = np.nonzero(moving)[0]
+
+        # 蛇头入队
+        self.head_index[ids] = (self.head_index[ids] + 1) % self.capacity
+        self.body[ids, self.head_index[ids]] = new_heads[ids]
+        self.occupancy[ids, ny[ids], nx[ids]] += 1
+        self.body_len[ids] += 1
+        self.heads[ids] = new_heads[ids]
+        self.ticks[ids] += 1
+
+        # 超出长度的蛇尾出队
+        pop = ids[self.body_len[ids] > self.length[ids]]
+        tail_index = (self.head_index[pop] - self.body_len[pop] + 1) % self.capacity
+        tails = self.body[pop, tail_index]
+        self.occupancy[pop, tails[:, 1], tails[:, 0]] -= 1
+        self.body_len[pop] -= 1
+
+        # 吃食物：长度加一、加分并重新放置食物
+        eaten = np.zeros(n, dtype=np.int8)
+        ate = ids[(new_heads[ids] == self.food[ids]).all(axis=1) & (self.food_level[ids] > 0)]
+        eaten[ate] = self.food_level[ate]
+        self.length[ate] += 1
+        self.scores[ate] += self._food_scores[self.food_level[ate]]
+        if len(ate):
+            full = self._spawn_food(ate)
+            death[ate[full]] = DEATH_BOARD_FULL
+
+        # 撞障碍物
+        hit_wall = moving & (death == 0) & self.obstacles[self._env_ids, ny, nx]
+        death[hit_wall] = DEATH_WALL
+
+        done = death != 0
+        self.done |= done
+        result = BatchStepResult(eaten, done, death, self.scores.copy(), self.length.copy())
+        finished = np.nonzero(done)[0]
+        self.games_finished += len(finished)
+        if self.auto_reset:
+            self.reset(finished)
+        return result
+
+    def snake_positions(self, env_id):
+        """第 env_id 个棋盘的蛇身坐标列表（蛇头在前），用于调试或绘制"""
+        indices = (self.head_index[env_id] - np.arange(self.body_len[env_id])) % self.capacity
+        return [tuple(int(v) for v in cell) for cell in self.body[env_id, indices]]
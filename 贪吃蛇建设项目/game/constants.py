@@ -6,24 +6,19 @@ import os
 # 仅初始化字体模块，避免在导入常量时初始化所有子系统
 pygame.font.init() # 初始化字体模块
 
-def get_resource_path(relative_path):
-    """
-    获取资源文件的绝对路径
-    在开发环境中直接返回相对路径
-    在PyInstaller打包后返回资源文件的真实路径
-    """
-    if hasattr(sys, '_MEIPASS'):
-        # PyInstaller打包后的路径
-        return os.path.join(sys._MEIPASS, relative_path)
-    else:
-        # 开发环境中的路径
-        return os.path.join(os.path.abspath('.'), relative_path)
+# 资源路径、网格尺寸、模拟核心和存档设置放在不依赖 pygame 的 core_constants 中，这里一并导出
+from .core_constants import (
+    get_resource_path, GRID_SIZE, WINDOW_WIDTH, WINDOW_HEIGHT, GRID_WIDTH, GRID_HEIGHT,
+    SNAKE_SPEED, ARENA_TICK_RATE, OBSTACLE_COUNT, OBSTACLE_SAFE_DISTANCE, FOOD_SAMPLE_ATTEMPTS,
+    PLAYER_SAVE_INTERVAL, PLAYER_DATA_BACKEND,
+)
 
 # 窗口设置
-GRID_SIZE = 30
-WINDOW_WIDTH = GRID_SIZE * 40  # 40个格子
-WINDOW_HEIGHT = GRID_SIZE * 30  # 30个格子
 FPS = 60
+SIM_TICK_RATE = 60  # 界面动画和小游戏的逻辑帧率（它们原来每绘制一帧推进一次，按 60 帧/秒调校）
+MAX_TICKS_PER_FRAME = 5  # 卡顿后单帧最多补几个逻辑帧，超出的时间直接丢弃
+IDLE_FPS = 15  # 静态界面（主菜单、帮助、背包、活动大厅）空闲时的绘制帧率
+IDLE_DELAY = 1500  # 最后一次输入之后保持全帧率的时间（毫秒），让悬停等过渡动画播完
 
 # 颜色定义
 WHITE = (255, 255, 255)
@@ -34,12 +29,7 @@ BLUE = (0, 0, 255)
 GOLD = (255, 215, 0)
 TRANSPARENT = (0, 0, 0, 0)
 
-# 游戏设置
-GRID_WIDTH = WINDOW_WIDTH // GRID_SIZE  # 40个格子
-GRID_HEIGHT = WINDOW_HEIGHT // GRID_SIZE  # 30个格子
-
 # 蛇的设置
-SNAKE_SPEED = 9  # 每秒移动的格子数
 SNAKE_COLOR = (0, 255, 0)
 SNAKE_HEAD_COLOR = (0, 200, 0)
 SNAKE_ANIMATION_SPEED = 0.2  # 蛇身动画速度
@@ -50,8 +40,6 @@ FOOD_ANIMATION_SPEED = 0.3  # 食物动画速度
 
 # 障碍物设置
 OBSTACLE_COLOR = (128, 128, 128)
-OBSTACLE_COUNT = 5
-OBSTACLE_SAFE_DISTANCE = 3  # 障碍物与蛇头和食物的安全距离
 
 # 字体设置
 # 尝试加载中文字体
@@ -61,6 +49,8 @@ if not FONT_NAME:
     print("警告：未找到支持中文的字体（SimHei或Microsoft YaHei），中文显示可能不正常。")
 FONT_SIZE = 32
 SCORE_FONT_SIZE = 24
+TEXT_CACHE_SIZE = 512  # 文字渲染缓存最多保留的 Surface 数量
+SPRITE_CACHE_SIZE = 256  # 泡泡、发光、阴影等精灵缓存最多保留的 Surface 数量
 TITLE_FONT_SIZE = 48
 
 # 按钮设置
@@ -84,6 +74,17 @@ SNOW_PARTICLE_SIZE = 2
 TITLE_FLOAT_AMPLITUDE = 10
 TITLE_FLOAT_SPEED = 0.5
 
+# 粒子设置：各场景粒子系统的粒子数上限（已满时新粒子被丢弃）
+PARTICLE_BUDGETS = {
+    'menu_snow': SNOW_PARTICLE_COUNT,
+    'sokoban_snow': 50,
+    '2048': 30,
+    'pong': 200,
+    'piano': 300,
+}
+PARTICLE_STAMP_LIMIT = 256  # 粒子贴图数达到这个数量时丢弃没有粒子使用的贴图（随机颜色的粒子不会让贴图无限增长）
+BUBBLE_ALPHA_STEP = 10  # 主菜单泡泡的透明度按这个步长分档，同一档共用一张预先画好的泡泡图
+
 # 菜单设置
 MENU_TITLE_COLOR = (255, 255, 255)
 MENU_TITLE_SHADOW_COLOR = (100, 100, 100)
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+不依赖 pygame 的常量：资源路径、网格尺寸、模拟核心和存档的设置
+world、occupancy、batch_world、arena、autopilot、replay、player 只从这里导入常量，
+没有安装 pygame（或没有窗口、没有 pywin32）时也能导入，用于无界面模拟和基准测试。
+constants 模块会重新导出这里的全部名字，界面代码继续从 constants 导入即可。
+"""
+import sys
+import os
+
+def get_resource_path(relative_path):
+    """
+    获取资源文件的绝对路径
+    在开发环境中直接返回相对路径
+    在PyInstaller打包后返回资源文件的真实路径
+    """
+    if hasattr(sys, '_MEIPASS'):
+        # PyInstaller打包后的路径
+        return os.path.join(sys._MEIPASS, relative_path)
+    else:
+        # 开发环境中的路径
+        return os.path.join(os.path.abspath('.'), relative_path)
+
+# 窗口与网格设置
+GRID_SIZE = 30
+WINDOW_WIDTH = GRID_SIZE * 40  # 40个格子
+WINDOW_HEIGHT = GRID_SIZE * 30  # 30个格子
+GRID_WIDTH = WINDOW_WIDTH // GRID_SIZE  # 40个格子
+GRID_HEIGHT = WINDOW_HEIGHT // GRID_SIZE  # 30个格子
+
+# 蛇的设置
+SNAKE_SPEED = 9  # 每秒移动的格子数
+
+# 竞技场（多蛇模式）设置
+ARENA_TICK_RATE = 10  # 每秒逻辑帧数，与绘制帧率无关
+
+# 障碍物与食物设置
+OBSTACLE_COUNT = 5
+OBSTACLE_SAFE_DISTANCE = 3  # 障碍物与蛇头和食物的安全距离
+FOOD_SAMPLE_ATTEMPTS = 8  # 生成食物时避开蛇头的最大取样次数
+
+# 存档设置
+PLAYER_SAVE_INTERVAL = 2.0  # 玩家数据后台合并写盘的间隔（秒）
+PLAYER_DATA_BACKEND = "json"  # 存档后端："json" 或 "sqlite"（首次使用时自动导入 JSON 存档）
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+"""
+脏矩形绘制（可选，启动参数 --dirty-rects）
+静态背景（底色 + 网格）每局只合成一次；每帧先用背景盖掉上一帧画过的矩形，
+再绘制会动的元素（障碍物光晕、食物、蛇、分数面板）并记录它们碰到的矩形，
+最后用 pygame.display.update(rects) 只提交这两帧涉及的区域，而不是整屏 flip。
+软件渲染的窗口下，每帧拷贝的像素量大约只有整屏重画的十分之一。
+"""
+import pygame
+
+class DirtyRectRenderer:
+    """记录并恢复每帧的脏矩形"""
+
+    def __init__(self, screen):
+        self.screen = screen
+        self.background = None
+        self.previous = []  # 上一帧画过的矩形，本帧要先用背景盖掉
+        self.current = []
+        self.full_redraw = True
+
+    def set_background(self, background):
+        """设置静态背景（新的一局开始时调用），下一帧整屏重画"""
+        if pygame.display.get_surface():
+            background = background.convert()
+        self.background = background
+        self.invalidate()
+
+    def invalidate(self):
+        """下一帧整屏重画（切换场景、背景变化时调用）"""
+        self.full_redraw = True
+
+    def begin(self):
+        """开始新的一帧：恢复上一帧画过的区域，返回用来记录本帧脏矩形的列表"""
+        if self.full_redraw:
+            self.screen.blit(self.background, (0, 0))
+        else:
+            for rect in self.previous:
+                self.screen.blit(self.background, rect, rect)
+        self.current = []
+        return self.current
+
+    def present(self):
+        """提交本帧：整屏重画时 flip，否则只更新上一帧和本帧的脏矩形"""
+        if self.full_redraw:
+            pygame.display.flip()
+            self.full_redraw = False
+        else:
+            pygame.display.update(self.previous + self.current)
+        self.previous = self.current
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""
+全局字体注册表和文字渲染缓存
+- get_font / get_sysfont：按 (字体, 字号, 粗体, 斜体) 共用 Font 对象，draw() 里每帧取字体不再重新解析字体文件。
+  返回的字体是共享的，不要再调用 set_bold 等方法修改样式，需要粗体时传 bold=True。
+- render_text：参数与 Font.render 相同，按 (字体, 文字, 抗锯齿, 颜色, 背景色) 缓存渲染结果（LRU），
+  不变的文字不再每帧重新光栅化。返回的 Surface 也是共享的，需要 set_alpha 或在上面绘制时直接用 Font.render。
+"""
+from collections import OrderedDict
+import pygame
+from .constants import FONT_NAME, FONT_SIZE, TEXT_CACHE_SIZE
+
+_fonts = {}
+
+def get_font(name=FONT_NAME, size=FONT_SIZE, bold=False, italic=False):
+    """取得字体文件 name 的 size 号字体（同样的参数总是返回同一个对象）"""
+    key = ('file', name, size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.Font(name, size)
+        if bold:
+            font.set_bold(True)
+        if italic:
+            font.set_italic(True)
+        _fonts[key] = font
+    return font
+
+def get_sysfont(name, size, bold=False, italic=False):
+    """取得系统字体 name 的 size 号字体（同样的参数总是返回同一个对象）"""
+    key = ('sys', name, size, bold, italic)
+    font = _fonts.get(key)
+    if font is None:
+        font = pygame.font.SysFont(name, size, bold, italic)
+        _fonts[key] = font
+    return font
+
+class TextCache:
+    """渲染好的文字 Surface 的 LRU 缓存"""
+
+    def __init__(self, max_size=TEXT_CACHE_SIZE):
+        self.max_size = max_size
+        self._surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font, text, antialias, color, background=None):
+        key = (font, text, antialias, tuple(color), None if background is None else tuple(background))
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        if background is None:
+            surface = font.render(text, antialias, color)
+        else:
+            surface = font.render(text, antialias, color, background)
+        self._surfaces[key] = surface
+        if len(self._surfaces) > self.max_size:
+            self._surfaces.popitem(last=False)
+        return surface
+
+    def clear(self):
+        self._surfaces.clear()
+
+text_cache = TextCache()
+
+def render_text(font, text, antialias, color, background=None):
+    """带缓存的 font.render(text, antialias, color, background)"""
+    return text_cache.render(font, text, antialias, color, background)
@@ -3,22 +3,27 @@ import pygame
 import random
 import math
 from .constants import *
+from .fonts import get_font, render_text
+from .world import FoodState
+from .game_loop import AnimationClock
 
-class Food:
+class Food(FoodState):
+    """
+    可绘制的食物：等级、分数和位置来自 FoodState，由 SnakeWorld / ArenaWorld 生成时设置，
+    这里只负责外观和动画
+    """
     def __init__(self, level=1):
-        self.level = level
-        self.position = (0, 0)
+        super().__init__(level)
         self.animation_time = random.uniform(0, 2 * math.pi)
         self.pulse_time = 0
+        self.anim_clock = AnimationClock()
         self.set_properties_by_level()
-        self.randomize_position()
 
     def set_properties_by_level(self):
         if self.level == 1:
             # 等级1：基础食物 - 红色苹果
             self.color = (255, 50, 50)  # 鲜艳的红色
             self.glow_color = (255, 100, 100)  # 发光颜色
-            self.score = 1
             self.size_multiplier = 0.8  # 较小尺寸
             self.animation_speed = 0.2  # 较慢动画
             self.shape = "circle"
@@ -26,7 +31,6 @@ class Food:
             # 等级2：高级食物 - 金色钻石
             self.color = (255, 215, 0)  # 金色
             self.glow_color = (255, 255, 100)  # 黄色发光
-            self.score = 3
             self.size_multiplier = 1.0  # 标准尺寸
             self.animation_speed = 0.4  # 中等动画速度
             self.shape = "diamond"
@@ -34,44 +38,18 @@ class Food:
             # 等级3：稀有食物 - 紫色星星
             self.color = (138, 43, 226)  # 紫色
             self.glow_color = (255, 100, 255)  # 粉色发光
-            self.score = 5
             self.size_multiplier = 1.2  # 较大尺寸
             self.animation_speed = 0.6  # 快速动画
             self.shape = "star"
 
-    def randomize_position(self, snake_positions=None, obstacles=None):
-        if snake_positions is None:
-            snake_positions = []
-        if obstacles is None:
-            obstacles = []
-            
-        while True:
-            self.position = (random.randint(0, GRID_WIDTH-1),
-                           random.randint(0, GRID_HEIGHT-1))
-            
-            # 检查是否与蛇身重叠
-            if self.position in snake_positions:
-                continue
-                
-            # 检查是否与障碍物重叠
-            if self.position in obstacles:
-                continue
-                
-            # 检查是否在蛇头3x3范围内
-            if snake_positions:
-                head_x, head_y = snake_positions[0]
-                if (abs(self.position[0] - head_x) <= 1 and 
-                    abs(self.position[1] - head_y) <= 1):
-                    continue
-                    
-            break
-
     def update(self, current_time):
-        # 更新动画时间
-        self.animation_time = (self.animation_time + self.animation_speed) % (2 * math.pi)
-        self.pulse_time = (self.pulse_time + 0.1) % (2 * math.pi)
+        # 更新动画时间（按经过的时间推进，与帧率无关）
+        frames = self.anim_clock.frames(current_time)
+        self.animation_time = (self.animation_time + self.animation_speed * frames) % (2 * math.pi)
+        self.pulse_time = (self.pulse_time + 0.1 * frames) % (2 * math.pi)
 
-    def draw(self, surface):
+    def draw(self, surface, dirty=None):
+        """传入 dirty 列表时追加本次画过的矩形（脏矩形绘制用）"""
         # 计算动画偏移
         scale = 1 + 0.15 * math.sin(self.animation_time)  # 缩放动画
         rotation = 20 * math.sin(self.animation_time * 2)  # 旋转动画
@@ -108,13 +86,15 @@ class Food:
         draw_y = pos_y + (GRID_SIZE - rotated_surface.get_height()) // 2
         
         # 绘制发光效果
-        self.draw_glow_effect(surface, pos_x, pos_y)
+        glow_rect = self.draw_glow_effect(surface, pos_x, pos_y)
         
         # 绘制到主表面
-        surface.blit(rotated_surface, (draw_x, draw_y))
+        food_rect = surface.blit(rotated_surface, (draw_x, draw_y))
         
         # 绘制等级指示器
-        self.draw_level_indicator(surface, pos_x, pos_y)
+        indicator_rect = self.draw_level_indicator(surface, pos_x, pos_y)
+        if dirty is not None:
+            dirty.append(glow_rect.union(food_rect).union(indicator_rect))
 
     def draw_circle_food(self, surface, size, offset):
         """绘制圆形食物（等级1）"""
@@ -192,13 +172,13 @@ class Food:
         
         glow_x = pos_x + (GRID_SIZE - glow_size) // 2
         glow_y = pos_y + (GRID_SIZE - glow_size) // 2
-        surface.blit(glow_surface, (glow_x, glow_y))
+        return surface.blit(glow_surface, (glow_x, glow_y))
 
     def draw_level_indicator(self, surface, pos_x, pos_y):
         """绘制等级指示器"""
         # 在食物上方显示等级数字
-        font = pygame.font.Font(FONT_NAME, 12)
-        level_text = font.render(str(self.level), True, WHITE)
+        font = get_font(FONT_NAME, 12)
+        level_text = render_text(font, str(self.level), True, WHITE)
         text_rect = level_text.get_rect(center=(pos_x + GRID_SIZE // 2, pos_y - 5))
         
         # 添加背景
@@ -207,6 +187,7 @@ class Food:
         pygame.draw.rect(surface, self.color, bg_rect, 1, border_radius=3)
         
         surface.blit(level_text, text_rect)
+        return bg_rect
 
     def get_star_points(self, cx, cy, num_points, outer_radius, inner_radius):
         """生成星形点"""
@@ -3,6 +3,9 @@ import random
 import time
 import math
 from .constants import *
+from .fonts import get_font, render_text
+from . import layers
+from .particles import ParticleSystem
 
 class Game2048:
     def __init__(self, surface):
@@ -65,13 +68,13 @@ class Game2048:
         }
         
         # 字体
-        self.font_large = pygame.font.Font(FONT_NAME, 56)
-        self.font_medium = pygame.font.Font(FONT_NAME, 36)
-        self.font_small = pygame.font.Font(FONT_NAME, 28)
-        self.font_tiny = pygame.font.Font(FONT_NAME, 20)
+        self.font_large = get_font(FONT_NAME, 56)
+        self.font_medium = get_font(FONT_NAME, 36)
+        self.font_small = get_font(FONT_NAME, 28)
+        self.font_tiny = get_font(FONT_NAME, 20)
         
         # 背景粒子效果
-        self.particles = []
+        self.particles = ParticleSystem(PARTICLE_BUDGETS['2048'], edge='bounce')
         self.init_particles()
         
         # 初始化游戏
@@ -80,32 +83,24 @@ class Game2048:
         
     def init_particles(self):
         """初始化背景粒子"""
-        for _ in range(30):  # 减少粒子数量以提高性能
-            self.particles.append({
-                'x': random.randint(0, WINDOW_WIDTH),
-                'y': random.randint(0, WINDOW_HEIGHT),
-                'vx': random.uniform(-0.3, 0.3),  # 降低速度
-                'vy': random.uniform(-0.3, 0.3),
-                'size': random.randint(2, 4),  # 减小粒子大小
-                'alpha': random.randint(20, 60)  # 降低透明度
-            })
+        for _ in range(PARTICLE_BUDGETS['2048']):  # 减少粒子数量以提高性能
+            self.particles.emit(
+                random.randint(0, WINDOW_WIDTH),
+                random.randint(0, WINDOW_HEIGHT),
+                random.uniform(-0.3, 0.3),  # 降低速度
+                random.uniform(-0.3, 0.3),
+                radius=random.randint(2, 4) // 2,  # 减小粒子大小
+                color=(255, 255, 255, random.randint(20, 60))  # 降低透明度
+            )
     
     def update_particles(self):
-        """更新背景粒子"""
-        for particle in self.particles:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            
-            # 边界反弹
-            if particle['x'] <= 0 or particle['x'] >= WINDOW_WIDTH:
-                particle['vx'] *= -1
-            if particle['y'] <= 0 or particle['y'] >= WINDOW_HEIGHT:
-                particle['vy'] *= -1
-            
-            # 确保粒子在屏幕内
-            particle['x'] = max(0, min(WINDOW_WIDTH, particle['x']))
-            particle['y'] = max(0, min(WINDOW_HEIGHT, particle['y']))
+        """更新背景粒子（在屏幕边界反弹）"""
+        self.particles.update()
         
+    def update(self):
+        """推进一个逻辑帧（SIM_TICK_RATE 帧/秒）"""
+        self.update_particles()
+
     def add_random_tile(self):
         """在随机空位置添加一个数字（2或4）"""
         empty_cells = []
@@ -367,16 +362,10 @@ class Game2048:
                 if not self.can_move():
                     self.game_state = "game_over"
     
-    def draw_background(self):
-        """绘制优化的渐变背景"""
+    def draw_static_background(self, surface):
+        """绘制不会动的背景（渐变 + 径向光晕），由 layers 缓存"""
         # 创建更美观的渐变背景 - 从温暖的米色到浅蓝
-        for y in range(WINDOW_HEIGHT):
-            # 从温暖的米色到浅蓝的渐变
-            ratio = y / WINDOW_HEIGHT
-            r = int(250 + (240 - 250) * ratio)
-            g = int(245 + (248 - 245) * ratio)
-            b = int(240 + (255 - 240) * ratio)
-            pygame.draw.line(self.surface, (r, g, b), (0, y), (WINDOW_WIDTH, y))
+        surface.blit(layers.gradient((WINDOW_WIDTH, WINDOW_HEIGHT), [(250, 245, 240), (240, 248, 255)]), (0, 0))
         
         # 添加径向渐变效果 - 优化性能
         center_x, center_y = WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2
@@ -390,15 +379,14 @@ class Game2048:
                 if alpha > 0:
                     overlay_surface = pygame.Surface((8, 8), pygame.SRCALPHA)
                     overlay_surface.fill((255, 255, 255, alpha))
-                    self.surface.blit(overlay_surface, (x, y))
+                    surface.blit(overlay_surface, (x, y))
+
+    def draw_background(self):
+        """绘制优化的渐变背景"""
+        self.surface.blit(layers.get_layer('2048', (WINDOW_WIDTH, WINDOW_HEIGHT), self.draw_static_background), (0, 0))
         
-        # 绘制背景粒子
-        self.update_particles()
-        for particle in self.particles:
-            particle_surface = pygame.Surface((particle['size'], particle['size']), pygame.SRCALPHA)
-            pygame.draw.circle(particle_surface, (255, 255, 255, particle['alpha']), 
-                             (particle['size']//2, particle['size']//2), particle['size']//2)
-            self.surface.blit(particle_surface, (particle['x'], particle['y']))
+        # 绘制背景粒子（移动在 update 中按固定帧率推进）
+        self.particles.draw(self.surface)
     
     def draw_grid(self):
         """绘制优化的游戏网格"""
@@ -463,7 +451,7 @@ class Game2048:
                     else:
                         text_color = (249, 246, 242)
                     
-                    text = font.render(str(value), True, text_color)
+                    text = render_text(font, str(value), True, text_color)
                     text_rect = text.get_rect(center=cell_rect.center)
                     self.surface.blit(text, text_rect)
         
@@ -507,7 +495,7 @@ class Game2048:
                 else:
                     text_color = (249, 246, 242, anim['alpha'])
                 
-                text = font.render(str(anim['value']), True, text_color)
+                text = render_text(font, str(anim['value']), True, text_color)
                 text_rect = text.get_rect(center=(scaled_size//2, scaled_size//2))
                 anim_surface.blit(text, text_rect)
                 
@@ -547,7 +535,7 @@ class Game2048:
                 else:
                     text_color = (249, 246, 242, anim['alpha'])
                 
-                text = font.render(str(anim['value']), True, text_color)
+                text = render_text(font, str(anim['value']), True, text_color)
                 text_rect = text.get_rect(center=(scaled_size//2, scaled_size//2))
                 anim_surface.blit(text, text_rect)
                 
@@ -577,11 +565,11 @@ class Game2048:
         self.surface.blit(highlight_surface, highlight_rect)
         
         # 标题文字阴影
-        title_shadow = self.font_large.render("2048", True, (0, 0, 0, 60))
+        title_shadow = render_text(self.font_large, "2048", True, (0, 0, 0, 60))
         title_shadow_rect = title_shadow.get_rect(center=(WINDOW_WIDTH // 2 + 2, 72))
         self.surface.blit(title_shadow, title_shadow_rect)
         
-        title_text = self.font_large.render("2048", True, (119, 110, 101))
+        title_text = render_text(self.font_large, "2048", True, (119, 110, 101))
         title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, 70))
         self.surface.blit(title_text, title_rect)
         
@@ -610,11 +598,11 @@ class Game2048:
         pygame.draw.rect(score_highlight_surface, (255, 255, 255, 40), (0, 0, score_highlight_rect.width, score_highlight_rect.height), border_radius=13)
         self.surface.blit(score_highlight_surface, score_highlight_rect)
         
-        score_label = self.font_tiny.render("分数", True, (119, 110, 101))
+        score_label = render_text(self.font_tiny, "分数", True, (119, 110, 101))
         score_label_rect = score_label.get_rect(center=(score_panel_x + score_panel_width // 2, score_panel_y + 12))
         self.surface.blit(score_label, score_label_rect)
         
-        score_value = self.font_medium.render(str(self.score), True, (119, 110, 101))
+        score_value = render_text(self.font_medium, str(self.score), True, (119, 110, 101))
         score_value_rect = score_value.get_rect(center=(score_panel_x + score_panel_width // 2, score_panel_y + 35))
         self.surface.blit(score_value, score_value_rect)
         
@@ -637,11 +625,11 @@ class Game2048:
         pygame.draw.rect(best_highlight_surface, (255, 255, 255, 40), (0, 0, best_highlight_rect.width, best_highlight_rect.height), border_radius=13)
         self.surface.blit(best_highlight_surface, best_highlight_rect)
         
-        best_score_label = self.font_tiny.render("最高分", True, (119, 110, 101))
+        best_score_label = render_text(self.font_tiny, "最高分", True, (119, 110, 101))
         best_score_label_rect = best_score_label.get_rect(center=(best_score_rect.centerx, best_score_rect.centery - 12))
         self.surface.blit(best_score_label, best_score_label_rect)
         
-        best_score_value = self.font_medium.render(str(self.best_score), True, (119, 110, 101))
+        best_score_value = render_text(self.font_medium, str(self.best_score), True, (119, 110, 101))
         best_score_value_rect = best_score_value.get_rect(center=(best_score_rect.centerx, best_score_rect.centery + 8))
         self.surface.blit(best_score_value, best_score_value_rect)
         
@@ -664,11 +652,11 @@ class Game2048:
         pygame.draw.rect(moves_highlight_surface, (255, 255, 255, 40), (0, 0, moves_highlight_rect.width, moves_highlight_rect.height), border_radius=13)
         self.surface.blit(moves_highlight_surface, moves_highlight_rect)
         
-        moves_label = self.font_tiny.render("移动", True, (119, 110, 101))
+        moves_label = render_text(self.font_tiny, "移动", True, (119, 110, 101))
         moves_label_rect = moves_label.get_rect(center=(moves_rect.centerx, moves_rect.centery - 12))
         self.surface.blit(moves_label, moves_label_rect)
         
-        moves_value = self.font_medium.render(str(self.moves), True, (119, 110, 101))
+        moves_value = render_text(self.font_medium, str(self.moves), True, (119, 110, 101))
         moves_value_rect = moves_value.get_rect(center=(moves_rect.centerx, moves_rect.centery + 8))
         self.surface.blit(moves_value, moves_value_rect)
         
@@ -691,7 +679,7 @@ class Game2048:
         pygame.draw.rect(back_highlight_surface, (255, 255, 255, 40), (0, 0, back_highlight_rect.width, back_highlight_rect.height), border_radius=8)
         self.surface.blit(back_highlight_surface, back_highlight_rect)
         
-        back_text = self.font_small.render("返回", True, (119, 110, 101))
+        back_text = render_text(self.font_small, "返回", True, (119, 110, 101))
         back_rect = back_text.get_rect(center=(back_button_rect.centerx, back_button_rect.centery))
         self.surface.blit(back_text, back_rect)
     
@@ -725,19 +713,19 @@ class Game2048:
                            (win_panel.centerx - 3, win_panel.y + 42),
                            (win_panel.centerx + 12, win_panel.y + 28)], 0)
         
-        win_text = self.font_large.render("恭喜获胜！", True, (255, 255, 255))
+        win_text = render_text(self.font_large, "恭喜获胜！", True, (255, 255, 255))
         win_rect = win_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 30))
         self.surface.blit(win_text, win_rect)
         
-        continue_text = self.font_medium.render("按C继续游戏", True, (255, 255, 255))
+        continue_text = render_text(self.font_medium, "按C继续游戏", True, (255, 255, 255))
         continue_rect = continue_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 15))
         self.surface.blit(continue_text, continue_rect)
         
-        restart_text = self.font_medium.render("按R重新开始", True, (255, 255, 255))
+        restart_text = render_text(self.font_medium, "按R重新开始", True, (255, 255, 255))
         restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 50))
         self.surface.blit(restart_text, restart_rect)
         
-        exit_text = self.font_medium.render("按ESC退出", True, (255, 255, 255))
+        exit_text = render_text(self.font_medium, "按ESC退出", True, (255, 255, 255))
         exit_rect = exit_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 85))
         self.surface.blit(exit_text, exit_rect)
     
@@ -773,19 +761,19 @@ class Game2048:
                         (icon_rect.centerx + 15, icon_rect.centery - 15),
                         (icon_rect.centerx - 15, icon_rect.centery + 15), 3)
         
-        game_over_text = self.font_large.render("游戏结束", True, (255, 255, 255))
+        game_over_text = render_text(self.font_large, "游戏结束", True, (255, 255, 255))
         game_over_rect = game_over_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 30))
         self.surface.blit(game_over_text, game_over_rect)
         
-        final_score_text = self.font_medium.render(f"最终分数: {self.score}", True, (255, 255, 255))
+        final_score_text = render_text(self.font_medium, f"最终分数: {self.score}", True, (255, 255, 255))
         final_score_rect = final_score_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 15))
         self.surface.blit(final_score_text, final_score_rect)
         
-        restart_text = self.font_medium.render("按R重新开始", True, (255, 255, 255))
+        restart_text = render_text(self.font_medium, "按R重新开始", True, (255, 255, 255))
         restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 50))
         self.surface.blit(restart_text, restart_rect)
         
-        exit_text = self.font_medium.render("按ESC退出", True, (255, 255, 255))
+        exit_text = render_text(self.font_medium, "按ESC退出", True, (255, 255, 255))
         exit_rect = exit_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 85))
         self.surface.blit(exit_text, exit_rect)
     
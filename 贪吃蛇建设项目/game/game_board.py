@@ -3,13 +3,23 @@ import pygame
 import random
 import math
 from .constants import *
+from .occupancy import OccupancyGrid
+from .world import generate_obstacles
+from .game_loop import AnimationClock
 
 class GameBoard:
-    def __init__(self):
+    def __init__(self, grid=None, obstacles=None):
+        # 障碍物与蛇身共用一张占用表，碰撞检测为 O(1)
+        self.grid = grid if grid is not None else OccupancyGrid()
         self.obstacles = []
         self.obstacle_details = [] # 存储(颜色, 动画偏移)
         self.grid_surface = None
-        self.generate_obstacles()
+        self.anim_clock = AnimationClock()
+        if obstacles is None:
+            self.generate_obstacles()
+        else:
+            # 障碍物已由 SnakeWorld 放入占用表，这里只负责绘制
+            self.set_obstacles(obstacles)
         self.create_grid_surface()
 
     def create_grid_surface(self):
@@ -26,14 +36,12 @@ class GameBoard:
             pygame.draw.line(self.grid_surface, grid_color, (0, y), (WINDOW_WIDTH, y))
 
     def generate_obstacles(self, snake_positions=None):
-        if snake_positions is None:
-            snake_positions = []
-            
-        self.obstacles = []
+        self.set_obstacles(generate_obstacles(self.grid, random, snake_positions))
+
+    def set_obstacles(self, obstacles):
+        """使用给定的障碍物坐标（例如 SnakeWorld 生成的），并为每个障碍物生成外观"""
+        self.obstacles = list(obstacles)
         self.obstacle_details = []
-        attempts = 0
-        max_attempts = 200 # 增加尝试次数以确保生成足够数量
-        
         # 定义新的颜色方案（红色/橙色系，更具警示性）
         obstacle_colors = [
             (255, 69, 0),    # OrangeRed
@@ -42,33 +50,7 @@ class GameBoard:
             (178, 34, 34),   # Firebrick
             (255, 0, 0)      # Red
         ]
-        
-        while len(self.obstacles) < OBSTACLE_COUNT and attempts < max_attempts:
-            attempts += 1
-            pos = (random.randint(1, GRID_WIDTH - 2), # 避免在最边缘生成
-                  random.randint(1, GRID_HEIGHT - 2))
-            
-            # 检查是否与蛇身重叠
-            if pos in snake_positions:
-                continue
-                
-            # 检查是否与现有障碍物重叠或太近
-            too_close = False
-            for obs_pos in self.obstacles:
-                if abs(pos[0] - obs_pos[0]) <= 1 and abs(pos[1] - obs_pos[1]) <= 1:
-                    too_close = True
-                    break
-            if too_close:
-                continue
-                    
-            # 检查是否在蛇头3x3范围内
-            if snake_positions:
-                head_x, head_y = snake_positions[0]
-                if (abs(pos[0] - head_x) <= 2 and # 扩大安全区域
-                    abs(pos[1] - head_y) <= 2):
-                    continue
-                    
-            self.obstacles.append(pos)
+        for _ in self.obstacles:
             # 为每个障碍物添加颜色和随机动画偏移
             self.obstacle_details.append({
                 'color': random.choice(obstacle_colors),
@@ -76,15 +58,25 @@ class GameBoard:
             })
 
     def update(self, current_time):
-        # 更新动画状态
+        # 更新动画状态（按经过的时间推进，与帧率无关）
+        step = 0.05 * self.anim_clock.frames(current_time) # 控制动画速度
         for detail in self.obstacle_details:
-            detail['anim_offset'] += 0.05 # 控制动画速度
+            detail['anim_offset'] += step
+
+    def create_background(self, color=BACKGROUND_COLOR):
+        """底色加网格合成的静态背景（脏矩形绘制时每局只合成一次）"""
+        background = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        background.fill(color)
+        background.blit(self.grid_surface, (0, 0))
+        return background
 
     def draw(self, surface):
         # 绘制网格背景
         surface.blit(self.grid_surface, (0, 0))
-        
-        # 绘制障碍物
+        self.draw_obstacles(surface)
+
+    def draw_obstacles(self, surface, dirty=None):
+        """绘制障碍物；传入 dirty 列表时追加每个障碍物光晕覆盖的矩形"""
         for i, pos in enumerate(self.obstacles):
             center_x = pos[0] * GRID_SIZE + GRID_SIZE // 2
             center_y = pos[1] * GRID_SIZE + GRID_SIZE // 2
@@ -97,7 +89,9 @@ class GameBoard:
             # 更亮、范围更大的光晕
             glow_alpha = 120 + 100 * (math.sin(anim_offset) + 1) / 2 # 范围: 120 -> 220
             glow_size = size * (1.8 + 0.4 * math.sin(anim_offset)) # 范围: 1.4 -> 2.2 倍大小
-            self.draw_hexagon(surface, (*color, glow_alpha), center_x, center_y, glow_size, is_filled=True)
+            glow_rect = self.draw_hexagon(surface, (*color, glow_alpha), center_x, center_y, glow_size, is_filled=True)
+            if dirty is not None and glow_rect is not None:
+                dirty.append(glow_rect)
 
             # 2. 绘制更清晰的六边形主体
             highlight_color = tuple(min(255, c + 100) for c in color)
@@ -122,9 +116,5 @@ class GameBoard:
             points.append((x, y))
             
         if is_filled:
-            pygame.draw.polygon(surface, color, points)
-        else:
-            pygame.draw.polygon(surface, color, points, border_width)
-
-    def check_collision(self, position):
-        return position in self.obstacles 
\ No newline at end of file
+            return pygame.draw.polygon(surface, color, points)
+        return pygame.draw.polygon(surface, color, points, border_width)
\ No newline at end of file
@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+"""
+固定步长的主循环驱动
+逻辑按固定的 tick_rate 推进（与绘制帧率无关），绘制按 FPS 限速：
+- 卡顿时在一帧内补上落下的逻辑帧，最多 max_ticks_per_frame 帧，超出的时间直接丢弃，避免越补越慢；
+- alpha 为距下一个逻辑帧还差的比例（0~1），绘制时可用来在上一帧和当前帧之间插值。
+静态界面空闲时由 FramePacer 降低绘制帧率。
+"""
+import pygame
+from .constants import FPS, SIM_TICK_RATE, MAX_TICKS_PER_FRAME, IDLE_FPS, IDLE_DELAY
+
+# 表示用户正在操作的事件，收到后恢复全帧率
+INPUT_EVENTS = frozenset((pygame.KEYDOWN, pygame.KEYUP, pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN,
+                          pygame.MOUSEBUTTONUP, pygame.MOUSEWHEEL, pygame.TEXTINPUT, pygame.ACTIVEEVENT))
+
+class FixedStepLoop:
+    """把每帧经过的时间换算成固定步长的逻辑帧"""
+
+    def __init__(self, tick_rate=SIM_TICK_RATE, max_ticks_per_frame=MAX_TICKS_PER_FRAME, fps=FPS, clock=None):
+        self.tick_rate = tick_rate
+        self.step_ms = 1000.0 / tick_rate
+        self.max_ticks_per_frame = max_ticks_per_frame
+        self.fps = fps
+        self.clock = clock or pygame.time.Clock()
+        self.accumulator = 0.0
+        self.alpha = 0.0
+
+    def reset(self):
+        """清空累计时间（开始新的一局、暂停恢复后调用），并丢弃上次 tick 以来经过的时间"""
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.clock.tick()
+
+    def advance(self, elapsed_ms):
+        """累加 elapsed_ms 毫秒，返回本帧应推进的逻辑帧数"""
+        self.accumulator += elapsed_ms
+        ticks = int(self.accumulator // self.step_ms)
+        if ticks > self.max_ticks_per_frame:
+            ticks = self.max_ticks_per_frame
+            self.accumulator = self.step_ms * ticks  # 丢弃补不上的时间
+        self.accumulator -= ticks * self.step_ms
+        self.alpha = self.accumulator / self.step_ms
+        return ticks
+
+    def tick(self, update=None, paused=False):
+        """
+        等到下一帧（按 fps 限速），然后调用 update() 推进本帧应补的逻辑帧数；
+        update 返回 False 时停止补帧（例如游戏结束）。paused 为 True 时只限速不推进。返回推进的帧数。
+        """
+        elapsed = self.clock.tick(self.fps)
+        if paused:
+            return 0
+        return self.run(elapsed, update)
+
+    def run(self, elapsed_ms, update=None):
+        """按外部测得的 elapsed_ms 推进逻辑帧（由 SceneManager 的共用时钟驱动时使用），返回推进的帧数"""
+        ticks = self.advance(elapsed_ms)
+        if update is None:
+            return ticks
+        for done in range(ticks):
+            if update() is False:
+                # 停止推进后没有下一帧可插值，直接画当前状态
+                self.accumulator = 0.0
+                self.alpha = 1.0
+                return done + 1
+        return ticks
+
+class AnimationClock:
+    """
+    把两次调用之间经过的时间换算成“按 FPS 计的帧数”，
+    让原来每帧固定增加的动画变量在任何帧率下都保持同样的速度
+    """
+
+    def __init__(self, fps=FPS, max_frames=MAX_TICKS_PER_FRAME):
+        self.fps = fps
+        self.max_frames = max_frames
+        self.last_time = None
+
+    def frames(self, current_time):
+        """距上次调用经过了多少帧（第一次调用按一帧算）"""
+        last, self.last_time = self.last_time, current_time
+        if last is None:
+            return 1.0
+        return min(max(current_time - last, 0) * self.fps / 1000.0, self.max_frames)
+
+class FramePacer:
+    """
+    自适应帧率：界面在播放动画或刚收到输入时按 fps 绘制；
+    静止（只剩雪花、泡泡这类缓慢的背景动画）超过 idle_delay 毫秒后降到 idle_fps，
+    两帧之间用 pygame.event.wait 阻塞等待，不再空转占满一个核，收到输入立即恢复全帧率。
+    背景动画要按经过的时间推进（AnimationClock），降帧后速度才不会变慢。
+    """
+
+    def __init__(self, clock=None, fps=FPS, idle_fps=IDLE_FPS, idle_delay=IDLE_DELAY):
+        self.clock = clock or pygame.time.Clock()
+        self.fps = fps
+        self.idle_ms = 1000 // idle_fps
+        self.idle_delay = idle_delay
+        self.last_input = pygame.time.get_ticks()
+        self.last_frame = self.last_input
+        self.idle = False
+
+    def wake(self):
+        """立即恢复全帧率（切换界面时调用）"""
+        self.last_input = pygame.time.get_ticks()
+
+    def next_frame(self, animating=True):
+        """等到下一帧，返回 (距上一帧经过的毫秒数, 本帧的事件列表)"""
+        now = pygame.time.get_ticks()
+        self.idle = not animating and now - self.last_input >= self.idle_delay
+        events = []
+        if self.idle:
+            timeout = self.idle_ms - (now - self.last_frame)
+            if timeout > 0:
+                event = pygame.event.wait(timeout)
+                if event.type != pygame.NOEVENT:
+                    events.append(event)
+            elapsed = self.clock.tick()
+        else:
+            elapsed = self.clock.tick(self.fps)
+        events.extend(pygame.event.get())
+        self.last_frame = pygame.time.get_ticks()
+        if any(event.type in INPUT_EVENTS for event in events):
+            self.last_input = self.last_frame
+        return elapsed, events
@@ -100,9 +100,21 @@ class ImageSkinManager:
     
     def draw_image_segment(self, surface, center_pos, direction, skin_id, is_head=False):
         """绘制图片皮肤段"""
+        rotated_image = self.get_segment_image(skin_id, direction, is_head)
+        if rotated_image is None:
+            return False
+        
+        # 获取最终图片的矩形（直接使用传入的像素中心坐标）
+        rect = rotated_image.get_rect(center=center_pos)
+        surface.blit(rotated_image, rect)
+        
+        return True
+    
+    def get_segment_image(self, skin_id, direction, is_head=False):
+        """获取按方向旋转好的图片皮肤段（带缓存），无法加载时返回 None"""
         skin_data = self.get_skin_data(skin_id)
         if not skin_data:
-            return False
+            return None
         
         # 确定使用哪个图片
         if is_head:
@@ -111,7 +123,7 @@ class ImageSkinManager:
             image_name = skin_data.get("body_image")
         
         if not image_name:
-            return False
+            return None
         
         # 确保图片大小严格为一个格子大小
         image_size = int(GRID_SIZE * 4 / 3)  # 将图片放大三分之一
@@ -119,10 +131,7 @@ class ImageSkinManager:
         # 获取图片
         image = self.get_image(image_name, (image_size, image_size))
         if not image:
-            return False
-        
-        # 直接使用传入的像素中心坐标
-        center_x, center_y = center_pos
+            return None
         
         # 处理图片变换
         transformed_image = image
@@ -156,11 +165,7 @@ class ImageSkinManager:
             rotated_image = pygame.transform.rotate(transformed_image, angle)
             self.rotated_cache[cache_key] = rotated_image
         
-        # 获取最终图片的矩形
-        rect = rotated_image.get_rect(center=(center_x, center_y))
-        surface.blit(rotated_image, rect)
-        
-        return True
+        return rotated_image
     
     def add_image_skin(self, skin_id, name, price, head_image, body_image):
         """添加新的图片皮肤"""
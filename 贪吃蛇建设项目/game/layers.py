@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""
+背景图层缓存
+- gradient：按 (尺寸, 颜色, 方向) 生成一次渐变，以后直接返回缓存的 Surface，不再每帧逐行画线。
+  有 NumPy 时通过 pygame.surfarray 一次写入整张图的像素，否则每行（列）fill 一次。
+- get_layer：渐变上再叠加圆、网格等不会动的装饰时，用 key 缓存 draw(surface) 画好的整张图层。
+有窗口时图层都转换成显示格式（convert / convert_alpha），blit 时不需要再转换像素格式。
+返回的 Surface 是共享的，只能 blit，不要在上面绘制。
+"""
+import pygame
+
+try:
+    import numpy as np
+except ImportError:  # 没有 NumPy 时逐行填充
+    np = None
+
+_layers = {}
+
+def _new_surface(size, alpha):
+    """创建图层用的 Surface，有窗口时转换成显示格式"""
+    if alpha:
+        surface = pygame.Surface(size, pygame.SRCALPHA)
+        return surface.convert_alpha() if pygame.display.get_surface() else surface
+    surface = pygame.Surface(size)
+    return surface.convert() if pygame.display.get_surface() else surface
+
+def _ramp(colors, length):
+    """把 colors 均匀分布在 length 个像素上，逐像素线性插值（与原来逐行 int(c0 + (c1 - c0) * t) 的算法相同）"""
+    segments = len(colors) - 1
+    ramp = []
+    for i in range(length):
+        pos = i / length * segments
+        seg = min(int(pos), segments - 1)
+        t = pos - seg
+        c0, c1 = colors[seg], colors[seg + 1]
+        ramp.append(tuple(int(a + (b - a) * t) for a, b in zip(c0, c1)))
+    return ramp
+
+def _ramp_np(colors, length):
+    """_ramp 的 NumPy 版本，返回 (length, 通道数) 的 uint8 数组"""
+    stops = np.array(colors, dtype=np.float64)
+    segments = len(colors) - 1
+    pos = np.arange(length) / length * segments
+    seg = np.minimum(pos.astype(np.int64), segments - 1)
+    t = (pos - seg)[:, None]
+    return (stops[seg] + (stops[seg + 1] - stops[seg]) * t).astype(np.uint8)
+
+def _fill_gradient(surface, colors, vertical):
+    width, height = surface.get_size()
+    length = height if vertical else width
+    if np is not None and surface.get_bitsize() >= 24:
+        ramp = _ramp_np(colors, length)
+        line = ramp[None, :] if vertical else ramp[:, None]
+        pixels = pygame.surfarray.pixels3d(surface)
+        pixels[...] = line[..., :3]
+        del pixels  # 释放对 Surface 的锁定
+        if len(colors[0]) == 4:
+            alphas = pygame.surfarray.pixels_alpha(surface)
+            alphas[...] = line[..., 3]
+            del alphas
+    else:
+        for i, color in enumerate(_ramp(colors, length)):
+            surface.fill(color, (0, i, width, 1) if vertical else (i, 0, 1, height))
+
+def gradient(size, colors, direction='vertical'):
+    """
+    取得 size 大小的渐变图层：colors 为两个或更多颜色，均匀分布，vertical 从上到下，horizontal 从左到右。
+    颜色带透明度 (r, g, b, a) 时生成带 alpha 的图层，缺少透明度的颜色按不透明处理。
+    """
+    alpha = any(len(color) == 4 for color in colors)
+    colors = tuple(tuple(color) + ((255,) if alpha and len(color) == 3 else ()) for color in colors)
+    key = ('gradient', tuple(size), colors, direction)
+    surface = _layers.get(key)
+    if surface is None:
+        surface = _new_surface(size, alpha)
+        _fill_gradient(surface, colors, direction == 'vertical')
+        _layers[key] = surface
+    return surface
+
+def get_layer(key, size, draw, alpha=False):
+    """取得名为 key 的静态图层：第一次取时创建 size 大小的 Surface 并调用 draw(surface) 画好，以后直接返回"""
+    cache_key = ('layer', key, tuple(size), alpha)
+    surface = _layers.get(cache_key)
+    if surface is None:
+        surface = _new_surface(size, alpha)
+        draw(surface)
+        _layers[cache_key] = surface
+    return surface
+
+def clear():
+    """丢弃所有缓存的图层（切换显示模式后调用）"""
+    _layers.clear()
@@ -1,6 +1,7 @@
 import pygame
 import random
 from .constants import WINDOW_WIDTH, WINDOW_HEIGHT, FONT_NAME
+from .fonts import get_font, render_text
 import math
 
 class LinkGamePage:
@@ -281,7 +282,7 @@ class LinkGamePage:
         self.surface.blit(grad, (self.panel_x, self.panel_y))
         # 不再绘制任何白色底板
         # 顶部按钮（紧贴面板顶部，半透明）
-        btn_font = pygame.font.Font(FONT_NAME, 26)
+        btn_font = get_font(FONT_NAME, 26)
         btn_height = 44
         btn_margin_top = 10
         btn_y = self.panel_y + btn_margin_top
@@ -292,7 +293,7 @@ class LinkGamePage:
         pygame.draw.rect(restart_surf, (255,152,0,160), (0,0,140,btn_height), border_radius=16)
         pygame.draw.rect(restart_surf, (255,193,7,180), (0,0,140,btn_height), 3, border_radius=16)
         self.surface.blit(restart_surf, (restart_rect.x, restart_rect.y))
-        restart_text = btn_font.render('重新开始', True, (255,255,255,220))
+        restart_text = render_text(btn_font, '重新开始', True, (255,255,255,220))
         self.surface.blit(restart_text, (restart_rect.x+restart_rect.w//2-restart_text.get_width()//2, restart_rect.y+8))
         
         # 提示按钮
@@ -304,27 +305,27 @@ class LinkGamePage:
         pygame.draw.rect(hint_surf, (76,175,80,cooldown_alpha), (0,0,140,btn_height), border_radius=16)
         pygame.draw.rect(hint_surf, (120,220,120,180), (0,0,140,btn_height), 3, border_radius=16)
         self.surface.blit(hint_surf, (hint_rect.x, hint_rect.y))
-        hint_text = btn_font.render('提示', True, (255,255,255,220))
+        hint_text = render_text(btn_font, '提示', True, (255,255,255,220))
         self.surface.blit(hint_text, (hint_rect.x+hint_rect.w//2-hint_text.get_width()//2, hint_rect.y+8))
         
         back_surf = pygame.Surface((140, btn_height), pygame.SRCALPHA)
         pygame.draw.rect(back_surf, (66,165,245,160), (0,0,140,btn_height), border_radius=16)
         pygame.draw.rect(back_surf, (120,200,255,180), (0,0,140,btn_height), 3, border_radius=16)
         self.surface.blit(back_surf, (back_rect.x, back_rect.y))
-        back_text = btn_font.render('返回活动', True, (255,255,255,220))
+        back_text = render_text(btn_font, '返回活动', True, (255,255,255,220))
         self.surface.blit(back_text, (back_rect.x+back_rect.w//2-back_text.get_width()//2, back_rect.y+8))
         # 标题
-        font = pygame.font.Font(FONT_NAME, 44)
-        title = font.render('连连看', True, (255,87,34))
+        font = get_font(FONT_NAME, 44)
+        title = render_text(font, '连连看', True, (255,87,34))
         # 添加标题阴影效果
-        shadow = font.render('连连看', True, (0,0,0,100))
+        shadow = render_text(font, '连连看', True, (0,0,0,100))
         self.surface.blit(shadow, (self.panel_x + self.panel_w//2 - title.get_width()//2 + 2, self.panel_y+btn_height+btn_margin_top+8))
         self.surface.blit(title, (self.panel_x + self.panel_w//2 - title.get_width()//2, self.panel_y+btn_height+btn_margin_top+6))
         # 等级与剩余
-        info_font = pygame.font.Font(FONT_NAME, 22)
+        info_font = get_font(FONT_NAME, 22)
         if self.level is not None and self.state == 'playing' and self.grid and len(self.grid) == self.rows and all(len(row) == self.cols for row in self.grid):
             left_pairs = sum(1 for r in range(self.rows) for c in range(self.cols) if self.grid[r][c]!=-1)//2
-            info = info_font.render(f'等级: {self.levels[self.level-1]["name"]}   剩余对数: {left_pairs}', True, (66,165,245))
+            info = render_text(info_font, f'等级: {self.levels[self.level-1]["name"]}   剩余对数: {left_pairs}', True, (66,165,245))
             # 添加信息背景
             info_bg = pygame.Surface((info.get_width()+20, info.get_height()+10), pygame.SRCALPHA)
             pygame.draw.rect(info_bg, (255,255,255,100), (0,0,info_bg.get_width(),info_bg.get_height()), border_radius=10)
@@ -409,21 +410,21 @@ class LinkGamePage:
                 self.path = []
         
         # 按钮
-        btn_font = pygame.font.Font(FONT_NAME, 26)
+        btn_font = get_font(FONT_NAME, 26)
         # 底部留白
         pygame.draw.rect(self.surface, (245,245,245), (self.panel_x, self.panel_y+self.panel_h-30, self.panel_w, 30), border_radius=0)
         
         # 添加操作提示
         if self.state == 'playing':
-            tip_font = pygame.font.Font(FONT_NAME, 16)
-            tip_text = tip_font.render('提示：点击相同类型的方块进行连接，最多可以拐2次弯', True, (150,150,150))
+            tip_font = get_font(FONT_NAME, 16)
+            tip_text = render_text(tip_font, '提示：点击相同类型的方块进行连接，最多可以拐2次弯', True, (150,150,150))
             self.surface.blit(tip_text, (self.panel_x+self.panel_w//2-tip_text.get_width()//2, self.panel_y+self.panel_h-25))
         # 胜利/失败提示
         if self.state == 'win':
             # 胜利动画效果
             win_alpha = abs(math.sin(self.animation_timer * 0.1)) * 255
-            win_font = pygame.font.Font(FONT_NAME, 44)
-            win_text = win_font.render('恭喜通关！', True, (76,175,80))
+            win_font = get_font(FONT_NAME, 44)
+            win_text = render_text(win_font, '恭喜通关！', True, (76,175,80))
             # 添加发光效果
             glow_surf = pygame.Surface((win_text.get_width()+40, win_text.get_height()+40), pygame.SRCALPHA)
             pygame.draw.ellipse(glow_surf, (76,175,80,int(win_alpha*0.3)), glow_surf.get_rect())
@@ -431,24 +432,24 @@ class LinkGamePage:
             self.surface.blit(win_text, (self.panel_x+self.panel_w//2-win_text.get_width()//2, self.panel_y+100))
             
             # 添加庆祝文字
-            celebrate_font = pygame.font.Font(FONT_NAME, 24)
-            celebrate_text = celebrate_font.render('点击"重新开始"再来一局！', True, (255,193,7))
+            celebrate_font = get_font(FONT_NAME, 24)
+            celebrate_text = render_text(celebrate_font, '点击"重新开始"再来一局！', True, (255,193,7))
             self.surface.blit(celebrate_text, (self.panel_x+self.panel_w//2-celebrate_text.get_width()//2, self.panel_y+150))
             
         elif self.state == 'fail':
-            fail_font = pygame.font.Font(FONT_NAME, 44)
-            fail_text = fail_font.render('无解，已失败！', True, (220,0,0))
+            fail_font = get_font(FONT_NAME, 44)
+            fail_text = render_text(fail_font, '无解，已失败！', True, (220,0,0))
             self.surface.blit(fail_text, (self.panel_x+self.panel_w//2-fail_text.get_width()//2, self.panel_y+100))
             
             # 添加提示文字
-            retry_font = pygame.font.Font(FONT_NAME, 24)
-            retry_text = retry_font.render('点击"重新开始"重试！', True, (255,152,0))
+            retry_font = get_font(FONT_NAME, 24)
+            retry_text = render_text(retry_font, '点击"重新开始"重试！', True, (255,152,0))
             self.surface.blit(retry_text, (self.panel_x+self.panel_w//2-retry_text.get_width()//2, self.panel_y+150))
         # 不再绘制任何白色底板 
 
     def draw_level_select(self):
-        font = pygame.font.Font(FONT_NAME, 32)
-        desc_font = pygame.font.Font(FONT_NAME, 22)
+        font = get_font(FONT_NAME, 32)
+        desc_font = get_font(FONT_NAME, 22)
         mouse_pos = pygame.mouse.get_pos()
         # 动漫风蓝粉渐变背景+星星气泡点缀
         overlay = pygame.Surface((self.panel_w, self.panel_h), pygame.SRCALPHA)
@@ -530,16 +531,16 @@ class LinkGamePage:
             pygame.draw.rect(card_surf, (255,255,255,40), (0,0,scaled_rect.width,scaled_rect.height), border_radius=28)
             self.surface.blit(card_surf, scaled_rect)
             # 难度名称（卡通描边）
-            text = font.render(lv['name'], True, (255,255,255))
+            text = render_text(font, lv['name'], True, (255,255,255))
             for dx,dy in [(-2,0),(2,0),(0,-2),(0,2)]:
-                outline = font.render(lv['name'], True, (80,80,160))
+                outline = render_text(font, lv['name'], True, (80,80,160))
                 self.surface.blit(outline, (scaled_rect.x+scaled_rect.w//2-text.get_width()//2+dx, scaled_rect.y+38+dy))
             self.surface.blit(text, (scaled_rect.x+scaled_rect.w//2-text.get_width()//2, scaled_rect.y+38))
             # 详细参数
             desc = f"{lv['rows']}行{lv['cols']}列  {lv['types']}种图标"
-            desc_text = desc_font.render(desc, True, (255,255,255))
+            desc_text = render_text(desc_font, desc, True, (255,255,255))
             for dx,dy in [(-1,0),(1,0),(0,-1),(0,1)]:
-                outline = desc_font.render(desc, True, (120,120,180))
+                outline = render_text(desc_font, desc, True, (120,120,180))
                 self.surface.blit(outline, (scaled_rect.x+scaled_rect.w//2-desc_text.get_width()//2+dx, scaled_rect.y+80+dy))
             self.surface.blit(desc_text, (scaled_rect.x+scaled_rect.w//2-desc_text.get_width()//2, scaled_rect.y+80))
         # 开始按钮
@@ -558,16 +559,16 @@ class LinkGamePage:
             pygame.draw.rect(btn_surf, (255,255,255,60), (0,0,btn_rect.width,btn_rect.height//2), border_radius=20)
             pygame.draw.rect(btn_surf, (255, 128, 192), (0,0,btn_rect.width,btn_rect.height), 4, border_radius=20)
             self.surface.blit(btn_surf, btn_rect)
-            sfont = pygame.font.Font(FONT_NAME, 30)
-            stext = sfont.render('开始游戏', True, (255,255,255))
+            sfont = get_font(FONT_NAME, 30)
+            stext = render_text(sfont, '开始游戏', True, (255,255,255))
             for dx,dy in [(-2,0),(2,0),(0,-2),(0,2)]:
-                outline = sfont.render('开始游戏', True, (120,120,180))
+                outline = render_text(sfont, '开始游戏', True, (120,120,180))
                 self.surface.blit(outline, (btn_rect.x+btn_rect.w//2-stext.get_width()//2+dx, btn_rect.y+btn_rect.h//2-stext.get_height()//2+dy))
             self.surface.blit(stext, (btn_rect.x+btn_rect.w//2-stext.get_width()//2, btn_rect.y+btn_rect.h//2-stext.get_height()//2))
         else:
             pygame.draw.rect(self.surface, (180,180,180), start_rect, border_radius=20)
-            sfont = pygame.font.Font(FONT_NAME, 30)
-            stext = sfont.render('开始游戏', True, (220,220,220))
+            sfont = get_font(FONT_NAME, 30)
+            stext = render_text(sfont, '开始游戏', True, (220,220,220))
             self.surface.blit(stext, (start_rect.x+start_rect.w//2-stext.get_width()//2, start_rect.y+start_rect.h//2-stext.get_height()//2))
         
         # 添加返回按钮
@@ -583,8 +584,8 @@ class LinkGamePage:
         pygame.draw.rect(back_surf, (255, 120, 80, 220), (0,0,back_btn_rect.width,back_btn_rect.height), 3, border_radius=20)
         self.surface.blit(back_surf, back_btn_rect)
         
-        back_font = pygame.font.Font(FONT_NAME, 28)
-        back_text = back_font.render('返回', True, (255,255,255))
+        back_font = get_font(FONT_NAME, 28)
+        back_text = render_text(back_font, '返回', True, (255,255,255))
         self.surface.blit(back_text, (back_btn_rect.x+back_btn_rect.w//2-back_text.get_width()//2, 
                                    back_btn_rect.y+back_btn_rect.h//2-back_text.get_height()//2))
 
@@ -4,6 +4,8 @@ import random
 import time
 import math
 from .constants import *
+from .fonts import get_font, render_text
+from . import layers
 
 class MazeGame:
     def __init__(self, surface):
@@ -866,9 +868,9 @@ class MazeGame:
         # self.update_floating_particles(surface_width, surface_height)
 
         # 动态标题
-        title_font = pygame.font.Font(FONT_NAME, 52)
+        title_font = get_font(FONT_NAME, 52)
         title_offset = math.sin(self.level_select_animation * 1.5) * 3
-        title_text = title_font.render("🎯 走迷宫挑战 🎯", True, (255, 255, 255))
+        title_text = render_text(title_font, "🎯 走迷宫挑战 🎯", True, (255, 255, 255))
         title_rect = title_text.get_rect(center=(surface_width//2, 70 + title_offset))
 
         # 多层标题阴影
@@ -876,15 +878,15 @@ class MazeGame:
             shadow_alpha = 100 - i * 30
             shadow_offset = (i + 1) * 2
             shadow_surface = pygame.Surface(title_text.get_size(), pygame.SRCALPHA)
-            shadow_text = title_font.render("🎯 走迷宫挑战 🎯", True, (0, 0, 0, shadow_alpha))
+            shadow_text = render_text(title_font, "🎯 走迷宫挑战 🎯", True, (0, 0, 0, shadow_alpha))
             shadow_rect = shadow_text.get_rect(center=(surface_width//2 + shadow_offset, 73 + title_offset + shadow_offset))
             self.surface.blit(shadow_text, shadow_rect)
 
         self.surface.blit(title_text, title_rect)
 
         # 副标题
-        subtitle_font = pygame.font.Font(FONT_NAME, 20)
-        subtitle_text = subtitle_font.render("选择你的挑战等级", True, (200, 200, 255))
+        subtitle_font = get_font(FONT_NAME, 20)
+        subtitle_text = render_text(subtitle_font, "选择你的挑战等级", True, (200, 200, 255))
         subtitle_rect = subtitle_text.get_rect(center=(surface_width//2, 110))
         self.surface.blit(subtitle_text, subtitle_rect)
         
@@ -964,14 +966,14 @@ class MazeGame:
             self.draw_difficulty_icon(level, icon_x, icon_y, icon_size, config["color"])
 
             # 等级信息 - 改进排版
-            level_font = pygame.font.Font(FONT_NAME, 28)
-            name_font = pygame.font.Font(FONT_NAME, 22)
-            info_font = pygame.font.Font(FONT_NAME, 16)
+            level_font = get_font(FONT_NAME, 28)
+            name_font = get_font(FONT_NAME, 22)
+            info_font = get_font(FONT_NAME, 16)
 
-            level_text = level_font.render(f"等级 {level}", True, (255, 255, 255))
-            name_text = name_font.render(config["name"], True, (255, 255, 100))
-            size_text = info_font.render(f"迷宫: {config['size'][0]}×{config['size'][1]}", True, (200, 200, 255))
-            time_text = info_font.render(f"时限: {config['time_limit']}秒", True, (200, 255, 200))
+            level_text = render_text(level_font, f"等级 {level}", True, (255, 255, 255))
+            name_text = render_text(name_font, config["name"], True, (255, 255, 100))
+            size_text = render_text(info_font, f"迷宫: {config['size'][0]}×{config['size'][1]}", True, (200, 200, 255))
+            time_text = render_text(info_font, f"时限: {config['time_limit']}秒", True, (200, 255, 200))
 
             # 文字位置
             text_x = scaled_x + 55
@@ -988,9 +990,9 @@ class MazeGame:
         mode_color = (100, 200, 100) if self.unique_path_mode else (200, 100, 100)
         pygame.draw.rect(self.surface, mode_color, mode_rect, border_radius=8)
         pygame.draw.rect(self.surface, (255, 255, 255), mode_rect, 2, border_radius=8)
-        mode_font = pygame.font.Font(FONT_NAME, 18)
+        mode_font = get_font(FONT_NAME, 18)
         mode_text = "完美迷宫: 开" if self.unique_path_mode else "完美迷宫: 关"
-        mode_text_surface = mode_font.render(mode_text, True, (255, 255, 255))
+        mode_text_surface = render_text(mode_font, mode_text, True, (255, 255, 255))
         mode_text_rect = mode_text_surface.get_rect(center=mode_rect.center)
         self.surface.blit(mode_text_surface, mode_text_rect)
         self.mode_rect = mode_rect
@@ -1000,9 +1002,9 @@ class MazeGame:
         vision_color = (150, 100, 200) if self.vision_enabled else (100, 100, 100)
         pygame.draw.rect(self.surface, vision_color, vision_rect, border_radius=8)
         pygame.draw.rect(self.surface, (255, 255, 255), vision_rect, 2, border_radius=8)
-        vision_font = pygame.font.Font(FONT_NAME, 18)
+        vision_font = get_font(FONT_NAME, 18)
         vision_text = "视野限制: 开" if self.vision_enabled else "视野限制: 关"
-        vision_text_surface = vision_font.render(vision_text, True, (255, 255, 255))
+        vision_text_surface = render_text(vision_font, vision_text, True, (255, 255, 255))
         vision_text_rect = vision_text_surface.get_rect(center=vision_rect.center)
         self.surface.blit(vision_text_surface, vision_text_rect)
         self.vision_rect = vision_rect
@@ -1011,9 +1013,9 @@ class MazeGame:
         style_rect = pygame.Rect(surface_width - 250, surface_height - 190, 180, 50)
         pygame.draw.rect(self.surface, (80, 140, 220), style_rect, border_radius=8)
         pygame.draw.rect(self.surface, (255, 255, 255), style_rect, 2, border_radius=8)
-        style_font = pygame.font.Font(FONT_NAME, 18)
+        style_font = get_font(FONT_NAME, 18)
         style_name = self.maze_style_names[self.maze_style_index % len(self.maze_style_names)]
-        style_text_surface = style_font.render(f"迷宫风格: {style_name}", True, (255, 255, 255))
+        style_text_surface = render_text(style_font, f"迷宫风格: {style_name}", True, (255, 255, 255))
         style_text_rect = style_text_surface.get_rect(center=style_rect.center)
         self.surface.blit(style_text_surface, style_text_rect)
         self.style_rect = style_rect
@@ -1023,9 +1025,9 @@ class MazeGame:
         rand_color = (100, 200, 160) if self.random_spawn_enabled else (120, 120, 120)
         pygame.draw.rect(self.surface, rand_color, rand_rect, border_radius=8)
         pygame.draw.rect(self.surface, (255, 255, 255), rand_rect, 2, border_radius=8)
-        rand_font = pygame.font.Font(FONT_NAME, 18)
+        rand_font = get_font(FONT_NAME, 18)
         rand_text = "随机起终点: 开" if self.random_spawn_enabled else "随机起终点: 关"
-        rand_text_surface = rand_font.render(rand_text, True, (255, 255, 255))
+        rand_text_surface = render_text(rand_font, rand_text, True, (255, 255, 255))
         rand_text_rect = rand_text_surface.get_rect(center=rand_rect.center)
         self.surface.blit(rand_text_surface, rand_text_rect)
         self.random_rect = rand_rect
@@ -1037,8 +1039,8 @@ class MazeGame:
             hint_text = "完美迷宫：任意两点间只有唯一路径"
         else:
             hint_text = "普通迷宫：可能存在多条路径和环路"
-        hint_font = pygame.font.Font(FONT_NAME, 14)
-        hint_surface = hint_font.render(hint_text, True, (200, 200, 200))
+        hint_font = get_font(FONT_NAME, 14)
+        hint_surface = render_text(hint_font, hint_text, True, (200, 200, 200))
         hint_rect = hint_surface.get_rect(center=(surface_width - 160, surface_height - 25))
         self.surface.blit(hint_surface, hint_rect)
 
@@ -1046,8 +1048,8 @@ class MazeGame:
         back_rect = pygame.Rect(50, surface_height - 80, 100, 50)
         pygame.draw.rect(self.surface, (100, 100, 100), back_rect, border_radius=8)
         pygame.draw.rect(self.surface, (255, 255, 255), back_rect, 2, border_radius=8)
-        back_font = pygame.font.Font(FONT_NAME, 24)
-        back_text = back_font.render("返回", True, (255, 255, 255))
+        back_font = get_font(FONT_NAME, 24)
+        back_text = render_text(back_font, "返回", True, (255, 255, 255))
         back_text_rect = back_text.get_rect(center=back_rect.center)
         self.surface.blit(back_text, back_text_rect)
         self.back_rect = back_rect
@@ -1055,14 +1057,8 @@ class MazeGame:
     def draw_maze_background(self, surface_width, surface_height):
         """绘制迷宫风格的背景"""
         # 创建渐变背景
-        gradient_surface = pygame.Surface((surface_width, surface_height), pygame.SRCALPHA)
-        for y in range(surface_height):
-            # 顶部深蓝渐变到底部紫色
-            r = int(10 + (y / surface_height) * 20)
-            g = int(15 + (y / surface_height) * 15)
-            b = int(40 + (y / surface_height) * 60)
-            pygame.draw.line(gradient_surface, (r, g, b), (0, y), (surface_width, y))
-        self.surface.blit(gradient_surface, (0, 0))
+        # 顶部深蓝渐变到底部紫色
+        self.surface.blit(layers.gradient((surface_width, surface_height), [(10, 15, 40), (30, 30, 100)]), (0, 0))
 
         # 绘制星空效果
         for _ in range(200):
@@ -1472,8 +1468,8 @@ class MazeGame:
         self.surface.blit(ui_surface, (0, 0))
 
         # 等级信息
-        level_font = pygame.font.Font(FONT_NAME, 28)
-        level_text = level_font.render(f"等级 {self.current_level}: {level_config['name']}", True, (255, 255, 255))
+        level_font = get_font(FONT_NAME, 28)
+        level_text = render_text(level_font, f"等级 {self.current_level}: {level_config['name']}", True, (255, 255, 255))
         self.surface.blit(level_text, (20, 15))
 
         # 时间信息
@@ -1488,31 +1484,31 @@ class MazeGame:
         elif remaining_time < 60:
             time_color = (255, 200, 100)
 
-        time_font = pygame.font.Font(FONT_NAME, 24)
-        time_text = time_font.render(f"时间: {minutes:02d}:{seconds:02d}", True, time_color)
+        time_font = get_font(FONT_NAME, 24)
+        time_text = render_text(time_font, f"时间: {minutes:02d}:{seconds:02d}", True, time_color)
         # 文本纵向位置根据高度自适应（底部对齐）
         text_base_y = max(12, ui_height - 19)
         self.surface.blit(time_text, (20, text_base_y))
 
         # 迷宫大小信息
-        size_text = time_font.render(f"迷宫: {level_config['size'][0]}×{level_config['size'][1]}", True, (200, 200, 200))
+        size_text = render_text(time_font, f"迷宫: {level_config['size'][0]}×{level_config['size'][1]}", True, (200, 200, 200))
         self.surface.blit(size_text, (surface_width - 200, 12))
 
         # 操作提示
-        hint_text = time_font.render("WASD/方向键移动", True, (200, 200, 200))
+        hint_text = render_text(time_font, "WASD/方向键移动", True, (200, 200, 200))
         self.surface.blit(hint_text, (surface_width - 200, text_base_y))
 
         # 视野限制状态显示
         if self.vision_enabled:
-            vision_font = pygame.font.Font(FONT_NAME, 18)
-            vision_text = vision_font.render("🔦 视野限制模式", True, (150, 100, 200))
+            vision_font = get_font(FONT_NAME, 18)
+            vision_text = render_text(vision_font, "🔦 视野限制模式", True, (150, 100, 200))
             self.surface.blit(vision_text, (surface_width // 2 - 60, 12))
 
             # 探索进度
             total_cells = len(self.maze) * len(self.maze[0])
             explored_count = len(self.explored_cells)
             progress = (explored_count / total_cells) * 100
-            progress_text = vision_font.render(f"探索进度: {progress:.1f}%", True, (150, 200, 150))
+            progress_text = render_text(vision_font, f"探索进度: {progress:.1f}%", True, (150, 200, 150))
             if ui_height >= 40:
                 self.surface.blit(progress_text, (surface_width // 2 - 60, 32))
 
@@ -1520,8 +1516,8 @@ class MazeGame:
         back_rect = pygame.Rect(surface_width - 120, surface_height - 60, 100, 40)
         pygame.draw.rect(self.surface, (100, 100, 100, 200), back_rect, border_radius=8)
         pygame.draw.rect(self.surface, (255, 255, 255), back_rect, 2, border_radius=8)
-        back_font = pygame.font.Font(FONT_NAME, 20)
-        back_text = back_font.render("返回", True, (255, 255, 255))
+        back_font = get_font(FONT_NAME, 20)
+        back_text = render_text(back_font, "返回", True, (255, 255, 255))
         back_text_rect = back_text.get_rect(center=back_rect.center)
         self.surface.blit(back_text, back_text_rect)
         self.game_back_rect = back_rect
@@ -1558,21 +1554,21 @@ class MazeGame:
             pygame.draw.circle(self.surface, (255, 255, 100), (int(star_x), int(star_y)), star_size)
 
         # 胜利文字
-        win_font = pygame.font.Font(FONT_NAME, 48)
-        win_text = win_font.render("恭喜通关！", True, (255, 215, 0))
+        win_font = get_font(FONT_NAME, 48)
+        win_text = render_text(win_font, "恭喜通关！", True, (255, 215, 0))
         win_rect = win_text.get_rect(center=(panel_x + panel_width//2, panel_y + 60))
         self.surface.blit(win_text, win_rect)
 
         # 完成时间
-        time_font = pygame.font.Font(FONT_NAME, 24)
+        time_font = get_font(FONT_NAME, 24)
         minutes = int(self.game_time // 60)
         seconds = int(self.game_time % 60)
-        time_text = time_font.render(f"完成时间: {minutes:02d}:{seconds:02d}", True, (255, 255, 255))
+        time_text = render_text(time_font, f"完成时间: {minutes:02d}:{seconds:02d}", True, (255, 255, 255))
         time_rect = time_text.get_rect(center=(panel_x + panel_width//2, panel_y + 120))
         self.surface.blit(time_text, time_rect)
 
         # 等级信息
-        level_text = time_font.render(f"等级: {self.levels[self.current_level]['name']}", True, (255, 255, 255))
+        level_text = render_text(time_font, f"等级: {self.levels[self.current_level]['name']}", True, (255, 255, 255))
         level_rect = level_text.get_rect(center=(panel_x + panel_width//2, panel_y + 150))
         self.surface.blit(level_text, level_rect)
 
@@ -1586,8 +1582,8 @@ class MazeGame:
             next_rect = pygame.Rect(panel_x + 50, button_y, button_width, button_height)
             pygame.draw.rect(self.surface, (100, 200, 100), next_rect, border_radius=8)
             pygame.draw.rect(self.surface, (255, 255, 255), next_rect, 2, border_radius=8)
-            next_font = pygame.font.Font(FONT_NAME, 20)
-            next_text = next_font.render("下一关", True, (255, 255, 255))
+            next_font = get_font(FONT_NAME, 20)
+            next_text = render_text(next_font, "下一关", True, (255, 255, 255))
             next_text_rect = next_text.get_rect(center=next_rect.center)
             self.surface.blit(next_text, next_text_rect)
             self.next_rect = next_rect
@@ -1596,8 +1592,8 @@ class MazeGame:
         restart_rect = pygame.Rect(panel_x + panel_width - 170, button_y, button_width, button_height)
         pygame.draw.rect(self.surface, (100, 100, 200), restart_rect, border_radius=8)
         pygame.draw.rect(self.surface, (255, 255, 255), restart_rect, 2, border_radius=8)
-        restart_font = pygame.font.Font(FONT_NAME, 20)
-        restart_text = restart_font.render("重新开始", True, (255, 255, 255))
+        restart_font = get_font(FONT_NAME, 20)
+        restart_text = render_text(restart_font, "重新开始", True, (255, 255, 255))
         restart_text_rect = restart_text.get_rect(center=restart_rect.center)
         self.surface.blit(restart_text, restart_text_rect)
         self.restart_rect = restart_rect
@@ -1606,8 +1602,8 @@ class MazeGame:
         back_rect = pygame.Rect(panel_x + (panel_width - button_width)//2, button_y + 50, button_width, button_height)
         pygame.draw.rect(self.surface, (150, 150, 150), back_rect, border_radius=8)
         pygame.draw.rect(self.surface, (255, 255, 255), back_rect, 2, border_radius=8)
-        back_font = pygame.font.Font(FONT_NAME, 20)
-        back_text = back_font.render("返回选择", True, (255, 255, 255))
+        back_font = get_font(FONT_NAME, 20)
+        back_text = render_text(back_font, "返回选择", True, (255, 255, 255))
         back_text_rect = back_text.get_rect(center=back_rect.center)
         self.surface.blit(back_text, back_text_rect)
         self.win_back_rect = back_rect
@@ -1636,14 +1632,14 @@ class MazeGame:
         pygame.draw.rect(self.surface, (255, 100, 100), panel_rect, 4, border_radius=20)
 
         # 失败文字
-        lose_font = pygame.font.Font(FONT_NAME, 42)
-        lose_text = lose_font.render("时间到！", True, (255, 100, 100))
+        lose_font = get_font(FONT_NAME, 42)
+        lose_text = render_text(lose_font, "时间到！", True, (255, 100, 100))
         lose_rect = lose_text.get_rect(center=(panel_x + panel_width//2, panel_y + 60))
         self.surface.blit(lose_text, lose_rect)
 
         # 提示文字
-        hint_font = pygame.font.Font(FONT_NAME, 24)
-        hint_text = hint_font.render("再试一次吧！", True, (255, 255, 255))
+        hint_font = get_font(FONT_NAME, 24)
+        hint_text = render_text(hint_font, "再试一次吧！", True, (255, 255, 255))
         hint_rect = hint_text.get_rect(center=(panel_x + panel_width//2, panel_y + 110))
         self.surface.blit(hint_text, hint_rect)
 
@@ -1656,8 +1652,8 @@ class MazeGame:
         restart_rect = pygame.Rect(panel_x + 30, button_y, button_width, button_height)
         pygame.draw.rect(self.surface, (100, 100, 200), restart_rect, border_radius=8)
         pygame.draw.rect(self.surface, (255, 255, 255), restart_rect, 2, border_radius=8)
-        restart_font = pygame.font.Font(FONT_NAME, 20)
-        restart_text = restart_font.render("重新开始", True, (255, 255, 255))
+        restart_font = get_font(FONT_NAME, 20)
+        restart_text = render_text(restart_font, "重新开始", True, (255, 255, 255))
         restart_text_rect = restart_text.get_rect(center=restart_rect.center)
         self.surface.blit(restart_text, restart_text_rect)
         self.lose_restart_rect = restart_rect
@@ -1666,8 +1662,8 @@ class MazeGame:
         back_rect = pygame.Rect(panel_x + panel_width - 150, button_y, button_width, button_height)
         pygame.draw.rect(self.surface, (150, 150, 150), back_rect, border_radius=8)
         pygame.draw.rect(self.surface, (255, 255, 255), back_rect, 2, border_radius=8)
-        back_font = pygame.font.Font(FONT_NAME, 20)
-        back_text = back_font.render("返回选择", True, (255, 255, 255))
+        back_font = get_font(FONT_NAME, 20)
+        back_text = render_text(back_font, "返回选择", True, (255, 255, 255))
         back_text_rect = back_text.get_rect(center=back_rect.center)
         self.surface.blit(back_text, back_text_rect)
         self.lose_back_rect = back_rect
@@ -9,12 +9,18 @@ import subprocess
 import time # Added for time.time()
 
 # 导入常量和模块
-from .constants import get_resource_path, SNOW_PARTICLE_COUNT, WINDOW_WIDTH, WINDOW_HEIGHT, SNOW_PARTICLE_SPEED, SNOW_PARTICLE_SIZE, BACKGROUND_SWITCH_BUTTON_SIZE, BUTTON_WIDTH, BUTTON_HEIGHT, BUTTON_COLOR, BUTTON_HOVER_COLOR, BUTTON_TEXT_COLOR, FONT_NAME, WHITE, TITLE_FLOAT_SPEED, TITLE_FLOAT_AMPLITUDE, TITLE_FONT_SIZE, BACKGROUND_COLOR, SETTINGS_MENU_WIDTH, SETTINGS_MENU_HEIGHT, GOLD, MENU_BACKGROUND_ALPHA, FONT_SIZE
+from .constants import get_resource_path, WINDOW_WIDTH, WINDOW_HEIGHT, SNOW_PARTICLE_SPEED, SNOW_PARTICLE_SIZE, BACKGROUND_SWITCH_BUTTON_SIZE, BUTTON_WIDTH, BUTTON_HEIGHT, BUTTON_COLOR, BUTTON_HOVER_COLOR, BUTTON_TEXT_COLOR, FONT_NAME, WHITE, TITLE_FLOAT_SPEED, TITLE_FLOAT_AMPLITUDE, TITLE_FONT_SIZE, BACKGROUND_COLOR, PARTICLE_BUDGETS, BUBBLE_ALPHA_STEP, SETTINGS_MENU_WIDTH, SETTINGS_MENU_HEIGHT, GOLD, MENU_BACKGROUND_ALPHA, FONT_SIZE
+from .fonts import get_font, render_text
+from . import layers
 from .shop import ShopMenu
 from .backpack import BackpackMenu
 from .player import player_data
 from .ui_elements import Button, CircularButton, draw_rounded_rect, CartoonButton
+from .game_loop import AnimationClock
+from .particles import snowfall, make_stamp
+from .sprites import get_sprite
 from .activity_page import ActivityPage
+from .backgrounds import BackgroundLoader
 
 HELP_TEXT = [
     "游戏控制:",
@@ -44,23 +50,15 @@ def load_help_text():
     except FileNotFoundError:
         return ["错误: help.md 文件未找到。"]
 
-class SnowParticle:
-    def __init__(self):
-        self.x = random.randint(0, WINDOW_WIDTH)
-        self.y = random.randint(-50, 0)
-        self.speed = random.uniform(0.5, SNOW_PARTICLE_SPEED)
-        self.size = random.randint(1, SNOW_PARTICLE_SIZE)
-
-    def update(self):
-        self.y += self.speed
-        if self.y > WINDOW_HEIGHT:
-            self.y = random.randint(-50, 0)
-            self.x = random.randint(0, WINDOW_WIDTH)
-
-    def draw(self, surface):
-        pygame.draw.circle(surface, WHITE, (int(self.x), int(self.y)), self.size)
+def rotate_points(points, cx, cy, degrees):
+    """把顶点绕 (cx, cy) 逆时针旋转 degrees 度（与 pygame.transform.rotate 的方向相同）"""
+    rad = math.radians(degrees)
+    c, s = math.cos(rad), math.sin(rad)
+    return [(cx + (x - cx) * c + (y - cy) * s, cy - (x - cx) * s + (y - cy) * c) for x, y in points]
 
 class BubbleFragment:
+    canvas = None  # 所有碎片共用的 56x56 画布，每次绘制前清空
+
     def __init__(self, x, y, color, shape="circle"):
         self.x = x
         self.y = y
@@ -75,6 +73,7 @@ class BubbleFragment:
         self.scale = 1.0
         self.rotation = random.uniform(0, 360)
         self.rotation_speed = random.uniform(-7, 7)  # 旋转速度略减缓
+        self.sides = random.randint(5, 8)  # 多边形碎片的边数（创建时确定，避免每帧变化闪烁）
 
     def update(self):
         self.x += math.cos(self.angle) * self.speed
@@ -86,7 +85,11 @@ class BubbleFragment:
         self.rotation += self.rotation_speed
 
     def draw(self, surface):
-        s = pygame.Surface((56, 56), pygame.SRCALPHA)
+        # 在共用画布上按当前旋转角度直接画出形状，不再每帧创建 Surface 再旋转
+        if BubbleFragment.canvas is None:
+            BubbleFragment.canvas = pygame.Surface((56, 56), pygame.SRCALPHA)
+        s = BubbleFragment.canvas
+        s.fill((0, 0, 0, 0))
         cx, cy, r = 28, 28, int(self.radius * self.scale * 1.7)
         color = (*self.color, min(255, int(self.alpha*1.5)))
         shape_type = getattr(self, 'shape_type', self.shape)
@@ -96,8 +99,10 @@ class BubbleFragment:
             pygame.draw.circle(s, color, (cx, cy), r)
             pygame.draw.circle(s, border_color, (cx, cy), r, 4)
             pygame.draw.circle(s, glow_color, (cx, cy), r+6, 6)
-        elif shape_type == "star":
-            points = []
+            surface.blit(s, (self.x-28, self.y-28))
+            return
+        points = []
+        if shape_type == "star":
             for i in range(5):
                 angle = math.radians(i * 72 - 90)
                 x = cx + r * math.cos(angle)
@@ -107,33 +112,41 @@ class BubbleFragment:
                 x = cx + r * 0.5 * math.cos(angle)
                 y = cy + r * 0.5 * math.sin(angle)
                 points.append((x, y))
-            pygame.draw.polygon(s, color, points)
-            pygame.draw.polygon(s, border_color, points, 4)
-            pygame.draw.polygon(s, glow_color, points, 8)
         elif shape_type == "polygon":
-            sides = random.randint(5,8)
-            points = []
-            for i in range(sides):
-                angle = math.radians(i * 360 / sides)
+            for i in range(self.sides):
+                angle = math.radians(i * 360 / self.sides)
                 x = cx + r * math.cos(angle)
                 y = cy + r * math.sin(angle)
                 points.append((x, y))
-            pygame.draw.polygon(s, color, points)
-            pygame.draw.polygon(s, border_color, points, 4)
-            pygame.draw.polygon(s, glow_color, points, 8)
         elif shape_type == "heart":
-            heart_points = []
             for t in range(0, 360, 20):
                 rad = math.radians(t)
                 x = cx + r * 0.8 * math.sin(rad) ** 3
                 y = cy - r * (0.6 * math.cos(rad) - 0.3 * math.cos(2*rad) - 0.2 * math.cos(3*rad) - 0.1 * math.cos(4*rad))
-                heart_points.append((x, y))
-            pygame.draw.polygon(s, color, heart_points)
-            pygame.draw.polygon(s, border_color, heart_points, 4)
-            pygame.draw.polygon(s, glow_color, heart_points, 8)
-        s = pygame.transform.rotate(s, self.rotation)
+                points.append((x, y))
+        if points:
+            points = rotate_points(points, cx, cy, self.rotation)
+            pygame.draw.polygon(s, color, points)
+            pygame.draw.polygon(s, border_color, points, 4)
+            pygame.draw.polygon(s, glow_color, points, 8)
         surface.blit(s, (self.x-28, self.y-28))
 
+def draw_bubble_body(r, color, alpha):
+    """画泡泡本体（渐变、发光边缘、阴影），由精灵缓存按 (半径, 颜色, 透明度档位) 保存"""
+    s = pygame.Surface((r*2, r*2), pygame.SRCALPHA)
+    # 主体渐变
+    for i in range(r, 0, -1):
+        ratio = i/r
+        c = tuple(int(color[j]*ratio + 255*(1-ratio)) for j in range(3))
+        a = int(alpha * ratio)
+        pygame.draw.circle(s, c+(a,), (r, r), i)
+    # 发光边缘
+    for glow in range(2, 8):
+        pygame.draw.circle(s, (255,255,255,int(alpha*0.06)), (r, r), r+glow, 1)
+    # 阴影
+    pygame.draw.ellipse(s, (120,120,120,40), (int(r*0.2), int(r*1.3), int(r*1.2), int(r*0.4)))
+    return s
+
 class Bubble:
     COLORS = [
         (180, 220, 255), # 淡蓝
@@ -153,9 +166,10 @@ class Bubble:
         self.pop_time = 0
         self.fragments = []  # 爆炸碎片
         self.flash_life = 0
-    def update(self):
+    def update(self, frames=1):
+        # frames：距上次更新经过的帧数，上升按时间推进；爆炸只在全帧率下播放，每次推进一帧
         if not self.popped:
-            self.y -= self.speed
+            self.y -= self.speed * frames
             if self.y < -self.r:
                 self.popped = True
         else:
@@ -186,24 +200,19 @@ class Bubble:
                 self.flash_life -= 1
     def draw(self, surface):
         if self.alpha > 0 and not self.popped:
-            s = pygame.Surface((self.r*2, self.r*2), pygame.SRCALPHA)
-            # 主体渐变+动态高光
-            for i in range(self.r, 0, -1):
-                ratio = i/self.r
-                c = tuple(int(self.color[j]*ratio + 255*(1-ratio)) for j in range(3))
-                a = int(self.alpha * ratio)
-                pygame.draw.circle(s, c+(a,), (self.r, self.r), i)
-            # 动态高光
+            # 本体用预先画好的精灵，透明度按 BUBBLE_ALPHA_STEP 分档
+            alpha = self.alpha - self.alpha % BUBBLE_ALPHA_STEP
+            body = get_sprite(('bubble', self.r, self.color, alpha), draw_bubble_body, self.r, self.color, alpha)
+            left, top = int(self.x-self.r), int(self.y-self.r)
+            surface.blit(body, (left, top))
+            # 动态高光：缓存的小圆随时间绕中心转动
             t = pygame.time.get_ticks()//8 % 360
             highlight_x = int(self.r + self.r*0.4*math.cos(math.radians(t)))
             highlight_y = int(self.r + self.r*0.4*math.sin(math.radians(t)))
-            pygame.draw.circle(s, (255,255,255, min(120, self.alpha)), (highlight_x, highlight_y), int(self.r*0.22))
-            # 发光边缘
-            for glow in range(2, 8):
-                pygame.draw.circle(s, (255,255,255,int(self.alpha*0.06)), (self.r, self.r), self.r+glow, 1)
-            # 阴影
-            pygame.draw.ellipse(s, (120,120,120,40), (int(self.r*0.2), int(self.r*1.3), int(self.r*1.2), int(self.r*0.4)))
-            surface.blit(s, (int(self.x-self.r), int(self.y-self.r)))
+            highlight_r = int(self.r*0.22)
+            highlight_color = (255, 255, 255, min(120, alpha))
+            highlight = get_sprite(('bubble_highlight', highlight_r, highlight_color), make_stamp, highlight_color, highlight_r)
+            surface.blit(highlight, (left + highlight_x - highlight_r - 1, top + highlight_y - highlight_r - 1))
             # 粒子特效
             if getattr(self, 'has_particle', False):
                 for _ in range(2):
@@ -213,9 +222,9 @@ class Bubble:
         # 爆炸中心闪光
         if self.popped and self.flash_life > 0:
             alpha = int(180 * (self.flash_life / 10))
-            s = pygame.Surface((60, 60), pygame.SRCALPHA)
-            pygame.draw.circle(s, (255, 255, 200, alpha), (30, 30), 30)
-            surface.blit(s, (self.x-30, self.y-30))
+            flash_color = (255, 255, 200, alpha)
+            flash = get_sprite(('bubble_flash', flash_color), make_stamp, flash_color, 30)
+            surface.blit(flash, (int(self.x) - 31, int(self.y) - 31))
         # 爆炸碎片
         for frag in self.fragments:
             frag.draw(surface)
@@ -245,8 +254,8 @@ class ModeSelectMenu:
         panel_rect = pygame.Rect(WINDOW_WIDTH//2-260, WINDOW_HEIGHT//2-120, 520, 240)
         draw_rounded_rect(self.surface, panel_rect, (255,255,255,240), 32)
         # 标题
-        font = pygame.font.Font(FONT_NAME, 44)
-        text = font.render("选择模式", True, (66,165,245))
+        font = get_font(FONT_NAME, 44)
+        text = render_text(font, "选择模式", True, (66,165,245))
         text_rect = text.get_rect(center=(WINDOW_WIDTH//2, panel_rect.top+48))
         self.surface.blit(text, text_rect)
         # 按钮
@@ -265,42 +274,40 @@ class Menu:
     def __init__(self, surface):
         self.surface = surface
         self.buttons = []
-        self.background_images = []
+        # 背景图延迟加载：启动时只解码当前这张，其余由后台线程加载
+        self.backgrounds = BackgroundLoader()
         self.current_bg_index = 0
-        self.snow_particles = [SnowParticle() for _ in range(SNOW_PARTICLE_COUNT)]
+        self.snow_particles = snowfall(PARTICLE_BUDGETS['menu_snow'], SNOW_PARTICLE_SPEED, SNOW_PARTICLE_SIZE)
         self.title_offset = 0
         self.title_direction = 1
         self.hide_icons = False  # 新增：是否隐藏图标
         # self.activity_page = ActivityPage(self.surface)  # 不再主窗口弹窗
-        self.load_backgrounds()
         self.load_bg_index()
+        self.load_backgrounds()
         self.setup_buttons()
         self.bubbles = [Bubble(WINDOW_WIDTH, WINDOW_HEIGHT) for _ in range(random.randint(3,5))]
+        # 雪花、泡泡、标题按经过的时间推进，空闲降帧时速度不变
+        self.anim_clock = AnimationClock()
         # 新增：模式选择弹窗
         self.show_mode_select = False
         self.mode_select_menu = ModeSelectMenu(self.surface)
 
     def load_backgrounds(self):
-        bg_dir = get_resource_path('backgrounds')
-        if os.path.exists(bg_dir):
-            for file in os.listdir(bg_dir):
-                if file.lower().endswith(('.png', '.jpg', '.bmp')):
-                    try:
-                        image_path = os.path.join(bg_dir, file)
-                        image = pygame.image.load(image_path)
-                        image = pygame.transform.scale(image, (WINDOW_WIDTH, WINDOW_HEIGHT))
-                        self.background_images.append(image)
-                    except pygame.error as e:
-                        print(f"错误：无法加载图片 {file}: {e}")
-                        continue
+        """列出背景图片并同步加载当前这张，其余图片从下一张（预览图）开始在后台线程中加载"""
+        count = self.backgrounds.scan(get_resource_path('backgrounds'))
+        if not 0 <= self.current_bg_index < count:
+            self.current_bg_index = 0
+        self.backgrounds.get(self.current_bg_index)
+        self.backgrounds.prefetch(self.backgrounds.next_index(self.current_bg_index))
 
     def load_bg_index(self):
         try:
             bg_index_path = get_resource_path('current_bg_index.json')
             with open(bg_index_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
+                # 编号是否超出图片数量由 load_backgrounds 检查
                 idx = int(data.get('current_bg_index', 0))
-                if 0 <= idx < len(self.background_images):
+                if idx >= 0:
                     self.current_bg_index = idx
         except Exception:
             pass
@@ -396,29 +403,41 @@ class Menu:
         )
         self.buttons = [start_button, settings_button, exit_button, bg_button, activity_button, shop_button, backpack_button, hide_icons_button]
 
-    def update_bubbles(self):
+    def is_animating(self):
+        """泡泡爆炸或按钮悬停时需要全帧率，其余只有缓慢的背景动画"""
+        return any(b.popped for b in self.bubbles) or any(button.is_hovered for button in self.buttons)
+
+    def update_bubbles(self, frames=1):
         for i, b in enumerate(self.bubbles):
-            b.update()
+            b.update(frames)
             if b.alpha <= 0 or b.y < -b.r*2:
                 self.bubbles[i] = Bubble(WINDOW_WIDTH, WINDOW_HEIGHT)
 
+    def draw_title_fill(self, grad, title):
+        """主标题的渐变填充：绿到黄的渐变按文字形状裁剪"""
+        grad.blit(layers.gradient(title.get_size(), [(102, 204, 102, 255), (255, 255, 0, 255)]), (0, 0))
+        title_mask = title.copy()
+        title_mask.set_colorkey((0,0,0))
+        grad.blit(title_mask, (0,0), special_flags=pygame.BLEND_RGBA_MULT)
+
     def draw(self):
         # 绘制背景
-        if self.background_images:
-            self.surface.blit(self.background_images[self.current_bg_index], (0, 0))
+        background = self.backgrounds.get(self.current_bg_index)
+        if background is not None:
+            self.surface.blit(background, (0, 0))
         else:
             self.surface.fill(BACKGROUND_COLOR)
         # 左上角显示版本号和开发者（可隐藏，且字体更小）
         if not self.hide_icons:
-            font_ver = pygame.font.Font(FONT_NAME, 14)
-            ver_text = font_ver.render("版本 2.6.2.3  开发者：宗成焕", True, (66, 165, 245))
+            font_ver = get_font(FONT_NAME, 14)
+            ver_text = render_text(font_ver, "版本 2.6.2.3  开发者：宗成焕", True, (66, 165, 245))
             self.surface.blit(ver_text, (12, 12))
+        frames = self.anim_clock.frames(pygame.time.get_ticks())
         # 更新和绘制雪花
-        for particle in self.snow_particles:
-            particle.update()
-            particle.draw(self.surface)
+        self.snow_particles.update(frames)
+        self.snow_particles.draw(self.surface)
         # 绘制泡泡
-        self.update_bubbles()
+        self.update_bubbles(frames)
         for b in self.bubbles:
             b.draw(self.surface)
         if self.hide_icons:
@@ -427,45 +446,38 @@ class Menu:
                     button.draw(self.surface, hide_state=True)
             return
         # --- 卡通风主标题 ---
-        self.title_offset += TITLE_FLOAT_SPEED * self.title_direction
+        self.title_offset += TITLE_FLOAT_SPEED * self.title_direction * frames
 
         # 优化切换背景按钮及预览
         for button in self.buttons:
             if isinstance(button, CircularButton):
-                next_idx = (self.current_bg_index + 1) % len(self.background_images) if self.background_images else 0
-                next_img = self.background_images[next_idx] if self.background_images else None
+                # 预览图还没在后台加载好时先不显示，不阻塞绘制
+                next_img = self.backgrounds.peek(self.backgrounds.next_index(self.current_bg_index))
                 button.draw(self.surface, next_bg_image=next_img, show_tip=True)
             else:
                 button.draw(self.surface)
         # 其它UI绘制...
         if abs(self.title_offset) > TITLE_FLOAT_AMPLITUDE:
             self.title_direction *= -1
-        font = pygame.font.Font(FONT_NAME, TITLE_FONT_SIZE+16)
+        font = get_font(FONT_NAME, TITLE_FONT_SIZE+16)
         text = "贪吃蛇"
         center_x = WINDOW_WIDTH // 2
         center_y = WINDOW_HEIGHT // 4 + int(self.title_offset)
         # 1. 黑色阴影
         for dx, dy in [(-4,4),(4,4),(-4,-4),(4,-4),(0,6)]:
-            shadow = font.render(text, True, (0,0,0))
+            shadow = render_text(font, text, True, (0,0,0))
             shadow_rect = shadow.get_rect(center=(center_x+dx, center_y+dy))
             self.surface.blit(shadow, shadow_rect)
         # 2. 彩色描边
         for dx, dy, color in [(-3,0,(0,200,0)),(3,0,(255,200,0)),(0,-3,(0,255,0)),(0,3,(255,255,0))]:
-            edge = font.render(text, True, color)
+            edge = render_text(font, text, True, color)
             edge_rect = edge.get_rect(center=(center_x+dx, center_y+dy))
             self.surface.blit(edge, edge_rect)
-        # 3. 渐变填充
-        title = font.render(text, True, (255,255,255))
+        # 3. 渐变填充（文字不变，整张图由 layers 缓存）
+        title = render_text(font, text, True, (255,255,255))
         title_rect = title.get_rect(center=(center_x, center_y))
-        grad = pygame.Surface(title.get_size(), pygame.SRCALPHA)
-        for y in range(title.get_height()):
-            r = int(102 + (255-102)*y/title.get_height())
-            g = int(204 + (255-204)*y/title.get_height())
-            b = int(102 + (0-102)*y/title.get_height())
-            pygame.draw.line(grad, (r,g,b), (0,y), (title.get_width(),y))
-        title_mask = title.copy()
-        title_mask.set_colorkey((0,0,0))
-        grad.blit(title_mask, (0,0), special_flags=pygame.BLEND_RGBA_MULT)
+        grad = layers.get_layer(('menu_title', font, text), title.get_size(),
+                                lambda surface: self.draw_title_fill(surface, title), alpha=True)
         self.surface.blit(grad, title_rect)
         # 4. Q版蛇头装饰
         cx = title_rect.right + 36
@@ -536,11 +548,13 @@ class Menu:
                 elif button.text == "活动":
                     return "activity"
                 elif isinstance(button, CircularButton):
-                    if self.background_images:
+                    if len(self.backgrounds):
                         # 渐变动画参数
                         button.fade_alpha = 0
-                        self.current_bg_index = (self.current_bg_index + 1) % len(self.background_images)
+                        self.current_bg_index = self.backgrounds.next_index(self.current_bg_index)
                         self.save_bg_index()
+                        # 新的下一张排到后台加载队列最前面
+                        self.backgrounds.prefetch(self.backgrounds.next_index(self.current_bg_index))
         return None
 
 class SettingsMenu:
@@ -719,18 +733,9 @@ class SettingsMenu:
     
     def _draw_modern_background(self):
         """绘制现代化背景"""
-        # 创建微妙的径向渐变背景
-        for y in range(WINDOW_HEIGHT):
-            ratio = y / WINDOW_HEIGHT
-            # 从深蓝到浅紫的渐变
-            r = int(50 + (80 - 50) * ratio)
-            g = int(120 + (140 - 120) * ratio) 
-            b = int(200 + (255 - 200) * ratio)
-            alpha = int(120 + (180 - 120) * ratio)
-            
-            overlay = pygame.Surface((WINDOW_WIDTH, 1), pygame.SRCALPHA)
-            overlay.fill((r, g, b, alpha))
-            self.surface.blit(overlay, (0, y))
+        # 创建微妙的径向渐变背景：从深蓝到浅紫，半透明
+        overlay = layers.gradient((WINDOW_WIDTH, WINDOW_HEIGHT), [(50, 120, 200, 120), (80, 140, 255, 180)])
+        self.surface.blit(overlay, (0, 0))
     
     def _draw_main_panel(self):
         """绘制主面板"""
@@ -766,14 +771,14 @@ class SettingsMenu:
         title_y = 80
         
         # 主标题 - 更大更醒目
-        title_font = pygame.font.Font(FONT_NAME, 52)
+        title_font = get_font(FONT_NAME, 52)
         title_text = "游戏设置"
         
         # 现代化标题效果 - 多层渐变阴影
         shadow_colors = [(0, 0, 0, 60), (66, 165, 245, 40), (156, 39, 176, 30)]
         for i, (r, g, b, a) in enumerate(shadow_colors):
             offset = 3 - i
-            shadow = title_font.render(title_text, True, (r, g, b, a))
+            shadow = render_text(title_font, title_text, True, (r, g, b, a))
             shadow_rect = shadow.get_rect(center=(WINDOW_WIDTH // 2 + offset, title_y + offset))
             self.surface.blit(shadow, shadow_rect)
         
@@ -788,7 +793,7 @@ class SettingsMenu:
             pygame.draw.line(title_gradient, (r, g, b), (x, 0), (x, 60), 1)
         
         # 渲染标题文本
-        title_surface = title_font.render(title_text, True, (255, 255, 255))
+        title_surface = render_text(title_font, title_text, True, (255, 255, 255))
         title_mask = pygame.mask.from_surface(title_surface)
         title_outline = title_mask.to_surface(setcolor=(255, 255, 255), unsetcolor=(0, 0, 0, 0))
         
@@ -801,9 +806,9 @@ class SettingsMenu:
         self.surface.blit(title_gradient, title_rect)
         
         # 副标题 - 更现代的字体和颜色
-        subtitle_font = pygame.font.Font(FONT_NAME, 22)
+        subtitle_font = get_font(FONT_NAME, 22)
         subtitle_text = "个性化您的游戏体验"
-        subtitle_surface = subtitle_font.render(subtitle_text, True, (100, 100, 120))
+        subtitle_surface = render_text(subtitle_font, subtitle_text, True, (100, 100, 120))
         subtitle_rect = subtitle_surface.get_rect(center=(WINDOW_WIDTH // 2, title_y + 40))
         self.surface.blit(subtitle_surface, subtitle_rect)
         
@@ -872,15 +877,15 @@ class SettingsMenu:
                               math.radians(angle_start), math.radians(angle_end), 3)
         
         # 卡片标题
-        title_font = pygame.font.Font(FONT_NAME, 24)
-        title_surface = title_font.render("游戏设置", True, (80, 80, 80))
+        title_font = get_font(FONT_NAME, 24)
+        title_surface = render_text(title_font, "游戏设置", True, (80, 80, 80))
         title_rect = title_surface.get_rect(center=(WINDOW_WIDTH // 2, card_y - 15))
         self.surface.blit(title_surface, title_rect)
     
     def _draw_status_info(self):
         """绘制状态信息"""
         info_y = WINDOW_HEIGHT - 60
-        info_font = pygame.font.Font(FONT_NAME, 18)
+        info_font = get_font(FONT_NAME, 18)
         
         # 获取当前音乐名称
         try:
@@ -896,7 +901,7 @@ class SettingsMenu:
         
         # 绘制状态文本
         status_text = f"当前背景音乐: {current_music}  |  版本: v2.0  |  状态: 正常运行"
-        status_surface = info_font.render(status_text, True, (80, 80, 100))
+        status_surface = render_text(info_font, status_text, True, (80, 80, 100))
         status_rect = status_surface.get_rect(center=(WINDOW_WIDTH // 2, info_y))
         self.surface.blit(status_surface, status_rect)
 
@@ -955,9 +960,9 @@ class MusicSelectionMenu:
         self.surface = surface
         self.audio_manager = audio_manager
         self.game_controller = game_controller
-        self.font = pygame.font.Font(FONT_NAME, 24)
-        self.title_font = pygame.font.Font(FONT_NAME, 36)
-        self.small_font = pygame.font.Font(FONT_NAME, 18)
+        self.font = get_font(FONT_NAME, 24)
+        self.title_font = get_font(FONT_NAME, 36)
+        self.small_font = get_font(FONT_NAME, 18)
         
         # 加载音乐列表
         self.music_list = self._load_music_list()
@@ -1292,7 +1297,7 @@ class MusicSelectionMenu:
             self.surface.blit(edge, edge_rect)
         
         # 主文字
-        main_title = self.title_font.render(title_text, True, (255, 255, 255))
+        main_title = render_text(self.title_font, title_text, True, (255, 255, 255))
         title_rect = main_title.get_rect(center=(WINDOW_WIDTH // 2, title_y))
         self.surface.blit(main_title, title_rect)
     
@@ -1385,12 +1390,12 @@ class MusicSelectionMenu:
         
         # 绘制音乐图标
         icon_text = "🎵"
-        icon_surface = self.font.render(icon_text, True, icon_color)
+        icon_surface = render_text(self.font, icon_text, True, icon_color)
         icon_rect = icon_surface.get_rect(center=(rect.centerx, rect.centery - 20))
         self.surface.blit(icon_surface, icon_rect)
         
         # 绘制音乐名称
-        name_text = self.font.render(music['name'], True, text_color)
+        name_text = render_text(self.font, music['name'], True, text_color)
         name_rect = name_text.get_rect(center=(rect.centerx, rect.centery + 5))
         self.surface.blit(name_text, name_rect)
         
@@ -1402,7 +1407,7 @@ class MusicSelectionMenu:
             status_text = "👆 点击选择"
             status_color = text_color
         
-        status_surface = self.small_font.render(status_text, True, status_color)
+        status_surface = render_text(self.small_font, status_text, True, status_color)
         status_rect = status_surface.get_rect(center=(rect.centerx, rect.centery + 25))
         self.surface.blit(status_surface, status_rect)
     
@@ -1431,12 +1436,318 @@ class MusicSelectionMenu:
             self.surface.blit(corner_surface, 
                             (WINDOW_WIDTH - 110 - offset, WINDOW_HEIGHT - 110 - offset))
 
+def volume_bar_layer(size, colors):
+    """音量进度条：整条宽度的横向渐变加圆角，只画一次；绘制时按进度截取左边一段（截断的一端被滑块盖住）"""
+    def draw(surface):
+        surface.blit(layers.gradient(size, colors, 'horizontal'), (0, 0))
+        mask = pygame.Surface(size, pygame.SRCALPHA)
+        pygame.draw.rect(mask, (255, 255, 255), (0, 0) + tuple(size), border_radius=15)
+        surface.blit(mask, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+    return layers.get_layer(('volume_bar', tuple(colors)), size, draw, alpha=True)
+
+class VolumeSettingsMenu:
+    """音量设置页面：背景音乐和游戏音效两条音量条，可拖动滑块、点击音量条、用 +/- 按钮或方向键调节"""
+    # 音量条参数 - 更宽更美观
+    bar_width = 350
+    bar_height = 30
+    bar_x = WINDOW_WIDTH//2 - bar_width//2
+    # 滑块参数
+    slider_radius = 18
+    # 按钮参数
+    button_width = 50
+    button_height = 50
+    button_margin = 20
+
+    def __init__(self, surface, audio_manager):
+        self.surface = surface
+        self.audio_manager = audio_manager
+        self.font = get_font(FONT_NAME, 26)
+        self.title_font = get_font(FONT_NAME, 36)
+        self.open()
+
+    def open(self):
+        """进入页面时读取当前音量"""
+        self.music_volume = self.audio_manager.get_music_volume()
+        self.sound_volume = self.audio_manager.get_sound_volume()
+        self.music_slider_dragging = False
+        self.sound_slider_dragging = False
+
+    def handle_event(self, event):
+        """按 ESC 时返回 "back"，其余事件用来调节音量"""
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
+                return "back"
+            elif event.key == pygame.K_UP:
+                self.music_volume = min(1.0, self.music_volume + 0.05)
+                self.audio_manager.set_music_volume(self.music_volume)
+            elif event.key == pygame.K_DOWN:
+                self.music_volume = max(0.0, self.music_volume - 0.05)
+                self.audio_manager.set_music_volume(self.music_volume)
+            elif event.key == pygame.K_RIGHT:
+                self.sound_volume = min(1.0, self.sound_volume + 0.05)
+                self.audio_manager.set_sound_volume(self.sound_volume)
+            elif event.key == pygame.K_LEFT:
+                self.sound_volume = max(0.0, self.sound_volume - 0.05)
+                self.audio_manager.set_sound_volume(self.sound_volume)
+        
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:  # 左键点击
+                mouse_x, mouse_y = event.pos
+                
+                # 计算音量条位置
+                panel_rect = pygame.Rect(WINDOW_WIDTH//2 - 350, WINDOW_HEIGHT//2 - 250, 700, 500)
+                music_y = panel_rect.y + 150
+                music_bar_y = music_y + 50
+                sound_y = music_y + 160
+                sound_bar_y = sound_y + 50
+                
+                # 音乐音量滑块区域
+                music_slider_x = self.bar_x + int(self.bar_width * self.music_volume)
+                music_slider_rect = pygame.Rect(music_slider_x - self.slider_radius, music_bar_y - self.slider_radius + self.bar_height//2, 
+                                              self.slider_radius*2, self.slider_radius*2)
+                if music_slider_rect.collidepoint(mouse_x, mouse_y):
+                    self.music_slider_dragging = True
+                
+                # 音效音量滑块区域
+                sound_slider_x = self.bar_x + int(self.bar_width * self.sound_volume)
+                sound_slider_rect = pygame.Rect(sound_slider_x - self.slider_radius, sound_bar_y - self.slider_radius + self.bar_height//2, 
+                                              self.slider_radius*2, self.slider_radius*2)
+                if sound_slider_rect.collidepoint(mouse_x, mouse_y):
+                    self.sound_slider_dragging = True
+                
+                # 音乐音量条点击区域
+                music_bar_rect = pygame.Rect(self.bar_x, music_bar_y, self.bar_width, self.bar_height)
+                if music_bar_rect.collidepoint(mouse_x, mouse_y) and not self.music_slider_dragging:
+                    # 计算点击位置对应的音量值
+                    relative_x = mouse_x - self.bar_x
+                    self.music_volume = max(0.0, min(1.0, relative_x / self.bar_width))
+                    self.audio_manager.set_music_volume(self.music_volume)
+                
+                # 音效音量条点击区域
+                sound_bar_rect = pygame.Rect(self.bar_x, sound_bar_y, self.bar_width, self.bar_height)
+                if sound_bar_rect.collidepoint(mouse_x, mouse_y) and not self.sound_slider_dragging:
+                    # 计算点击位置对应的音量值
+                    relative_x = mouse_x - self.bar_x
+                    self.sound_volume = max(0.0, min(1.0, relative_x / self.bar_width))
+                    self.audio_manager.set_sound_volume(self.sound_volume)
+                
+                # 音乐音量快捷按钮
+                music_minus_rect = pygame.Rect(self.bar_x - self.button_width - self.button_margin, music_bar_y - (self.button_height - self.bar_height)//2, 
+                                             self.button_width, self.button_height)
+                if music_minus_rect.collidepoint(mouse_x, mouse_y):
+                    self.music_volume = max(0.0, self.music_volume - 0.1)
+                    self.audio_manager.set_music_volume(self.music_volume)
+                
+                music_plus_rect = pygame.Rect(self.bar_x + self.bar_width + self.button_margin, music_bar_y - (self.button_height - self.bar_height)//2, 
+                                            self.button_width, self.button_height)
+                if music_plus_rect.collidepoint(mouse_x, mouse_y):
+                    self.music_volume = min(1.0, self.music_volume + 0.1)
+                    self.audio_manager.set_music_volume(self.music_volume)
+                
+                # 音效音量快捷按钮
+                sound_minus_rect = pygame.Rect(self.bar_x - self.button_width - self.button_margin, sound_bar_y - (self.button_height - self.bar_height)//2, 
+                                             self.button_width, self.button_height)
+                if sound_minus_rect.collidepoint(mouse_x, mouse_y):
+                    self.sound_volume = max(0.0, self.sound_volume - 0.1)
+                    self.audio_manager.set_sound_volume(self.sound_volume)
+                
+                sound_plus_rect = pygame.Rect(self.bar_x + self.bar_width + self.button_margin, sound_bar_y - (self.button_height - self.bar_height)//2, 
+                                            self.button_width, self.button_height)
+                if sound_plus_rect.collidepoint(mouse_x, mouse_y):
+                    self.sound_volume = min(1.0, self.sound_volume + 0.1)
+                    self.audio_manager.set_sound_volume(self.sound_volume)
+        
+        elif event.type == pygame.MOUSEBUTTONUP:
+            if event.button == 1:  # 左键释放
+                self.music_slider_dragging = False
+                self.sound_slider_dragging = False
+        
+        elif event.type == pygame.MOUSEMOTION:
+            if self.music_slider_dragging:
+                mouse_x, mouse_y = event.pos
+                relative_x = mouse_x - self.bar_x
+                self.music_volume = max(0.0, min(1.0, relative_x / self.bar_width))
+                self.audio_manager.set_music_volume(self.music_volume)
+            
+            if self.sound_slider_dragging:
+                mouse_x, mouse_y = event.pos
+                relative_x = mouse_x - self.bar_x
+                self.sound_volume = max(0.0, min(1.0, relative_x / self.bar_width))
+                self.audio_manager.set_sound_volume(self.sound_volume)
+        return None
+
+    def draw(self):
+        # 绘制音量设置界面 - 美化背景设计
+        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
+        overlay.fill((0, 0, 0, 150))
+        self.surface.blit(overlay, (0, 0))
+        
+        # 绘制设置面板 - 采用现代化玻璃态设计
+        panel_rect = pygame.Rect(WINDOW_WIDTH//2 - 350, WINDOW_HEIGHT//2 - 250, 700, 500)
+        
+        # 多层阴影效果
+        for i in range(4):
+            shadow_offset = 5 + i * 2
+            shadow_alpha = 35 - i * 8
+            shadow_surface = pygame.Surface((700, 500), pygame.SRCALPHA)
+            pygame.draw.rect(shadow_surface, (0, 0, 0, shadow_alpha), 
+                           (0, 0, 700, 500), border_radius=30)
+            self.surface.blit(shadow_surface, (panel_rect.x + shadow_offset, panel_rect.y + shadow_offset))
+        
+        # 玻璃态面板背景 - 渐变效果
+        # 从深紫到浅蓝的渐变，更加精美（layers 缓存，不再每帧逐行生成）
+        glass_surface = layers.gradient((700, 500), [(240, 245, 255, 255), (255, 255, 255, 244)])
+        self.surface.blit(glass_surface, panel_rect)
+        
+        # 多层边框效果
+        pygame.draw.rect(self.surface, (200, 220, 255, 180), panel_rect, 3, border_radius=30)
+        pygame.draw.rect(self.surface, (255, 255, 255, 120), panel_rect, 1, border_radius=30)
+        
+        # 发光效果
+        glow_pulse = time.time() * 2
+        glow_intensity = math.sin(glow_pulse) * 0.3 + 0.7
+        for i in range(3):
+            glow_alpha = int(80 * glow_intensity / (i + 1))
+            glow_rect = pygame.Rect(panel_rect.x - i * 2, panel_rect.y - i * 2, 
+                                  panel_rect.width + i * 4, panel_rect.height + i * 4)
+            pygame.draw.rect(self.surface, (156, 39, 176, glow_alpha), glow_rect, 2, border_radius=30)
+        
+        # 标题 - 更大更醒目
+        title_shadow = render_text(self.title_font, "🔊 音量设置", True, (0, 0, 0, 100))
+        title_shadow_rect = title_shadow.get_rect(center=(WINDOW_WIDTH//2 + 2, panel_rect.y + 70 + 2))
+        self.surface.blit(title_shadow, title_shadow_rect)
+        
+        title = render_text(self.title_font, "🔊 音量设置", True, (66, 165, 245))
+        title_rect = title.get_rect(center=(WINDOW_WIDTH//2, panel_rect.y + 70))
+        self.surface.blit(title, title_rect)
+        
+        # 装饰线
+        line_y = panel_rect.y + 110
+        line_width = 400
+        line_x = (WINDOW_WIDTH - line_width) // 2
+        
+        # 渐变线条：从紫色渐变到蓝色，中间最亮
+        line_surface = layers.gradient((line_width, 3), [(156, 39, 176, 0), (111, 102, 210, 200), (66, 165, 245, 0)], 'horizontal')
+        self.surface.blit(line_surface, (line_x, line_y))
+        
+        # 音乐音量区域 - 增加间距
+        music_y = panel_rect.y + 150
+        music_label = render_text(self.font, "🎵 背景音乐音量", True, (80, 80, 100))
+        music_label_rect = music_label.get_rect(center=(WINDOW_WIDTH//2, music_y))
+        self.surface.blit(music_label, music_label_rect)
+        
+        # 音乐音量条 - 增加间距和美化
+        music_bar_y = music_y + 50
+        
+        # 绘制音乐音量快捷按钮
+        music_minus_rect = pygame.Rect(self.bar_x - self.button_width - self.button_margin, music_bar_y - (self.button_height - self.bar_height)//2, 
+                                     self.button_width, self.button_height)
+        pygame.draw.rect(self.surface, (240, 240, 250), music_minus_rect, border_radius=25)
+        pygame.draw.rect(self.surface, (156, 39, 176), music_minus_rect, 2, border_radius=25)
+        minus_font = get_font(FONT_NAME, 30)
+        minus_text = render_text(minus_font, "-", True, (156, 39, 176))
+        minus_rect = minus_text.get_rect(center=music_minus_rect.center)
+        self.surface.blit(minus_text, minus_rect)
+        
+        music_plus_rect = pygame.Rect(self.bar_x + self.bar_width + self.button_margin, music_bar_y - (self.button_height - self.bar_height)//2, 
+                                    self.button_width, self.button_height)
+        pygame.draw.rect(self.surface, (240, 240, 250), music_plus_rect, border_radius=25)
+        pygame.draw.rect(self.surface, (156, 39, 176), music_plus_rect, 2, border_radius=25)
+        plus_text = render_text(minus_font, "+", True, (156, 39, 176))
+        plus_rect = plus_text.get_rect(center=music_plus_rect.center)
+        self.surface.blit(plus_text, plus_rect)
+        
+        # 背景条 - 更美观的凹槽效果
+        pygame.draw.rect(self.surface, (220, 220, 230), (self.bar_x, music_bar_y, self.bar_width, self.bar_height), border_radius=15)
+        pygame.draw.rect(self.surface, (200, 200, 210), (self.bar_x, music_bar_y, self.bar_width, self.bar_height), 1, border_radius=15)
+        
+        # 进度条 - 渐变效果
+        progress_width = int(self.bar_width * self.music_volume)
+        if progress_width > 0:
+            music_bar = volume_bar_layer((self.bar_width, self.bar_height), ((66, 165, 245), (156, 39, 176)))
+            self.surface.blit(music_bar, (self.bar_x, music_bar_y), (0, 0, progress_width, self.bar_height))
+        
+        # 滑块 - 更现代的设计
+        music_slider_x = self.bar_x + progress_width
+        # 滑块阴影
+        pygame.draw.circle(self.surface, (0, 0, 0, 50), (music_slider_x, music_bar_y + self.bar_height//2 + 2), self.slider_radius)
+        # 滑块本体
+        pygame.draw.circle(self.surface, (255, 255, 255), (music_slider_x, music_bar_y + self.bar_height//2), self.slider_radius)
+        pygame.draw.circle(self.surface, (156, 39, 176), (music_slider_x, music_bar_y + self.bar_height//2), self.slider_radius, 2)
+        
+        # 音乐音量值 - 调整位置，增加间距
+        music_value = render_text(self.font, f"{int(self.music_volume * 100)}%", True, (156, 39, 176))
+        music_value_rect = music_value.get_rect(center=(WINDOW_WIDTH//2, music_bar_y + 60))
+        self.surface.blit(music_value, music_value_rect)
+        
+        # 音效音量区域 - 增加间距
+        sound_y = music_y + 160
+        sound_label = render_text(self.font, "🔔 游戏音效音量", True, (80, 80, 100))
+        sound_label_rect = sound_label.get_rect(center=(WINDOW_WIDTH//2, sound_y))
+        self.surface.blit(sound_label, sound_label_rect)
+        
+        # 音效音量条 - 增加间距和美化
+        sound_bar_y = sound_y + 50
+        
+        # 绘制音效音量快捷按钮
+        sound_minus_rect = pygame.Rect(self.bar_x - self.button_width - self.button_margin, sound_bar_y - (self.button_height - self.bar_height)//2, 
+                                     self.button_width, self.button_height)
+        pygame.draw.rect(self.surface, (240, 240, 250), sound_minus_rect, border_radius=25)
+        pygame.draw.rect(self.surface, (66, 165, 245), sound_minus_rect, 2, border_radius=25)
+        self.surface.blit(minus_text, minus_text.get_rect(center=sound_minus_rect.center))
+        
+        sound_plus_rect = pygame.Rect(self.bar_x + self.bar_width + self.button_margin, sound_bar_y - (self.button_height - self.bar_height)//2, 
+                                    self.button_width, self.button_height)
+        pygame.draw.rect(self.surface, (240, 240, 250), sound_plus_rect, border_radius=25)
+        pygame.draw.rect(self.surface, (66, 165, 245), sound_plus_rect, 2, border_radius=25)
+        self.surface.blit(plus_text, plus_text.get_rect(center=sound_plus_rect.center))
+        
+        # 背景条 - 更美观的凹槽效果
+        pygame.draw.rect(self.surface, (220, 220, 230), (self.bar_x, sound_bar_y, self.bar_width, self.bar_height), border_radius=15)
+        pygame.draw.rect(self.surface, (200, 200, 210), (self.bar_x, sound_bar_y, self.bar_width, self.bar_height), 1, border_radius=15)
+        
+        # 进度条 - 渐变效果
+        sound_progress_width = int(self.bar_width * self.sound_volume)
+        if sound_progress_width > 0:
+            sound_bar = volume_bar_layer((self.bar_width, self.bar_height), ((255, 99, 132), (66, 165, 245)))
+            self.surface.blit(sound_bar, (self.bar_x, sound_bar_y), (0, 0, sound_progress_width, self.bar_height))
+        
+        # 滑块 - 更现代的设计
+        sound_slider_x = self.bar_x + sound_progress_width
+        # 滑块阴影
+        pygame.draw.circle(self.surface, (0, 0, 0, 50), (sound_slider_x, sound_bar_y + self.bar_height//2 + 2), self.slider_radius)
+        # 滑块本体
+        pygame.draw.circle(self.surface, (255, 255, 255), (sound_slider_x, sound_bar_y + self.bar_height//2), self.slider_radius)
+        pygame.draw.circle(self.surface, (66, 165, 245), (sound_slider_x, sound_bar_y + self.bar_height//2), self.slider_radius, 2)
+        
+        # 音效音量值 - 调整位置，增加间距
+        sound_value = render_text(self.font, f"{int(self.sound_volume * 100)}%", True, (66, 165, 245))
+        sound_value_rect = sound_value.get_rect(center=(WINDOW_WIDTH//2, sound_bar_y + 60))
+        self.surface.blit(sound_value, sound_value_rect)
+        
+        # 控制说明 - 优化提示位置和布局，增加间距
+        help_y = panel_rect.bottom - 70
+        
+        # 创建提示背景 - 更美观的卡片式设计
+        help_bg_rect = pygame.Rect(panel_rect.x + 50, help_y - 20, panel_rect.width - 100, 50)
+        help_bg_surface = pygame.Surface((panel_rect.width - 100, 50), pygame.SRCALPHA)
+        pygame.draw.rect(help_bg_surface, (255, 255, 255, 50), (0, 0, panel_rect.width - 100, 50), border_radius=15)
+        self.surface.blit(help_bg_surface, help_bg_rect)
+        
+        # 分行显示操作提示，更清晰易读
+        small_font = get_font(FONT_NAME, 20)
+        help_text = "🖱️ 拖动滑块或点击音量条调节  |  ⚙️ ↑↓←→微调  |  ❌ ESC返回"
+        
+        help_surface = render_text(small_font, help_text, True, (80, 80, 100))
+        help_rect = help_surface.get_rect(center=(WINDOW_WIDTH//2, help_y))
+        self.surface.blit(help_surface, help_rect)
+
 class HelpMenu:
     def __init__(self, surface):
         self.surface = surface
-        self.font_title = pygame.font.Font(FONT_NAME, 36)
-        self.font_heading = pygame.font.Font(FONT_NAME, 28)
-        self.font_text = pygame.font.Font(FONT_NAME, 22)
+        self.font_title = get_font(FONT_NAME, 36)
+        self.font_heading = get_font(FONT_NAME, 28)
+        self.font_text = get_font(FONT_NAME, 22)
         self.scroll_y = 0
         self.help_content = load_help_text()
         self.total_content_height = self._calculate_content_height()
@@ -1461,6 +1772,9 @@ class HelpMenu:
                 height += self.font_text.get_height() + 10
         return height
 
+    def is_animating(self):
+        return self.back_button.is_hovered
+
     def handle_event(self, event):
         if self.back_button.handle_event(event):
             return "back"
@@ -1476,32 +1790,24 @@ class HelpMenu:
 
         return None
 
-    def draw(self):
-        # 恢复为原始的帮助页面背景样式
+    @staticmethod
+    def draw_panel(surface):
+        """遮罩和面板图层：原来直接画在窗口上，颜色里的透明度不起作用，所以面板、边框、阴影都按不透明画"""
         # 使用深色半透明遮罩提升可读性
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 220))  # 增加透明度到220，更突出内容
-        self.surface.blit(overlay, (0, 0))
-
-        # 创建渐变背景面板
+        surface.fill((0, 0, 0, 220))  # 增加透明度到220，更突出内容
         panel_rect = pygame.Rect(50, 50, WINDOW_WIDTH - 100, WINDOW_HEIGHT - 100)
-        
-        # 绘制带有渐变效果的圆角矩形背景
-        gradient_height = panel_rect.height
-        for y in range(gradient_height):
-            alpha = int(180 + 30 * math.sin(y * math.pi / gradient_height))
-            color = (20, 30, 40, alpha)
-            pygame.draw.line(self.surface, color, 
-                           (panel_rect.left, panel_rect.top + y), 
-                           (panel_rect.right, panel_rect.top + y))
-        
+        # 面板背景（逐行画线时包含右边界那一列）
+        surface.fill((20, 30, 40), (panel_rect.left, panel_rect.top, panel_rect.width + 1, panel_rect.height))
         # 添加边框效果
-        pygame.draw.rect(self.surface, (66, 165, 245, 200), panel_rect, 3, border_radius=15)  # 使用主题蓝色边框
-        
+        pygame.draw.rect(surface, (66, 165, 245), panel_rect, 3, border_radius=15)  # 使用主题蓝色边框
         # 添加微妙的阴影效果
-        shadow_rect = panel_rect.move(-5, -5)
-        pygame.draw.rect(self.surface, (0, 0, 0, 80), shadow_rect, border_radius=15)
-        
+        pygame.draw.rect(surface, (0, 0, 0), panel_rect.move(-5, -5), border_radius=15)
+
+    def draw(self):
+        # 恢复为原始的帮助页面背景样式：遮罩和面板不会变化，只画一次
+        self.surface.blit(layers.get_layer(('help_panel',), (WINDOW_WIDTH, WINDOW_HEIGHT), self.draw_panel, alpha=True), (0, 0))
+        panel_rect = pygame.Rect(50, 50, WINDOW_WIDTH - 100, WINDOW_HEIGHT - 100)
+
         y_offset = 70 + self.scroll_y
         for line in self.help_content:
             if y_offset > panel_rect.bottom - 30:
@@ -1523,7 +1829,7 @@ class HelpMenu:
                 y_offset += 15
             
             if y_offset >= 60:
-                text_surf = font.render(line, True, color)
+                text_surf = render_text(font, line, True, color)
                 self.surface.blit(text_surf, (x_pos, y_offset))
 
             y_offset += font.get_height() + 5
@@ -1557,8 +1863,8 @@ class PauseMenu:
         panel_rect = pygame.Rect(WINDOW_WIDTH//2-260, WINDOW_HEIGHT//2-120, 520, 240)
         draw_rounded_rect(self.surface, panel_rect, (255,255,255,240), 32)
         # 标题
-        font = pygame.font.Font(FONT_NAME, 44)
-        text = font.render("游戏暂停", True, (66,165,245))
+        font = get_font(FONT_NAME, 44)
+        text = render_text(font, "游戏暂停", True, (66,165,245))
         text_rect = text.get_rect(center=(WINDOW_WIDTH//2, panel_rect.top+48))
         self.surface.blit(text, text_rect)
         # 优化按钮布局：标题下方留足间距，按钮整体在面板下半部分居中
@@ -1616,9 +1922,9 @@ class GameOverMenuSingle:
         overlay.set_alpha(MENU_BACKGROUND_ALPHA)
         overlay.fill((0, 0, 0))
         self.surface.blit(overlay, (0, 0))
-        font_title = pygame.font.Font(FONT_NAME, TITLE_FONT_SIZE + 18)
-        font_score = pygame.font.Font(FONT_NAME, FONT_SIZE+16)
-        font_result = pygame.font.Font(FONT_NAME, FONT_SIZE+18)
+        font_title = get_font(FONT_NAME, TITLE_FONT_SIZE + 18)
+        font_score = get_font(FONT_NAME, FONT_SIZE+16)
+        font_result = get_font(FONT_NAME, FONT_SIZE+18)
         # 计算高度
         title_h = font_title.get_height() + 16
         panel_h = 70
@@ -1630,14 +1936,14 @@ class GameOverMenuSingle:
         # 标题
         text = "游戏结束"
         for dx, dy in [(-5,5),(5,5),(-5,-5),(5,-5),(0,8)]:
-            shadow = font_title.render(text, True, (0,0,0))
+            shadow = render_text(font_title, text, True, (0,0,0))
             shadow_rect = shadow.get_rect(center=(center_x+dx, y+title_h//2+dy))
             self.surface.blit(shadow, shadow_rect)
         for dx, dy, color in [(-3,0,(0,200,0)),(3,0,(255,200,0)),(0,-3,(0,255,0)),(0,3,(255,255,0))]:
-            edge = font_title.render(text, True, color)
+            edge = render_text(font_title, text, True, color)
             edge_rect = edge.get_rect(center=(center_x+dx, y+title_h//2+dy))
             self.surface.blit(edge, edge_rect)
-        title = font_title.render(text, True, (255,255,255))
+        title = render_text(font_title, text, True, (255,255,255))
         title_rect = title.get_rect(center=(center_x, y+title_h//2))
         self.surface.blit(title, title_rect)
         y += title_h + gap
@@ -1646,7 +1952,7 @@ class GameOverMenuSingle:
         panel_rect = pygame.Rect(center_x - panel_w//2, y, panel_w, panel_h)
         pygame.draw.rect(self.surface, (66,165,245,180), panel_rect, border_radius=22)
         pygame.draw.rect(self.surface, (255,255,255), panel_rect, 4, border_radius=22)
-        txt = font_score.render(f"最终分数: {score}", True, (255,255,255))
+        txt = render_text(font_score, f"最终分数: {score}", True, (255,255,255))
         self.surface.blit(txt, (panel_rect.x+32, y+panel_h//2-txt.get_height()//2))
         y += panel_h + gap
         # 按钮
@@ -1688,16 +1994,17 @@ class GameOverMenuDual:
             icon_type="door"
         )
         self.buttons = [restart_button, main_menu_button]
-    def draw(self, score1=None, score2=None, winner=None):
+    def draw(self, score1=None, score2=None, winner=None, names=("玩家1", "玩家2"), result_text=None):
+        """names 为两个分数面板的名字；result_text 不为空时直接显示该胜负信息"""
         overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
         overlay.set_alpha(MENU_BACKGROUND_ALPHA)
         overlay.fill((0, 0, 0))
         self.surface.blit(overlay, (0, 0))
 
         # 字体
-        font_title = pygame.font.Font(FONT_NAME, TITLE_FONT_SIZE + 18)
-        font_score = pygame.font.Font(FONT_NAME, FONT_SIZE+16)
-        font_result = pygame.font.Font(FONT_NAME, FONT_SIZE+18)
+        font_title = get_font(FONT_NAME, TITLE_FONT_SIZE + 18)
+        font_score = get_font(FONT_NAME, FONT_SIZE+16)
+        font_result = get_font(FONT_NAME, FONT_SIZE+18)
 
         # 计算各部分高度
         title_h = font_title.get_height() + 16
@@ -1712,14 +2019,14 @@ class GameOverMenuDual:
         # --- 标题 ---
         text = "游戏结束"
         for dx, dy in [(-5,5),(5,5),(-5,-5),(5,-5),(0,8)]:
-            shadow = font_title.render(text, True, (0,0,0))
+            shadow = render_text(font_title, text, True, (0,0,0))
             shadow_rect = shadow.get_rect(center=(center_x+dx, y+title_h//2+dy))
             self.surface.blit(shadow, shadow_rect)
         for dx, dy, color in [(-3,0,(0,200,0)),(3,0,(255,200,0)),(0,-3,(0,255,0)),(0,3,(255,255,0))]:
-            edge = font_title.render(text, True, color)
+            edge = render_text(font_title, text, True, color)
             edge_rect = edge.get_rect(center=(center_x+dx, y+title_h//2+dy))
             self.surface.blit(edge, edge_rect)
-        title = font_title.render(text, True, (255,255,255))
+        title = render_text(font_title, text, True, (255,255,255))
         title_rect = title.get_rect(center=(center_x, y+title_h//2))
         self.surface.blit(title, title_rect)
         y += title_h + gap
@@ -1735,26 +2042,28 @@ class GameOverMenuDual:
         panel1 = pygame.Rect(x1 - panel_w//2, y, panel_w, panel_h)
         pygame.draw.rect(self.surface, (0,120,255,180), panel2, border_radius=22)
         pygame.draw.rect(self.surface, (255,255,255), panel2, 4, border_radius=22)
-        txt2 = font_score.render(f"玩家2分数: {score2}", True, (255,255,255))
+        txt2 = render_text(font_score, f"{names[1]}分数: {score2}", True, (255,255,255))
         self.surface.blit(txt2, (panel2.x+32, y+panel_h//2-txt2.get_height()//2))
         pygame.draw.rect(self.surface, (0,200,0,180), panel1, border_radius=22)
         pygame.draw.rect(self.surface, (255,255,255), panel1, 4, border_radius=22)
-        txt1 = font_score.render(f"玩家1分数: {score1}", True, (255,255,255))
+        txt1 = render_text(font_score, f"{names[0]}分数: {score1}", True, (255,255,255))
         self.surface.blit(txt1, (panel1.x+32, y+panel_h//2-txt1.get_height()//2))
         y += panel_h + gap
 
         # --- 胜负信息 ---
-        if winner == 1:
+        if result_text is not None:
+            color = (255,200,0)
+        elif winner == 1:
             result_text, color = "玩家1胜利！", (0,200,0)
         elif winner == 2:
             result_text, color = "玩家2胜利！", (0,120,255)
         else:
             result_text, color = "平局！", (255,200,0)
         for dx, dy in [(-3,3),(3,3),(-3,-3),(3,-3),(0,5)]:
-            shadow = font_result.render(result_text, True, (0,0,0))
+            shadow = render_text(font_result, result_text, True, (0,0,0))
             shadow_rect = shadow.get_rect(center=(center_x+dx, y+result_h//2+dy))
             self.surface.blit(shadow, shadow_rect)
-        result = font_result.render(result_text, True, color)
+        result = render_text(font_result, result_text, True, color)
         result_rect = result.get_rect(center=(center_x, y+result_h//2))
         self.surface.blit(result, result_rect)
         y += result_h + gap
@@ -1838,7 +2147,7 @@ class ModernIconButton(Button):
             pygame.draw.arc(surface, (255,255,255), (icon_center[0]-8, icon_center[1]-10, 8, 8), 0.8, 2.4, 2)
             pygame.draw.arc(surface, (255,255,255), (icon_center[0], icon_center[1]-10, 8, 8), 0.8, 2.4, 2)
         # 文字
-        text_surface = self.font.render(self.text, True, self.text_color)
+        text_surface = render_text(self.font, self.text, True, self.text_color)
         text_rect = text_surface.get_rect(midleft=(rect.x + 44, rect.centery))
         surface.blit(text_surface, text_rect)
 
@@ -1,6 +1,7 @@
 import pygame
 import random
 from .constants import FONT_NAME, WINDOW_WIDTH, WINDOW_HEIGHT
+from .fonts import get_font, render_text
 
 DIFFICULTY = {
     "初级": {"rows": 9, "cols": 9, "mines": 10},
@@ -328,8 +329,8 @@ class MinesweeperGame:
                 rect = pygame.Rect(x + i*(seg_w+gap), y, seg_w, seg_h)
                 pygame.draw.rect(self.surface, (0,0,0), rect)
                 # 使用红色数字模拟数码管
-                dig_font = pygame.font.Font(FONT_NAME, 24)
-                txt = dig_font.render(ch, True, (255,0,0))
+                dig_font = get_font(FONT_NAME, 24)
+                txt = render_text(dig_font, ch, True, (255,0,0))
                 self.surface.blit(txt, txt.get_rect(center=rect.center))
 
         # 左侧：难度按钮与剩余雷数（含“全屏”）
@@ -338,13 +339,13 @@ class MinesweeperGame:
         btn_w = 64
         btn_h = 28
         btn_start_x = 20
-        small_font = pygame.font.Font(FONT_NAME, 18)
+        small_font = get_font(FONT_NAME, 18)
         for i, name in enumerate(diff_names):
             sel = name == self.difficulty
             rect = pygame.Rect(btn_start_x + i*(btn_w+btn_gap), 14, btn_w, btn_h)
             pygame.draw.rect(self.surface, (160,160,160) if sel else (210,210,210), rect)
             pygame.draw.rect(self.surface, (255,255,255), rect, 1)
-            label = small_font.render(name, True, (0,0,0))
+            label = render_text(small_font, name, True, (0,0,0))
             self.surface.blit(label, label.get_rect(center=rect.center))
         # 剩余雷数
         remaining = max(0, self.mines - self.flagged_cells)
@@ -373,8 +374,8 @@ class MinesweeperGame:
 
         # 顶部栏胜利提示（不在棋盘上显示）
         if self.game_over and self.win:
-            victory_font = pygame.font.Font(FONT_NAME, 24)
-            victory_text = victory_font.render("胜利！", True, (255, 255, 0))
+            victory_font = get_font(FONT_NAME, 24)
+            victory_text = render_text(victory_font, "胜利！", True, (255, 255, 0))
             vx = face_rect.right + 16
             vy = face_rect.centery - victory_text.get_height() // 2
             self.surface.blit(victory_text, (vx, vy))
@@ -386,9 +387,9 @@ class MinesweeperGame:
         protect_rect = self._get_protect_toggle_rect(surface_w)
         pygame.draw.rect(self.surface, (210,210,210), protect_rect)
         pygame.draw.rect(self.surface, (255,255,255), protect_rect, 1)
-        small_font = pygame.font.Font(FONT_NAME, 18)
+        small_font = get_font(FONT_NAME, 18)
         label = "保护:开" if self.safe_click_protect_enabled else "保护:关"
-        txt = small_font.render(label, True, (0,0,0))
+        txt = render_text(small_font, label, True, (0,0,0))
         self.surface.blit(txt, txt.get_rect(center=protect_rect.center))
         # 游戏区外框（经典凹凸边）
         offset_x, offset_y = self.get_grid_offset()
@@ -463,8 +464,8 @@ class MinesweeperGame:
                         draw_mine(rect, exploded=(self.exploded_pos == (x, y)))
                     elif cell.number > 0:
                         # 数字字号下调，提升清晰度并留白
-                        num_font = pygame.font.Font(FONT_NAME, 18)
-                        text = num_font.render(str(cell.number), True, self.get_number_color(cell.number))
+                        num_font = get_font(FONT_NAME, 18)
+                        text = render_text(num_font, str(cell.number), True, self.get_number_color(cell.number))
                         self.surface.blit(text, text.get_rect(center=rect.center))
                 elif cell.is_flag:
                     # 经典旗帜样式（红旗+黑杆）
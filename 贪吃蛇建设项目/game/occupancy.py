@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+import random
+from array import array
+from collections.abc import Sequence
+from .core_constants import GRID_WIDTH, GRID_HEIGHT
+
+class FreeCellIndex:
+    """
+    空闲格子索引：交换删除数组 + 位置表，添加/删除/随机取样都是 O(1)。
+    格子用编号 y * width + x 存储，取样时再转换回 (x, y)。
+    """
+
+    def __init__(self, width, height):
+        self.width = width
+        self._cells = array('i', range(width * height))  # 当前所有空闲格子编号
+        self._slot = array('i', range(width * height))   # 格子编号 -> 在 _cells 中的下标，-1 表示不空闲
+
+    def __len__(self):
+        return len(self._cells)
+
+    def __contains__(self, cell):
+        index = cell[1] * self.width + cell[0]
+        return 0 <= index < len(self._slot) and self._slot[index] >= 0
+
+    def add_index(self, index):
+        if self._slot[index] < 0:
+            self._slot[index] = len(self._cells)
+            self._cells.append(index)
+
+    def discard_index(self, index):
+        slot = self._slot[index]
+        if slot < 0:
+            return
+        # 用最后一个元素填补被删除的位置
+        last = self._cells.pop()
+        if last != index:
+            self._cells[slot] = last
+            self._slot[last] = slot
+        self._slot[index] = -1
+
+    def sample(self, rng=random):
+        """随机返回一个空闲格子 (x, y)；没有空闲格子时返回 None"""
+        if not self._cells:
+            return None
+        index = self._cells[rng.randrange(len(self._cells))]
+        return (index % self.width, index // self.width)
+
+class OccupancyGrid:
+    """
+    棋盘占用表：每个格子一个16位计数，低14位是蛇身计数（允许穿过自己时同一格可能有多节），
+    最高位是障碍物标记，次高位是食物标记。蛇身、障碍物和食物共用一张表，查询都是 O(1)；
+    值为 0 的格子同时登记在 free 索引中，用于常数时间生成食物。
+    一条蛇的蛇身计数独占一张表（障碍物可以与之共用）。
+    """
+    OBSTACLE = 0x8000
+    FOOD = 0x4000
+    BODY_MASK = 0x3FFF
+
+    def __init__(self, width=GRID_WIDTH, height=GRID_HEIGHT):
+        self.width = width
+        self.height = height
+        self.cells = array('H', bytes(2 * width * height))
+        self.free = FreeCellIndex(width, height)
+
+    def in_bounds(self, cell):
+        return 0 <= cell[0] < self.width and 0 <= cell[1] < self.height
+
+    def _set(self, index, value):
+        """写入格子并同步空闲索引"""
+        old = self.cells[index]
+        self.cells[index] = value
+        if value and not old:
+            self.free.discard_index(index)
+        elif old and not value:
+            self.free.add_index(index)
+
+    def add_body(self, cell):
+        index = cell[1] * self.width + cell[0]
+        self._set(index, self.cells[index] + 1)
+
+    def remove_body(self, cell):
+        index = cell[1] * self.width + cell[0]
+        self._set(index, self.cells[index] - 1)
+
+    def body_count(self, cell):
+        if not self.in_bounds(cell):
+            return 0
+        return self.cells[cell[1] * self.width + cell[0]] & self.BODY_MASK
+
+    def clear_body(self):
+        for i, value in enumerate(self.cells):
+            if value & self.BODY_MASK:
+                self._set(i, value & ~self.BODY_MASK)
+
+    def set_obstacle(self, cell):
+        index = cell[1] * self.width + cell[0]
+        self._set(index, self.cells[index] | self.OBSTACLE)
+
+    def is_obstacle(self, cell):
+        if not self.in_bounds(cell):
+            return False
+        return bool(self.cells[cell[1] * self.width + cell[0]] & self.OBSTACLE)
+
+    def clear_obstacles(self):
+        for i, value in enumerate(self.cells):
+            if value & self.OBSTACLE:
+                self._set(i, value & ~self.OBSTACLE)
+
+    def set_food(self, cell):
+        index = cell[1] * self.width + cell[0]
+        self._set(index, self.cells[index] | self.FOOD)
+
+    def remove_food(self, cell):
+        index = cell[1] * self.width + cell[0]
+        self._set(index, self.cells[index] & ~self.FOOD)
+
+    def is_blocked(self, cell):
+        """格子上有蛇身或障碍物"""
+        if not self.in_bounds(cell):
+            return False
+        return bool(self.cells[cell[1] * self.width + cell[0]] & (self.OBSTACLE | self.BODY_MASK))
+
+class SnakeBodyView(Sequence):
+    """蛇身坐标的只读视图（蛇头在前），包含判断走占用表，不复制列表"""
+
+    def __init__(self, body, grid):
+        self._body = body
+        self._grid = grid
+
+    def __len__(self):
+        return len(self._body)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self._body)[index]
+        return self._body[index]
+
+    def __iter__(self):
+        return iter(self._body)
+
+    def __reversed__(self):
+        return reversed(self._body)
+
+    def __contains__(self, cell):
+        return self._grid.body_count(cell) > 0
+
+    def __add__(self, other):
+        return list(self._body) + list(other)
+
+    def __radd__(self, other):
+        return list(other) + list(self._body)
+
+    def __eq__(self, other):
+        if isinstance(other, (SnakeBodyView, list, tuple)):
+            return list(self._body) == list(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"SnakeBodyView({list(self._body)!r})"
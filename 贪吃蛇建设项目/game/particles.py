@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+共用的粒子系统
+位置、速度、剩余寿命和贴图编号按列存放在 NumPy 数组中，每帧对所有粒子整体更新；
+绘制时不再为每个粒子创建 Surface，而是按 (颜色, 半径) 预先画好圆形贴图，用 Surface.blits 一次提交。
+每个场景的粒子数上限见 constants.PARTICLE_BUDGETS，粒子已满时新发射的粒子被丢弃。
+没有 NumPy 时退回到逐个粒子计算的纯 Python 实现，效果相同。
+"""
+import random
+import pygame
+from .constants import WINDOW_WIDTH, WINDOW_HEIGHT, WHITE, PARTICLE_STAMP_LIMIT
+
+try:
+    import numpy as np
+except ImportError:  # 没有 NumPy 时逐个粒子计算
+    np = None
+
+WRAP_MARGIN = 50  # edge='wrap' 时粒子从顶部上方这么高的范围内重新落下
+
+def make_stamp(color, radius):
+    """画一个圆形粒子贴图，圆心在 (radius + 1, radius + 1)，与直接 pygame.draw.circle 的像素相同"""
+    size = radius * 2 + 2
+    stamp = pygame.Surface((size, size), pygame.SRCALPHA)
+    pygame.draw.circle(stamp, color, (radius + 1, radius + 1), radius)
+    return stamp.convert_alpha() if pygame.display.get_surface() else stamp
+
+class ParticleSystem:
+    """
+    一组圆形粒子，capacity 为粒子数上限。
+    edge 决定粒子离开 bounds 后的处理：None 不处理（只按寿命消失），
+    'wrap' 落到底部后从顶部随机位置重新落下（雪花），'bounce' 在边界上反弹。
+    gravity 为每帧加到竖直速度上的加速度。
+    """
+
+    def __init__(self, capacity, edge=None, gravity=0.0, bounds=(WINDOW_WIDTH, WINDOW_HEIGHT)):
+        self.capacity = capacity
+        self.edge = edge
+        self.gravity = gravity
+        self.bounds = bounds
+        self._stamps = []  # 贴图编号 -> (贴图, 圆心在贴图中的偏移)
+        self._stamp_ids = {}  # (颜色, 半径) -> 贴图编号
+        self._compact_at = PARTICLE_STAMP_LIMIT  # 贴图数达到这个数量时丢弃没有粒子使用的贴图
+        self.count = 0
+        if np is not None:
+            self._x = np.zeros(capacity)
+            self._y = np.zeros(capacity)
+            self._vx = np.zeros(capacity)
+            self._vy = np.zeros(capacity)
+            self._life = np.zeros(capacity)
+            self._stamp = np.zeros(capacity, dtype=np.int32)
+            self._anchor = np.zeros(capacity, dtype=np.int32)
+        else:
+            self._particles = []  # [x, y, vx, vy, life, 贴图编号]
+
+    def __len__(self):
+        return self.count
+
+    def clear(self):
+        self.count = 0
+        if np is None:
+            self._particles.clear()
+
+    def _stamp_id(self, color, radius):
+        key = (tuple(color), radius)
+        stamp_id = self._stamp_ids.get(key)
+        if stamp_id is None:
+            if len(self._stamps) >= self._compact_at:
+                # 随机颜色会不断产生新贴图：丢弃没有粒子使用的贴图；
+                # 存活粒子用到的贴图仍然很多时推迟下一次整理，保证均摊开销为常数
+                self._compact_stamps()
+                self._compact_at = max(PARTICLE_STAMP_LIMIT, 2 * len(self._stamps))
+            stamp_id = len(self._stamps)
+            self._stamps.append((make_stamp(color, radius), radius + 1))
+            self._stamp_ids[key] = stamp_id
+        return stamp_id
+
+    def _compact_stamps(self):
+        """只保留存活粒子用到的贴图，并把粒子的贴图编号改成新的编号"""
+        if np is not None:
+            ids = self._stamp[:self.count]
+            used = np.unique(ids)
+            ids[:] = np.searchsorted(used, ids)
+            used = used.tolist()
+        else:
+            used = sorted({p[5] for p in self._particles})
+            remap = {old: new for new, old in enumerate(used)}
+            for p in self._particles:
+                p[5] = remap[p[5]]
+        keys = {stamp_id: key for key, stamp_id in self._stamp_ids.items()}
+        self._stamps = [self._stamps[i] for i in used]
+        self._stamp_ids = {keys[old]: new for new, old in enumerate(used)}
+
+    def emit(self, x, y, vx=0.0, vy=0.0, life=None, radius=2, color=WHITE):
+        """发射一个粒子，life 为存活的帧数（None 表示一直存在）；粒子已满时返回 False"""
+        if self.count >= self.capacity:
+            return False
+        stamp_id = self._stamp_id(color, radius)
+        life = float('inf') if life is None else life
+        if np is not None:
+            i = self.count
+            self._x[i], self._y[i], self._vx[i], self._vy[i] = x, y, vx, vy
+            self._life[i] = life
+            self._stamp[i] = stamp_id
+            self._anchor[i] = radius + 1
+        else:
+            self._particles.append([x, y, vx, vy, life, stamp_id])
+        self.count += 1
+        return True
+
+    def update(self, frames=1):
+        """推进 frames 帧：移动、施加重力、处理边界，并移除寿命耗尽的粒子"""
+        if not self.count:
+            return
+        if np is not None:
+            self._update_np(frames)
+        else:
+            self._update_py(frames)
+
+    def _update_np(self, frames):
+        n = self.count
+        x, y, vx, vy, life = self._x[:n], self._y[:n], self._vx[:n], self._vy[:n], self._life[:n]
+        x += vx * frames
+        y += vy * frames
+        if self.gravity:
+            vy += self.gravity * frames
+        life -= frames
+        width, height = self.bounds
+        if self.edge == 'wrap':
+            fallen = y > height
+            k = int(np.count_nonzero(fallen))
+            if k:
+                y[fallen] = np.random.randint(-WRAP_MARGIN, 1, k)
+                x[fallen] = np.random.randint(0, width + 1, k)
+        elif self.edge == 'bounce':
+            vx[(x <= 0) | (x >= width)] *= -1
+            vy[(y <= 0) | (y >= height)] *= -1
+            np.clip(x, 0, width, out=x)
+            np.clip(y, 0, height, out=y)
+        alive = life > 0
+        if not alive.all():
+            keep = np.flatnonzero(alive)
+            m = len(keep)
+            for column in (self._x, self._y, self._vx, self._vy, self._life, self._stamp, self._anchor):
+                column[:m] = column[keep]
+            self.count = m
+
+    def _update_py(self, frames):
+        width, height = self.bounds
+        for p in self._particles:
+            p[0] += p[2] * frames
+            p[1] += p[3] * frames
+            p[3] += self.gravity * frames
+            p[4] -= frames
+            if self.edge == 'wrap':
+                if p[1] > height:
+                    p[1] = random.randint(-WRAP_MARGIN, 0)
+                    p[0] = random.randint(0, width)
+            elif self.edge == 'bounce':
+                if p[0] <= 0 or p[0] >= width:
+                    p[2] *= -1
+                if p[1] <= 0 or p[1] >= height:
+                    p[3] *= -1
+                p[0] = max(0, min(width, p[0]))
+                p[1] = max(0, min(height, p[1]))
+        self._particles = [p for p in self._particles if p[4] > 0]
+        self.count = len(self._particles)
+
+    def draw(self, surface, offset=(0, 0)):
+        """把所有粒子画到 surface 上，offset 为整体偏移（例如屏幕震动）"""
+        if not self.count:
+            return
+        ox, oy = offset
+        stamps = self._stamps
+        if np is not None:
+            n = self.count
+            anchor = self._anchor[:n]
+            xs = ((self._x[:n] + ox).astype(np.int32) - anchor).tolist()
+            ys = ((self._y[:n] + oy).astype(np.int32) - anchor).tolist()
+            sequence = [(stamps[i][0], (px, py)) for i, px, py in zip(self._stamp[:n].tolist(), xs, ys)]
+        else:
+            sequence = []
+            for p in self._particles:
+                stamp, anchor = stamps[p[5]]
+                sequence.append((stamp, (int(p[0] + ox) - anchor, int(p[1] + oy) - anchor)))
+        surface.blits(sequence, doreturn=False)
+
+def snowfall(capacity, max_speed, max_size):
+    """雪花：capacity 片白色雪花从顶部上方落下，速度 0.5 ~ max_speed，半径 1 ~ max_size，落到底部后重新落下"""
+    snow = ParticleSystem(capacity, edge='wrap')
+    for _ in range(capacity):
+        snow.emit(random.randint(0, WINDOW_WIDTH), random.randint(-WRAP_MARGIN, 0),
+                  vy=random.uniform(0.5, max_speed), radius=random.randint(1, max_size))
+    return snow
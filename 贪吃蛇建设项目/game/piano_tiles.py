@@ -4,6 +4,9 @@ import random
 import time
 import math
 from .constants import *
+from .fonts import get_font, render_text
+from . import layers
+from .particles import ParticleSystem
 
 class PianoTilesGame:
     def __init__(self, surface):
@@ -69,7 +72,7 @@ class PianoTilesGame:
         
         # 视觉效果
         self.animation_time = 0
-        self.particle_effects = []
+        self.particle_effects = ParticleSystem(PARTICLE_BUDGETS['piano'], gravity=0.2)
         self.screen_shake = 0
         self.rainbow_mode = False
         self.game_over_reason = ""
@@ -205,12 +208,7 @@ class PianoTilesGame:
             effect['y'] -= 2
             effect['life'] -= 1
         
-        self.particle_effects = [p for p in self.particle_effects if p['life'] > 0]
-        for particle in self.particle_effects:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= 1
-            particle['vy'] += 0.2
+        self.particle_effects.update()
         
         if self.current_mode == 'crazy':
             self.speed_change_timer -= 1
@@ -281,14 +279,14 @@ class PianoTilesGame:
         pygame.draw.rect(self.surface, (100, 150, 255), title_bg, 3)
         
         # 标题
-        title_font = pygame.font.Font(FONT_NAME, 52)
-        title_text = title_font.render("♫ 手残大师 ♫", True, (50, 50, 150))
+        title_font = get_font(FONT_NAME, 52)
+        title_text = render_text(title_font, "♫ 手残大师 ♫", True, (50, 50, 150))
         title_rect = title_text.get_rect(center=(surface_width // 2, 80))
         self.surface.blit(title_text, title_rect)
         
         # 副标题
-        subtitle_font = pygame.font.Font(FONT_NAME, 18)
-        subtitle_text = subtitle_font.render("节奏感挑战游戏", True, (100, 100, 100))
+        subtitle_font = get_font(FONT_NAME, 18)
+        subtitle_text = render_text(subtitle_font, "节奏感挑战游戏", True, (100, 100, 100))
         subtitle_rect = subtitle_text.get_rect(center=(surface_width // 2, 115))
         self.surface.blit(subtitle_text, subtitle_rect)
         
@@ -310,8 +308,8 @@ class PianoTilesGame:
         surface_width = self.surface.get_size()[0]
         
         # 模式选择标题
-        title_font = pygame.font.Font(FONT_NAME, 28)
-        title_text = title_font.render("选择游戏模式", True, (50, 50, 150))
+        title_font = get_font(FONT_NAME, 28)
+        title_text = render_text(title_font, "选择游戏模式", True, (50, 50, 150))
         title_rect = title_text.get_rect(center=(surface_width // 2, start_y))
         self.surface.blit(title_text, title_rect)
         
@@ -363,15 +361,15 @@ class PianoTilesGame:
             self.draw_mode_icon(mode, x + card_width // 2, icon_y + 20)
             
             # 模式名称
-            name_font = pygame.font.Font(FONT_NAME, 18)
-            name_text = name_font.render(self.game_modes[mode]['name'], True, (50, 50, 50))
+            name_font = get_font(FONT_NAME, 18)
+            name_text = render_text(name_font, self.game_modes[mode]['name'], True, (50, 50, 50))
             name_rect = name_text.get_rect(center=(x + card_width // 2, y + 65))
             self.surface.blit(name_text, name_rect)
             
             # 最高分
-            score_font = pygame.font.Font(FONT_NAME, 14)
+            score_font = get_font(FONT_NAME, 14)
             high_score = self.high_scores.get(mode, 0)
-            score_text = score_font.render(f"最高: {high_score}", True, (100, 100, 100))
+            score_text = render_text(score_font, f"最高: {high_score}", True, (100, 100, 100))
             score_rect = score_text.get_rect(center=(x + card_width // 2, y + 85))
             self.surface.blit(score_text, score_rect)
             
@@ -382,8 +380,8 @@ class PianoTilesGame:
                 pygame.draw.circle(self.surface, (200, 150, 0), (x + card_width // 2, indicator_y), 6, 2)
                 
                 # 模式描述
-                desc_font = pygame.font.Font(FONT_NAME, 16)
-                desc_text = desc_font.render(self.game_modes[mode]['desc'], True, (80, 80, 80))
+                desc_font = get_font(FONT_NAME, 16)
+                desc_text = render_text(desc_font, self.game_modes[mode]['desc'], True, (80, 80, 80))
                 desc_rect = desc_text.get_rect(center=(surface_width // 2, indicator_y + 25))
                 self.surface.blit(desc_text, desc_rect)
             
@@ -432,21 +430,21 @@ class PianoTilesGame:
         pygame.draw.rect(self.surface, (150, 150, 150), panel_rect, 2, border_radius=15)
         
         # 统计信息
-        stats_font = pygame.font.Font(FONT_NAME, 16)
+        stats_font = get_font(FONT_NAME, 16)
         
         # 当前模式最高分
         current_high = self.high_scores.get(self.current_mode, 0)
-        high_text = stats_font.render(f"当前模式最高分: {current_high}", True, (80, 80, 80))
+        high_text = render_text(stats_font, f"当前模式最高分: {current_high}", True, (80, 80, 80))
         self.surface.blit(high_text, (panel_x + 20, start_y + 15))
         
         # 总游戏次数
         total_games = self.session_stats.get('games_played', 0)
-        games_text = stats_font.render(f"本次游戏次数: {total_games}", True, (80, 80, 80))
+        games_text = render_text(stats_font, f"本次游戏次数: {total_games}", True, (80, 80, 80))
         self.surface.blit(games_text, (panel_x + 20, start_y + 35))
         
         # 最大连击
         max_combo = self.session_stats.get('max_combo', 0)
-        combo_text = stats_font.render(f"最大连击: {max_combo}", True, (80, 80, 80))
+        combo_text = render_text(stats_font, f"最大连击: {max_combo}", True, (80, 80, 80))
         self.surface.blit(combo_text, (panel_x + 20, start_y + 55))
 
     def draw_menu_buttons(self, start_y):
@@ -492,8 +490,8 @@ class PianoTilesGame:
             pygame.draw.rect(self.surface, (50, 50, 50), button_rect, 2, border_radius=8)
             
             # 按钮文字
-            text_font = pygame.font.Font(FONT_NAME, 18)
-            text = text_font.render(button_info['text'], True, (255, 255, 255))
+            text_font = get_font(FONT_NAME, 18)
+            text = render_text(text_font, button_info['text'], True, (255, 255, 255))
             text_rect = text.get_rect(center=button_rect.center)
             self.surface.blit(text, text_rect)
             
@@ -514,11 +512,11 @@ class PianoTilesGame:
             "ESC键: 返回活动页面"
         ]
         
-        hint_font = pygame.font.Font(FONT_NAME, 14)
+        hint_font = get_font(FONT_NAME, 14)
         start_y = surface_height - 80
         
         for i, hint in enumerate(hints):
-            hint_text = hint_font.render(hint, True, (120, 120, 120))
+            hint_text = render_text(hint_font, hint, True, (120, 120, 120))
             self.surface.blit(hint_text, (20, start_y + i * 18))
 
     def draw_game(self):
@@ -529,17 +527,14 @@ class PianoTilesGame:
         shake_x = random.randint(-self.screen_shake//2, self.screen_shake//2) if self.screen_shake > 0 else 0
         shake_y = random.randint(-self.screen_shake//2, self.screen_shake//2) if self.screen_shake > 0 else 0
         
-        # 渐变背景
-        for y in range(surface_height):
-            color_ratio = y / surface_height
-            if self.rainbow_mode:
+        # 渐变背景（彩虹模式随时间变化，逐行绘制；普通模式用缓存的渐变图层）
+        if self.rainbow_mode:
+            for y in range(surface_height):
                 hue = (y + self.animation_time * 10) % 360
                 r, g, b = self.hsv_to_rgb(hue, 0.3, 0.9)
-            else:
-                r = int(240 + 15 * color_ratio)
-                g = int(240 + 15 * color_ratio)
-                b = int(250 + 5 * color_ratio)
-            pygame.draw.line(self.surface, (r, g, b), (shake_x, y + shake_y), (surface_width + shake_x, y + shake_y))
+                pygame.draw.line(self.surface, (r, g, b), (shake_x, y + shake_y), (surface_width + shake_x, y + shake_y))
+        else:
+            self.surface.blit(layers.gradient((surface_width, surface_height), [(240, 240, 250), (255, 255, 255)]), (shake_x, shake_y))
         
         # 绘制分割线
         for i in range(1, self.cols):
@@ -555,14 +550,12 @@ class PianoTilesGame:
                 self.draw_tile(tile, shake_x, shake_y)
         
         # 绘制粒子效果
-        for particle in self.particle_effects:
-            pygame.draw.circle(self.surface, particle['color'], 
-                             (int(particle['x'] + shake_x), int(particle['y'] + shake_y)), 3)
+        self.particle_effects.draw(self.surface, (shake_x, shake_y))
         
         # 绘制连击效果
         for effect in self.combo_effects:
             font_size = int(24 + effect['scale'] * 10)
-            font = pygame.font.Font(FONT_NAME, font_size)
+            font = get_font(FONT_NAME, font_size)
             text = font.render(f"COMBO x{effect['combo']}", True, (255, 215, 0))
             alpha = int(255 * effect['life'] / 60)
             text.set_alpha(alpha)
@@ -616,8 +609,8 @@ class PianoTilesGame:
             center = rect.center
             pygame.draw.circle(self.surface, (255, 255, 0), center, 15)
             pygame.draw.circle(self.surface, (200, 200, 0), center, 15, 2)
-            font = pygame.font.Font(FONT_NAME, 20)
-            text = font.render("$", True, (150, 150, 0))
+            font = get_font(FONT_NAME, 20)
+            text = render_text(font, "$", True, (150, 150, 0))
             text_rect = text.get_rect(center=center)
             self.surface.blit(text, text_rect)
         elif tile['type'] == 'speed':
@@ -655,56 +648,56 @@ class PianoTilesGame:
             pygame.draw.rect(self.surface, (100, 100, 100), key_rect, 2, border_radius=8)
             
             # 按键文字
-            font = pygame.font.Font(FONT_NAME, 24)
-            text = font.render(self.key_names[i], True, (0, 0, 0))
+            font = get_font(FONT_NAME, 24)
+            text = render_text(font, self.key_names[i], True, (0, 0, 0))
             text_rect = text.get_rect(center=key_rect.center)
             self.surface.blit(text, text_rect)
 
     def draw_ui(self):
         """绘制UI信息"""
         # 分数
-        score_font = pygame.font.Font(FONT_NAME, 32)
-        score_text = score_font.render(f"分数: {self.score}", True, (50, 50, 50))
+        score_font = get_font(FONT_NAME, 32)
+        score_text = render_text(score_font, f"分数: {self.score}", True, (50, 50, 50))
         self.surface.blit(score_text, (20, 20))
         
         # 连击
         if self.combo > 0:
-            combo_font = pygame.font.Font(FONT_NAME, 28)
+            combo_font = get_font(FONT_NAME, 28)
             combo_color = (255, 100, 100) if self.combo >= 50 else (100, 255, 100) if self.combo >= 20 else (100, 100, 255)
-            combo_text = combo_font.render(f"连击: {self.combo}", True, combo_color)
+            combo_text = render_text(combo_font, f"连击: {self.combo}", True, combo_color)
             self.surface.blit(combo_text, (20, 60))
         
         # 最高分
         high_score = self.high_scores.get(self.current_mode, 0)
-        high_score_font = pygame.font.Font(FONT_NAME, 20)
-        high_score_text = high_score_font.render(f"最高分: {high_score}", True, (100, 100, 100))
+        high_score_font = get_font(FONT_NAME, 20)
+        high_score_text = render_text(high_score_font, f"最高分: {high_score}", True, (100, 100, 100))
         self.surface.blit(high_score_text, (20, 100))
         
         # 速度
-        speed_text = high_score_font.render(f"速度: {self.speed}", True, (100, 100, 100))
+        speed_text = render_text(high_score_font, f"速度: {self.speed}", True, (100, 100, 100))
         self.surface.blit(speed_text, (20, 125))
         
         # 模式信息
-        mode_text = high_score_font.render(f"模式: {self.game_modes[self.current_mode]['name']}", True, (100, 100, 100))
+        mode_text = render_text(high_score_font, f"模式: {self.game_modes[self.current_mode]['name']}", True, (100, 100, 100))
         self.surface.blit(mode_text, (20, 150))
         
         # 挑战模式倒计时
         if self.current_mode == 'challenge' and self.remaining_time > 0:
-            time_font = pygame.font.Font(FONT_NAME, 36)
+            time_font = get_font(FONT_NAME, 36)
             time_color = (255, 50, 50) if self.remaining_time < 10 else (50, 50, 50)
-            time_text = time_font.render(f"时间: {int(self.remaining_time)}", True, time_color)
+            time_text = render_text(time_font, f"时间: {int(self.remaining_time)}", True, time_color)
             surface_width = self.surface.get_size()[0]
             time_rect = time_text.get_rect(center=(surface_width // 2, 50))
             self.surface.blit(time_text, time_rect)
         
         # 操作提示
         surface_width, surface_height = self.surface.get_size()
-        hint_font = pygame.font.Font(FONT_NAME, 16)
-        hint_text = hint_font.render("使用 D F J K 键击打黑块", True, (150, 150, 150))
+        hint_font = get_font(FONT_NAME, 16)
+        hint_text = render_text(hint_font, "使用 D F J K 键击打黑块", True, (150, 150, 150))
         self.surface.blit(hint_text, (20, surface_height - 120))
         
         # ESC返回提示
-        esc_text = hint_font.render("ESC - 返回菜单", True, (150, 150, 150))
+        esc_text = render_text(hint_font, "ESC - 返回菜单", True, (150, 150, 150))
         self.surface.blit(esc_text, (surface_width - 120, 20))
 
     def draw_game_over(self):
@@ -726,38 +719,38 @@ class PianoTilesGame:
         pygame.draw.rect(self.surface, (200, 200, 200), panel_rect, 3, border_radius=15)
         
         # 游戏结束文字
-        game_over_font = pygame.font.Font(FONT_NAME, 36)
+        game_over_font = get_font(FONT_NAME, 36)
         reason = getattr(self, 'game_over_reason', '游戏结束')
-        game_over_text = game_over_font.render(reason, True, (255, 50, 50))
+        game_over_text = render_text(game_over_font, reason, True, (255, 50, 50))
         game_over_rect = game_over_text.get_rect(center=(panel_x + panel_width//2, panel_y + 50))
         self.surface.blit(game_over_text, game_over_rect)
         
         # 最终分数
-        final_score_font = pygame.font.Font(FONT_NAME, 24)
-        final_score_text = final_score_font.render(f"最终分数: {self.score}", True, (50, 50, 50))
+        final_score_font = get_font(FONT_NAME, 24)
+        final_score_text = render_text(final_score_font, f"最终分数: {self.score}", True, (50, 50, 50))
         final_score_rect = final_score_text.get_rect(center=(panel_x + panel_width//2, panel_y + 100))
         self.surface.blit(final_score_text, final_score_rect)
         
         # 最大连击
-        max_combo_text = final_score_font.render(f"最大连击: {self.combo}", True, (50, 50, 50))
+        max_combo_text = render_text(final_score_font, f"最大连击: {self.combo}", True, (50, 50, 50))
         max_combo_rect = max_combo_text.get_rect(center=(panel_x + panel_width//2, panel_y + 130))
         self.surface.blit(max_combo_text, max_combo_rect)
         
         # 模式信息
-        mode_text = pygame.font.Font(FONT_NAME, 20).render(f"模式: {self.game_modes[self.current_mode]['name']}", True, (100, 100, 100))
+        mode_text = render_text(get_font(FONT_NAME, 20), f"模式: {self.game_modes[self.current_mode]['name']}", True, (100, 100, 100))
         mode_rect = mode_text.get_rect(center=(panel_x + panel_width//2, panel_y + 160))
         self.surface.blit(mode_text, mode_rect)
         
         # 新纪录提示
         if self.score > 0 and self.score == self.high_scores[self.current_mode]:
-            new_record_font = pygame.font.Font(FONT_NAME, 20)
-            new_record_text = new_record_font.render("★ 新纪录! ★", True, (255, 215, 0))
+            new_record_font = get_font(FONT_NAME, 20)
+            new_record_text = render_text(new_record_font, "★ 新纪录! ★", True, (255, 215, 0))
             new_record_rect = new_record_text.get_rect(center=(panel_x + panel_width//2, panel_y + 190))
             self.surface.blit(new_record_text, new_record_rect)
         
         # 操作提示
-        hint_font = pygame.font.Font(FONT_NAME, 18)
-        hint_text = hint_font.render("空格键重新开始，ESC键返回菜单", True, (100, 100, 100))
+        hint_font = get_font(FONT_NAME, 18)
+        hint_text = render_text(hint_font, "空格键重新开始，ESC键返回菜单", True, (100, 100, 100))
         hint_rect = hint_text.get_rect(center=(panel_x + panel_width//2, panel_y + 240))
         self.surface.blit(hint_text, hint_rect)
 
@@ -766,16 +759,11 @@ class PianoTilesGame:
         surface_width, surface_height = self.surface.get_size()
         
         # 渐变背景
-        for y in range(surface_height):
-            color_ratio = y / surface_height
-            r = int(240 + 15 * color_ratio)
-            g = int(240 + 15 * color_ratio)
-            b = int(250 + 5 * color_ratio)
-            pygame.draw.line(self.surface, (r, g, b), (0, y), (surface_width, y))
+        self.surface.blit(layers.gradient((surface_width, surface_height), [(240, 240, 250), (255, 255, 255)]), (0, 0))
         
         # 标题
-        title_font = pygame.font.Font(FONT_NAME, 36)
-        title_text = title_font.render("成就系统", True, (50, 50, 150))
+        title_font = get_font(FONT_NAME, 36)
+        title_text = render_text(title_font, "成就系统", True, (50, 50, 150))
         title_rect = title_text.get_rect(center=(surface_width // 2, 50))
         self.surface.blit(title_text, title_rect)
         
@@ -789,20 +777,20 @@ class PianoTilesGame:
             pygame.draw.rect(self.surface, (100, 100, 100), rect, 2, border_radius=10)
             
             # 成就名称
-            name_font = pygame.font.Font(FONT_NAME, 24)
-            name_text = name_font.render(achievement['name'], True, (50, 50, 50))
+            name_font = get_font(FONT_NAME, 24)
+            name_text = render_text(name_font, achievement['name'], True, (50, 50, 50))
             self.surface.blit(name_text, (70, y_offset + 5))
             
             # 成就描述
-            desc_font = pygame.font.Font(FONT_NAME, 16)
-            desc_text = desc_font.render(achievement['desc'], True, (100, 100, 100))
+            desc_font = get_font(FONT_NAME, 16)
+            desc_text = render_text(desc_font, achievement['desc'], True, (100, 100, 100))
             self.surface.blit(desc_text, (70, y_offset + 30))
             
             # 解锁状态
             status_text = "✓" if achievement['unlocked'] else "✗"
             status_color = (0, 150, 0) if achievement['unlocked'] else (150, 0, 0)
-            status_font = pygame.font.Font(FONT_NAME, 36)
-            status_render = status_font.render(status_text, True, status_color)
+            status_font = get_font(FONT_NAME, 36)
+            status_render = render_text(status_font, status_text, True, status_color)
             self.surface.blit(status_render, (surface_width - 100, y_offset + 10))
             
             y_offset += 80
@@ -814,7 +802,7 @@ class PianoTilesGame:
         pygame.draw.rect(self.surface, color, back_rect, border_radius=10)
         pygame.draw.rect(self.surface, (50, 50, 50), back_rect, 2, border_radius=10)
         
-        back_text = pygame.font.Font(FONT_NAME, 20).render("返回", True, (255, 255, 255))
+        back_text = render_text(get_font(FONT_NAME, 20), "返回", True, (255, 255, 255))
         back_text_rect = back_text.get_rect(center=back_rect.center)
         self.surface.blit(back_text, back_text_rect)
 
@@ -990,14 +978,9 @@ class PianoTilesGame:
                 random.randint(100, 255)
             )
             
-            self.particle_effects.append({
-                'x': x + random.uniform(-10, 10),
-                'y': y + random.uniform(-10, 10),
-                'vx': random.uniform(-4, 4),
-                'vy': random.uniform(-6, -2),
-                'life': 25 if perfect else 20,
-                'color': color
-            })
+            self.particle_effects.emit(x + random.uniform(-10, 10), y + random.uniform(-10, 10),
+                                       random.uniform(-4, 4), random.uniform(-6, -2),
+                                       life=25 if perfect else 20, radius=3, color=color)
             
     def add_combo_effect(self, col):
         """添加连击特效"""
@@ -1020,14 +1003,8 @@ class PianoTilesGame:
         for _ in range(20):
             hue = random.randint(0, 360)
             color = self.hsv_to_rgb(hue, 1, 1)
-            self.particle_effects.append({
-                'x': x,
-                'y': y,
-                'vx': random.uniform(-5, 5),
-                'vy': random.uniform(-8, -3),
-                'life': 30,
-                'color': color
-            })
+            self.particle_effects.emit(x, y, random.uniform(-5, 5), random.uniform(-8, -3),
+                                       life=30, radius=3, color=color)
             
     def add_miss_effect(self, col):
         """添加错过特效"""
@@ -1035,14 +1012,8 @@ class PianoTilesGame:
         y = self.judge_line_y
         
         for _ in range(5):
-            self.particle_effects.append({
-                'x': x,
-                'y': y,
-                'vx': random.uniform(-2, 2),
-                'vy': random.uniform(-3, -1),
-                'life': 15,
-                'color': (150, 150, 150)
-            })
+            self.particle_effects.emit(x, y, random.uniform(-2, 2), random.uniform(-3, -1),
+                                       life=15, radius=3, color=(150, 150, 150))
 
     def restart_game(self):
         """重新开始游戏"""
@@ -1054,7 +1025,7 @@ class PianoTilesGame:
         self.col_feedback = [0] * self.cols
         self.error_col = None
         self.error_timer = 0
-        self.particle_effects = []
+        self.particle_effects.clear()
         self.combo_effects = []
         self.screen_shake = 0
         self.rainbow_mode = False
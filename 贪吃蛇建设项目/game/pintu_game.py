@@ -4,7 +4,9 @@ import os
 import random
 import time
 from .constants import *
+from .fonts import get_font, render_text
 from .player import player_data
+from .game_loop import FixedStepLoop
 
 class PintuGame:
     def __init__(self, surface, parent):
@@ -33,8 +35,8 @@ class PintuGame:
         self.thumbnail_size = (100, 100)  # 缩略图大小
         self.load_image_list()  # 加载图片列表
         # 加载字体
-        self.font = pygame.font.Font(FONT_NAME, 24)
-        self.title_font = pygame.font.Font(FONT_NAME, 36)
+        self.font = get_font(FONT_NAME, 24)
+        self.title_font = get_font(FONT_NAME, 36)
 
     def load_image_list(self):
         """加载pintu文件夹中的所有图片文件"""
@@ -237,9 +239,7 @@ class PintuGame:
                                         self.completed = True
                                         self.completion_time = time.time() - self.start_time
                                         # 更新玩家数据
-                                        if 'pintu_best_score' not in player_data.data or self.moves < player_data.data['pintu_best_score']:
-                                            player_data.data['pintu_best_score'] = self.moves
-                                            player_data._save_data()
+                                        player_data.record_best('pintu', 'best_score', self.moves, lower_is_better=True)
                                 # 取消选中
                                 self.selected_piece = None
                             break
@@ -271,9 +271,7 @@ class PintuGame:
                         self.completed = True
                         self.completion_time = time.time() - self.start_time
                         # 更新玩家数据
-                        if 'pintu_best_score' not in player_data.data or self.moves < player_data.data['pintu_best_score']:
-                            player_data.data['pintu_best_score'] = self.moves
-                            player_data._save_data()
+                        player_data.record_best('pintu', 'best_score', self.moves, lower_is_better=True)
                     placed = True
                 # 如果没有放置成功，则放回原位
                 if not placed and hasattr(self.selected_piece, 'original_pos'):
@@ -300,7 +298,7 @@ class PintuGame:
         self.surface.fill(BACKGROUND_COLOR)
         if self.show_image_selector:
             # 绘制标题
-            title_text = self.title_font.render("选择拼图图片", True, (66, 165, 245))
+            title_text = render_text(self.title_font, "选择拼图图片", True, (66, 165, 245))
             title_rect = title_text.get_rect(center=(self.panel_x + self.panel_w // 2, self.panel_y + 40))
             self.surface.blit(title_text, title_rect)
             # 绘制图片选择区域背景
@@ -352,12 +350,12 @@ class PintuGame:
             back_btn_rect = pygame.Rect(self.panel_x + self.panel_w - 130, self.panel_y + self.panel_h - 60, 110, 45)
             pygame.draw.rect(self.surface, (220, 220, 220), back_btn_rect, border_radius=10)
             pygame.draw.rect(self.surface, (0, 0, 0), back_btn_rect, 2, border_radius=10)
-            back_text = self.font.render("返回", True, (0, 0, 0))
+            back_text = render_text(self.font, "返回", True, (0, 0, 0))
             back_rect = back_text.get_rect(center=back_btn_rect.center)
             self.surface.blit(back_text, back_rect)
         else:
             # 绘制标题
-            title_text = self.title_font.render("拼图游戏", True, (66, 165, 245))
+            title_text = render_text(self.title_font, "拼图游戏", True, (66, 165, 245))
             title_rect = title_text.get_rect(center=(self.panel_x + self.panel_w // 2, self.panel_y + 40))
             self.surface.blit(title_text, title_rect)
             # 绘制拼图块
@@ -398,25 +396,25 @@ class PintuGame:
                     else:
                         pygame.draw.rect(self.surface, (0, 0, 0), piece['rect'], 1)
             # 绘制游戏信息
-            moves_text = self.font.render(f"步数: {self.moves}", True, (0, 0, 0))
+            moves_text = render_text(self.font, f"步数: {self.moves}", True, (0, 0, 0))
             self.surface.blit(moves_text, (self.panel_x + 20, self.panel_y + 20))
             # 绘制最佳成绩
-            best_score = player_data.data.get('pintu_best_score', 999)
-            best_text = self.font.render(f"最佳步数: {best_score}", True, (0, 0, 0))
+            best_score = player_data.get_int('pintu', 'best_score', 999)
+            best_text = render_text(self.font, f"最佳步数: {best_score}", True, (0, 0, 0))
             self.surface.blit(best_text, (self.panel_x + 150, self.panel_y + 20))
             # 绘制难度
-            difficulty_text = self.font.render(f"难度: {self.difficulty}x{self.difficulty}", True, (0, 0, 0))
+            difficulty_text = render_text(self.font, f"难度: {self.difficulty}x{self.difficulty}", True, (0, 0, 0))
             self.surface.blit(difficulty_text, (self.panel_x + 300, self.panel_y + 20))
             # 如果游戏完成，显示完成信息
             if self.completed:
                 # 绘制完成文本到底部区域
-                complete_text1 = self.title_font.render("恭喜完成!", True, (66, 165, 245))
+                complete_text1 = render_text(self.title_font, "恭喜完成!", True, (66, 165, 245))
                 complete_rect1 = complete_text1.get_rect(center=(self.panel_x + self.panel_w // 2, self.panel_y + self.panel_h - 120))
                 self.surface.blit(complete_text1, complete_rect1)
-                complete_text2 = self.font.render(f"用时: {self.completion_time:.1f}秒", True, (0, 0, 0))
+                complete_text2 = render_text(self.font, f"用时: {self.completion_time:.1f}秒", True, (0, 0, 0))
                 complete_rect2 = complete_text2.get_rect(center=(self.panel_x + self.panel_w // 2, self.panel_y + self.panel_h - 80))
                 self.surface.blit(complete_text2, complete_rect2)
-                complete_text3 = self.font.render(f"步数: {self.moves}", True, (0, 0, 0))
+                complete_text3 = render_text(self.font, f"步数: {self.moves}", True, (0, 0, 0))
                 complete_rect3 = complete_text3.get_rect(center=(self.panel_x + self.panel_w // 2, self.panel_y + self.panel_h - 40))
                 self.surface.blit(complete_text3, complete_rect3)
             # 绘制按钮
@@ -424,59 +422,62 @@ class PintuGame:
             back_btn_rect = pygame.Rect(self.panel_x + self.panel_w - 130, self.panel_y + self.panel_h - 60, 110, 45)
             pygame.draw.rect(self.surface, (220, 220, 220), back_btn_rect, border_radius=10)
             pygame.draw.rect(self.surface, (0, 0, 0), back_btn_rect, 2, border_radius=10)
-            back_text = self.font.render("返回", True, (0, 0, 0))
+            back_text = render_text(self.font, "返回", True, (0, 0, 0))
             back_rect = back_text.get_rect(center=back_btn_rect.center)
             self.surface.blit(back_text, back_rect)
             # 重新开始按钮
             restart_btn_rect = pygame.Rect(self.panel_x + 20, self.panel_y + self.panel_h - 60, 130, 45)
             pygame.draw.rect(self.surface, (220, 220, 220), restart_btn_rect, border_radius=10)
             pygame.draw.rect(self.surface, (0, 0, 0), restart_btn_rect, 2, border_radius=10)
-            restart_text = self.font.render("重新开始", True, (0, 0, 0))
+            restart_text = render_text(self.font, "重新开始", True, (0, 0, 0))
             restart_rect = restart_text.get_rect(center=restart_btn_rect.center)
             self.surface.blit(restart_text, restart_rect)
             # 更换图片按钮
             change_image_btn_rect = pygame.Rect(self.panel_x + 430, self.panel_y + self.panel_h - 60, 130, 45)
             pygame.draw.rect(self.surface, (220, 220, 220), change_image_btn_rect, border_radius=10)
             pygame.draw.rect(self.surface, (0, 0, 0), change_image_btn_rect, 2, border_radius=10)
-            change_image_text = self.font.render("更换图片", True, (0, 0, 0))
+            change_image_text = render_text(self.font, "更换图片", True, (0, 0, 0))
             change_image_rect = change_image_text.get_rect(center=change_image_btn_rect.center)
             self.surface.blit(change_image_text, change_image_rect)
             # 难度按钮
             easy_btn_rect = pygame.Rect(self.panel_x + 160, self.panel_y + self.panel_h - 60, 80, 45)
             pygame.draw.rect(self.surface, (144, 238, 144) if self.difficulty == 3 else (220, 220, 220), easy_btn_rect, border_radius=10)
             pygame.draw.rect(self.surface, (0, 0, 0), easy_btn_rect, 2, border_radius=10)
-            easy_text = self.font.render("简单", True, (0, 0, 0))
+            easy_text = render_text(self.font, "简单", True, (0, 0, 0))
             easy_rect = easy_text.get_rect(center=easy_btn_rect.center)
             self.surface.blit(easy_text, easy_rect)
             medium_btn_rect = pygame.Rect(self.panel_x + 250, self.panel_y + self.panel_h - 60, 80, 45)
             pygame.draw.rect(self.surface, (144, 238, 144) if self.difficulty == 4 else (220, 220, 220), medium_btn_rect, border_radius=10)
             pygame.draw.rect(self.surface, (0, 0, 0), medium_btn_rect, 2, border_radius=10)
-            medium_text = self.font.render("中等", True, (0, 0, 0))
+            medium_text = render_text(self.font, "中等", True, (0, 0, 0))
             medium_rect = medium_text.get_rect(center=medium_btn_rect.center)
             self.surface.blit(medium_text, medium_rect)
             hard_btn_rect = pygame.Rect(self.panel_x + 340, self.panel_y + self.panel_h - 60, 80, 45)
             pygame.draw.rect(self.surface, (144, 238, 144) if self.difficulty == 5 else (220, 220, 220), hard_btn_rect, border_radius=10)
             pygame.draw.rect(self.surface, (0, 0, 0), hard_btn_rect, 2, border_radius=10)
-            hard_text = self.font.render("困难", True, (0, 0, 0))
+            hard_text = render_text(self.font, "困难", True, (0, 0, 0))
             hard_rect = hard_text.get_rect(center=hard_btn_rect.center)
             self.surface.blit(hard_text, hard_rect)
 
+    def update(self):
+        """推进一个逻辑帧（SIM_TICK_RATE 帧/秒）"""
+        # 处理交换动画
+        if self.swapping:
+            self.swap_progress += 0.1
+            if self.swap_progress >= 1.0:
+                self.swapping = False
+                self.swap_pieces = []
+                self.swap_progress = 0
+
     def run(self):
         """运行游戏主循环"""
-        clock = pygame.time.Clock()
+        loop = FixedStepLoop()
         while self.is_running:
             for event in pygame.event.get():
                 self.handle_event(event)
                 if event.type == pygame.QUIT:
                     pygame.quit()
                     sys.exit()
-            # 处理交换动画
-            if self.swapping:
-                self.swap_progress += 0.1
-                if self.swap_progress >= 1.0:
-                    self.swapping = False
-                    self.swap_pieces = []
-                    self.swap_progress = 0
+            loop.tick(self.update)
             self.draw()
-            pygame.display.flip()
-            clock.tick(FPS)
\ No newline at end of file
+            pygame.display.flip()
\ No newline at end of file
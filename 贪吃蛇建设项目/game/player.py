@@ -2,7 +2,12 @@ import json
 import os
 import sys
 import shutil
-from game.constants import get_resource_path
+import atexit
+import sqlite3
+import tempfile
+import threading
+from contextlib import contextmanager
+from game.core_constants import get_resource_path, PLAYER_SAVE_INTERVAL, PLAYER_DATA_BACKEND
 
 # 在打包环境中，将数据保存到用户主目录
 if hasattr(sys, '_MEIPASS'):
@@ -17,77 +22,379 @@ if not os.path.exists(PLAYER_DATA_PATH):
     with open(PLAYER_DATA_PATH, 'w', encoding='utf-8') as f:
         f.write('{"coins": 0, "sign_in_streak": 0, "max_sign_in_streak": 0}')
 
-class Player:
-    def __init__(self, data_file=PLAYER_DATA_PATH):
+def default_player_data():
+    return {
+        "coins": 0,
+        "sign_in_streak": 0,
+        "max_sign_in_streak": 0,
+        "purchased_skins": ["default_rectangle"],
+        "equipped_skin": "default_rectangle"
+    }
+
+# 进程的 umask，新建文件按 0o666 & ~umask 设置权限；os.umask 只能“设置并返回旧值”，所以在导入时（单线程）读取一次
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def write_file_atomic(path, content, prefix='.player_data_'):
+    """
+    先写临时文件再替换，写盘中途崩溃也不会损坏存档；content 可以是 str 或 bytes。
+    prefix 为临时文件名前缀，崩溃后残留的临时文件能看出属于哪类数据。
+    """
+    directory = os.path.dirname(path) or '.'
+    # 确保目录存在
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix=prefix, suffix='.tmp', dir=directory)
+    try:
+        if isinstance(content, bytes):
+            f = os.fdopen(fd, 'wb')
+        else:
+            f = os.fdopen(fd, 'w', encoding='utf-8')
+        with f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp 创建的临时文件权限为 0600，替换后会沿用：保留原文件的权限，新文件按 umask 设置
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        else:
+            os.chmod(tmp_path, 0o666 & ~_UMASK)
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+class JsonPlayerStore:
+    """JSON 存档：每次写盘整体替换文件"""
+    def __init__(self, data_file):
         self.data_file = data_file
-        self.data = self._load_data()
 
-    def _load_data(self):
+    def load(self):
         if os.path.exists(self.data_file):
-            with open(self.data_file, 'r') as f:
+            with open(self.data_file, 'r', encoding='utf-8') as f:
                 return json.load(f)
-        else:
-            # Default data
-            return {
-                "coins": 0,
-                "sign_in_streak": 0,
-                "max_sign_in_streak": 0,
-                "purchased_skins": ["default_rectangle"],
-                "equipped_skin": "default_rectangle"
-            }
-
-    def _save_data(self):
+        return default_player_data()
+
+    def snapshot(self, data, dirty_keys):
+        """在数据锁内调用，返回写盘所需的快照"""
+        return json.dumps(data, indent=4)
+
+    def write(self, content):
         try:
-            # 确保目录存在
-            os.makedirs(os.path.dirname(self.data_file), exist_ok=True)
-            
-            # 尝试写入文件
-            with open(self.data_file, 'w', encoding='utf-8') as f:
-                json.dump(self.data, f, indent=4)
-            return True
+            write_file_atomic(self.data_file, content)
         except Exception as e:
             print(f"保存玩家数据失败: {e}")
             # 尝试保存到用户主目录作为备选
+            alt_path = os.path.join(os.path.expanduser('~'), 'snake_game_player_data.json')
+            write_file_atomic(alt_path, content)
+            print(f"已保存数据到备用路径: {alt_path}")
+
+    def close(self):
+        pass
+
+class SqlitePlayerStore:
+    """
+    SQLite 存档（WAL 模式）
+    每个顶层字段一行，已购皮肤每个一行；写盘只更新被修改的字段，
+    一次写盘的所有修改在同一事务中提交。首次使用时从 JSON 存档导入。
+    """
+    SKINS_KEY = "purchased_skins"
+
+    def __init__(self, db_file, json_file=PLAYER_DATA_PATH):
+        self.db_file = db_file
+        self.json_file = json_file
+        # 写盘在后台线程进行，由 Player 的写锁保证串行
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        with self.conn:
+            self.conn.execute("CREATE TABLE IF NOT EXISTS profile (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS purchased_skins (seq INTEGER PRIMARY KEY AUTOINCREMENT, skin_id TEXT NOT NULL UNIQUE)")
+            self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self._persisted_skins = set()
+
+    def load(self):
+        if self._get_meta("json_imported") is None:
+            self._import_json()
+        data = {}
+        for key, value in self.conn.execute("SELECT key, value FROM profile"):
+            data[key] = json.loads(value)
+        skins = [row[0] for row in self.conn.execute("SELECT skin_id FROM purchased_skins ORDER BY seq")]
+        self._persisted_skins = set(skins)
+        data[self.SKINS_KEY] = skins or ["default_rectangle"]
+        return data
+
+    def _get_meta(self, key):
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _import_json(self):
+        """一次性导入旧的 JSON 存档（保留原文件作为备份）"""
+        data = default_player_data()
+        if self.json_file and os.path.exists(self.json_file):
             try:
-                alt_path = os.path.join(os.path.expanduser('~'), 'snake_game_player_data.json')
-                with open(alt_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.data, f, indent=4)
-                print(f"已保存数据到备用路径: {alt_path}")
+                with open(self.json_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"导入 JSON 存档失败: {e}")
+        skins = data.pop(self.SKINS_KEY, ["default_rectangle"])
+        with self.conn:
+            self.conn.executemany("INSERT OR REPLACE INTO profile (key, value) VALUES (?, ?)",
+                                  [(k, json.dumps(v)) for k, v in data.items()])
+            self.conn.executemany("INSERT OR IGNORE INTO purchased_skins (skin_id) VALUES (?)",
+                                  [(skin_id,) for skin_id in skins])
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('json_imported', '1')")
+
+    def snapshot(self, data, dirty_keys):
+        """在数据锁内调用，只序列化被修改的字段；dirty_keys 为 None 表示全部"""
+        keys = data.keys() if dirty_keys is None else dirty_keys
+        rows = []
+        deleted = []
+        added_skins = []
+        removed_skins = []
+        for key in keys:
+            if key == self.SKINS_KEY:
+                skins = data.get(self.SKINS_KEY, [])
+                added_skins = [s for s in skins if s not in self._persisted_skins]
+                if len(skins) - len(added_skins) != len(self._persisted_skins):
+                    removed_skins = list(self._persisted_skins.difference(skins))
+            elif key in data:
+                rows.append((key, json.dumps(data[key])))
+            else:
+                deleted.append((key,))
+        return rows, deleted, added_skins, removed_skins
+
+    def write(self, changes):
+        rows, deleted, added_skins, removed_skins = changes
+        with self.conn:
+            if rows:
+                self.conn.executemany("INSERT OR REPLACE INTO profile (key, value) VALUES (?, ?)", rows)
+            if deleted:
+                self.conn.executemany("DELETE FROM profile WHERE key = ?", deleted)
+            if added_skins:
+                self.conn.executemany("INSERT OR IGNORE INTO purchased_skins (skin_id) VALUES (?)",
+                                      [(s,) for s in added_skins])
+            if removed_skins:
+                self.conn.executemany("DELETE FROM purchased_skins WHERE skin_id = ?",
+                                      [(s,) for s in removed_skins])
+        self._persisted_skins.update(added_skins)
+        self._persisted_skins.difference_update(removed_skins)
+
+    def close(self):
+        self.conn.close()
+
+def create_player_store(backend=PLAYER_DATA_BACKEND, data_file=PLAYER_DATA_PATH):
+    """按配置创建存档后端，SQLite 存档与 JSON 存档放在同一目录"""
+    if backend == "sqlite":
+        return SqlitePlayerStore(os.path.splitext(data_file)[0] + '.db', json_file=data_file)
+    return JsonPlayerStore(data_file)
+
+class Player:
+    """
+    玩家数据（写后缓存）
+    修改只在内存中进行并记录被修改的字段，由后台线程按固定间隔合并写盘；
+    退出程序或切换场景时调用 flush() 保证数据落盘。
+    """
+    def __init__(self, data_file=PLAYER_DATA_PATH, flush_interval=PLAYER_SAVE_INTERVAL, store=None):
+        self.data_file = data_file
+        self.flush_interval = flush_interval
+        self.store = store or create_player_store(data_file=data_file)
+        self.data = self.store.load()
+
+        # 脏字段与写盘线程；_dirty_keys 为 None 表示整份数据都需要写
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._dirty_keys = set()
+        self._flush_thread = None
+        self._stop_event = threading.Event()
+
+        # 已购皮肤索引：有序元组 + 集合，版本号在拥有列表变化时递增
+        self._rebuild_skin_index()
+
+    def _save_data(self, *keys):
+        """标记数据已修改（不传字段名表示整份数据），实际写盘由后台线程合并完成"""
+        with self._lock:
+            self._dirty = True
+            if not keys:
+                self._dirty_keys = None
+            elif self._dirty_keys is not None:
+                self._dirty_keys.update(keys)
+            self._ensure_flush_thread()
+        return True
+
+    def _ensure_flush_thread(self):
+        """按需启动后台写盘线程"""
+        if self._flush_thread is None or not self._flush_thread.is_alive():
+            self._stop_event.clear()
+            self._flush_thread = threading.Thread(target=self._flush_loop, name="PlayerDataFlusher", daemon=True)
+            self._flush_thread.start()
+
+    def _flush_loop(self):
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
+
+    def is_dirty(self):
+        return self._dirty
+
+    @contextmanager
+    def batch(self):
+        """批量修改：块内的修改不会被后台线程拆开写盘"""
+        with self._lock:
+            yield self
+
+    def flush(self):
+        """如果有未保存的修改，立即写盘"""
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty:
+                    return True
+                # 只在锁内做快照，磁盘写入不阻塞主线程的修改；之后的修改会重新置脏
+                dirty_keys = self._dirty_keys
+                payload = self.store.snapshot(self.data, dirty_keys)
+                self._dirty = False
+                self._dirty_keys = set()
+            try:
+                self.store.write(payload)
                 return True
-            except Exception as e2:
-                print(f"保存到备用路径也失败: {e2}")
+            except Exception as e:
+                print(f"玩家数据写盘失败: {e}")
+                with self._lock:
+                    self._dirty = True
+                    if dirty_keys is None:
+                        self._dirty_keys = None
+                    elif self._dirty_keys is not None:
+                        self._dirty_keys.update(dirty_keys)
                 return False
 
+    def close(self):
+        """停止后台线程并写入剩余修改"""
+        self._stop_event.set()
+        if self._flush_thread is not None and self._flush_thread is not threading.current_thread():
+            self._flush_thread.join(timeout=self.flush_interval + 1)
+        result = self.flush()
+        self.store.close()
+        return result
+
+    # ---------- 分区键值接口（各小游戏统一使用） ----------
+    # section 为游戏名（如 "pong"），实际存储键为 "pong_high_score"，与旧存档兼容；
+    # section 为 None 时直接读写顶层键（如签到数据）。
+    @staticmethod
+    def _make_key(section, key):
+        return f"{section}_{key}" if section else key
+
+    def get_value(self, section, key, default=None):
+        return self.data.get(self._make_key(section, key), default)
+
+    def set_value(self, section, key, value):
+        with self._lock:
+            full_key = self._make_key(section, key)
+            self.data[full_key] = value
+            self._save_data(full_key)
+
+    def set_values(self, section, values):
+        """一次写入同一分区的多个键，只触发一次保存"""
+        with self._lock:
+            keys = []
+            for key, value in values.items():
+                full_key = self._make_key(section, key)
+                self.data[full_key] = value
+                keys.append(full_key)
+            self._save_data(*keys)
+
+    def get_int(self, section, key, default=0):
+        value = self.get_value(section, key, default)
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return default
+
+    def set_int(self, section, key, value):
+        self.set_value(section, key, int(value))
+
+    def get_str(self, section, key, default=""):
+        value = self.get_value(section, key, default)
+        return value if isinstance(value, str) else default
+
+    def set_str(self, section, key, value):
+        self.set_value(section, key, str(value))
+
+    def get_dict(self, section, key):
+        """返回字典的副本，修改后需通过 set_dict 写回"""
+        value = self.get_value(section, key)
+        return dict(value) if isinstance(value, dict) else {}
+
+    def set_dict(self, section, key, value):
+        self.set_value(section, key, dict(value))
+
+    def record_best(self, section, key, value, lower_is_better=False):
+        """记录最佳成绩，刷新纪录时返回 True"""
+        with self._lock:
+            old = self.get_value(section, key)
+            if old is not None:
+                if lower_is_better and value >= old:
+                    return False
+                if not lower_is_better and value <= old:
+                    return False
+            self.set_value(section, key, value)
+            return True
+
     def get_coins(self):
         return self.data.get("coins", 0)
 
     def add_coins(self, amount):
-        self.data["coins"] = self.get_coins() + amount
-        self._save_data()
+        with self._lock:
+            self.data["coins"] = self.get_coins() + amount
+            self._save_data("coins")
 
     def spend_coins(self, amount):
-        if self.get_coins() >= amount:
-            self.data["coins"] -= amount
-            self._save_data()
-            return True
-        return False
+        with self._lock:
+            if self.get_coins() >= amount:
+                self.data["coins"] -= amount
+                self._save_data("coins")
+                return True
+            return False
+
+    def _rebuild_skin_index(self):
+        skins = self.data.get("purchased_skins", ["default_rectangle"])
+        self._purchased_view = tuple(skins)
+        self._owned_skins = frozenset(skins)
+        self.ownership_version = getattr(self, "ownership_version", 0) + 1
 
     def get_purchased_skins(self):
-        return self.data.get("purchased_skins", ["default_rectangle"])
+        """按购买顺序返回已购皮肤（只读元组）"""
+        return self._purchased_view
+
+    def get_owned_skins(self):
+        """返回已购皮肤的只读集合，用于 O(1) 判断是否拥有"""
+        return self._owned_skins
+
+    def owns_skin(self, skin_id):
+        return skin_id in self._owned_skins
 
     def add_purchased_skin(self, skin_id):
-        if "purchased_skins" not in self.data:
-            self.data["purchased_skins"] = []
-        if skin_id not in self.data["purchased_skins"]:
+        with self._lock:
+            if skin_id in self._owned_skins:
+                return
+            if "purchased_skins" not in self.data:
+                self.data["purchased_skins"] = list(self._purchased_view)
             self.data["purchased_skins"].append(skin_id)
-            self._save_data()
+            self._rebuild_skin_index()
+            self._save_data("purchased_skins")
 
     def get_equipped_skin(self):
         return self.data.get("equipped_skin", "default_rectangle")
 
     def equip_skin(self, skin_id):
-        if skin_id in self.get_purchased_skins():
+        with self._lock:
+            if not self.owns_skin(skin_id):
+                return
             self.data["equipped_skin"] = skin_id
-            self._save_data()
+            self._save_data("equipped_skin")
+        # 预先生成新皮肤的蛇身贴图，避免进入游戏后首帧卡顿（在此处导入以避免循环导入）；在锁外进行，不阻塞写盘线程
+        from .snake import segment_sprites
+        segment_sprites.warm_up(skin_id)
 
-player_data = Player()
\ No newline at end of file
+player_data = Player()
+# 程序退出时确保写入剩余修改
+atexit.register(player_data.close)
@@ -4,6 +4,9 @@ import math
 import json
 import os
 from .constants import *
+from .fonts import get_font, render_text
+from . import layers
+from .particles import ParticleSystem
 from .player import player_data
 
 # 特殊方块类型
@@ -17,35 +20,6 @@ SPECIAL_TYPES = {
     'EXPLOSION': 6      # 爆炸效果
 }
 
-# 粒子系统
-class Particle:
-    def __init__(self, x, y, color):
-        self.x = x
-        self.y = y
-        self.color = color
-        self.size = random.randint(2, 3)  # 减小粒子大小
-        self.life = 200  # 减少初始生命值
-        self.vx = random.uniform(-1.5, 1.5)  # 减小速度范围
-        self.vy = random.uniform(-1.5, 1.5)
-        self.rotation = random.uniform(0, 360)
-        self.rotation_speed = random.uniform(-3, 3)  # 减小旋转速度
-
-    def update(self):
-        self.x += self.vx
-        self.y += self.vy
-        self.life -= 8  # 加快粒子消失速度
-        self.rotation += self.rotation_speed
-        return self.life > 0
-
-    def draw(self, surface):
-        alpha = max(0, min(255, self.life))
-        color = (*self.color[:3], alpha)
-        
-        # 简化粒子绘制，避免旋转计算
-        draw_x = int(self.x)
-        draw_y = int(self.y)
-        pygame.draw.circle(surface, color, (draw_x, draw_y), self.size)
-
 # 球类
 class Ball:
     def __init__(self, x, y):
@@ -105,8 +79,8 @@ class SpecialBlock:
             elif self.special_type == SPECIAL_TYPES['EXPLOSION']:
                 self.draw_explosion_mark(surface, center_x, center_y)
         if self.special_type is not None and self.hit_points > 1:
-            font = pygame.font.Font(FONT_NAME, 14)
-            hit_text = font.render(str(self.hit_points), True, (255, 255, 255))
+            font = get_font(FONT_NAME, 14)
+            hit_text = render_text(font, str(self.hit_points), True, (255, 255, 255))
             text_rect = hit_text.get_rect(center=(center_x, center_y + 10))
             surface.blit(hit_text, text_rect)
 
@@ -383,7 +357,7 @@ class PongGame:
         from .player import player_data
         self.player_data = player_data
         self.score = 0
-        self.high_score = self.player_data.data.get('pong_high_score', 0)
+        self.high_score = self.player_data.get_int('pong', 'high_score', 0)
         self.game_state = "level_select"  # 新增关卡选择状态
         self.selected_level = 1
         self.paddle_width = 100
@@ -396,7 +370,7 @@ class PongGame:
         self.brick_margin = 0  # 无缝隙
         self.blocks = []
         self.balls = []
-        self.particles = []
+        self.particles = ParticleSystem(PARTICLE_BUDGETS['pong'])
         self.speed_multiplier = 1.0
         self.hit_count = 0
         self.level = 1
@@ -454,7 +428,7 @@ class PongGame:
         self.bricks_destroyed = 0
         self.show_level_up_message = False
         self.level_up_timer = 0
-        self.particles = []
+        self.particles.clear()
         
         # 重置能量道具
         self.power_up_duration = 0.0  # 改为秒为单位
@@ -517,8 +491,7 @@ class PongGame:
             # 保存最高分
             if self.score > self.high_score:
                 self.high_score = self.score
-                self.player_data.data['pong_high_score'] = self.high_score
-                self.player_data._save_data()
+                self.player_data.set_int('pong', 'high_score', self.high_score)
             self.game_state = "game_over"
             return
         if self.game_state != "playing":
@@ -814,11 +787,12 @@ class PongGame:
     def add_particle_effect(self, x, y, color):
         # 大幅减少粒子数量以提高性能
         for _ in range(1):  # 从2个粒子减少到1个
-            self.particles.append(Particle(x, y, color))
+            # 存活 25 帧；直接画在窗口上，颜色不带透明度
+            self.particles.emit(x, y, random.uniform(-1.5, 1.5), random.uniform(-1.5, 1.5),
+                                life=25, radius=random.randint(2, 3), color=color[:3])
 
     def update_particles(self):
-        # 使用列表推导式一次性过滤，而不是逐个检查
-        self.particles = [p for p in self.particles if p.update()]
+        self.particles.update()
 
     def add_new_ball(self):
         self.balls.append(Ball(self.width // 2, self.height - 30))
@@ -976,14 +950,8 @@ class PongGame:
             self.draw_game_over_screen()
             return
         # ...原有draw内容...
-        # 优化背景绘制，避免重复创建背景表面
-        if not hasattr(self, '_background_surface') or self._background_surface.get_size() != (self.width, self.height):
-            # 只在第一次创建背景，或者窗口大小改变时重新创建
-            self._background_surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-            for y in range(self.height):
-                c = 180 - int(80 * y / self.height)
-                pygame.draw.line(self._background_surface, (c//3, c//3, c, 255), (0, y), (self.width, y))
-        self.surface.blit(self._background_surface, (0, 0))
+        # 背景渐变由 layers 缓存，只在第一次或窗口大小改变时生成
+        self.surface.blit(layers.gradient((self.width, self.height), [(60, 60, 180), (33, 33, 100)]), (0, 0))
         
         # 绘制方块
         for block in self.blocks:
@@ -1002,8 +970,7 @@ class PongGame:
                 ball.draw(self.surface)
         
         # 绘制粒子
-        for particle in self.particles:
-            particle.draw(self.surface)
+        self.particles.draw(self.surface)
         
         # 如果游戏结束但还没显示结束页面，显示简单提示
         if self.game_over and not self.show_end_screen:
@@ -1026,11 +993,11 @@ class PongGame:
             pygame.draw.polygon(self.surface, (255, 60, 60), points)
         
         # 绘制分数、最高分、速度、关卡
-        font = pygame.font.Font(FONT_NAME, 32)
-        score_text = font.render(f"分数: {self.score}", True, (255, 255, 0))
-        high_score_text = font.render(f"最高分: {self.high_score}", True, (100, 255, 100))
-        speed_text = font.render(f"速度: {self.speed_multiplier:.1f}x", True, (255, 150, 255))
-        level_text = font.render(f"关卡: {self.level}", True, (100, 200, 255))
+        font = get_font(FONT_NAME, 32)
+        score_text = render_text(font, f"分数: {self.score}", True, (255, 255, 0))
+        high_score_text = render_text(font, f"最高分: {self.high_score}", True, (100, 255, 100))
+        speed_text = render_text(font, f"速度: {self.speed_multiplier:.1f}x", True, (255, 150, 255))
+        level_text = render_text(font, f"关卡: {self.level}", True, (100, 200, 255))
         self.surface.blit(score_text, (20, 60))
         self.surface.blit(high_score_text, (self.width - 200, 20))
         self.surface.blit(speed_text, (20, 95))
@@ -1039,7 +1006,7 @@ class PongGame:
         # 显示能量道具状态
         if self.power_up_active:
             remaining_time = max(0.0, self.power_up_duration)
-            power_up_text = font.render(f"能量道具: {remaining_time:.1f}s", True, (255, 255, 0))
+            power_up_text = render_text(font, f"能量道具: {remaining_time:.1f}s", True, (255, 255, 0))
             self.surface.blit(power_up_text, (self.width - 250, 55))
         
         # 绘制关卡进阶提示
@@ -1056,11 +1023,11 @@ class PongGame:
         overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         overlay.fill((0, 0, 0, 128))
         self.surface.blit(overlay, (0, 0))
-        font = pygame.font.Font(FONT_NAME, 48)
-        text = font.render("游戏暂停", True, (255, 255, 255))
+        font = get_font(FONT_NAME, 48)
+        text = render_text(font, "游戏暂停", True, (255, 255, 255))
         text_rect = text.get_rect(center=(self.width // 2, self.height // 2 - 60))
         self.surface.blit(text, text_rect)
-        font2 = pygame.font.Font(FONT_NAME, 28)
+        font2 = get_font(FONT_NAME, 28)
         # 按钮参数
         btn_w, btn_h = 220, 60
         btn_gap = 40
@@ -1070,36 +1037,33 @@ class PongGame:
         # 继续游戏按钮
         self.pause_btn_continue = pygame.Rect(btn_x, btn_y1, btn_w, btn_h)
         pygame.draw.rect(self.surface, (66, 165, 245), self.pause_btn_continue, border_radius=12)
-        cont_text = font2.render("继续游戏", True, (255,255,255))
+        cont_text = render_text(font2, "继续游戏", True, (255,255,255))
         cont_rect = cont_text.get_rect(center=self.pause_btn_continue.center)
         self.surface.blit(cont_text, cont_rect)
         # 结束游戏按钮
         self.pause_btn_quit = pygame.Rect(btn_x, btn_y2, btn_w, btn_h)
         pygame.draw.rect(self.surface, (255, 120, 120), self.pause_btn_quit, border_radius=12)
-        quit_text = font2.render("结束本局", True, (255,255,255))
+        quit_text = render_text(font2, "结束本局", True, (255,255,255))
         quit_rect = quit_text.get_rect(center=self.pause_btn_quit.center)
         self.surface.blit(quit_text, quit_rect)
         
     def draw_game_over_screen(self):
-        overlay = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         # 渐变背景
-        for y in range(self.height):
-            c = 40 + int(80 * y / self.height)
-            pygame.draw.line(overlay, (c, c//2, c//2, 180), (0, y), (self.width, y))
+        overlay = layers.gradient((self.width, self.height), [(40, 20, 20, 180), (120, 60, 60, 180)])
         self.surface.blit(overlay, (0, 0))
-        font = pygame.font.Font(FONT_NAME, 56)
-        text = font.render("游戏结束", True, (255, 255, 255))
+        font = get_font(FONT_NAME, 56)
+        text = render_text(font, "游戏结束", True, (255, 255, 255))
         text_rect = text.get_rect(center=(self.width // 2, self.height // 2 - 120))
         self.surface.blit(text, text_rect)
-        font2 = pygame.font.Font(FONT_NAME, 36)
-        score_text = font2.render(f"最终分数: {self.score}", True, (255, 215, 0))
+        font2 = get_font(FONT_NAME, 36)
+        score_text = render_text(font2, f"最终分数: {self.score}", True, (255, 215, 0))
         score_rect = score_text.get_rect(center=(self.width // 2, self.height // 2 - 40))
         self.surface.blit(score_text, score_rect)
-        level_text = font2.render(f"到达关卡: {self.level}", True, (100, 200, 255))
+        level_text = render_text(font2, f"到达关卡: {self.level}", True, (100, 200, 255))
         level_rect = level_text.get_rect(center=(self.width // 2, self.height // 2 + 10))
         self.surface.blit(level_text, level_rect)
         if self.score > self.high_score:
-            new_record_text = font2.render("新纪录！", True, (255, 80, 80))
+            new_record_text = render_text(font2, "新纪录！", True, (255, 80, 80))
             new_record_rect = new_record_text.get_rect(center=(self.width // 2, self.height // 2 + 60))
             self.surface.blit(new_record_text, new_record_rect)
         # 两个按钮：选择关卡、返回活动页面
@@ -1112,42 +1076,34 @@ class PongGame:
         # 重新游戏按钮
         self.over_btn_restart_level = pygame.Rect(btn_x, btn_y1, btn_w, btn_h)
         pygame.draw.rect(self.surface, (255, 193, 7), self.over_btn_restart_level, border_radius=12)
-        restart_level_text = font2.render("重新游戏", True, (255,255,255))
+        restart_level_text = render_text(font2, "重新游戏", True, (255,255,255))
         restart_level_rect = restart_level_text.get_rect(center=self.over_btn_restart_level.center)
         self.surface.blit(restart_level_text, restart_level_rect)
         # 选择关卡按钮
         self.over_btn_restart = pygame.Rect(btn_x, btn_y2, btn_w, btn_h)
         pygame.draw.rect(self.surface, (66, 165, 245), self.over_btn_restart, border_radius=12)
-        restart_text = font2.render("选择关卡", True, (255,255,255))
+        restart_text = render_text(font2, "选择关卡", True, (255,255,255))
         restart_rect = restart_text.get_rect(center=self.over_btn_restart.center)
         self.surface.blit(restart_text, restart_rect)
         # 返回活动页面按钮
         self.over_btn_back = pygame.Rect(btn_x, btn_y3, btn_w, btn_h)
         pygame.draw.rect(self.surface, (120, 120, 120), self.over_btn_back, border_radius=12)
-        back_text = font2.render("返回活动页面", True, (255,255,255))
+        back_text = render_text(font2, "返回活动页面", True, (255,255,255))
         back_rect = back_text.get_rect(center=self.over_btn_back.center)
         self.surface.blit(back_text, back_rect)
         
     def draw_ready_screen(self):
         # 渐变背景
-        grad = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        for y in range(self.height):
-            c1 = (66, 165, 245)
-            c2 = (156, 39, 176)
-            ratio = y / self.height
-            r = int(c1[0] * (1 - ratio) + c2[0] * ratio)
-            g = int(c1[1] * (1 - ratio) + c2[1] * ratio)
-            b = int(c1[2] * (1 - ratio) + c2[2] * ratio)
-            pygame.draw.line(grad, (r, g, b, 220), (0, y), (self.width, y))
+        grad = layers.gradient((self.width, self.height), [(66, 165, 245, 220), (156, 39, 176, 220)])
         self.surface.blit(grad, (0, 0))
         # 标题
-        font_title = pygame.font.Font(FONT_NAME, 64)
-        title_text = font_title.render("高级弹球游戏", True, (255, 255, 255))
+        font_title = get_font(FONT_NAME, 64)
+        title_text = render_text(font_title, "高级弹球游戏", True, (255, 255, 255))
         title_rect = title_text.get_rect(center=(self.width // 2, self.height // 2 - 120))
         self.surface.blit(title_text, title_rect)
         # 副标题
-        font_sub = pygame.font.Font(FONT_NAME, 32)
-        sub_text = font_sub.render("经典打砖块，畅享乐趣！", True, (255, 255, 255, 180))
+        font_sub = get_font(FONT_NAME, 32)
+        sub_text = render_text(font_sub, "经典打砖块，畅享乐趣！", True, (255, 255, 255, 180))
         sub_rect = sub_text.get_rect(center=(self.width // 2, self.height // 2 - 60))
         self.surface.blit(sub_text, sub_rect)
         # 大按钮
@@ -1174,14 +1130,14 @@ class PongGame:
         # 按钮描边
         pygame.draw.rect(self.surface, (255,255,255), self.ready_btn_start, 3, border_radius=24)
         # 按钮文字
-        font_btn = pygame.font.Font(FONT_NAME, 36)
-        btn_text = font_btn.render("开始游戏", True, (255,255,255))
+        font_btn = get_font(FONT_NAME, 36)
+        btn_text = render_text(font_btn, "开始游戏", True, (255,255,255))
         btn_rect = btn_text.get_rect(center=self.ready_btn_start.center)
         self.surface.blit(btn_text, btn_rect)
         # 操作说明
-        font_tip = pygame.font.Font(FONT_NAME, 22)
-        tip1 = font_tip.render("A/D键或方向键控制挡板", True, (255,255,255,180))
-        tip2 = font_tip.render("击碎特殊方块获得能量道具", True, (255,255,255,180))
+        font_tip = get_font(FONT_NAME, 22)
+        tip1 = render_text(font_tip, "A/D键或方向键控制挡板", True, (255,255,255,180))
+        tip2 = render_text(font_tip, "击碎特殊方块获得能量道具", True, (255,255,255,180))
         self.surface.blit(tip1, tip1.get_rect(center=(self.width//2, self.height//2 + 110)))
         self.surface.blit(tip2, tip2.get_rect(center=(self.width//2, self.height//2 + 140)))
 
@@ -1191,8 +1147,8 @@ class PongGame:
         self.surface.blit(overlay, (0, 0))
         
         # 使用更高效的字体渲染
-        font = pygame.font.Font(FONT_NAME, 36)
-        text = font.render(f"第 {self.level} 关！", True, (255, 255, 0))
+        font = get_font(FONT_NAME, 36)
+        text = render_text(font, f"第 {self.level} 关！", True, (255, 255, 0))
         text_rect = text.get_rect(center=(self.width // 2, self.height // 2))
         self.surface.blit(text, text_rect)
 
@@ -1205,30 +1161,30 @@ class PongGame:
         surface.blit(overlay, (0, 0))
         
         # 主标题
-        title_font = pygame.font.Font(FONT_NAME, 48)
-        title_text = title_font.render("游戏结束", True, (255, 255, 255))
+        title_font = get_font(FONT_NAME, 48)
+        title_text = render_text(title_font, "游戏结束", True, (255, 255, 255))
         title_rect = title_text.get_rect(center=(self.width // 2, 200))
         surface.blit(title_text, title_rect)
         
         # 得分显示
-        score_font = pygame.font.Font(FONT_NAME, 32)
-        score_text = score_font.render(f"最终得分: {self.score}", True, (255, 215, 0))
+        score_font = get_font(FONT_NAME, 32)
+        score_text = render_text(score_font, f"最终得分: {self.score}", True, (255, 215, 0))
         score_rect = score_text.get_rect(center=(self.width // 2, 280))
         surface.blit(score_text, score_rect)
         
         # 关卡显示
-        level_text = score_font.render(f"到达关卡: {self.level + 1}", True, (255, 215, 0))
+        level_text = render_text(score_font, f"到达关卡: {self.level + 1}", True, (255, 215, 0))
         level_rect = level_text.get_rect(center=(self.width // 2, 320))
         surface.blit(level_text, level_rect)
         
         # 重新开始提示
-        restart_font = pygame.font.Font(FONT_NAME, 24)
-        restart_text = restart_font.render("按 R 键重新开始", True, (255, 255, 255))
+        restart_font = get_font(FONT_NAME, 24)
+        restart_text = render_text(restart_font, "按 R 键重新开始", True, (255, 255, 255))
         restart_rect = restart_text.get_rect(center=(self.width // 2, 400))
         surface.blit(restart_text, restart_rect)
         
         # 返回主菜单提示
-        menu_text = restart_font.render("按 ESC 键返回主菜单", True, (255, 255, 255))
+        menu_text = render_text(restart_font, "按 ESC 键返回主菜单", True, (255, 255, 255))
         menu_rect = menu_text.get_rect(center=(self.width // 2, 440))
         surface.blit(menu_text, menu_rect)
         
@@ -1245,8 +1201,8 @@ class PongGame:
 
     def draw_game_over_hint(self, surface):
         """绘制游戏结束提示"""
-        hint_font = pygame.font.Font(FONT_NAME, 28)
-        hint_text = hint_font.render("游戏结束", True, (255, 0, 0))
+        hint_font = get_font(FONT_NAME, 28)
+        hint_text = render_text(hint_font, "游戏结束", True, (255, 0, 0))
         hint_rect = hint_text.get_rect(center=(self.width // 2, self.height // 2))
         surface.blit(hint_text, hint_rect)
 
@@ -1312,19 +1268,11 @@ class PongGame:
 
     def draw_level_select_screen(self):
         # 渐变背景
-        grad = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
-        for y in range(self.height):
-            c1 = (66, 165, 245)
-            c2 = (156, 39, 176)
-            ratio = y / self.height
-            r = int(c1[0] * (1 - ratio) + c2[0] * ratio)
-            g = int(c1[1] * (1 - ratio) + c2[1] * ratio)
-            b = int(c1[2] * (1 - ratio) + c2[2] * ratio)
-            pygame.draw.line(grad, (r, g, b, 220), (0, y), (self.width, y))
+        grad = layers.gradient((self.width, self.height), [(66, 165, 245, 220), (156, 39, 176, 220)])
         self.surface.blit(grad, (0, 0))
         # 标题
-        font_title = pygame.font.Font(FONT_NAME, 54)
-        title_text = font_title.render("选择关卡", True, (255, 255, 255))
+        font_title = get_font(FONT_NAME, 54)
+        title_text = render_text(font_title, "选择关卡", True, (255, 255, 255))
         title_rect = title_text.get_rect(center=(self.width // 2, 80))
         self.surface.blit(title_text, title_rect)
         # 关卡按钮和预览
@@ -1352,8 +1300,8 @@ class PongGame:
             btn_rect = pygame.Rect(bx, by, btn_w, btn_h)
             color = (66, 165, 245) if self.selected_level == idx+1 else (120,120,120)
             pygame.draw.rect(self.surface, color, btn_rect, border_radius=16)
-            font_btn = pygame.font.Font(FONT_NAME, 32)
-            btn_text = font_btn.render(f"第{idx+1}关", True, (255,255,255))
+            font_btn = get_font(FONT_NAME, 32)
+            btn_text = render_text(font_btn, f"第{idx+1}关", True, (255,255,255))
             btn_text_rect = btn_text.get_rect(center=btn_rect.center)
             self.surface.blit(btn_text, btn_text_rect)
             preview_rect = pygame.Rect(bx + (btn_w-preview_w)//2, by+btn_h+10, preview_w, preview_h)
@@ -1375,8 +1323,8 @@ class PongGame:
         start_btn_rect = pygame.Rect(btn_x, btn_y_start, btn_w, btn_h)
         start_btn_surface = pygame.Surface((btn_w, btn_h), pygame.SRCALPHA)
         pygame.draw.rect(start_btn_surface, (255, 120, 120, 180), (0,0,btn_w,btn_h), border_radius=20)
-        font_start = pygame.font.Font(FONT_NAME, 32)
-        start_text = font_start.render("开始游戏", True, (255,255,255))
+        font_start = get_font(FONT_NAME, 32)
+        start_text = render_text(font_start, "开始游戏", True, (255,255,255))
         start_text_rect = start_text.get_rect(center=(btn_w//2, btn_h//2))
         start_btn_surface.blit(start_text, start_text_rect)
         self.surface.blit(start_btn_surface, (btn_x, btn_y_start))
@@ -1385,8 +1333,8 @@ class PongGame:
         back_btn_rect = pygame.Rect(btn_x, btn_y_back, btn_w, btn_h)
         back_btn_surface = pygame.Surface((btn_w, btn_h), pygame.SRCALPHA)
         pygame.draw.rect(back_btn_surface, (120, 120, 120, 160), (0,0,btn_w,btn_h), border_radius=16)
-        font_back = pygame.font.Font(FONT_NAME, 28)
-        back_text = font_back.render("返回活动页面", True, (255,255,255))
+        font_back = get_font(FONT_NAME, 28)
+        back_text = render_text(font_back, "返回活动页面", True, (255,255,255))
         back_text_rect = back_text.get_rect(center=(btn_w//2, btn_h//2))
         back_btn_surface.blit(back_text, back_text_rect)
         self.surface.blit(back_btn_surface, (btn_x, btn_y_back))
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+贪吃蛇对局录像
+SnakeWorld 的结果只取决于种子和每一帧的方向指令，所以录像只保存这两样：
+文件头（魔数、版本、种子、棋盘尺寸、障碍物数、结束帧、指令数、最终分数）后面
+紧跟每条指令 (帧号 uint32, 方向编号 uint8)，一局通常只有几百字节。
+回放既可以在窗口中按任意倍速播放（scenes.ReplayScene），也可以无界面全速运行。
+"""
+import os
+import glob
+import struct
+import time
+from .player import PLAYER_DATA_PATH, write_file_atomic
+from .world import SnakeWorld
+
+# 录像目录（与存档放在同一目录，打包后也可写）
+REPLAY_DIR = os.path.join(os.path.dirname(PLAYER_DATA_PATH), 'replays')
+REPLAY_EXTENSION = '.snakerep'
+MAX_REPLAYS = 20  # 只保留最近的录像
+
+REPLAY_MAGIC = b'SNKR'
+REPLAY_VERSION = 1
+HEADER = struct.Struct('<4sBQHHHIIi')
+INPUT = struct.Struct('<IB')
+
+# 方向与编号的对应关系
+DIRECTION_CODES = {(0, -1): 0, (0, 1): 1, (-1, 0): 2, (1, 0): 3}
+CODE_DIRECTIONS = {code: direction for direction, code in DIRECTION_CODES.items()}
+
+class SessionRecorder:
+    """记录一局中每个逻辑帧交给 world.step 的方向指令"""
+
+    def __init__(self, world):
+        self.world = world
+        self.inputs = []  # [(帧号, 方向编号)]
+        self.saved = False
+
+    def record(self, actions):
+        """在 world.step(actions) 之前调用"""
+        tick = self.world.tick
+        for action in actions:
+            self.inputs.append((tick, DIRECTION_CODES[tuple(action)]))
+
+    def to_replay(self):
+        world = self.world
+        return Replay(world.seed, world.width, world.height, world.obstacle_count,
+                      list(self.inputs), world.tick, world.snake.score)
+
+    def save(self, path=None):
+        """保存录像并返回路径；path 为空时存入 REPLAY_DIR 并清理旧录像"""
+        if path is None:
+            millis = int(time.time() * 1000) % 1000
+            name = time.strftime('snake_%Y%m%d_%H%M%S') + f'_{millis:03d}' + REPLAY_EXTENSION
+            path = os.path.join(REPLAY_DIR, name)
+            self.to_replay().save(path)
+            prune_replays()
+        else:
+            self.to_replay().save(path)
+        self.saved = True
+        return path
+
+class Replay:
+    """一局录像：种子、棋盘参数和按帧排列的方向指令"""
+
+    def __init__(self, seed, width, height, obstacle_count, inputs, end_tick, final_score):
+        self.seed = seed
+        self.width = width
+        self.height = height
+        self.obstacle_count = obstacle_count
+        self.inputs = inputs
+        self.end_tick = end_tick
+        self.final_score = final_score
+        self._actions_by_tick = {}
+        for tick, code in inputs:
+            self._actions_by_tick.setdefault(tick, []).append(CODE_DIRECTIONS[code])
+
+    def actions_at(self, tick):
+        """第 tick 帧（world.tick 等于 tick 时）要交给 step 的方向指令"""
+        return self._actions_by_tick.get(tick, ())
+
+    def to_bytes(self):
+        header = HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.seed, self.width, self.height,
+                             self.obstacle_count, self.end_tick, len(self.inputs), self.final_score)
+        return header + b''.join(INPUT.pack(tick, code) for tick, code in self.inputs)
+
+    @classmethod
+    def from_bytes(cls, data):
+        if len(data) < HEADER.size:
+            raise ValueError("录像文件不完整")
+        magic, version, seed, width, height, obstacle_count, end_tick, count, final_score = \
+            HEADER.unpack_from(data, 0)
+        if magic != REPLAY_MAGIC:
+            raise ValueError("不是贪吃蛇录像文件")
+        if version != REPLAY_VERSION:
+            raise ValueError(f"不支持的录像版本: {version}")
+        if len(data) < HEADER.size + count * INPUT.size:
+            raise ValueError("录像文件不完整")
+        inputs = [INPUT.unpack_from(data, HEADER.size + i * INPUT.size) for i in range(count)]
+        return cls(seed, width, height, obstacle_count, inputs, end_tick, final_score)
+
+    def save(self, path):
+        write_file_atomic(path, self.to_bytes(), prefix='.replay_')
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+    def make_world(self, **kwargs):
+        """用录像的种子和棋盘参数创建世界（kwargs 可传入 snake_factory / food_factory）"""
+        return SnakeWorld(seed=self.seed, width=self.width, height=self.height,
+                          obstacle_count=self.obstacle_count, **kwargs)
+
+    def run_headless(self):
+        """无界面全速回放，返回 (world, 耗时秒数)；world.snake.score 应等于 final_score"""
+        world = self.make_world()
+        start = time.perf_counter()
+        while world.tick < self.end_tick and not world.done:
+            world.step(self.actions_at(world.tick))
+        return world, time.perf_counter() - start
+
+def prune_replays(directory=REPLAY_DIR, keep=MAX_REPLAYS):
+    """删除多余的旧录像"""
+    paths = sorted(glob.glob(os.path.join(directory, '*' + REPLAY_EXTENSION)), key=os.path.getmtime)
+    for path in paths[:-keep]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+"""
+场景栈
+所有界面（主菜单、游戏、商店、背包、活动……）都是 Scene，由 SceneManager 统一驱动：
+一个事件泵、一个共用时钟，每帧只更新和绘制栈顶场景。
+进入子界面时 push，返回时 pop，不再在各自的 run() 里嵌套阻塞的 while 循环。
+"""
+import time
+import pygame
+from .constants import FPS, SIM_TICK_RATE
+from .game_loop import FixedStepLoop, FramePacer
+
+class Scene:
+    """
+    场景基类
+    tick_rate 不为 None 时，update() 按该固定帧率调用（与绘制帧率无关）；为 None 时每个绘制帧调用一次。
+    被其他场景盖住（suspend）或弹出（exit）时调用 release()，释放可以重新创建的资源。
+    is_animating() 返回 False 的场景在没有输入时按 IDLE_FPS 低帧率绘制。
+    """
+    tick_rate = SIM_TICK_RATE
+
+    def __init__(self):
+        self.manager = None
+        self.loop = FixedStepLoop(self.tick_rate) if self.tick_rate else None
+
+    def enter(self):
+        """压入栈时调用"""
+
+    def exit(self):
+        """弹出栈时调用"""
+        self.release()
+
+    def suspend(self):
+        """被新场景盖住时调用"""
+        self.release()
+
+    def resume(self):
+        """上层场景弹出、重新回到栈顶时调用"""
+
+    def release(self):
+        """释放缓存的图片、小游戏实例等可以重新创建的资源"""
+
+    def is_animating(self):
+        """是否有需要全帧率播放的动画；只有缓慢的背景动画时返回 False"""
+        return True
+
+    def handle_event(self, event):
+        pass
+
+    def frame(self, elapsed_ms):
+        """每个绘制帧调用一次：按固定帧率补齐 update()"""
+        if self.loop is not None:
+            self.loop.run(elapsed_ms, self.update)
+        else:
+            self.update()
+
+    def update(self):
+        """一个逻辑帧"""
+
+    def draw(self):
+        pass
+
+    def present(self):
+        """把绘制结果提交到屏幕"""
+        pygame.display.flip()
+
+class SceneManager:
+    """场景栈与唯一的主循环"""
+
+    def __init__(self, screen, clock=None, fps=FPS):
+        self.screen = screen
+        self.clock = clock or pygame.time.Clock()
+        self.fps = fps
+        self.pacer = FramePacer(self.clock, fps)
+        self.stack = []
+        self.running = False
+        # 帧耗时统计（毫秒，不含限速等待）：最近一帧和指数滑动平均
+        self.frame_ms = 0.0
+        self.average_frame_ms = 0.0
+
+    @property
+    def top(self):
+        return self.stack[-1] if self.stack else None
+
+    def push(self, scene):
+        self.pacer.wake()
+        if self.stack:
+            self.stack[-1].suspend()
+        scene.manager = self
+        self.stack.append(scene)
+        if scene.loop is not None:
+            scene.loop.reset()
+        scene.enter()
+
+    def pop(self):
+        """弹出栈顶场景并恢复下面的场景；栈空时主循环结束"""
+        self.pacer.wake()
+        scene = self.stack.pop()
+        scene.exit()
+        scene.manager = None
+        if self.stack:
+            below = self.stack[-1]
+            if below.loop is not None:
+                below.loop.reset()
+            below.resume()
+        return scene
+
+    def replace(self, scene):
+        """用 scene 替换栈顶场景（下面的场景不会被恢复）"""
+        old = self.stack.pop()
+        old.exit()
+        old.manager = None
+        scene.manager = self
+        self.stack.append(scene)
+        if scene.loop is not None:
+            scene.loop.reset()
+        scene.enter()
+
+    def quit(self):
+        """从上到下依次退出所有场景并结束主循环"""
+        while self.stack:
+            scene = self.stack.pop()
+            scene.exit()
+            scene.manager = None
+        self.running = False
+
+    def run(self, scene=None):
+        """运行主循环，直到所有场景弹出或调用 quit()"""
+        if scene is not None:
+            self.push(scene)
+        self.running = True
+        self.clock.tick()
+        while self.running and self.stack:
+            elapsed, events = self.pacer.next_frame(self.stack[-1].is_animating())
+            start = time.perf_counter()
+            for event in events:
+                if event.type == pygame.QUIT:
+                    self.quit()
+                    break
+                if not self.stack:
+                    break
+                # 事件总是交给当前栈顶场景（处理过程中可能已经切换）
+                self.stack[-1].handle_event(event)
+            if not self.running or not self.stack:
+                break
+            scene = self.stack[-1]
+            scene.frame(elapsed)
+            if scene is not self.top:
+                continue  # 更新时切换了场景，从下一帧开始绘制新场景
+            scene.draw()
+            scene.present()
+            self.frame_ms = (time.perf_counter() - start) * 1000
+            self.average_frame_ms += (self.frame_ms - self.average_frame_ms) * 0.05
+        self.running = False
@@ -0,0 +1,332 @@
+# -*- coding: utf-8 -*-
+"""
+各个界面对应的场景，由 SceneManager 驱动
+主菜单在栈底，进入游戏、设置、帮助、商店、背包、活动时压栈，返回时出栈；
+设置页面里的背景音乐、音量和帮助页面再压在设置场景上面。
+"""
+import pygame
+from .scene_manager import Scene
+from .player import player_data
+from .game_loop import FixedStepLoop
+from .arena_controller import ArenaController
+from .constants import SNAKE_SPEED, FPS, MAX_TICKS_PER_FRAME
+
+class MenuScene(Scene):
+    """主菜单（栈底场景）"""
+    tick_rate = None  # 菜单动画在 draw 中按经过的时间推进
+
+    def __init__(self, game, bots=0):
+        super().__init__()
+        self.game = game
+        self.bots = bots  # 双人模式中加入的电脑数量
+
+    def enter(self):
+        self.resume()
+
+    def resume(self):
+        # 切换场景时把玩家数据写盘，并在菜单中播放菜单音乐
+        player_data.flush()
+        self.game.in_game = False
+        self.game.play_menu_music()
+
+    def exit(self):
+        self.game.stop_menu_music()
+        super().exit()
+
+    def handle_event(self, event):
+        game = self.game
+        result = game.menu.handle_event(event)
+        if result == "exit":
+            self.manager.quit()
+        elif result == "start":
+            self.manager.push(GameScene(game))
+        elif result == "dual":  # 双人模式：两个本地玩家，可加入电脑
+            self.manager.push(ArenaScene(ArenaController(game.screen, players=2, bots=self.bots)))
+        elif result == "settings":
+            self.manager.push(SettingsScene(game))
+        elif result == "help":
+            self.manager.push(HelpScene(game))
+        elif result == "shop":
+            self.manager.push(MenuPageScene(game.shop_menu))
+        elif result == "backpack":
+            self.manager.push(MenuPageScene(game.backpack_menu))
+        elif result == "activity":
+            self.manager.push(ActivityScene(game))
+
+    def is_animating(self):
+        return self.game.menu.is_animating()
+
+    def update(self):
+        self.game.check_english_input_method(pygame.time.get_ticks())
+
+    def draw(self):
+        self.game.menu.draw()
+
+class GameScene(Scene):
+    """单人游戏，逻辑帧率由 GameController 的固定步长循环（SNAKE_SPEED）决定"""
+    tick_rate = None
+
+    def __init__(self, game):
+        super().__init__()
+        self.game = game
+
+    def enter(self):
+        # 重新初始化游戏状态并开始播放音乐
+        self.game.reset_game(play_music=True)
+
+    def exit(self):
+        self.game.save_replay()
+        super().exit()
+
+    def release(self):
+        self.game.autopilot = None
+
+    def handle_event(self, event):
+        result = self.game.handle_event(event)
+        if result == "exit":
+            self.manager.quit()
+        elif result == "menu":
+            self.manager.pop()
+
+    def frame(self, elapsed_ms):
+        self.game.check_english_input_method(pygame.time.get_ticks())
+        self.game.advance_frame(elapsed_ms)
+
+    def draw(self):
+        self.game.draw()
+
+    def present(self):
+        self.game.present()
+
+class ReplayScene(Scene):
+    """在窗口中回放录像，speed 为倍速（每帧可推进多个逻辑帧）；按 ESC 返回"""
+    tick_rate = None
+
+    def __init__(self, game, replay, speed=1.0):
+        super().__init__()
+        self.game = game
+        self.replay = replay
+        # 高倍速时每帧要推进多个逻辑帧，补帧上限随之放宽
+        rate = SNAKE_SPEED * speed
+        self.replay_loop = FixedStepLoop(rate, max_ticks_per_frame=MAX_TICKS_PER_FRAME + int(rate / FPS))
+
+    def enter(self):
+        self.game.reset_game(play_music=False, replay=self.replay)
+        self.replay_loop.reset()
+
+    def handle_event(self, event):
+        if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+            self.manager.pop()
+
+    def step(self):
+        game = self.game
+        if game.world.tick >= self.replay.end_tick:
+            return False
+        game.advance_world(self.replay.actions_at(game.world.tick))
+        return not game.game_over
+
+    def frame(self, elapsed_ms):
+        game = self.game
+        if not game.game_over:
+            self.replay_loop.run(elapsed_ms, self.step)
+        current_time = pygame.time.get_ticks()
+        game.snake.animation_time = current_time
+        if not game.game_over:
+            game.snake.render_alpha = self.replay_loop.alpha
+            game.update_animations(current_time)
+
+    def draw(self):
+        self.game.draw()
+
+    def present(self):
+        self.game.present()
+
+class ArenaScene(Scene):
+    """多蛇竞技场，逻辑帧率为 ARENA_TICK_RATE"""
+    tick_rate = None
+
+    def __init__(self, arena):
+        super().__init__()
+        self.arena = arena
+
+    def handle_event(self, event):
+        if self.arena.handle_event(event) == "menu":
+            self.manager.pop()
+
+    def frame(self, elapsed_ms):
+        self.arena.advance_frame(elapsed_ms)
+
+    def draw(self):
+        self.arena.draw()
+
+class MenuPageScene(Scene):
+    """商店、背包等全屏页面：page 提供 open / handle_event / update / draw / release，running 为 False 时返回"""
+
+    def __init__(self, page):
+        super().__init__()
+        self.page = page
+        if not hasattr(page, 'update'):
+            self.loop = None
+
+    def enter(self):
+        self.page.open()
+
+    def release(self):
+        self.page.release()
+
+    def is_animating(self):
+        return getattr(self.page, 'is_animating', lambda: True)()
+
+    def handle_event(self, event):
+        self.page.handle_event(event)
+        if not self.page.running:
+            self.manager.pop()
+
+    def update(self):
+        if hasattr(self.page, 'update'):
+            self.page.update()
+
+    def draw(self):
+        self.page.draw()
+
+class ActivityScene(Scene):
+    """活动页面：小游戏按固定的 SIM_TICK_RATE 推进（它们原来每帧推进一次），离开时释放所有小游戏实例"""
+
+    def __init__(self, game):
+        super().__init__()
+        self.game = game
+        self.activity_page = game.activity_page
+
+    def enter(self):
+        self.activity_page.open()
+        # 确保菜单音乐在活动页面播放
+        self.game.in_game = False
+        self.game.play_menu_music()
+
+    def exit(self):
+        self.activity_page.close()
+        super().exit()
+
+    def release(self):
+        self.activity_page.release()
+
+    def is_animating(self):
+        return self.activity_page.is_animating()
+
+    def handle_event(self, event):
+        self.activity_page.handle_event(event)
+        if not self.activity_page.is_open:
+            self.manager.pop()
+
+    def frame(self, elapsed_ms):
+        super().frame(elapsed_ms)
+        # 弹球按实际经过的时间移动，每个绘制帧调用一次update（连连看用draw即可刷新）
+        pong = getattr(self.activity_page, 'pong_game', None)
+        if self.activity_page.page == "pong" and pong is not None:
+            pong.update()
+
+    def update(self):
+        self.activity_page.update()
+
+    def draw(self):
+        self.game.screen.fill((245, 245, 245))
+        self.activity_page.draw()
+
+class SettingsScene(Scene):
+    """设置面板，背后继续绘制主菜单的动画；背景音乐、音量、帮助页面压在它上面"""
+    tick_rate = None
+
+    def __init__(self, game):
+        super().__init__()
+        self.game = game
+
+    def enter(self):
+        # 确保菜单音乐在设置页面播放
+        self.game.play_menu_music()
+
+    def handle_event(self, event):
+        game = self.game
+        result = game.settings_menu.handle_event(event)
+        if result == "add_background":
+            game.add_background()
+        elif result == "background_music":
+            self.manager.push(MusicSelectionScene(game))
+        elif result == "volume_settings":
+            self.manager.push(VolumeSettingsScene(game))
+        elif result == "help":
+            self.manager.push(HelpScene(game, from_settings=True))
+        elif result == "back":
+            self.manager.pop()
+
+    def draw(self):
+        # 背后绘制主菜单以保留其动画，再画设置面板和上面的动画小蛇
+        self.game.menu.draw()
+        self.game.settings_menu.draw()
+        self.game.settings_menu.draw_animated_snake()
+
+class MusicSelectionScene(Scene):
+    """背景音乐选择，画在设置面板上面"""
+    tick_rate = None
+
+    def __init__(self, game):
+        super().__init__()
+        self.game = game
+
+    def enter(self):
+        self.game.play_menu_music()
+
+    def handle_event(self, event):
+        if self.game.music_selection_menu.handle_event(event) == "back":
+            self.manager.pop()
+
+    def draw(self):
+        self.game.settings_menu.draw()
+        self.game.music_selection_menu.draw()
+
+class VolumeSettingsScene(Scene):
+    """音量设置，画在设置面板上面"""
+    tick_rate = None
+
+    def __init__(self, game):
+        super().__init__()
+        self.game = game
+
+    def enter(self):
+        self.game.play_menu_music()
+        self.game.volume_settings_menu.open()
+
+    def handle_event(self, event):
+        if self.game.volume_settings_menu.handle_event(event) == "back":
+            self.manager.pop()
+
+    def draw(self):
+        self.game.settings_menu.draw()
+        self.game.volume_settings_menu.draw()
+
+class HelpScene(Scene):
+    """帮助页面；从设置进入时背后是设置面板，否则是主菜单"""
+    tick_rate = None
+
+    def __init__(self, game, from_settings=False):
+        super().__init__()
+        self.game = game
+        self.from_settings = from_settings
+
+    def enter(self):
+        # 确保菜单音乐在帮助页面播放
+        self.game.play_menu_music()
+
+    def is_animating(self):
+        # 帮助页面是静态的，没有输入时降低帧率（设置页面背景有动画，保持全帧率）
+        return self.from_settings or self.game.menu.is_animating() or self.game.help_menu.is_animating()
+
+    def handle_event(self, event):
+        if self.game.help_menu.handle_event(event) == "back":
+            self.manager.pop()
+
+    def draw(self):
+        if self.from_settings:
+            self.game.settings_menu.draw()
+        else:
+            self.game.menu.draw()
+        self.game.help_menu.draw()
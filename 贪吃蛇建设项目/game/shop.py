@@ -1,10 +1,14 @@
 import pygame
+import math
 import json
 import os
+from collections import OrderedDict
 from .constants import WINDOW_WIDTH, WINDOW_HEIGHT, WHITE, GOLD, BLACK, FONT_NAME, BUTTON_COLOR, BUTTON_HOVER_COLOR, BUTTON_WIDTH, BUTTON_HEIGHT, BUTTON_TEXT_COLOR
+from .fonts import get_font, render_text
 from .player import player_data
 from .ui_elements import CartoonButton, Button
 from .image_skins import image_skin_manager
+from .skin_thumbnails import get_skin_thumbnails
 
 def load_skins_from_file():
     """从JSON文件中加载皮肤数据"""
@@ -27,6 +31,110 @@ def load_skins_from_file():
 # 从外部文件加载皮肤数据
 SKINS = load_skins_from_file()
 
+# 颜色皮肤默认排序使用的形状顺序
+SHAPE_ORDER = [
+    "rectangle", "circle", "pentagram", "fan", "heart", "leaf", "water_drop", "music_note", "lightning_bolt", "crown", "arrow", "nebula"
+]
+
+class SkinCatalog:
+    """
+    商店皮肤目录（只构建一次）
+    预先计算分类、形状分桶、默认/价格排序和搜索索引，
+    筛选结果按 (分类, 搜索词, 形状, 是否显示已拥有, 排序方式, 拥有版本) 缓存；
+    搜索结果按搜索词缓存（最近使用的 MAX_CACHED_RESULTS 个），两者数量都有上限。
+    """
+    MAX_CACHED_RESULTS = 32
+
+    def __init__(self, color_skins_data, image_skins_data, is_image_skin, shape_order=SHAPE_ORDER):
+        # 合并所有皮肤数据，保持原有的插入顺序
+        self.all_skins = {}
+        self.all_skins.update(color_skins_data)
+        self.all_skins.update(image_skins_data)
+        self.image_skins = {}
+        self.color_skins = {}
+        for skin_id, skin_data in self.all_skins.items():
+            if is_image_skin(skin_id):
+                self.image_skins[skin_id] = skin_data
+            else:
+                self.color_skins[skin_id] = skin_data
+
+        # 形状分桶（仅颜色皮肤）
+        self.shape_buckets = {}
+        for skin_id, skin_data in self.color_skins.items():
+            self.shape_buckets.setdefault(skin_data.get("shape"), set()).add(skin_id)
+
+        # 预排序：默认排序（颜色按形状/价格/ID，图片按名称）和价格排序
+        shape_rank = {shape: i for i, shape in enumerate(shape_order)}
+        def color_sort_key(skin_id):
+            skin = self.color_skins[skin_id]
+            return (shape_rank.get(skin.get("shape", ""), len(shape_order)), skin.get("price", 0), skin_id)
+        self.orders = {
+            (False, False): sorted(self.color_skins, key=color_sort_key),
+            (True, False): sorted(self.image_skins, key=lambda k: self.image_skins[k].get("name", "")),
+            (False, True): sorted(self.color_skins, key=lambda k: self.color_skins[k].get("price", 0)),
+            (True, True): sorted(self.image_skins, key=lambda k: self.image_skins[k].get("price", 0)),
+        }
+
+        # 搜索索引：每个皮肤的小写名称+ID，以及字符到皮肤ID的倒排表
+        self.search_text = {}
+        self.char_index = {}
+        for skin_id, skin_data in self.all_skins.items():
+            text = skin_data.get("name", "").lower() + "\n" + skin_id.lower()
+            self.search_text[skin_id] = text
+            for ch in set(text):
+                self.char_index.setdefault(ch, set()).add(skin_id)
+        self._all_ids = frozenset(self.all_skins)
+        self._search_cache = OrderedDict()
+        self._filter_cache = {}
+
+    def search(self, term):
+        """返回名称或ID包含 term 的皮肤ID集合（term 为小写）"""
+        if not term:
+            return self._all_ids
+        result = self._search_cache.get(term)
+        if result is not None:
+            self._search_cache.move_to_end(term)
+            return result
+        # 输入时逐字追加：直接在上一次（前缀）的结果中继续筛选
+        candidates = self._all_ids if len(term) == 1 else self._search_cache.get(term[:-1])
+        if candidates is None:
+            for ch in set(term):
+                ids = self.char_index.get(ch, set())
+                candidates = ids if candidates is None else candidates & ids
+        result = frozenset(k for k in candidates if term in self.search_text[k])
+        self._search_cache[term] = result
+        if len(self._search_cache) > self.MAX_CACHED_RESULTS:
+            self._search_cache.popitem(last=False)
+        return result
+
+    def filter(self, is_image_mode, search_text, shape_filter, show_owned, sort_by_price, owned_skins, ownership_version):
+        """筛选和排序，返回 {skin_id: skin_data}（有序）；相同条件直接返回缓存结果"""
+        term = search_text.strip().lower()
+        if is_image_mode:
+            shape_filter = None
+        cache_key = (is_image_mode, term, shape_filter, show_owned, sort_by_price, ownership_version)
+        result = self._filter_cache.get(cache_key)
+        if result is not None:
+            return result
+
+        skins = self.image_skins if is_image_mode else self.color_skins
+        matches = self.search(term) if term else None
+        bucket = self.shape_buckets.get(shape_filter, set()) if shape_filter else None
+        result = {}
+        for skin_id in self.orders[(is_image_mode, sort_by_price)]:
+            if matches is not None and skin_id not in matches:
+                continue
+            if bucket is not None and skin_id not in bucket:
+                continue
+            if not show_owned and skin_id in owned_skins:
+                continue
+            result[skin_id] = skins[skin_id]
+
+        if len(self._filter_cache) >= self.MAX_CACHED_RESULTS:
+            self._filter_cache.clear()
+        self._filter_cache[cache_key] = result
+        return result
+
 class CategoryToggleButton:
     """美观的分类切换按钮"""
     def __init__(self, x, y, width, height):
@@ -34,7 +142,7 @@ class CategoryToggleButton:
         self.is_image_mode = False
         self.is_hovered = False
         self.animation_progress = 0.0
-        self.font = pygame.font.Font(FONT_NAME, 20)
+        self.font = get_font(FONT_NAME, 20)
         
         # 颜色定义
         self.bg_color = (30, 50, 80)
@@ -58,8 +166,8 @@ class CategoryToggleButton:
         pygame.draw.rect(surface, slider_color, slider_rect, border_radius=18)
         
         # 绘制文字
-        color_text = self.font.render("颜色", True, self.text_color if not self.is_image_mode else (100, 100, 100))
-        image_text = self.font.render("图片", True, self.text_color if self.is_image_mode else (100, 100, 100))
+        color_text = render_text(self.font, "颜色", True, self.text_color if not self.is_image_mode else (100, 100, 100))
+        image_text = render_text(self.font, "图片", True, self.text_color if self.is_image_mode else (100, 100, 100))
         
         # 文字位置
         color_x = self.rect.x + (self.rect.width // 2 - color_text.get_width()) // 2
@@ -94,8 +202,8 @@ class ConfirmationDialog:
         self.screen = screen
         self.skin_name = skin_name
         self.price = price
-        self.font = pygame.font.Font(FONT_NAME, 24)
-        self.title_font = pygame.font.Font(FONT_NAME, 32)
+        self.font = get_font(FONT_NAME, 24)
+        self.title_font = get_font(FONT_NAME, 32)
         
         # 对话框位置和大小
         self.width = 400
@@ -150,17 +258,17 @@ class ConfirmationDialog:
         
         if self.scale >= 1.0:  # 只有完全显示时才绘制内容
             # 标题
-            title_text = self.title_font.render("购买确认", True, WHITE)
+            title_text = render_text(self.title_font, "购买确认", True, WHITE)
             title_rect = title_text.get_rect(center=(self.x + self.width // 2, self.y + 50))
             self.screen.blit(title_text, title_rect)
             
             # 皮肤信息
-            info_text = self.font.render(f"皮肤: {self.skin_name}", True, WHITE)
+            info_text = render_text(self.font, f"皮肤: {self.skin_name}", True, WHITE)
             info_rect = info_text.get_rect(center=(self.x + self.width // 2, self.y + 100))
             self.screen.blit(info_text, info_rect)
             
             # 价格信息
-            price_text = self.font.render(f"价格: {self.price} 金币", True, (255, 213, 79))
+            price_text = render_text(self.font, f"价格: {self.price} 金币", True, (255, 213, 79))
             price_rect = price_text.get_rect(center=(self.x + self.width // 2, self.y + 130))
             self.screen.blit(price_text, price_rect)
             
@@ -184,7 +292,7 @@ class SearchBox:
         self.rect = pygame.Rect(x, y, width, height)
         self.text = ""
         self.active = False
-        self.font = pygame.font.Font(FONT_NAME, 18)  # 缩小字体
+        self.font = get_font(FONT_NAME, 18)  # 缩小字体
         self.cursor_visible = True
         self.cursor_timer = 0
         
@@ -211,11 +319,11 @@ class SearchBox:
         
         # 占位符文本
         if not self.text and not self.active:
-            placeholder = self.font.render("搜索皮肤...", True, (150, 150, 150))
+            placeholder = render_text(self.font, "搜索皮肤...", True, (150, 150, 150))
             surface.blit(placeholder, (self.rect.x + 10, self.rect.y + 10))
         else:
             # 实际文本
-            text_surface = self.font.render(self.text, True, WHITE)
+            text_surface = render_text(self.font, self.text, True, WHITE)
             surface.blit(text_surface, (self.rect.x + 10, self.rect.y + 10))
             
             # 光标
@@ -225,13 +333,15 @@ class SearchBox:
                 pygame.draw.line(surface, WHITE, (cursor_x, cursor_y), (cursor_x, cursor_y + 24), 2)
 
 class ShopMenu:
+    MAX_CACHED_CARDS = 48  # 卡片整图缓存上限（一屏约12张，含悬停状态）
+
     def __init__(self, screen, game_controller):
         self.screen = screen
         self.game_controller = game_controller
-        self.font = pygame.font.Font(FONT_NAME, 40)
-        self.small_font = pygame.font.Font(FONT_NAME, 20)  # 稍微减小
-        self.tiny_font = pygame.font.Font(FONT_NAME, 16)   # 稍微减小
-        self.label_font = pygame.font.Font(FONT_NAME, 14)  # 新增标签字体
+        self.font = get_font(FONT_NAME, 40)
+        self.small_font = get_font(FONT_NAME, 20)  # 稍微减小
+        self.tiny_font = get_font(FONT_NAME, 16)   # 稍微减小
+        self.label_font = get_font(FONT_NAME, 14)  # 新增标签字体
         self.running = True
         self.buttons = {} # skin_id -> rect
         self.scroll_offset = 0 # For scrolling
@@ -266,9 +376,7 @@ class ShopMenu:
             "nebula": "星云"
         }
         from .ui_elements import Dropdown
-        self.shape_order = [
-            "rectangle", "circle", "pentagram", "fan", "heart", "leaf", "water_drop", "music_note", "lightning_bolt", "crown", "arrow", "nebula"
-        ]
+        self.shape_order = SHAPE_ORDER
         shape_options = ["不筛选"] + [self.shape_map[s] for s in self.shape_order]
         self.shape_dropdown = Dropdown(490, 120, 120, 40, shape_options, selected=None)
         
@@ -290,26 +398,24 @@ class ShopMenu:
             icon_type="back"
         )
         
-        # 合并所有皮肤数据
-        self.all_skins = {}
-        self.all_skins.update(SKINS)
-        self.all_skins.update(image_skin_manager.get_all_image_skins())
-        # 分离图片皮肤和颜色皮肤
-        self.image_skins = {}
-        self.color_skins = {}
-        for skin_id, skin_data in self.all_skins.items():
-            if image_skin_manager.is_image_skin(skin_id):
-                self.image_skins[skin_id] = skin_data
-            else:
-                self.color_skins[skin_id] = skin_data
+        # 皮肤目录（合并颜色皮肤和图片皮肤，预建索引）
+        self.catalog = SkinCatalog(SKINS, image_skin_manager.get_all_image_skins(), image_skin_manager.is_image_skin)
+        self.all_skins = self.catalog.all_skins
+        self.image_skins = self.catalog.image_skins
+        self.color_skins = self.catalog.color_skins
 
         # 背景缓存表面（避免每帧重建）
         self._bg_surface = None
         # 价格图标小表面缓存
         self._coin_icon_surface = None
-        # 预览图片缓存（仅商店用，避免反复从磁盘加载）
-        self._preview_image_cache = {}
-        
+        # 皮肤缩略图图集（所有预览一次性生成并缓存到磁盘）
+        self.thumbnails = get_skin_thumbnails()
+        # 商品卡片整图缓存：(skin_id, 是否已拥有, 是否悬停) -> Surface，按最近使用淘汰
+        self._card_cache = {}
+        # 筛选结果转成的列表（筛选结果对象不变时复用）
+        self._skin_list = []
+        self._skin_list_source = None
+
         # 确认对话框
         self.confirmation_dialog = None
         self.pending_purchase = None  # (skin_id, skin_data)
@@ -320,195 +426,154 @@ class ShopMenu:
         self.card_height = 160
         self.card_margin = 20
 
-    def run(self):
+    def open(self):
+        """进入商店（由商店场景调用）"""
         self.running = True
         self.buttons = {}
-        clock = pygame.time.Clock()
-        while self.running:
-            self.handle_events()
-            self.update()
-            self.draw()
-            clock.tick(60)  # 60 FPS
-            
+
+    def release(self):
+        """离开商店时释放缓存的背景和缩放后的缩略图"""
+        self._bg_surface = None
+        self.thumbnails.release_scaled()
+
     def update(self):
         """更新动画和状态"""
         self.search_box.update()
         if self.confirmation_dialog:
             self.confirmation_dialog.update()
 
-    def handle_events(self):
-        for event in pygame.event.get():
-            # 如果有确认对话框，优先处理对话框事件
-            if self.confirmation_dialog:
-                result = self.confirmation_dialog.handle_event(event)
-                if result == "confirm" and self.pending_purchase:
-                    skin_id, skin_data = self.pending_purchase
+    def handle_event(self, event):
+        """处理一个事件（由商店场景调用）"""
+        # 如果有确认对话框，优先处理对话框事件
+        if self.confirmation_dialog:
+            result = self.confirmation_dialog.handle_event(event)
+            if result == "confirm" and self.pending_purchase:
+                skin_id, skin_data = self.pending_purchase
+                # 扣币与入库在同一批次中完成，避免只写入一半
+                with player_data.batch():
                     if player_data.spend_coins(skin_data['price']):
                         player_data.add_purchased_skin(skin_id)
-                        # TODO: 添加购买成功动画效果
-                    self.confirmation_dialog = None
-                    self.pending_purchase = None
-                elif result == "cancel":
-                    self.confirmation_dialog = None
-                    self.pending_purchase = None
-                continue
-            
-            # 处理搜索框事件
-            self.search_box.handle_event(event)
+                    # TODO: 添加购买成功动画效果
+                self.confirmation_dialog = None
+                self.pending_purchase = None
+            elif result == "cancel":
+                self.confirmation_dialog = None
+                self.pending_purchase = None
+            return
+        
+        # 处理搜索框事件
+        self.search_box.handle_event(event)
+        
+        # 处理排序和筛选按钮事件
+        if self.price_sort_button.handle_event(event):
+            self.sort_by_price = not self.sort_by_price
+            self.sort_text = "价格" if self.sort_by_price else "默认"
+            self.price_sort_button.text = self.sort_text
             
-            # 处理排序和筛选按钮事件
-            if self.price_sort_button.handle_event(event):
-                self.sort_by_price = not self.sort_by_price
-                self.sort_text = "价格" if self.sort_by_price else "默认"
-                self.price_sort_button.text = self.sort_text
-                
-            if self.owned_toggle_button.handle_event(event):
-                self.show_owned = not self.show_owned
-                self.owned_text = "显示" if self.show_owned else "隐藏"
-                self.owned_toggle_button.text = self.owned_text
-                self.scroll_offset = 0  # 重置滚动位置
+        if self.owned_toggle_button.handle_event(event):
+            self.show_owned = not self.show_owned
+            self.owned_text = "显示" if self.show_owned else "隐藏"
+            self.owned_toggle_button.text = self.owned_text
+            self.scroll_offset = 0  # 重置滚动位置
+        
+        # 处理形状筛选下拉框事件（仅颜色皮肤模式）
+        if not self.category_button.is_image_mode:
+            self.shape_dropdown.handle_event(event)
             
-            # 处理形状筛选下拉框事件（仅颜色皮肤模式）
-            if not self.category_button.is_image_mode:
-                self.shape_dropdown.handle_event(event)
-                
-            if event.type == pygame.QUIT:
+        if event.type == pygame.QUIT:
+            self.running = False
+            self.game_controller.running = False
+        if event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_ESCAPE:
                 self.running = False
-                self.game_controller.running = False
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    self.running = False
+        
+        # 处理分类按钮点击
+        if self.category_button.handle_event(event):
+            self.scroll_offset = 0  # 重置滚动位置
+            self.shape_filter = None  # 切换分类时重置筛选
+            self.shape_dropdown.selected = None  # 切换分类时重置下拉框选中项
             
-            # 处理分类按钮点击
-            if self.category_button.handle_event(event):
-                self.scroll_offset = 0  # 重置滚动位置
-                self.shape_filter = None  # 切换分类时重置筛选
-                self.shape_dropdown.selected = None  # 切换分类时重置下拉框选中项
-                
-            # 处理形状筛选下拉框选择（仅颜色皮肤模式）
-            if not self.category_button.is_image_mode:
-                if self.shape_dropdown.selected == "不筛选" or not self.shape_dropdown.selected:
+        # 处理形状筛选下拉框选择（仅颜色皮肤模式）
+        if not self.category_button.is_image_mode:
+            if self.shape_dropdown.selected == "不筛选" or not self.shape_dropdown.selected:
+                self.shape_filter = None
+            else:
+                try:
+                    idx = [self.shape_map[s] for s in self.shape_order].index(self.shape_dropdown.selected)
+                    self.shape_filter = self.shape_order[idx]
+                except ValueError:
                     self.shape_filter = None
-                else:
-                    try:
-                        idx = [self.shape_map[s] for s in self.shape_order].index(self.shape_dropdown.selected)
-                        self.shape_filter = self.shape_order[idx]
-                    except ValueError:
-                        self.shape_filter = None
-            
-            if self.back_button.handle_event(event):
-                self.running = False
-                return
-            
-            # Handle mouse wheel scrolling
-            if event.type == pygame.MOUSEWHEEL:
-                self.scroll_offset += event.y * 30  # 增加滚动速度
-
-            # Handle mouse button down
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                if event.button == 1:  # Left click
-                    # 检查是否点击了购买按钮
-                    for skin_id, rect in self.buttons.items():
-                        if rect.collidepoint(event.pos):
-                            # 根据当前显示的分类获取皮肤信息
-                            current_skins = self._get_filtered_skins()
-                            if skin_id in current_skins:
-                                skin_info = current_skins[skin_id]
-                                purchased_skins = player_data.get_purchased_skins()
-                                if skin_id not in purchased_skins:
-                                    # 显示购买确认对话框
-                                    self.confirmation_dialog = ConfirmationDialog(
-                                        self.screen, skin_info['name'], skin_info['price']
-                                    )
-                                    self.pending_purchase = (skin_id, skin_info)
-                            return  # 如果点击了按钮，不开始拖拽
-                    
-                    # 检查是否点击了滚动条
-                    y_start = 210  # 与_draw_shop_items中的y_start保持一致
-                    list_height = WINDOW_HEIGHT - y_start - 80
-                    scrollbar_rect = pygame.Rect(WINDOW_WIDTH - 25, y_start, 15, list_height)
-                    if scrollbar_rect.collidepoint(event.pos):
-                        # 计算点击位置对应的滚动偏移
-                        click_ratio = (event.pos[1] - y_start) / list_height
-                        # 根据当前分类筛选皮肤
+        
+        if self.back_button.handle_event(event):
+            self.running = False
+            return
+        
+        # Handle mouse wheel scrolling
+        if event.type == pygame.MOUSEWHEEL:
+            self.scroll_offset += event.y * 30  # 增加滚动速度
+
+        # Handle mouse button down
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            if event.button == 1:  # Left click
+                # 检查是否点击了购买按钮
+                for skin_id, rect in self.buttons.items():
+                    if rect.collidepoint(event.pos):
+                        # 根据当前显示的分类获取皮肤信息
                         current_skins = self._get_filtered_skins()
-                        grid_rows = (len(current_skins) + self.grid_cols - 1) // self.grid_cols
-                        content_height = grid_rows * (self.card_height + self.card_margin)
-                        max_scroll = content_height - list_height
-                        if max_scroll > 0:
-                            self.scroll_offset = -click_ratio * max_scroll
-                        return  # 如果点击了滚动条，不开始拖拽
-                    
-                    # 如果没有点击按钮或滚动条，开始拖拽
-                    self.is_dragging = True
-                    self.drag_start_y = event.pos[1]
-                    self.drag_start_offset = self.scroll_offset
-
-            # Handle mouse button up
-            if event.type == pygame.MOUSEBUTTONUP:
-                if event.button == 1:  # Left click release
-                    self.is_dragging = False
-
-            # Handle mouse motion (dragging)
-            if event.type == pygame.MOUSEMOTION:
-                if self.is_dragging:
-                    # 计算拖拽距离并更新滚动偏移
-                    drag_distance = event.pos[1] - self.drag_start_y
-                    self.scroll_offset = self.drag_start_offset + drag_distance
-    
+                        if skin_id in current_skins:
+                            skin_info = current_skins[skin_id]
+                            if not player_data.owns_skin(skin_id):
+                                # 显示购买确认对话框
+                                self.confirmation_dialog = ConfirmationDialog(
+                                    self.screen, skin_info['name'], skin_info['price']
+                                )
+                                self.pending_purchase = (skin_id, skin_info)
+                        return  # 如果点击了按钮，不开始拖拽
+                
+                # 检查是否点击了滚动条
+                y_start = 210  # 与_draw_shop_items中的y_start保持一致
+                list_height = WINDOW_HEIGHT - y_start - 80
+                scrollbar_rect = pygame.Rect(WINDOW_WIDTH - 25, y_start, 15, list_height)
+                if scrollbar_rect.collidepoint(event.pos):
+                    # 计算点击位置对应的滚动偏移
+                    click_ratio = (event.pos[1] - y_start) / list_height
+                    # 根据当前分类筛选皮肤
+                    current_skins = self._get_filtered_skins()
+                    grid_rows = (len(current_skins) + self.grid_cols - 1) // self.grid_cols
+                    content_height = grid_rows * (self.card_height + self.card_margin)
+                    max_scroll = content_height - list_height
+                    if max_scroll > 0:
+                        self.scroll_offset = -click_ratio * max_scroll
+                    return  # 如果点击了滚动条，不开始拖拽
+                
+                # 如果没有点击按钮或滚动条，开始拖拽
+                self.is_dragging = True
+                self.drag_start_y = event.pos[1]
+                self.drag_start_offset = self.scroll_offset
+
+        # Handle mouse button up
+        if event.type == pygame.MOUSEBUTTONUP:
+            if event.button == 1:  # Left click release
+                self.is_dragging = False
+
+        # Handle mouse motion (dragging)
+        if event.type == pygame.MOUSEMOTION:
+            if self.is_dragging:
+                # 计算拖拽距离并更新滚动偏移
+                drag_distance = event.pos[1] - self.drag_start_y
+                self.scroll_offset = self.drag_start_offset + drag_distance
+
     def _get_filtered_skins(self):
-        """获取筛选和排序后的皮肤列表"""
-        # 根据当前分类获取皮肤
-        current_skins = self.image_skins if self.category_button.is_image_mode else self.color_skins
-        
-        # 搜索筛选
-        if self.search_box.text.strip():
-            search_term = self.search_box.text.strip().lower()
-            filtered_skins = {}
-            for skin_id, skin_data in current_skins.items():
-                if (search_term in skin_data.get('name', '').lower() or 
-                    search_term in skin_id.lower()):
-                    filtered_skins[skin_id] = skin_data
-            current_skins = filtered_skins
-        
-        # 形状筛选（仅颜色皮肤）
-        if not self.category_button.is_image_mode and self.shape_filter:
-            filtered_skins = {}
-            for skin_id, skin_data in current_skins.items():
-                if skin_data.get('shape') == self.shape_filter:
-                    filtered_skins[skin_id] = skin_data
-            current_skins = filtered_skins
-        
-        # 已拥有筛选
-        purchased_skins = player_data.get_purchased_skins()
-        if not self.show_owned:
-            # 隐藏已拥有的皮肤
-            filtered_skins = {}
-            for skin_id, skin_data in current_skins.items():
-                if skin_id not in purchased_skins:
-                    filtered_skins[skin_id] = skin_data
-            current_skins = filtered_skins
-        
-        # 排序
-        if self.sort_by_price:
-            # 按价格排序
-            sorted_items = sorted(current_skins.items(), key=lambda x: x[1].get('price', 0))
-        else:
-            # 默认排序（颜色皮肤按形状排序）
-            if self.category_button.is_image_mode:
-                sorted_items = sorted(current_skins.items(), key=lambda x: x[1].get('name', ''))
-            else:
-                def skin_sort_key(item):
-                    skin = item[1]
-                    shape = skin.get("shape", "")
-                    try:
-                        idx = self.shape_order.index(shape)
-                    except ValueError:
-                        idx = len(self.shape_order)
-                    return (idx, skin.get("price", 0), item[0])
-                sorted_items = sorted(current_skins.items(), key=skin_sort_key)
-        
-        return dict(sorted_items)
+        """获取筛选和排序后的皮肤列表（由皮肤目录缓存，条件不变时不重复计算）"""
+        return self.catalog.filter(
+            self.category_button.is_image_mode,
+            self.search_box.text,
+            self.shape_filter,
+            self.show_owned,
+            self.sort_by_price,
+            player_data.get_owned_skins(),
+            player_data.ownership_version,
+        )
 
     def draw(self):
         # 商店专属紫粉橙渐变背景（缓存）
@@ -538,17 +603,17 @@ class ShopMenu:
         self.screen.blit(self._bg_surface, (0,0))
 
         # --- 卡通大标题 ---
-        font = pygame.font.Font(FONT_NAME, 48)  # 稍微减小字体
+        font = get_font(FONT_NAME, 48)  # 稍微减小字体
         text = "商店"
         for dx, dy in [(-3,3),(3,3),(-3,-3),(3,-3),(0,4)]:
-            shadow = font.render(text, True, (0,0,0))
+            shadow = render_text(font, text, True, (0,0,0))
             shadow_rect = shadow.get_rect(center=(WINDOW_WIDTH//2+dx, 50+dy))
             self.screen.blit(shadow, shadow_rect)
         for dx, dy, color in [(-2,0,(66,165,245)),(2,0,(255,213,79)),(0,-2,(120,200,120)),(0,2,(255,255,255))]:
-            edge = font.render(text, True, color)
+            edge = render_text(font, text, True, color)
             edge_rect = edge.get_rect(center=(WINDOW_WIDTH//2+dx, 50+dy))
             self.screen.blit(edge, edge_rect)
-        title = font.render(text, True, (66,165,245))
+        title = render_text(font, text, True, (66,165,245))
         title_rect = title.get_rect(center=(WINDOW_WIDTH//2, 50))
         self.screen.blit(title, title_rect)
 
@@ -563,7 +628,7 @@ class ShopMenu:
             self.shape_dropdown.draw(self.screen)
             
         # 在右上角显示金币，位置调整到更高的位置
-        coin_text = self.small_font.render(f"金币: {player_data.get_coins()}", True, GOLD)
+        coin_text = render_text(self.small_font, f"金币: {player_data.get_coins()}", True, GOLD)
         self.screen.blit(coin_text, (WINDOW_WIDTH - 150, 70))
 
         # 绘制排序和筛选按钮（第二行）
@@ -571,19 +636,19 @@ class ShopMenu:
         self.owned_toggle_button.draw(self.screen)
         
         # 注释掉状态标签，让界面更简洁
-        # sort_label = self.label_font.render("排序:", True, (180, 180, 180))
+        # sort_label = render_text(self.label_font, "排序:", True, (180, 180, 180))
         # self.screen.blit(sort_label, (50, 164))
         
-        # owned_label = self.label_font.render("已拥有:", True, (180, 180, 180))
+        # owned_label = render_text(self.label_font, "已拥有:", True, (180, 180, 180))
         # self.screen.blit(owned_label, (140, 164))
         
         # 注释掉商品统计信息，让界面更简洁
         # current_skins = self._get_filtered_skins()
         # if len(current_skins) > 0:
-        #     count_text = self.label_font.render(f"共 {len(current_skins)} 件商品", True, (160, 160, 160))
+        #     count_text = render_text(self.label_font, f"共 {len(current_skins)} 件商品", True, (160, 160, 160))
         #     self.screen.blit(count_text, (240, 185))
         # else:
-        #     count_text = self.label_font.render("暂无匹配商品", True, (200, 100, 100))
+        #     count_text = render_text(self.label_font, "暂无匹配商品", True, (200, 100, 100))
         #     self.screen.blit(count_text, (240, 185))
 
         self._draw_shop_items()  # 绘制商品项目
@@ -598,8 +663,6 @@ class ShopMenu:
         # 绘制确认对话框（在最顶层）
         if self.confirmation_dialog:
             self.confirmation_dialog.draw()
-            
-        pygame.display.flip()
         
     def _draw_dropdown_options(self):
         """绘制下拉框展开选项"""
@@ -611,25 +674,30 @@ class ShopMenu:
             opt_rect = pygame.Rect(self.shape_dropdown.rect.x, self.shape_dropdown.rect.bottom+i*opt_h, self.shape_dropdown.rect.width, opt_h)
             bg = self.shape_dropdown.hover_color if self.shape_dropdown.hovered_idx == self.shape_dropdown.scroll+i else self.shape_dropdown.color
             pygame.draw.rect(self.screen, bg, opt_rect, border_radius=8)
-            txt = self.shape_dropdown.font.render(str(opt), True, BUTTON_TEXT_COLOR)
+            txt = render_text(self.shape_dropdown.font, str(opt), True, BUTTON_TEXT_COLOR)
             self.screen.blit(txt, (opt_rect.x+12, opt_rect.y+8))
             
     def _draw_shop_items(self):
-        """绘制商品项目的网格布局"""
+        """绘制商品项目的网格布局（只计算和绘制可见行，卡片整图缓存）"""
         # --- 网格布局逻辑 ---
         y_start = 210  # 调整起始位置，给按钮留出足够空间
         list_height = WINDOW_HEIGHT - y_start - 80  # 列表可见区域
         
         # 获取筛选后的皮肤
         current_skins = self._get_filtered_skins()
+        if current_skins is not self._skin_list_source:
+            self._skin_list = list(current_skins.items())
+            self._skin_list_source = current_skins
+        skin_list = self._skin_list
         
         # 计算网格参数
         grid_start_x = 50
         grid_width = WINDOW_WIDTH - 100 - 30  # 留出滚动条空间
         actual_card_width = (grid_width - (self.grid_cols - 1) * self.card_margin) // self.grid_cols
+        row_height = self.card_height + self.card_margin
         
-        grid_rows = (len(current_skins) + self.grid_cols - 1) // self.grid_cols
-        content_height = grid_rows * (self.card_height + self.card_margin)
+        grid_rows = (len(skin_list) + self.grid_cols - 1) // self.grid_cols
+        content_height = grid_rows * row_height
         
         # 限制滚动偏移
         if content_height > list_height:
@@ -639,79 +707,48 @@ class ShopMenu:
             self.scroll_offset = 0
 
         # 如果没有商品，简单显示提示信息
-        if not current_skins:
-            empty_text = self.small_font.render("暂无商品", True, (180, 180, 180))
+        if not skin_list:
+            empty_text = render_text(self.small_font, "暂无商品", True, (180, 180, 180))
             empty_rect = empty_text.get_rect(center=(WINDOW_WIDTH//2, y_start + 100))
             self.screen.blit(empty_text, empty_rect)
             return
 
         # --- 绘制商品卡片 ---
         self.buttons = {}  # 重置按钮
-        purchased_skins = player_data.get_purchased_skins()
+        owned_skins = player_data.get_owned_skins()
+        
+        # 根据滚动偏移直接算出可见行范围，不再遍历全部商品
+        first_row = max(0, math.ceil((-self.scroll_offset - self.card_height) / row_height))
+        last_row = min(grid_rows - 1, math.floor((list_height - self.scroll_offset) / row_height))
+        
+        # 悬停检测（有确认对话框时不高亮）
+        mouse_pos = None
+        if not self.confirmation_dialog:
+            mouse_pos = pygame.mouse.get_pos()
+            if not (y_start <= mouse_pos[1] < y_start + list_height):
+                mouse_pos = None
         
         # 裁剪区域，只绘制可见的卡片
         clip_rect = pygame.Rect(0, y_start, WINDOW_WIDTH, list_height)
         self.screen.set_clip(clip_rect)
         
-        skin_list = list(current_skins.items())
-        for i, (skin_id, skin_data) in enumerate(skin_list):
+        for i in range(first_row * self.grid_cols, min(len(skin_list), (last_row + 1) * self.grid_cols)):
+            skin_id, skin_data = skin_list[i]
             row = i // self.grid_cols
             col = i % self.grid_cols
             
             card_x = grid_start_x + col * (actual_card_width + self.card_margin)
-            card_y = y_start + self.scroll_offset + row * (self.card_height + self.card_margin)
-            
-            # 只绘制可见的卡片
-            if card_y + self.card_height < y_start or card_y > y_start + list_height:
-                continue
-                
-            # 卡片背景
+            card_y = y_start + self.scroll_offset + row * row_height
             card_rect = pygame.Rect(card_x, card_y, actual_card_width, self.card_height)
             
-            # 阴影效果
-            shadow_rect = card_rect.move(4, 4)
-            pygame.draw.rect(self.screen, (0, 0, 0, 100), shadow_rect, border_radius=16)
-            
-            # 卡片主体
-            is_owned = skin_id in purchased_skins
-            card_color = (100, 150, 100) if is_owned else (60, 80, 120)
-            pygame.draw.rect(self.screen, card_color, card_rect, border_radius=16)
-            pygame.draw.rect(self.screen, (120, 160, 200), card_rect, 2, border_radius=16)
-            
-            # 皮肤预览
-            self._draw_skin_preview(skin_id, skin_data, card_x, card_y, actual_card_width)
-            
-            # 皮肤名称（使用小字体，颜色更柔和）
-            name_text = self.small_font.render(skin_data['name'], True, (240, 240, 240))
-            name_rect = name_text.get_rect(center=(card_x + actual_card_width // 2, card_y + 95))
-            self.screen.blit(name_text, name_rect)
+            is_owned = skin_id in owned_skins
+            is_hovered = mouse_pos is not None and card_rect.collidepoint(mouse_pos)
+            card_surface = self._get_card_surface(skin_id, skin_data, is_owned, is_hovered, actual_card_width)
+            self.screen.blit(card_surface, card_rect.topleft)
             
-            # 价格和按钮
-            if is_owned:
-                # 已拥有标识（使用更鲜明的绿色）
-                owned_text = self.small_font.render("✓ 已拥有", True, (100, 255, 150))
-                owned_rect = owned_text.get_rect(center=(card_x + actual_card_width // 2, card_y + 125))
-                self.screen.blit(owned_text, owned_rect)
-            else:
-                # 价格显示（使用更鲜明的金色）
-                price_text = self.small_font.render(f"{skin_data['price']} 金币", True, (255, 223, 100))
-                price_rect = price_text.get_rect(center=(card_x + actual_card_width // 2, card_y + 115))
-                self.screen.blit(price_text, price_rect)
-                
-                # 购买按钮
-                button_width = 60
-                button_height = 25
-                button_x = card_x + (actual_card_width - button_width) // 2
-                button_y = card_y + 130
-                
-                buy_btn = CartoonButton(
-                    button_x, button_y, button_width, button_height,
-                    "购买",
-                    color=(46, 204, 113),
-                    font_size=16
-                )
-                buy_btn.draw(self.screen)
-                self.buttons[skin_id] = buy_btn.rect
+            # 购买按钮点击区域（屏幕坐标）
+            if not is_owned:
+                self.buttons[skin_id] = self._buy_button_rect(actual_card_width).move(card_rect.topleft)
         
         # 取消裁剪
         self.screen.set_clip(None)
@@ -719,68 +756,91 @@ class ShopMenu:
         # --- 绘制滚动条 ---
         if content_height > list_height:
             self._draw_scrollbar(y_start, list_height, content_height)
+
+    def _buy_button_rect(self, card_width):
+        """购买按钮在卡片内的位置"""
+        button_width = 60
+        button_height = 25
+        return pygame.Rect((card_width - button_width) // 2, 130, button_width, button_height)
+
+    def _get_card_surface(self, skin_id, skin_data, is_owned, is_hovered, card_width):
+        """获取合成好的商品卡片（背景、预览、文字、按钮），未命中时绘制一次并缓存"""
+        key = (skin_id, is_owned, is_hovered)
+        card = self._card_cache.pop(key, None)
+        if card is None:
+            card = self._render_card(skin_id, skin_data, is_owned, is_hovered, card_width)
+            if len(self._card_cache) >= self.MAX_CACHED_CARDS:
+                # 淘汰最久未使用的卡片
+                del self._card_cache[next(iter(self._card_cache))]
+        self._card_cache[key] = card
+        return card
+
+    def _render_card(self, skin_id, skin_data, is_owned, is_hovered, card_width):
+        """把一张商品卡片完整绘制到独立的透明表面上（坐标相对卡片左上角）"""
+        card = pygame.Surface((card_width + 4, self.card_height + 4), pygame.SRCALPHA)
+        card_rect = pygame.Rect(0, 0, card_width, self.card_height)
+        
+        # 阴影效果
+        shadow_rect = card_rect.move(4, 4)
+        pygame.draw.rect(card, (0, 0, 0), shadow_rect, border_radius=16)
+        
+        # 卡片主体
+        card_color = (100, 150, 100) if is_owned else (60, 80, 120)
+        pygame.draw.rect(card, card_color, card_rect, border_radius=16)
+        if is_hovered:
+            pygame.draw.rect(card, (255, 223, 100), card_rect, 3, border_radius=16)
+        else:
+            pygame.draw.rect(card, (120, 160, 200), card_rect, 2, border_radius=16)
+        
+        # 皮肤预览
+        self._draw_skin_preview(card, skin_id, skin_data, 0, 0, card_width)
+        
+        # 皮肤名称（使用小字体，颜色更柔和）
+        name_text = render_text(self.small_font, skin_data['name'], True, (240, 240, 240))
+        name_rect = name_text.get_rect(center=(card_width // 2, 95))
+        card.blit(name_text, name_rect)
+        
+        # 价格和按钮
+        if is_owned:
+            # 已拥有标识（使用更鲜明的绿色）
+            owned_text = render_text(self.small_font, "✓ 已拥有", True, (100, 255, 150))
+            owned_rect = owned_text.get_rect(center=(card_width // 2, 125))
+            card.blit(owned_text, owned_rect)
+        else:
+            # 价格显示（使用更鲜明的金色）
+            price_text = render_text(self.small_font, f"{skin_data['price']} 金币", True, (255, 223, 100))
+            price_rect = price_text.get_rect(center=(card_width // 2, 115))
+            card.blit(price_text, price_rect)
+            
+            # 购买按钮
+            button_rect = self._buy_button_rect(card_width)
+            buy_btn = CartoonButton(
+                button_rect.x, button_rect.y, button_rect.width, button_rect.height,
+                "购买",
+                color=(46, 204, 113),
+                font_size=16
+            )
+            buy_btn.is_hovered = is_hovered
+            buy_btn.draw(card)
+        return card
             
-    def _draw_skin_preview(self, skin_id, skin_data, card_x, card_y, card_width):
-        """绘制皮肤预览"""
+    def _draw_skin_preview(self, surface, skin_id, skin_data, card_x, card_y, card_width):
+        """绘制皮肤预览（来自缩略图图集）"""
         preview_size = 64
         preview_x = card_x + (card_width - preview_size) // 2
         preview_y = card_y + 15
         preview_rect = pygame.Rect(preview_x, preview_y, preview_size, preview_size)
         
-        if self.category_button.is_image_mode and ('head_image' in skin_data or 'image' in skin_data):
-            try:
-                img_key = (skin_id, preview_size, preview_size)
-                if img_key not in self._preview_image_cache:
-                    from .constants import get_resource_path
-                    # 优先使用head_image，如果没有则使用image
-                    img_path = skin_data.get('head_image') or skin_data.get('image', '')
-                    if not img_path:
-                        raise Exception("未找到图片路径")
-                        
-                    if not os.path.isabs(img_path):
-                        # 尝试不同的路径解析方式
-                        resolved = None
-                        # 先尝试snake_images目录
-                        snake_images_path = os.path.join(get_resource_path('snake_images'), img_path)
-                        if os.path.exists(snake_images_path):
-                            resolved = snake_images_path
-                        else:
-                            # 再尝试相对于项目根目录
-                            root_path = get_resource_path(img_path)
-                            if os.path.exists(root_path):
-                                resolved = root_path
-                        
-                        if not resolved:
-                            raise Exception(f"图片文件不存在: {img_path}")
-                    else:
-                        resolved = img_path
-                        
-                    image = pygame.image.load(resolved).convert_alpha()
-                    image = pygame.transform.scale(image, (preview_size, preview_size))
-                    self._preview_image_cache[img_key] = image
-                self.screen.blit(self._preview_image_cache[img_key], preview_rect)
-            except Exception as e:
-                # 如果图片加载失败，显示默认占位符并添加调试信息
-                print(f"图片加载失败 {skin_id}: {e}")
-                pygame.draw.rect(self.screen, (120,120,120), preview_rect, border_radius=8)
-                # 在占位符中显示“图”字
-                text_surface = self.tiny_font.render("图", True, (255, 255, 255))
-                text_rect = text_surface.get_rect(center=preview_rect.center)
-                self.screen.blit(text_surface, text_rect)
-        elif not self.category_button.is_image_mode and 'colors' in skin_data:
-            color_list = skin_data['colors']
-            circle_size = min(20, preview_size // len(color_list))
-            for j, c in enumerate(color_list[:4]):  # 最多显示4个颜色
-                circle_x = preview_x + j * (circle_size + 4)
-                circle_y = preview_y + preview_size // 2
-                pygame.draw.circle(self.screen, tuple(c), (circle_x + circle_size//2, circle_y), circle_size//2)
-        else:
-            # 默认占位符
-            pygame.draw.rect(self.screen, (120,120,120), preview_rect, border_radius=8)
-            # 显示默认标识
-            text_surface = self.tiny_font.render("?", True, (255, 255, 255))
-            text_rect = text_surface.get_rect(center=preview_rect.center)
-            self.screen.blit(text_surface, text_rect)
+        thumb = self.thumbnails.get(skin_id, (preview_size, preview_size))
+        if thumb is not None:
+            surface.blit(thumb, preview_rect)
+            return
+        # 图集中没有该皮肤（图片缺失或没有颜色数据），显示占位符
+        pygame.draw.rect(surface, (120,120,120), preview_rect, border_radius=8)
+        placeholder = "图" if self.category_button.is_image_mode else "?"
+        text_surface = render_text(self.tiny_font, placeholder, True, (255, 255, 255))
+        text_rect = text_surface.get_rect(center=preview_rect.center)
+        surface.blit(text_surface, text_rect)
             
     def _draw_scrollbar(self, y_start, list_height, content_height):
         """绘制滚动条"""
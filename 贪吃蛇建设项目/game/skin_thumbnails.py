@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+import pygame
+import os
+import json
+import math
+import hashlib
+from .constants import get_resource_path
+from .player import PLAYER_DATA_PATH, write_file_atomic
+
+# 缩略图图集缓存目录（与存档放在同一目录，打包后也可写）
+THUMBNAIL_CACHE_DIR = os.path.join(os.path.dirname(PLAYER_DATA_PATH), 'thumbnail_cache')
+# 绘制逻辑变化时递增，使旧的磁盘缓存失效
+ATLAS_VERSION = 1
+
+class SkinThumbnailAtlas:
+    """
+    商店/背包共用的皮肤缩略图图集
+    所有皮肤预览只绘制一次，拼成一张大图并附带索引，按皮肤数据内容哈希缓存到磁盘；
+    之后打开商店或背包只需加载一张图片。
+    """
+    TILE_SIZE = 128
+    COLOR_KEY = (1, 2, 3)  # 绘制颜色皮肤时的背景色键
+
+    def __init__(self, color_skins, image_skins, cache_dir=THUMBNAIL_CACHE_DIR, tile_size=TILE_SIZE):
+        self.color_skins = color_skins
+        self.image_skins = image_skins
+        self.cache_dir = cache_dir
+        self.tile_size = tile_size
+        self.content_key = self._content_key()
+        self.sheet = None
+        self.index = {}  # skin_id -> (x, y)
+        self._scaled_cache = {}  # (skin_id, size) -> Surface
+        if not self._load_from_disk():
+            self._build()
+            self._save_to_disk()
+
+    def _content_key(self):
+        """皮肤数据（skins.json + image_skins.json）以及图片皮肤所用图片文件（修改时间、大小）的内容哈希"""
+        image_files = {}
+        for skin_id, skin_data in self.image_skins.items():
+            resolved = self._image_path(skin_data)
+            if resolved is not None:
+                stat = os.stat(resolved)
+                # 只记录文件名而不是完整路径：打包后的资源目录每次运行可能不同
+                image_files[skin_id] = [os.path.basename(resolved), stat.st_mtime_ns, stat.st_size]
+        payload = json.dumps([ATLAS_VERSION, self.tile_size, self.color_skins, self.image_skins, image_files],
+                             sort_keys=True, ensure_ascii=False)
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+    def _cache_paths(self):
+        base = os.path.join(self.cache_dir, f"skin_thumbs_{self.content_key}")
+        return base + '.png', base + '.json'
+
+    def _load_from_disk(self):
+        sheet_path, index_path = self._cache_paths()
+        if not (os.path.exists(sheet_path) and os.path.exists(index_path)):
+            return False
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('key') != self.content_key:
+                return False
+            sheet = pygame.image.load(sheet_path)
+            self.sheet = sheet.convert_alpha() if pygame.display.get_surface() else sheet
+            self.index = {skin_id: tuple(pos) for skin_id, pos in meta['skins'].items()}
+            return True
+        except Exception as e:
+            print(f"缩略图缓存读取失败，将重新生成: {e}")
+            return False
+
+    def _save_to_disk(self):
+        sheet_path, index_path = self._cache_paths()
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # 清理旧版本的图集
+            for name in os.listdir(self.cache_dir):
+                if name.startswith('skin_thumbs_') and not name.startswith(f"skin_thumbs_{self.content_key}"):
+                    os.remove(os.path.join(self.cache_dir, name))
+            tmp_path = sheet_path[:-4] + '.tmp.png'
+            pygame.image.save(self.sheet, tmp_path)
+            os.replace(tmp_path, sheet_path)
+            meta = {'key': self.content_key, 'tile_size': self.tile_size,
+                    'skins': {skin_id: list(pos) for skin_id, pos in self.index.items()}}
+            # 索引最后写入：只有图片完整写好后缓存才会被认为有效
+            write_file_atomic(index_path, json.dumps(meta, ensure_ascii=False), prefix='.skin_thumbs_')
+        except Exception as e:
+            print(f"缩略图缓存保存失败: {e}")
+
+    def _build(self):
+        """把所有皮肤预览绘制到一张图集上"""
+        tiles = {}
+        for skin_id, skin_data in self.color_skins.items():
+            tile = self._render_color_tile(skin_data)
+            if tile is not None:
+                tiles[skin_id] = tile
+        for skin_id, skin_data in self.image_skins.items():
+            tile = self._render_image_tile(skin_data)
+            if tile is not None:
+                tiles[skin_id] = tile
+
+        cols = max(1, math.ceil(math.sqrt(len(tiles))))
+        rows = max(1, math.ceil(len(tiles) / cols))
+        self.sheet = pygame.Surface((cols * self.tile_size, rows * self.tile_size), pygame.SRCALPHA)
+        self.index = {}
+        for i, (skin_id, tile) in enumerate(tiles.items()):
+            pos = ((i % cols) * self.tile_size, (i // cols) * self.tile_size)
+            self.sheet.blit(tile, pos)
+            self.index[skin_id] = pos
+
+    def _render_color_tile(self, skin_data):
+        """用蛇身的绘制函数画颜色皮肤（朝上，不画眼睛）"""
+        # 在此处导入，避免 shop -> skin_thumbnails -> snake -> shop 的循环导入
+        from .snake import draw_shape_segment
+        colors = skin_data.get('colors')
+        if not colors or len(colors) < 2:
+            return None
+        # 先画在不透明表面上（与游戏画面一致，高光等半透明颜色按不透明绘制），再用色键抠出背景
+        canvas = pygame.Surface((self.tile_size, self.tile_size))
+        canvas.fill(self.COLOR_KEY)
+        canvas.set_colorkey(self.COLOR_KEY)
+        center = self.tile_size / 2
+        radius = self.tile_size * 0.4
+        draw_shape_segment(canvas, skin_data.get('shape', 'rectangle'), center, center, radius,
+                           tuple(colors[0]), tuple(colors[1]), (0, -1))
+        tile = pygame.Surface((self.tile_size, self.tile_size), pygame.SRCALPHA)
+        tile.blit(canvas, (0, 0))
+        return tile
+
+    @staticmethod
+    def _image_path(skin_data):
+        """图片皮肤缩略图所用图片的完整路径：蛇头图片（没有则使用 image 字段）；找不到文件时返回 None"""
+        img_path = skin_data.get('head_image') or skin_data.get('image', '')
+        if not img_path:
+            return None
+        resolved = img_path
+        if not os.path.isabs(img_path):
+            # 先尝试snake_images目录，再尝试相对于项目根目录
+            resolved = os.path.join(get_resource_path('snake_images'), img_path)
+            if not os.path.exists(resolved):
+                resolved = get_resource_path(img_path)
+        return resolved if os.path.exists(resolved) else None
+
+    def _render_image_tile(self, skin_data):
+        """图片皮肤使用蛇头图片（没有则使用 image 字段）"""
+        img_path = skin_data.get('head_image') or skin_data.get('image', '')
+        if not img_path:
+            return None
+        resolved = self._image_path(skin_data)
+        if resolved is None:
+            print(f"图片文件不存在: {img_path}")
+            return None
+        try:
+            image = pygame.image.load(resolved)
+        except pygame.error as e:
+            print(f"图片加载失败 {img_path}: {e}")
+            return None
+        if pygame.display.get_surface():
+            image = image.convert_alpha()
+        return pygame.transform.smoothscale(image, (self.tile_size, self.tile_size))
+
+    def get(self, skin_id, size=None):
+        """返回皮肤缩略图；size 为 (宽, 高)，缩放结果会被缓存；图集中没有该皮肤时返回 None"""
+        pos = self.index.get(skin_id)
+        if pos is None:
+            return None
+        size = tuple(size) if size else (self.tile_size, self.tile_size)
+        key = (skin_id, size)
+        thumb = self._scaled_cache.get(key)
+        if thumb is None:
+            thumb = self.sheet.subsurface(pygame.Rect(pos, (self.tile_size, self.tile_size)))
+            if size != (self.tile_size, self.tile_size):
+                thumb = pygame.transform.smoothscale(thumb, size)
+            self._scaled_cache[key] = thumb
+        return thumb
+
+    def release_scaled(self):
+        """丢弃缩放后的缩略图（离开商店/背包时调用），图集本身保留"""
+        self._scaled_cache.clear()
+
+_atlas = None
+
+def get_skin_thumbnails():
+    """获取全局缩略图图集（首次调用时加载或生成）"""
+    global _atlas
+    if _atlas is None:
+        from .shop import SKINS
+        from .image_skins import image_skin_manager
+        _atlas = SkinThumbnailAtlas(SKINS, image_skin_manager.get_all_image_skins())
+    return _atlas
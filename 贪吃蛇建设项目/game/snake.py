@@ -1,10 +1,22 @@
 # -*- coding: utf-8 -*-
 import pygame
 import math
-from .constants import GRID_SIZE, WINDOW_WIDTH, WINDOW_HEIGHT, SNAKE_SPEED
+from .constants import GRID_SIZE
 from .player import player_data
 from .shop import SKINS
 from .image_skins import image_skin_manager
+from .world import SnakeState
+
+try:
+    import numpy as np
+except ImportError:  # 没有 NumPy 时使用纯 Python 计算
+    np = None
+
+# 蛇身波动用的正弦查找表
+WAVE_TABLE_SIZE = 1024
+WAVE_INDEX_SCALE = WAVE_TABLE_SIZE / (2 * math.pi)
+WAVE_TABLE = [math.sin(i / WAVE_INDEX_SCALE) for i in range(WAVE_TABLE_SIZE)]
+WAVE_TABLE_NP = np.array(WAVE_TABLE) if np is not None else None
 
 def get_hexagon_points(center_x, center_y, radius):
     """计算六边形的顶点坐标"""
@@ -33,186 +45,142 @@ def get_pentagram_points(center_x, center_y, outer_radius):
                        center_y + radius * math.sin(angle_rad)))
     return points
 
-class Snake:
-    def __init__(self, allow_cross_self=False):
-        self.length = 1
-        self.positions = [((WINDOW_WIDTH // GRID_SIZE) // 2, (WINDOW_HEIGHT // GRID_SIZE) // 2)]
-        self.direction = (1, 0)
-        self.next_direction = (1, 0)
-        self.score = 0
-        self.last_move_time = 0
-        self.speed = 1000 / SNAKE_SPEED
-        self.animation_time = 0
-        self.allow_cross_self = allow_cross_self
-
-    def get_head_position(self):
-        return self.positions[0]
+class Snake(SnakeState):
+    """可绘制的蛇：移动规则继承自 SnakeState，这里只负责动画、插值和皮肤绘制"""
 
-    def update(self, current_time):
-        self.animation_time = current_time
-        # 根据速度移动蛇
-        if current_time - self.last_move_time > self.speed:
-            self.last_move_time = current_time
-            if not self.move():
-                return False # 移动失败（撞到自己）
-        return True
+    def __init__(self, allow_cross_self=False, grid=None):
+        super().__init__(allow_cross_self=allow_cross_self, grid=grid)
+        self.animation_time = 0
+        # 绘制插值比例：0 表示画在上一个逻辑帧的位置，1 表示画在当前位置（不插值）
+        self.render_alpha = 1.0
+        self._last_tail = None  # 上一次移动前的蛇尾，插值时蛇尾从这里滑过来
 
     def move(self):
-        self.direction = self.next_direction
-        cur = self.get_head_position()
-        x, y = self.direction
-        # 计算新位置，实现穿墙效果
-        new_x = (cur[0] + x) % (WINDOW_WIDTH // GRID_SIZE)
-        new_y = (cur[1] + y) % (WINDOW_HEIGHT // GRID_SIZE)
-        new = (new_x, new_y)
-        if not self.allow_cross_self:
-            # 检查是否撞到自己
-            if new in self.positions:
-                if len(self.positions) > 2 and new in self.positions[1:]:
-                    return False
-        # 允许穿过自己，直接插入新头部
-        self.positions.insert(0, new)
-        if len(self.positions) > self.length:
-            self.positions.pop()
-        return True
-
-    def draw(self, surface):
+        self._last_tail = self._body[-1]
+        return super().move()
+
+    def draw(self, surface, dirty=None):
+        """批量绘制：一次算出所有节的中心和朝向，再用一次 blits 提交；传入 dirty 列表时追加每节画过的矩形"""
+        if not self.positions:
+            return
         skin_id = player_data.get_equipped_skin()
-        t = self.animation_time / 1000.0
-        direction = self.direction
-        perp = (-direction[1], direction[0])
-        wave_amp = GRID_SIZE * 0.09
+        xs, ys = self._segment_centers()
+        head_index = len(xs) - 1
 
-        # 检查是否为图片皮肤
         if image_skin_manager.is_image_skin(skin_id):
-            # 使用图片皮肤绘制
-            for i, pos in enumerate(reversed(self.positions)):
-                is_head = (i == len(self.positions) - 1)
-                wave_phase = t * 12 + i * 0.6
-                offset_x = perp[0] * math.sin(wave_phase) * wave_amp
-                offset_y = perp[1] * math.sin(wave_phase) * wave_amp
-                center_x = pos[0] * GRID_SIZE + GRID_SIZE // 2 + offset_x
-                center_y = pos[1] * GRID_SIZE + GRID_SIZE // 2 + offset_y
-                
-                # 计算每段身体的移动方向
-                if is_head:
-                    # 头部使用当前方向
-                    segment_direction = self.direction
-                else:
-                    # 身体段使用从当前位置到下一段位置的方向
-                    current_index = len(self.positions) - 1 - i
-                    next_index = current_index + 1
-                    if next_index < len(self.positions):
-                        next_pos = self.positions[next_index]
-                        dx = next_pos[0] - pos[0]
-                        dy = next_pos[1] - pos[1]
-                        # 处理穿墙情况
-                        if abs(dx) > 1:  # 穿墙
-                            dx = -1 if dx > 0 else 1
-                        if abs(dy) > 1:  # 穿墙
-                            dy = -1 if dy > 0 else 1
-                        segment_direction = (dx, dy)
+            # 图片皮肤：按每节朝向取旋转好的图片，加载失败的节回退到默认皮肤
+            fallback = {
+                False: segment_sprites.get("default_rectangle", False, self.direction),
+                True: segment_sprites.get("default_rectangle", True, self.direction),
+            }
+            sprite_by_direction = {}
+            sprites = []
+            for i, segment_direction in enumerate(self._segment_directions()):
+                is_head = (i == head_index)
+                key = (segment_direction, is_head)
+                sprite = sprite_by_direction.get(key)
+                if sprite is None:
+                    image = image_skin_manager.get_segment_image(skin_id, segment_direction, is_head)
+                    if image is None:
+                        sprite = fallback[is_head]
                     else:
-                        # 最后一段身体，使用从当前位置到前一段位置的方向（反向）
-                        prev_index = current_index - 1
-                        if prev_index >= 0:
-                            prev_pos = self.positions[prev_index]
-                            dx = pos[0] - prev_pos[0]
-                            dy = pos[1] - prev_pos[1]
-                            # 处理穿墙情况
-                            if abs(dx) > 1:  # 穿墙
-                                dx = -1 if dx > 0 else 1
-                            if abs(dy) > 1:  # 穿墙
-                                dy = -1 if dy > 0 else 1
-                            segment_direction = (dx, dy)
-                        else:
-                            # 如果只有一个身体段，使用蛇头方向
-                            segment_direction = self.direction
-                
-                # 尝试绘制图片皮肤，如果失败则回退到默认皮肤
-                if not image_skin_manager.draw_image_segment(surface, (center_x, center_y), segment_direction, skin_id, is_head):
-                    # 回退到默认皮肤
-                    skin_info = SKINS.get("default_rectangle")
-                    base_color, dark_color = skin_info["colors"]
-                    shape = skin_info.get("shape", "rectangle")
-                    self.draw_segment(surface, pos, i, base_color, dark_color, shape, is_head)
+                        sprite = (image, (-(image.get_width() // 2), -(image.get_height() // 2)))
+                    sprite_by_direction[key] = sprite
+                sprites.append(sprite)
         else:
-            # 使用原有的颜色皮肤系统
-            skin_info = SKINS.get(skin_id, SKINS.get("default_rectangle"))
-            base_color, dark_color = skin_info["colors"]
-            shape = skin_info.get("shape", "rectangle")
-
-            for i, pos in enumerate(reversed(self.positions)):
-                is_head = (i == len(self.positions) - 1)
-                self.draw_segment(surface, pos, i, base_color, dark_color, shape, is_head)
-    
-    def draw_segment(self, surface, pos, index, base_color, dark_color, shape, is_head):
-        center_x = pos[0] * GRID_SIZE + GRID_SIZE // 2
-        center_y = pos[1] * GRID_SIZE + GRID_SIZE // 2
-        
+            # 颜色皮肤：蛇身/蛇头贴图预渲染，所有蛇身共用同一张
+            body_sprite = segment_sprites.get(skin_id, False, self.direction)
+            sprites = [body_sprite] * head_index
+            sprites.append(segment_sprites.get(skin_id, True, self.direction))
+
+        rects = surface.blits([(image, (x + dx, y + dy)) for (image, (dx, dy)), x, y in zip(sprites, xs, ys)],
+                              dirty is not None)
+        if dirty is not None:
+            dirty.extend(rects)
+
+    def _segment_centers(self):
+        """
+        计算所有节的像素中心（从蛇尾到蛇头，即绘制顺序），包含垂直于前进方向的波动偏移
+        render_alpha < 1 时每节从上一个逻辑帧的位置（即后面一节所在的格子）向当前位置插值，穿墙的那一步不插值
+        波动使用正弦查表，有 NumPy 时整段向量化计算
+        """
         t = self.animation_time / 1000.0
-        direction = self.direction
-        perp = (-direction[1], direction[0])
+        perp = (-self.direction[1], self.direction[0])
         wave_amp = GRID_SIZE * 0.09
-        wave_phase = t * 12 + index * 0.6
-        offset_x = perp[0] * math.sin(wave_phase) * wave_amp
-        offset_y = perp[1] * math.sin(wave_phase) * wave_amp
-        center_x += offset_x
-        center_y += offset_y
-
-        radius = GRID_SIZE // 2 * 0.9
-
-        # --- 绘制光晕 (保留) ---
-        # breath = 0.5 + 0.5 * math.sin(t * 2)
-        # outer_glow_surface = pygame.Surface((radius * 3.5, radius * 3.5), pygame.SRCALPHA)
-        # outer_alpha = int((40 + 180 * breath) * 0.1)
-        # pygame.draw.circle(outer_glow_surface, (*base_color, outer_alpha), outer_glow_surface.get_rect().center, int(radius * 1.7))
-        # surface.blit(outer_glow_surface, (center_x - radius * 1.75, center_y - radius * 1.75), special_flags=pygame.BLEND_RGBA_ADD)
-
-        # inner_glow_surface = pygame.Surface((radius * 2.2, radius * 2.2), pygame.SRCALPHA)
-        # inner_alpha = int((80 + 100 * breath) * 0.1)
-        # pygame.draw.circle(inner_glow_surface, (*base_color, inner_alpha), inner_glow_surface.get_rect().center, int(radius * 1.1))
-        # surface.blit(inner_glow_surface, (center_x - radius * 1.1, center_y - radius * 1.1), special_flags=pygame.BLEND_RGBA_ADD)
-        # --- 光晕结束 ---
-
-        if shape == "circle":
-            self.draw_circle_segment(surface, center_x, center_y, radius, base_color, dark_color)
-        elif shape == "rectangle":
-            self.draw_rectangle_segment(surface, center_x, center_y, radius, base_color, dark_color)
-        elif shape == "hexagon":
-            self.draw_hexagon_segment(surface, center_x, center_y, radius, base_color, dark_color)
-        elif shape == "pentagram":
-            self.draw_pentagram_segment(surface, center_x, center_y, radius, base_color, dark_color)
-        elif shape == "fan":
-            self.draw_fan_segment(surface, center_x, center_y, radius, base_color, dark_color, self.direction)
-        elif shape == "heart":
-            self.draw_heart_segment(surface, center_x, center_y, radius, base_color, dark_color)
-        elif shape == "leaf":
-            self.draw_leaf_segment(surface, center_x, center_y, radius, base_color, dark_color, self.direction)
-        elif shape == "water_drop":
-            self.draw_water_drop_segment(surface, center_x, center_y, radius, base_color, dark_color, self.direction)
-        elif shape == "music_note":
-            self.draw_music_note_segment(surface, center_x, center_y, radius, base_color, dark_color, self.direction)
-        elif shape == "lightning_bolt":
-            self.draw_lightning_bolt_segment(surface, center_x, center_y, radius, base_color, dark_color, self.direction)
-        elif shape == "crown":
-            self.draw_crown_segment(surface, center_x, center_y, radius, base_color, dark_color, self.direction)
-        elif shape == "arrow":
-            self.draw_arrow_segment(surface, center_x, center_y, radius, base_color, dark_color, self.direction)
-        else: # rectangle/default
-            self.draw_rectangle_segment(surface, center_x, center_y, radius, base_color, dark_color)
-
-        if is_head:
-            self.draw_eyes(surface, center_x, center_y, radius)
-
-    def draw_circle_segment(self, surface, center_x, center_y, radius, base_color, dark_color):
+        half = GRID_SIZE // 2
+        n = len(self.positions)
+        lag = 1.0 - self.render_alpha if self._last_tail is not None else 0.0
+        if np is not None:
+            pos = np.array(list(reversed(self._body)), dtype=np.float64)
+            if lag > 0:
+                prev = np.empty_like(pos)
+                prev[0] = self._last_tail
+                prev[1:] = pos[:-1]
+                delta = pos - prev
+                delta[np.abs(delta) > 1] = 0
+                pos -= delta * lag
+            phase = (t * 12 + np.arange(n) * 0.6) * WAVE_INDEX_SCALE
+            wave = WAVE_TABLE_NP[phase.astype(np.int64) % WAVE_TABLE_SIZE] * wave_amp
+            xs = np.rint(pos[:, 0] * GRID_SIZE + half + perp[0] * wave).astype(np.int64)
+            ys = np.rint(pos[:, 1] * GRID_SIZE + half + perp[1] * wave).astype(np.int64)
+            return xs.tolist(), ys.tolist()
+        xs, ys = [], []
+        base_phase = t * 12
+        prev = self._last_tail
+        for i, (px, py) in enumerate(reversed(self._body)):
+            fx, fy = px, py
+            if lag > 0:
+                dx, dy = px - prev[0], py - prev[1]
+                if abs(dx) <= 1 and abs(dy) <= 1:
+                    fx, fy = px - dx * lag, py - dy * lag
+                prev = (px, py)
+            wave = WAVE_TABLE[int((base_phase + i * 0.6) * WAVE_INDEX_SCALE) % WAVE_TABLE_SIZE] * wave_amp
+            xs.append(round(fx * GRID_SIZE + half + perp[0] * wave))
+            ys.append(round(fy * GRID_SIZE + half + perp[1] * wave))
+        return xs, ys
+
+    def _segment_directions(self):
+        """
+        计算每节的朝向（从蛇尾到蛇头）：蛇头用当前方向，
+        蛇身用指向后一节的方向，蛇尾沿用与前一节的方向；穿墙时按相邻一格处理
+        """
+        positions = list(self._body)
+        n = len(positions)
+        if n == 1:
+            return [self.direction]
+        if np is not None:
+            pos = np.array(positions)
+            d = pos[1:] - pos[:-1]
+            d = np.where(np.abs(d) > 1, -np.sign(d), d)
+            d = np.vstack([d, d[-1:]])[::-1]
+            directions = [tuple(v) for v in d.tolist()]
+        else:
+            directions = []
+            for k in range(n - 1, -1, -1):
+                if k < n - 1:
+                    a, b = positions[k], positions[k + 1]
+                else:
+                    a, b = positions[k - 1], positions[k]
+                dx, dy = b[0] - a[0], b[1] - a[1]
+                # 处理穿墙情况
+                if abs(dx) > 1:
+                    dx = -1 if dx > 0 else 1
+                if abs(dy) > 1:
+                    dy = -1 if dy > 0 else 1
+                directions.append((dx, dy))
+        directions[-1] = self.direction
+        return directions
+
+    @staticmethod
+    def draw_circle_segment(surface, center_x, center_y, radius, base_color, dark_color):
         pygame.draw.circle(surface, dark_color, (center_x, center_y), radius)
         pygame.draw.circle(surface, base_color, (center_x, center_y), radius * 0.85)
         highlight_radius = radius * 0.2
         highlight_center = (center_x - radius * 0.4, center_y - radius * 0.4)
         pygame.draw.circle(surface, (255, 255, 255, 180), highlight_center, highlight_radius)
 
-    def draw_rectangle_segment(self, surface, center_x, center_y, radius, base_color, dark_color):
+    @staticmethod
+    def draw_rectangle_segment(surface, center_x, center_y, radius, base_color, dark_color):
         rect_size = radius * 2
         rect = pygame.Rect(center_x - radius, center_y - radius, rect_size, rect_size)
         pygame.draw.rect(surface, dark_color, rect, border_radius=int(radius * 0.2))
@@ -221,7 +189,8 @@ class Snake:
         highlight_rect.topleft = (rect.left + rect_size * 0.1, rect.top + rect_size * 0.1)
         pygame.draw.rect(surface, (255, 255, 255, 90), highlight_rect, border_radius=int(radius * 0.05))
 
-    def draw_hexagon_segment(self, surface, center_x, center_y, radius, base_color, dark_color):
+    @staticmethod
+    def draw_hexagon_segment(surface, center_x, center_y, radius, base_color, dark_color):
         points = get_hexagon_points(center_x, center_y, radius)
         pygame.draw.polygon(surface, dark_color, points)
         inner_points = get_hexagon_points(center_x, center_y, radius * 0.85)
@@ -230,7 +199,8 @@ class Snake:
         highlight_center = (center_x - radius * 0.3, center_y - radius * 0.3)
         pygame.draw.circle(surface, (255, 255, 255, 90), highlight_center, radius * 0.2)
 
-    def draw_pentagram_segment(self, surface, center_x, center_y, radius, base_color, dark_color):
+    @staticmethod
+    def draw_pentagram_segment(surface, center_x, center_y, radius, base_color, dark_color):
         points = get_pentagram_points(center_x, center_y, radius)
         pygame.draw.polygon(surface, dark_color, points)
         inner_points = get_pentagram_points(center_x, center_y, radius * 0.85)
@@ -239,7 +209,8 @@ class Snake:
         highlight_center = (center_x - radius * 0.3, center_y - radius * 0.3)
         pygame.draw.circle(surface, (255, 255, 255, 90), highlight_center, radius * 0.2)
 
-    def draw_fan_segment(self, surface, center_x, center_y, radius, base_color, dark_color, direction):
+    @staticmethod
+    def draw_fan_segment(surface, center_x, center_y, radius, base_color, dark_color, direction):
         # Determine fan orientation based on snake's direction
         angle = math.atan2(-direction[1], direction[0]) # Angle in radians
         
@@ -255,7 +226,8 @@ class Snake:
             end_pos = (center_x + radius * math.cos(rib_angle), center_y - radius * math.sin(rib_angle))
             pygame.draw.line(surface, dark_color, start_pos, end_pos, 2)
 
-    def draw_heart_segment(self, surface, center_x, center_y, radius, base_color, dark_color):
+    @staticmethod
+    def draw_heart_segment(surface, center_x, center_y, radius, base_color, dark_color):
         # Scale factor to make the heart fit well within the grid
         s = radius * 0.9
 
@@ -282,7 +254,8 @@ class Snake:
         adjusted_p3 = (p3[0], p3[1] - s*0.2)
         pygame.draw.polygon(surface, base_color, [adjusted_p1, adjusted_p2, adjusted_p3])
 
-    def draw_leaf_segment(self, surface, center_x, center_y, radius, base_color, dark_color, direction):
+    @staticmethod
+    def draw_leaf_segment(surface, center_x, center_y, radius, base_color, dark_color, direction):
         # Create a temporary surface to draw the leaf on, for easier rotation
         leaf_surface = pygame.Surface((radius * 2, radius * 2.5), pygame.SRCALPHA)
         w, h = leaf_surface.get_size()
@@ -315,7 +288,8 @@ class Snake:
         new_rect = rotated_leaf.get_rect(center=(center_x, center_y))
         surface.blit(rotated_leaf, new_rect.topleft)
 
-    def draw_water_drop_segment(self, surface, center_x, center_y, radius, base_color, dark_color, direction):
+    @staticmethod
+    def draw_water_drop_segment(surface, center_x, center_y, radius, base_color, dark_color, direction):
         # Create a temporary surface for the water drop to allow for rotation
         drop_surface = pygame.Surface((radius * 2, radius * 2.5), pygame.SRCALPHA)
         w, h = drop_surface.get_size()
@@ -334,7 +308,8 @@ class Snake:
         new_rect = rotated_drop.get_rect(center=(center_x, center_y))
         surface.blit(rotated_drop, new_rect.topleft)
 
-    def draw_music_note_segment(self, surface, center_x, center_y, radius, base_color, dark_color, direction):
+    @staticmethod
+    def draw_music_note_segment(surface, center_x, center_y, radius, base_color, dark_color, direction):
         # Create a temporary surface to draw the note on for rotation
         note_surface = pygame.Surface((radius * 2.5, radius * 3), pygame.SRCALPHA)
         w, h = note_surface.get_size()
@@ -370,7 +345,8 @@ class Snake:
         new_rect = rotated_note.get_rect(center=(center_x, center_y))
         surface.blit(rotated_note, new_rect.topleft)
 
-    def draw_lightning_bolt_segment(self, surface, center_x, center_y, radius, base_color, dark_color, direction):
+    @staticmethod
+    def draw_lightning_bolt_segment(surface, center_x, center_y, radius, base_color, dark_color, direction):
         # Create a temporary surface to draw the lightning bolt on for rotation
         bolt_surface = pygame.Surface((radius * 2.5, radius * 2.5), pygame.SRCALPHA)
         w, h = bolt_surface.get_size()
@@ -401,7 +377,8 @@ class Snake:
         new_rect = rotated_bolt.get_rect(center=(center_x, center_y))
         surface.blit(rotated_bolt, new_rect.topleft)
 
-    def draw_crown_segment(self, surface, center_x, center_y, radius, base_color, dark_color, direction):
+    @staticmethod
+    def draw_crown_segment(surface, center_x, center_y, radius, base_color, dark_color, direction):
         # 绘制一个清晰、经典的皇冠图标，不旋转
         crown_surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
         w, h = crown_surface.get_size()
@@ -442,7 +419,8 @@ class Snake:
         new_rect = crown_surface.get_rect(center=(center_x, center_y))
         surface.blit(crown_surface, new_rect.topleft)
 
-    def draw_arrow_segment(self, surface, center_x, center_y, radius, base_color, dark_color, direction):
+    @staticmethod
+    def draw_arrow_segment(surface, center_x, center_y, radius, base_color, dark_color, direction):
         # 创建一个临时表面用于旋转
         arrow_surface = pygame.Surface((radius * 2.2, radius * 2.2), pygame.SRCALPHA)
         w, h = arrow_surface.get_size()
@@ -465,8 +443,9 @@ class Snake:
         new_rect = rotated_arrow.get_rect(center=(center_x, center_y))
         surface.blit(rotated_arrow, new_rect.topleft)
 
-    def draw_eyes(self, surface, center_x, center_y, radius):
-        dir_x, dir_y = self.direction
+    @staticmethod
+    def draw_eyes(surface, center_x, center_y, radius, direction):
+        dir_x, dir_y = direction
         eye_size = max(2, radius * 0.15)
         eye_forward_offset = radius * 0.3
         eye_side_offset = radius * 0.35
@@ -486,27 +465,92 @@ class Snake:
         pygame.draw.circle(surface, (0, 0, 0), eye2_pos, eye_size)
         pygame.draw.circle(surface, (255, 255, 255), (eye2_pos[0] + 1, eye2_pos[1] + 1), eye_size * 0.3)
 
-    def change_direction(self, new_direction):
-        # 如果上一个方向指令还未执行，则忽略新的指令
-        if self.direction != self.next_direction:
-            return
-        # 避免180度转身
-        if len(self.positions) > 1 and (new_direction[0] * -1, new_direction[1] * -1) == self.direction:
+def draw_shape_segment(surface, shape, center_x, center_y, radius, base_color, dark_color, direction):
+    """按形状绘制一节蛇身（不含眼睛），蛇本体和皮肤缩略图共用"""
+    if shape == "circle":
+        Snake.draw_circle_segment(surface, center_x, center_y, radius, base_color, dark_color)
+    elif shape == "rectangle":
+        Snake.draw_rectangle_segment(surface, center_x, center_y, radius, base_color, dark_color)
+    elif shape == "hexagon":
+        Snake.draw_hexagon_segment(surface, center_x, center_y, radius, base_color, dark_color)
+    elif shape == "pentagram":
+        Snake.draw_pentagram_segment(surface, center_x, center_y, radius, base_color, dark_color)
+    elif shape == "fan":
+        Snake.draw_fan_segment(surface, center_x, center_y, radius, base_color, dark_color, direction)
+    elif shape == "heart":
+        Snake.draw_heart_segment(surface, center_x, center_y, radius, base_color, dark_color)
+    elif shape == "leaf":
+        Snake.draw_leaf_segment(surface, center_x, center_y, radius, base_color, dark_color, direction)
+    elif shape == "water_drop":
+        Snake.draw_water_drop_segment(surface, center_x, center_y, radius, base_color, dark_color, direction)
+    elif shape == "music_note":
+        Snake.draw_music_note_segment(surface, center_x, center_y, radius, base_color, dark_color, direction)
+    elif shape == "lightning_bolt":
+        Snake.draw_lightning_bolt_segment(surface, center_x, center_y, radius, base_color, dark_color, direction)
+    elif shape == "crown":
+        Snake.draw_crown_segment(surface, center_x, center_y, radius, base_color, dark_color, direction)
+    elif shape == "arrow":
+        Snake.draw_arrow_segment(surface, center_x, center_y, radius, base_color, dark_color, direction)
+    else: # rectangle/default
+        Snake.draw_rectangle_segment(surface, center_x, center_y, radius, base_color, dark_color)
+
+class SegmentSpriteCache:
+    """
+    颜色皮肤蛇身贴图缓存
+    每种 (皮肤, 形状, 是否蛇头, 方向) 只用超采样绘制一次，绘制蛇时每节只需一次 blit。
+    """
+    SUPERSAMPLE = 2
+    DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1)]
+
+    def __init__(self, grid_size=GRID_SIZE):
+        self.grid_size = grid_size
+        self.radius = grid_size // 2 * 0.9
+        # 贴图边长取两个格子，容纳旋转后超出格子的形状（音符、闪电等）
+        self.sprite_size = grid_size * 2
+        self.sprites = {}
+
+    def get(self, skin_id, is_head, direction):
+        """返回 (贴图, 贴图左上角相对格子中心的偏移)"""
+        skin_info = SKINS.get(skin_id, SKINS.get("default_rectangle"))
+        shape = skin_info.get("shape", "rectangle")
+        key = (skin_id, shape, is_head, direction)
+        sprite = self.sprites.get(key)
+        if sprite is None:
+            sprite = self._render(skin_info, shape, is_head, direction)
+            self.sprites[key] = sprite
+        return sprite
+
+    def warm_up(self, skin_id):
+        """预先生成某个皮肤所有方向的蛇头/蛇身贴图（装备皮肤时调用）"""
+        if image_skin_manager.is_image_skin(skin_id):
             return
-        self.next_direction = new_direction
-
-    def grow(self, score_increase=10):
-        self.length += 1
-        self.score += score_increase
-
-    def move_left(self):
-        self.change_direction((-1, 0))
-
-    def move_right(self):
-        self.change_direction((1, 0))
-
-    def move_up(self):
-        self.change_direction((0, -1))
-
-    def move_down(self):
-        self.change_direction((0, 1)) 
\ No newline at end of file
+        for direction in self.DIRECTIONS:
+            self.get(skin_id, False, direction)
+            self.get(skin_id, True, direction)
+
+    def _render(self, skin_info, shape, is_head, direction):
+        base_color, dark_color = (tuple(c) for c in skin_info["colors"])
+        size = self.sprite_size * self.SUPERSAMPLE
+        # 在放大的不透明画布上绘制（半透明高光与直接画在屏幕上效果一致），再用色键抠出背景
+        canvas = pygame.Surface((size, size))
+        canvas.fill((1, 2, 3))
+        canvas.set_colorkey((1, 2, 3))
+        draw_shape_segment(canvas, shape, size / 2, size / 2, self.radius * self.SUPERSAMPLE,
+                           base_color, dark_color, direction)
+        # 透明像素的颜色取暗色，缩小时边缘过渡到描边色而不是黑色
+        big = pygame.Surface((size, size), pygame.SRCALPHA)
+        big.fill((*dark_color, 0))
+        big.blit(canvas, (0, 0))
+        sprite = pygame.transform.smoothscale(big, (self.sprite_size, self.sprite_size))
+        center = self.sprite_size // 2
+        if is_head:
+            # 眼睛很小，直接按原尺寸绘制以保持清晰
+            Snake.draw_eyes(sprite, center, center, self.radius, direction)
+        # 裁掉透明边缘，并转换为屏幕像素格式以加快 blit
+        bounds = sprite.get_bounding_rect()
+        sprite = sprite.subsurface(bounds).copy()
+        if pygame.display.get_surface():
+            sprite = sprite.convert_alpha()
+        return sprite, (bounds.x - center, bounds.y - center)
+
+segment_sprites = SegmentSpriteCache()
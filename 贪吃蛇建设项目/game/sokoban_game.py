@@ -1,8 +1,11 @@
 import pygame
-import json
 import math
 import random
 from .constants import *
+from .fonts import get_font, render_text
+from . import layers
+from .particles import snowfall
+from .player import player_data
 
 # 自定义颜色
 COLORS = {
@@ -29,22 +32,6 @@ COLORS = {
     'overlay': (255, 255, 255, 180)
 }
 
-class SnowParticle:
-    def __init__(self):
-        self.x = random.randint(0, WINDOW_WIDTH)
-        self.y = random.randint(-50, 0)
-        self.speed = random.uniform(0.5, 2)
-        self.size = random.randint(1, 3)
-
-    def update(self):
-        self.y += self.speed
-        if self.y > WINDOW_HEIGHT:
-            self.y = random.randint(-50, 0)
-            self.x = random.randint(0, WINDOW_WIDTH)
-
-    def draw(self, surface):
-        pygame.draw.circle(surface, (255, 255, 255), (int(self.x), int(self.y)), self.size)
-
 class SokobanGame:
     def __init__(self, surface):
         self.surface = surface
@@ -63,9 +50,9 @@ class SokobanGame:
         self.cell_size = 40
         self.offset_x = 0
         self.offset_y = 0
-        self.font = pygame.font.Font(FONT_NAME, 36)
-        self.small_font = pygame.font.Font(FONT_NAME, 24)
-        self.very_small_font = pygame.font.Font(FONT_NAME, 18)
+        self.font = get_font(FONT_NAME, 36)
+        self.small_font = get_font(FONT_NAME, 24)
+        self.very_small_font = get_font(FONT_NAME, 18)
         self.level_buttons = []
         self.initialized = False
         self.move_history = []  # 用于存储移动历史，实现撤销功能
@@ -75,7 +62,7 @@ class SokobanGame:
         self.levels_per_page = 15  # 每页显示15个关卡
         self.total_pages = (len(self.levels) + self.levels_per_page - 1) // self.levels_per_page
         # 雪花粒子系统
-        self.snow_particles = [SnowParticle() for _ in range(50)]
+        self.snow_particles = snowfall(PARTICLE_BUDGETS['sokoban_snow'], 2, 3)
         # 添加时间属性用于动画效果
         self.time_passed = 0
 
@@ -558,25 +545,13 @@ class SokobanGame:
 
     def load_best_moves(self):
         """加载最佳步数记录"""
-        try:
-            with open('player_data.json', 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                self.best_moves = data.get('sokoban_best_moves', {})
-        except:
-            self.best_moves = {}
+        self.best_moves = player_data.get_dict('sokoban', 'best_moves')
 
     def save_best_move(self, level, moves):
         """保存最佳步数"""
         if str(level) not in self.best_moves or moves < int(self.best_moves[str(level)]):
             self.best_moves[str(level)] = moves
-            try:
-                with open('player_data.json', 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                data['sokoban_best_moves'] = self.best_moves
-                with open('player_data.json', 'w', encoding='utf-8') as f:
-                    json.dump(data, f, ensure_ascii=False, indent=4)
-            except Exception as e:
-                print(f"保存最佳步数失败: {e}")
+            player_data.set_dict('sokoban', 'best_moves', self.best_moves)
 
     def init_level(self, level):
         """初始化关卡"""
@@ -779,29 +754,8 @@ class SokobanGame:
     def draw_level_select(self):
         """绘制关卡选择界面"""
         # 绘制糖果马卡龙风格渐变背景：浅粉-浅紫-浅青
-        for y in range(WINDOW_HEIGHT):
-            # 主渐变 - 从顶部到底部
-            progress = y / WINDOW_HEIGHT
-            
-            # 三段式渐变：浅粉 -> 浅紫 -> 浅青
-            if progress < 0.33:  # 上部分：浅粉
-                sub_progress = progress / 0.33
-                r = int(255 - sub_progress * 30)
-                g = int(200 - sub_progress * 20)
-                b = int(220 + sub_progress * 35)
-            elif progress < 0.66:  # 中部分：浅紫
-                sub_progress = (progress - 0.33) / 0.33
-                r = int(225 - sub_progress * 45)
-                g = int(180 + sub_progress * 20)
-                b = int(255 - sub_progress * 25)
-            else:  # 下部分：浅青
-                sub_progress = (progress - 0.66) / 0.34
-                r = int(180 - sub_progress * 30)
-                g = int(200 + sub_progress * 55)
-                b = int(230 + sub_progress * 25)
-                
-            color = (r, g, b)
-            pygame.draw.line(self.surface, color, (0, y), (WINDOW_WIDTH, y))
+        # 三段式渐变：浅粉 -> 浅紫 -> 浅青
+        self.surface.blit(layers.gradient((WINDOW_WIDTH, WINDOW_HEIGHT), [(255, 200, 220), (225, 180, 255), (180, 200, 230), (150, 255, 255)]), (0, 0))
         
         # 添加糖果马卡龙风格的波浪图案
         wave_colors = [
@@ -868,13 +822,12 @@ class SokobanGame:
             self.surface.blit(glow_surface, (glow_x - glow_radius, glow_y - glow_radius))
         
         # 更新和绘制雪花粒子
-        for particle in self.snow_particles:
-            particle.update()
-            particle.draw(self.surface)
+        self.snow_particles.update()
+        self.snow_particles.draw(self.surface)
 
         # 绘制糖果马卡龙风格的标题
-        title_font = pygame.font.Font(FONT_NAME, 60)  # 更大的字体
-        title_text = title_font.render("推箱子游戏", True, (255, 105, 180))  # 粉色标题
+        title_font = get_font(FONT_NAME, 60)  # 更大的字体
+        title_text = render_text(title_font, "推箱子游戏", True, (255, 105, 180))  # 粉色标题
         title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, 100))
         
         # 添加多层次的标题光晕
@@ -909,7 +862,7 @@ class SokobanGame:
             offset = (i + 1) * 2
             shadow_rect = title_rect.copy()
             shadow_rect.move_ip(offset, offset)
-            shadow_text = title_font.render("推箱子游戏", True, color)
+            shadow_text = render_text(title_font, "推箱子游戏", True, color)
             self.surface.blit(shadow_text, shadow_rect)
         
         # 标题文本
@@ -1105,11 +1058,11 @@ class SokobanGame:
                         pygame.draw.rect(self.surface, highlight_color, highlight_rect)
 
             # 绘制关卡号带阴影（放在缩略图正上方）
-            level_text = self.font.render(str(i + 1), True, COLORS['text'])
+            level_text = render_text(self.font, str(i + 1), True, COLORS['text'])
             level_rect = level_text.get_rect(center=(rect.centerx, y + thumbnail_offset_y - 20))
             shadow_level_rect = level_rect.copy()
             shadow_level_rect.move_ip(1, 1)
-            shadow_level_text = self.font.render(str(i + 1), True, (200, 200, 200))
+            shadow_level_text = render_text(self.font, str(i + 1), True, (200, 200, 200))
             self.surface.blit(shadow_level_text, shadow_level_rect)
             self.surface.blit(level_text, level_rect)
 
@@ -1189,12 +1142,12 @@ class SokobanGame:
             pygame.draw.polygon(self.surface, (255, 255, 255), arrow_points)
         
         # 页码显示 - 糖果风格
-        page_font = pygame.font.Font(FONT_NAME, 24)
-        page_text = page_font.render(f"{self.current_page}/{self.total_pages}", True, (255, 105, 180))
+        page_font = get_font(FONT_NAME, 24)
+        page_text = render_text(page_font, f"{self.current_page}/{self.total_pages}", True, (255, 105, 180))
         page_rect = page_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 80))
         
         # 页码阴影
-        shadow_text = page_font.render(f"{self.current_page}/{self.total_pages}", True, (150, 100, 150))
+        shadow_text = render_text(page_font, f"{self.current_page}/{self.total_pages}", True, (150, 100, 150))
         shadow_rect = page_rect.copy()
         shadow_rect.move_ip(2, 2)
         self.surface.blit(shadow_text, shadow_rect)
@@ -1326,26 +1279,18 @@ class SokobanGame:
         )
         pygame.draw.rect(self.surface, back_color, door_rect)
 
-    def draw_playing(self):
-        """绘制游戏界面"""
-        # 绘制现代化渐变背景
+    def draw_playing_background(self, surface):
+        """绘制游戏界面不会动的背景（渐变、网格、装饰圆、顶部光晕），由 layers 缓存"""
         # 创建从浅蓝到深蓝的多层次渐变背景
-        for y in range(WINDOW_HEIGHT):
-            # 主渐变 - 从顶部到底部
-            progress = y / WINDOW_HEIGHT
-            r = int(240 - progress * 20)
-            g = int(245 - progress * 15)
-            b = int(255 - progress * 5)
-            color = (r, g, b)
-            pygame.draw.line(self.surface, color, (0, y), (WINDOW_WIDTH, y))
+        surface.blit(layers.gradient((WINDOW_WIDTH, WINDOW_HEIGHT), [(240, 245, 255), (220, 230, 250)]), (0, 0))
         
         # 添加网格图案
         grid_size = 40
         grid_color = (230, 240, 255, 30)  # 非常淡的蓝色
         for x in range(0, WINDOW_WIDTH, grid_size):
-            pygame.draw.line(self.surface, grid_color, (x, 0), (x, WINDOW_HEIGHT))
+            pygame.draw.line(surface, grid_color, (x, 0), (x, WINDOW_HEIGHT))
         for y in range(0, WINDOW_HEIGHT, grid_size):
-            pygame.draw.line(self.surface, grid_color, (0, y), (WINDOW_WIDTH, y))
+            pygame.draw.line(surface, grid_color, (0, y), (WINDOW_WIDTH, y))
         
         # 添加装饰性圆形
         for i in range(5):  # 添加5个装饰圆
@@ -1357,7 +1302,7 @@ class SokobanGame:
             # 创建一个带有alpha通道的surface来绘制圆形
             circle_surface = pygame.Surface((circle_radius*2, circle_radius*2), pygame.SRCALPHA)
             pygame.draw.circle(circle_surface, circle_color, (circle_radius, circle_radius), circle_radius)
-            self.surface.blit(circle_surface, (circle_x - circle_radius, circle_y - circle_radius))
+            surface.blit(circle_surface, (circle_x - circle_radius, circle_y - circle_radius))
         
         # 添加顶部光晕
         glow_radius = 300
@@ -1369,10 +1314,15 @@ class SokobanGame:
         for r in range(glow_radius, 0, -2):  # 从外到内绘制同心半圆
             alpha = max(0, min(255, int(20 - (glow_radius - r) * 0.1)))
             pygame.draw.circle(glow_surface, (255, 255, 255, alpha), (glow_radius, 0), r)
-        self.surface.blit(glow_surface, (glow_x - glow_radius, glow_y))
+        surface.blit(glow_surface, (glow_x - glow_radius, glow_y))
+
+    def draw_playing(self):
+        """绘制游戏界面"""
+        # 绘制现代化渐变背景
+        self.surface.blit(layers.get_layer('sokoban', (WINDOW_WIDTH, WINDOW_HEIGHT), self.draw_playing_background), (0, 0))
 
         # 绘制标题和关卡信息带阴影和光晕
-        title_text = self.font.render(f"推箱子 - 关卡 {self.current_level}", True, COLORS['text'])
+        title_text = render_text(self.font, f"推箱子 - 关卡 {self.current_level}", True, COLORS['text'])
         title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, 50))
         
         # 添加标题光晕
@@ -1387,7 +1337,7 @@ class SokobanGame:
         # 标题阴影
         shadow_title_rect = title_rect.copy()
         shadow_title_rect.move_ip(2, 2)
-        shadow_title_text = self.font.render(f"推箱子 - 关卡 {self.current_level}", True, (150, 150, 180))
+        shadow_title_text = render_text(self.font, f"推箱子 - 关卡 {self.current_level}", True, (150, 150, 180))
         self.surface.blit(shadow_title_text, shadow_title_rect)
         
         # 标题文本
@@ -1399,12 +1349,12 @@ class SokobanGame:
         pygame.draw.rect(self.surface, COLORS['primary_light'], stats_bg, 2, border_radius=10)
 
         # 绘制步数
-        moves_text = self.small_font.render(f"步数: {self.moves}", True, COLORS['text_small'])
+        moves_text = render_text(self.small_font, f"步数: {self.moves}", True, COLORS['text_small'])
         self.surface.blit(moves_text, (50, 50))
 
         # 绘制最佳步数
         best_move = self.best_moves.get(str(self.current_level), "--")
-        best_text = self.small_font.render(f"最佳: {best_move}", True, COLORS['text_small'])
+        best_text = render_text(self.small_font, f"最佳: {best_move}", True, COLORS['text_small'])
         self.surface.blit(best_text, (50, 80))
 
         # 绘制撤销按钮
@@ -1417,7 +1367,7 @@ class SokobanGame:
         else:
             pygame.draw.rect(self.surface, COLORS['button_bg'], self.undo_button_rect, border_radius=5)
             pygame.draw.rect(self.surface, COLORS['button_border'], self.undo_button_rect, 2, border_radius=5)
-        undo_text = self.small_font.render("撤销", True, COLORS['text'])
+        undo_text = render_text(self.small_font, "撤销", True, COLORS['text'])
         undo_rect_text = undo_text.get_rect(center=self.undo_button_rect.center)
         self.surface.blit(undo_text, undo_rect_text)
 
@@ -1430,7 +1380,7 @@ class SokobanGame:
         else:
             pygame.draw.rect(self.surface, COLORS['button_bg'], self.activity_back_rect, border_radius=5)
             pygame.draw.rect(self.surface, COLORS['button_border'], self.activity_back_rect, 2, border_radius=5)
-        activity_back_text = self.small_font.render("活动页面", True, COLORS['text'])
+        activity_back_text = render_text(self.small_font, "活动页面", True, COLORS['text'])
         activity_back_rect_text = activity_back_text.get_rect(center=self.activity_back_rect.center)
         self.surface.blit(activity_back_text, activity_back_rect_text)
 
@@ -1443,7 +1393,7 @@ class SokobanGame:
         else:
             pygame.draw.rect(self.surface, COLORS['button_bg'], self.level_select_button_rect, border_radius=5)
             pygame.draw.rect(self.surface, COLORS['button_border'], self.level_select_button_rect, 2, border_radius=5)
-        level_select_text = self.small_font.render("选择关卡", True, COLORS['text'])
+        level_select_text = render_text(self.small_font, "选择关卡", True, COLORS['text'])
         level_select_rect_text = level_select_text.get_rect(center=self.level_select_button_rect.center)
         self.surface.blit(level_select_text, level_select_rect_text)
 
@@ -1863,7 +1813,7 @@ class SokobanGame:
         # 绘制操作提示 - 半透明背景
         hint_bg = pygame.Rect(WINDOW_WIDTH//2 - 250, WINDOW_HEIGHT - 40, 500, 30)
         pygame.draw.rect(self.surface, (255, 255, 255, 150), hint_bg, border_radius=15)
-        hint_text = self.very_small_font.render("方向键移动, R键重置, Ctrl+Z撤销, ESC返回关卡选择", True, COLORS['text_small'])
+        hint_text = render_text(self.very_small_font, "方向键移动, R键重置, Ctrl+Z撤销, ESC返回关卡选择", True, COLORS['text_small'])
         hint_rect = hint_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT - 25))
         self.surface.blit(hint_text, hint_rect)
 
@@ -1875,16 +1825,16 @@ class SokobanGame:
         self.surface.blit(s, (0, 0))
 
         # 绘制胜利信息带阴影
-        win_text = self.font.render("恭喜过关!", True, COLORS['text'])
+        win_text = render_text(self.font, "恭喜过关!", True, COLORS['text'])
         win_rect = win_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 100))
         shadow_win_rect = win_rect.copy()
         shadow_win_rect.move_ip(3, 3)
-        shadow_win_text = self.font.render("恭喜过关!", True, (200, 200, 200))
+        shadow_win_text = render_text(self.font, "恭喜过关!", True, (200, 200, 200))
         self.surface.blit(shadow_win_text, shadow_win_rect)
         self.surface.blit(win_text, win_rect)
 
         # 绘制步数信息
-        moves_text = self.small_font.render(f"您用了 {self.moves} 步", True, COLORS['text_small'])
+        moves_text = render_text(self.small_font, f"您用了 {self.moves} 步", True, COLORS['text_small'])
         moves_rect = moves_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 40))
         self.surface.blit(moves_text, moves_rect)
 
@@ -1900,7 +1850,7 @@ class SokobanGame:
         else:
             pygame.draw.rect(self.surface, COLORS['button_bg'], self.next_level_rect, border_radius=10)
             pygame.draw.rect(self.surface, COLORS['button_border'], self.next_level_rect, 2, border_radius=10)
-        next_level_text = self.small_font.render("下一关", True, COLORS['text'])
+        next_level_text = render_text(self.small_font, "下一关", True, COLORS['text'])
         next_level_rect_text = next_level_text.get_rect(center=self.next_level_rect.center)
         self.surface.blit(next_level_text, next_level_rect_text)
 
@@ -1913,7 +1863,7 @@ class SokobanGame:
         else:
             pygame.draw.rect(self.surface, COLORS['button_bg'], self.back_to_level_rect, border_radius=10)
             pygame.draw.rect(self.surface, COLORS['button_border'], self.back_to_level_rect, 2, border_radius=10)
-        back_to_level_text = self.small_font.render("关卡选择", True, COLORS['text'])
+        back_to_level_text = render_text(self.small_font, "关卡选择", True, COLORS['text'])
         back_to_level_rect_text = back_to_level_text.get_rect(center=self.back_to_level_rect.center)
         self.surface.blit(back_to_level_text, back_to_level_rect_text)
 
@@ -1926,7 +1876,7 @@ class SokobanGame:
         else:
             pygame.draw.rect(self.surface, COLORS['button_bg'], self.activity_back_rect, border_radius=5)
             pygame.draw.rect(self.surface, COLORS['button_border'], self.activity_back_rect, 2, border_radius=5)
-        activity_back_text = self.small_font.render("活动页面", True, COLORS['text'])
+        activity_back_text = render_text(self.small_font, "活动页面", True, COLORS['text'])
         activity_back_rect_text = activity_back_text.get_rect(center=self.activity_back_rect.center)
         self.surface.blit(activity_back_text, activity_back_rect_text)
 
@@ -3,13 +3,14 @@ import time
 import math
 import random
 from game.constants import WINDOW_WIDTH, WINDOW_HEIGHT, FONT_NAME
+from game.fonts import get_font, render_text
 
 class SplashScreen:
     def __init__(self, screen):
         self.screen = screen
-        self.font_large = pygame.font.Font(FONT_NAME, 72)
-        self.font_medium = pygame.font.Font(FONT_NAME, 28)
-        self.font_small = pygame.font.Font(FONT_NAME, 18)
+        self.font_large = get_font(FONT_NAME, 72)
+        self.font_medium = get_font(FONT_NAME, 28)
+        self.font_small = get_font(FONT_NAME, 18)
         self.clock = pygame.time.Clock()
         self.start_time = time.time()
         self.duration = 3.5  # 延长启动画面持续时间
@@ -264,14 +265,14 @@ class SplashScreen:
                 glow_surface = self.font_large.render(title_text, True, (100, 150, 255))
                 glow_surface.set_alpha(alpha // (i*2))
                 glow_size = int(72 * title_scale) + i*2
-                glow_font = pygame.font.Font(FONT_NAME, glow_size)
+                glow_font = get_font(FONT_NAME, glow_size)
                 glow_surface = glow_font.render(title_text, True, (100, 150, 255))
                 glow_surface.set_alpha(alpha // (i*2))
                 glow_rect = glow_surface.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 120 + title_y_offset))
                 self.screen.blit(glow_surface, glow_rect)
             
             # 绘制主标题
-            title_font = pygame.font.Font(FONT_NAME, int(72 * title_scale))
+            title_font = get_font(FONT_NAME, int(72 * title_scale))
             title_surface = title_font.render(title_text, True, (255, 255, 255))
             title_surface.set_alpha(alpha)
             title_rect = title_surface.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 120 + title_y_offset))
@@ -287,7 +288,7 @@ class SplashScreen:
             if progress > 0.2:
                 subtitle_alpha = min(255, int((progress - 0.2) * 255 / 0.3))
                 subtitle_text = "多种游戏模式 · 丰富皮肤 · 精彩挑战"
-                subtitle_font = pygame.font.Font(FONT_NAME, 24)
+                subtitle_font = get_font(FONT_NAME, 24)
                 subtitle_surface = subtitle_font.render(subtitle_text, True, (220, 220, 255))
                 subtitle_surface.set_alpha(subtitle_alpha)
                 subtitle_rect = subtitle_surface.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT//2 - 60 + title_y_offset))
@@ -406,8 +407,8 @@ class SplashScreen:
             # 添加进度百分比显示
             percent = int(min(progress / 0.9, 1.0) * 100)
             percent_text = f"{percent}%"
-            percent_font = pygame.font.Font(FONT_NAME, 16)
-            percent_surface = percent_font.render(percent_text, True, (220, 220, 240))
+            percent_font = get_font(FONT_NAME, 16)
+            percent_surface = render_text(percent_font, percent_text, True, (220, 220, 240))
             percent_rect = percent_surface.get_rect(midright=(bar_x + bar_width + 30, bar_y + bar_height//2))
             self.screen.blit(percent_surface, percent_rect)
         
@@ -415,7 +416,7 @@ class SplashScreen:
         if progress < 0.9:
             # 加载文本
             loading_text = "游戏加载中..."
-            loading_surface = self.font_medium.render(loading_text, True, (220, 220, 240))
+            loading_surface = render_text(self.font_medium, loading_text, True, (220, 220, 240))
             loading_rect = loading_surface.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT - 70))
             self.screen.blit(loading_surface, loading_rect)
             
@@ -438,13 +439,13 @@ class SplashScreen:
             # 显示"按任意键继续"，带有脉动效果
             continue_text = "按任意键继续"
             pulse = 0.7 + 0.3 * math.sin(elapsed * 5)
-            continue_font = pygame.font.Font(FONT_NAME, int(28 * pulse))
-            continue_surface = continue_font.render(continue_text, True, (255, 255, 255))
+            continue_font = get_font(FONT_NAME, int(28 * pulse))
+            continue_surface = render_text(continue_font, continue_text, True, (255, 255, 255))
             continue_rect = continue_surface.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT - 70))
             
             # 添加发光效果
             for i in range(3, 0, -1):
-                glow = pygame.font.Font(FONT_NAME, int(28 * pulse) + i*2)
+                glow = get_font(FONT_NAME, int(28 * pulse) + i*2)
                 glow_surface = glow.render(continue_text, True, (100, 150, 255))
                 glow_surface.set_alpha(100 - i*30)
                 glow_rect = glow_surface.get_rect(center=(WINDOW_WIDTH//2, WINDOW_HEIGHT - 70))
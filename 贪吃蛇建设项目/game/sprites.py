@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+预先画好的小图（精灵）缓存
+泡泡、发光、阴影这类每帧都要画、但外观只取决于少数几个参数的图形，按参数组成的 key 只画一次，
+以后每帧直接 blit，绘制时不再创建新的 Surface。按最近使用淘汰（LRU），上限为 SPRITE_CACHE_SIZE。
+返回的 Surface 是共享的：不要在上面绘制；需要整体透明度时在 blit 前调用 set_alpha（每次使用前都要重新设置）。
+"""
+from collections import OrderedDict
+import pygame
+from .constants import SPRITE_CACHE_SIZE
+
+class SpriteCache:
+    """key -> 预先画好的 Surface 的 LRU 缓存"""
+
+    def __init__(self, max_size=SPRITE_CACHE_SIZE):
+        self.max_size = max_size
+        self._sprites = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, build, *args):
+        """取得 key 对应的精灵，没有时调用 build(*args) 画出来（有窗口时转换成显示格式）"""
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            self.hits += 1
+            return sprite
+        self.misses += 1
+        sprite = build(*args)
+        if pygame.display.get_surface():
+            sprite = sprite.convert_alpha()
+        self._sprites[key] = sprite
+        if len(self._sprites) > self.max_size:
+            self._sprites.popitem(last=False)
+        return sprite
+
+    def clear(self):
+        self._sprites.clear()
+
+sprite_cache = SpriteCache()
+
+def get_sprite(key, build, *args):
+    """带缓存的 build(*args)，同一个 key 只画一次"""
+    return sprite_cache.get(key, build, *args)
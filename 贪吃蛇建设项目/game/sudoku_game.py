@@ -2,6 +2,8 @@ import pygame
 import random
 import time
 from .constants import *
+from .fonts import get_font, render_text
+from . import layers
 
 class SudokuGame:
     def __init__(self, surface, parent):
@@ -12,9 +14,9 @@ class SudokuGame:
         self.board = self.generate_board()
         self.original_board = [row[:] for row in self.board]
         self.selected_cell = None
-        self.font = pygame.font.Font(FONT_NAME, 36)
-        self.small_font = pygame.font.Font(FONT_NAME, 20)
-        self.note_font = pygame.font.Font(FONT_NAME, 12)  # 注释字体
+        self.font = get_font(FONT_NAME, 36)
+        self.small_font = get_font(FONT_NAME, 20)
+        self.note_font = get_font(FONT_NAME, 12)  # 注释字体
         self.error_count = 0
         self.start_time = time.time()
         self.difficulty = 3  # 1-5，默认为3
@@ -135,15 +137,11 @@ class SudokuGame:
 
     def draw(self):
         # 绘制背景
-        grad = pygame.Surface((self.window_width, self.window_height), pygame.SRCALPHA)
-        for y in range(self.window_height):
-            c = 245 - int(60 * y / self.window_height)
-            pygame.draw.line(grad, (c, c+8, 255, 255), (0, y), (self.window_width, y))
-        self.surface.blit(grad, (0, 0))
+        self.surface.blit(layers.gradient((self.window_width, self.window_height), [(245, 253, 255), (185, 193, 255)]), (0, 0))
         
         # 绘制标题
-        title_font = pygame.font.Font(FONT_NAME, 40)
-        title_text = title_font.render("数独挑战", True, (66, 165, 245))
+        title_font = get_font(FONT_NAME, 40)
+        title_text = render_text(title_font, "数独挑战", True, (66, 165, 245))
         title_rect = title_text.get_rect(center=(self.window_width // 2, 100))
         self.surface.blit(title_text, title_rect)
         
@@ -196,14 +194,14 @@ class SudokuGame:
                 if self.show_solution and self.solution_board:
                     # 显示解决方案
                     color = (0, 150, 0) if self.original_board[i][j] == 0 else (0, 0, 0)
-                    text = self.font.render(str(self.solution_board[i][j]), True, color)
+                    text = render_text(self.font, str(self.solution_board[i][j]), True, color)
                     text_rect = text.get_rect(center=rect.center)
                     self.surface.blit(text, text_rect)
                 elif self.board[i][j] != 0:
                     # 检查是否为错误
                     is_error = self.show_errors and self.original_board[i][j] == 0 and not self.is_safe(self.board, i, j, self.board[i][j])
                     color = (200, 0, 0) if is_error else ((0, 0, 0) if self.original_board[i][j] != 0 else (66, 165, 245))
-                    text = self.font.render(str(self.board[i][j]), True, color)
+                    text = render_text(self.font, str(self.board[i][j]), True, color)
                     text_rect = text.get_rect(center=rect.center)
                     self.surface.blit(text, text_rect)
                 # 显示注释
@@ -215,7 +213,7 @@ class SudokuGame:
                     for idx, num in enumerate(self.notes[i][j]):
                         x_offset = (idx % 3) * (self.cell_size // 3) + 5
                         y_offset = (idx // 3) * (self.cell_size // 3) + 2
-                        note_text = self.note_font.render(str(num), True, (100, 100, 100))
+                        note_text = render_text(self.note_font, str(num), True, (100, 100, 100))
                         self.surface.blit(note_text, (rect.x + x_offset, rect.y + y_offset))
                     
                     # 重新绘制单元格边框
@@ -246,14 +244,14 @@ class SudokuGame:
         # 返回按钮
         pygame.draw.rect(self.surface, (220, 220, 220), self.back_button_rect, border_radius=5)
         pygame.draw.rect(self.surface, (0, 0, 0), self.back_button_rect, 2, border_radius=5)
-        back_text = self.small_font.render("返回", True, (0, 0, 0))
+        back_text = render_text(self.small_font, "返回", True, (0, 0, 0))
         back_text_rect = back_text.get_rect(center=self.back_button_rect.center)
         self.surface.blit(back_text, back_text_rect)
         
         # 绘制重置按钮
         pygame.draw.rect(self.surface, (220, 220, 220), self.reset_button_rect, border_radius=5)
         pygame.draw.rect(self.surface, (0, 0, 0), self.reset_button_rect, 2, border_radius=5)
-        reset_text = self.small_font.render("重置", True, (0, 0, 0))
+        reset_text = render_text(self.small_font, "重置", True, (0, 0, 0))
         reset_text_rect = reset_text.get_rect(center=self.reset_button_rect.center)
         self.surface.blit(reset_text, reset_text_rect)
         
@@ -261,54 +259,54 @@ class SudokuGame:
         note_color = (255, 215, 0) if self.note_mode else (220, 220, 220)
         pygame.draw.rect(self.surface, note_color, self.note_button_rect, border_radius=5)
         pygame.draw.rect(self.surface, (0, 0, 0), self.note_button_rect, 2, border_radius=5)
-        note_text = self.small_font.render("注释", True, (0, 0, 0))
+        note_text = render_text(self.small_font, "注释", True, (0, 0, 0))
         note_text_rect = note_text.get_rect(center=self.note_button_rect.center)
         self.surface.blit(note_text, note_text_rect)
         
         # 绘制提交按钮
         pygame.draw.rect(self.surface, (100, 200, 255), self.submit_button_rect, border_radius=5)
         pygame.draw.rect(self.surface, (0, 0, 0), self.submit_button_rect, 2, border_radius=5)
-        submit_text = self.small_font.render("提交", True, (0, 0, 0))
+        submit_text = render_text(self.small_font, "提交", True, (0, 0, 0))
         submit_text_rect = submit_text.get_rect(center=self.submit_button_rect.center)
         self.surface.blit(submit_text, submit_text_rect)
         
         # 绘制提示错误按钮
         pygame.draw.rect(self.surface, (255, 150, 150), self.hint_button_rect, border_radius=5)
         pygame.draw.rect(self.surface, (0, 0, 0), self.hint_button_rect, 2, border_radius=5)
-        hint_text = self.small_font.render("提示错误", True, (0, 0, 0))
+        hint_text = render_text(self.small_font, "提示错误", True, (0, 0, 0))
         hint_text_rect = hint_text.get_rect(center=self.hint_button_rect.center)
         self.surface.blit(hint_text, hint_text_rect)
         
         # 绘制显示答案按钮
         pygame.draw.rect(self.surface, (150, 255, 150), self.solution_button_rect, border_radius=5)
         pygame.draw.rect(self.surface, (0, 0, 0), self.solution_button_rect, 2, border_radius=5)
-        solution_text = self.small_font.render("显示答案", True, (0, 0, 0))
+        solution_text = render_text(self.small_font, "显示答案", True, (0, 0, 0))
         solution_text_rect = solution_text.get_rect(center=self.solution_button_rect.center)
         self.surface.blit(solution_text, solution_text_rect)
         
         # 绘制一键注释按钮
         pygame.draw.rect(self.surface, (200, 150, 255), self.auto_note_button_rect, border_radius=5)
         pygame.draw.rect(self.surface, (0, 0, 0), self.auto_note_button_rect, 2, border_radius=5)
-        auto_note_text = self.small_font.render("一键注释", True, (0, 0, 0))
+        auto_note_text = render_text(self.small_font, "一键注释", True, (0, 0, 0))
         auto_note_text_rect = auto_note_text.get_rect(center=self.auto_note_button_rect.center)
         self.surface.blit(auto_note_text, auto_note_text_rect)
 
         # 绘制删除按钮
         pygame.draw.rect(self.surface, (255, 100, 100), self.delete_button_rect, border_radius=5)
         pygame.draw.rect(self.surface, (0, 0, 0), self.delete_button_rect, 2, border_radius=5)
-        delete_text = self.small_font.render("删除", True, (0, 0, 0))
+        delete_text = render_text(self.small_font, "删除", True, (0, 0, 0))
         delete_text_rect = delete_text.get_rect(center=self.delete_button_rect.center)
         self.surface.blit(delete_text, delete_text_rect)
         
         # 难度按钮
-        difficulty_text = self.small_font.render("难度:", True, (0, 0, 0))
+        difficulty_text = render_text(self.small_font, "难度:", True, (0, 0, 0))
         self.surface.blit(difficulty_text, (self.window_width // 2 - 140, self.board_y + self.board_size + 70))
         
         for i in range(5):
             color = (100, 200, 255) if i + 1 == self.difficulty else (220, 220, 220)
             pygame.draw.rect(self.surface, color, self.difficulty_rects[i], border_radius=5)
             pygame.draw.rect(self.surface, (0, 0, 0), self.difficulty_rects[i], 2, border_radius=5)
-            diff_text = self.small_font.render(str(i + 1), True, (0, 0, 0))
+            diff_text = render_text(self.small_font, str(i + 1), True, (0, 0, 0))
             diff_text_rect = diff_text.get_rect(center=self.difficulty_rects[i].center)
             self.surface.blit(diff_text, diff_text_rect)        
         
@@ -323,7 +321,7 @@ class SudokuGame:
             pygame.draw.rect(self.surface, (255, 255, 255), msg_rect, border_radius=10)
             pygame.draw.rect(self.surface, (0, 0, 0), msg_rect, 2, border_radius=10)
             
-            msg_text = self.small_font.render(self.submit_message, True, (200, 0, 0) if "错误" in self.submit_message else (0, 150, 0))
+            msg_text = render_text(self.small_font, self.submit_message, True, (200, 0, 0) if "错误" in self.submit_message else (0, 150, 0))
             msg_text_rect = msg_text.get_rect(center=msg_rect.center)
             self.surface.blit(msg_text, msg_text_rect)
             
@@ -336,18 +334,18 @@ class SudokuGame:
             )
             pygame.draw.rect(self.surface, (100, 200, 255), ok_rect, border_radius=5)
             pygame.draw.rect(self.surface, (0, 0, 0), ok_rect, 2, border_radius=5)
-            ok_text = self.small_font.render("确定", True, (0, 0, 0))
+            ok_text = render_text(self.small_font, "确定", True, (0, 0, 0))
             ok_text_rect = ok_text.get_rect(center=ok_rect.center)
             self.surface.blit(ok_text, ok_text_rect)
 
     def draw_game_info(self):
         # 显示时间
         elapsed_time = int(time.time() - self.start_time)
-        time_text = self.small_font.render(f"时间: {elapsed_time}秒", True, (0, 0, 0))
+        time_text = render_text(self.small_font, f"时间: {elapsed_time}秒", True, (0, 0, 0))
         self.surface.blit(time_text, (self.board_x, self.board_y + self.board_size + 20))
         
         # 显示错误次数
-        error_text = self.small_font.render(f"错误: {self.error_count}", True, (0, 0, 0))
+        error_text = render_text(self.small_font, f"错误: {self.error_count}", True, (0, 0, 0))
         self.surface.blit(error_text, (self.board_x + self.board_size - 100, self.board_y + self.board_size + 20))
 
 
@@ -531,13 +529,13 @@ class SudokuGame:
         pygame.draw.rect(self.surface, (0, 0, 0), msg_rect, 2, border_radius=10)
         
         # 绘制失败消息文本
-        msg_font = pygame.font.Font(FONT_NAME, 36)
-        msg_text = msg_font.render("游戏失败！", True, (200, 0, 0))
+        msg_font = get_font(FONT_NAME, 36)
+        msg_text = render_text(msg_font, "游戏失败！", True, (200, 0, 0))
         msg_text_rect = msg_text.get_rect(center=(self.window_width // 2, self.window_height // 2 - 30))
         self.surface.blit(msg_text, msg_text_rect)
         
         # 显示错误次数
-        error_text = self.small_font.render(f"错误次数达到 {self.max_errors} 次", True, (0, 0, 0))
+        error_text = render_text(self.small_font, f"错误次数达到 {self.max_errors} 次", True, (0, 0, 0))
         error_text_rect = error_text.get_rect(center=(self.window_width // 2, self.window_height // 2 + 20))
         self.surface.blit(error_text, error_text_rect)
         
@@ -550,7 +548,7 @@ class SudokuGame:
         )
         pygame.draw.rect(self.surface, (100, 200, 255), retry_rect, border_radius=5)
         pygame.draw.rect(self.surface, (0, 0, 0), retry_rect, 2, border_radius=5)
-        retry_text = self.small_font.render("重新开始", True, (0, 0, 0))
+        retry_text = render_text(self.small_font, "重新开始", True, (0, 0, 0))
         retry_text_rect = retry_text.get_rect(center=retry_rect.center)
         self.surface.blit(retry_text, retry_text_rect)
         
@@ -563,7 +561,7 @@ class SudokuGame:
         )
         pygame.draw.rect(self.surface, (100, 200, 255), menu_rect, border_radius=5)
         pygame.draw.rect(self.surface, (0, 0, 0), menu_rect, 2, border_radius=5)
-        menu_text = self.small_font.render("返回菜单", True, (0, 0, 0))
+        menu_text = render_text(self.small_font, "返回菜单", True, (0, 0, 0))
         menu_text_rect = menu_text.get_rect(center=menu_rect.center)
         self.surface.blit(menu_text, menu_text_rect)
         
@@ -1,9 +1,11 @@
 import pygame
 import random
 import time
-import json
 import os
 from .constants import *
+from .fonts import get_font, render_text
+from . import layers
+from .player import player_data
 
 # 俄罗斯方块形状定义
 TETROMINOS = [
@@ -67,9 +69,9 @@ class TetrisGame:
         self.last_drop = time.time()
         
         # 字体
-        self.font_large = pygame.font.Font(FONT_NAME, 42)
-        self.font_medium = pygame.font.Font(FONT_NAME, 28)
-        self.font_small = pygame.font.Font(FONT_NAME, 20)
+        self.font_large = get_font(FONT_NAME, 42)
+        self.font_medium = get_font(FONT_NAME, 28)
+        self.font_small = get_font(FONT_NAME, 20)
         
         # 按键控制
         self.key_interval = 200  # 重复间隔
@@ -77,12 +79,11 @@ class TetrisGame:
         
     def load_high_score(self):
         """加载最高分"""
-        try:
-            with open('player_data.json', 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return data.get('tetris_high_score', 0)
-        except:
-            return 0
+        return player_data.get_int('tetris', 'high_score', 0)
+
+    def save_high_score(self):
+        """保存最高分"""
+        player_data.set_int('tetris', 'high_score', self.high_score)
     
     def start_game(self):
         """开始游戏"""
@@ -358,14 +359,8 @@ class TetrisGame:
     
     def draw_background(self):
         """绘制渐变背景"""
-        # 创建渐变背景
-        for y in range(WINDOW_HEIGHT):
-            # 从深蓝到黑色的渐变
-            ratio = y / WINDOW_HEIGHT
-            r = int(20 + (0 - 20) * ratio)
-            g = int(40 + (0 - 40) * ratio)
-            b = int(80 + (0 - 80) * ratio)
-            pygame.draw.line(self.surface, (r, g, b), (0, y), (WINDOW_WIDTH, y))
+        # 从深蓝到黑色的渐变
+        self.surface.blit(layers.gradient((WINDOW_WIDTH, WINDOW_HEIGHT), [(20, 40, 80), (0, 0, 0)]), (0, 0))
     
     def draw_grid(self):
         """绘制游戏网格"""
@@ -441,23 +436,23 @@ class TetrisGame:
         self.surface.blit(panel_surface, panel_rect)
         
         # 游戏标题
-        title_text = self.font_large.render("俄罗斯方块", True, (255, 255, 255))
+        title_text = render_text(self.font_large, "俄罗斯方块", True, (255, 255, 255))
         self.surface.blit(title_text, (panel_x + 20, panel_y + 20))
         
         # 分数
-        score_text = self.font_medium.render(f"分数: {self.score:,}", True, (255, 215, 0))
+        score_text = render_text(self.font_medium, f"分数: {self.score:,}", True, (255, 215, 0))
         self.surface.blit(score_text, (panel_x + 20, panel_y + 80))
         
         # 难度等级
-        difficulty_text = self.font_medium.render(f"难度: {DIFFICULTY_LEVELS[self.selected_difficulty]['name']}", True, (100, 200, 255))
+        difficulty_text = render_text(self.font_medium, f"难度: {DIFFICULTY_LEVELS[self.selected_difficulty]['name']}", True, (100, 200, 255))
         self.surface.blit(difficulty_text, (panel_x + 20, panel_y + 120))
         
         # 消除行数
-        lines_text = self.font_medium.render(f"消除行数: {self.lines_cleared}", True, (255, 100, 100))
+        lines_text = render_text(self.font_medium, f"消除行数: {self.lines_cleared}", True, (255, 100, 100))
         self.surface.blit(lines_text, (panel_x + 20, panel_y + 160))
         
         # 最高分
-        high_score_text = self.font_medium.render(f"最高分: {self.high_score:,}", True, (255, 255, 0))
+        high_score_text = render_text(self.font_medium, f"最高分: {self.high_score:,}", True, (255, 255, 0))
         self.surface.blit(high_score_text, (panel_x + 20, panel_y + 200))
         
         
@@ -476,7 +471,7 @@ class TetrisGame:
         self.surface.blit(right_panel_surface, right_panel_rect)
         
         # 下一个方块预览
-        preview_text = self.font_medium.render("下一个方块", True, (255, 255, 255))
+        preview_text = render_text(self.font_medium, "下一个方块", True, (255, 255, 255))
         self.surface.blit(preview_text, (right_panel_x + 20, right_panel_y + 20))
         
         # 绘制下一个方块预览
@@ -497,28 +492,7 @@ class TetrisGame:
     def draw_difficulty_select_screen(self):
         """绘制马卡龙风格的难度选择界面"""
         # 马卡龙风格渐变背景：浅粉 -> 浅紫 -> 浅青
-        for y in range(WINDOW_HEIGHT):
-            progress = y / WINDOW_HEIGHT
-            
-            # 三段式马卡龙渐变
-            if progress < 0.33:  # 上部分：浅粉色
-                sub_progress = progress / 0.33
-                r = int(255 - sub_progress * 35)  # 255 -> 220
-                g = int(182 + sub_progress * 18)  # 182 -> 200
-                b = int(193 + sub_progress * 32)  # 193 -> 225
-            elif progress < 0.66:  # 中部分：浅紫色
-                sub_progress = (progress - 0.33) / 0.33
-                r = int(220 - sub_progress * 50)  # 220 -> 170
-                g = int(200 + sub_progress * 20)  # 200 -> 220
-                b = int(225 + sub_progress * 30)  # 225 -> 255
-            else:  # 下部分：浅青色
-                sub_progress = (progress - 0.66) / 0.34
-                r = int(170 - sub_progress * 35)  # 170 -> 135
-                g = int(220 + sub_progress * 35)  # 220 -> 255
-                b = int(255 - sub_progress * 25)  # 255 -> 230
-                
-            color = (max(0, min(255, r)), max(0, min(255, g)), max(0, min(255, b)))
-            pygame.draw.line(self.surface, color, (0, y), (WINDOW_WIDTH, y))
+        self.surface.blit(layers.gradient((WINDOW_WIDTH, WINDOW_HEIGHT), [(255, 182, 193), (220, 200, 225), (170, 220, 255), (135, 255, 230)]), (0, 0))
         
         # 添加马卡龙风格的装饰气泡
         import math
@@ -589,7 +563,7 @@ class TetrisGame:
         self.surface.blit(title_bg_surface, title_bg_rect)
         
         # 主标题
-        title_text = title_font.render("俄罗斯方块", True, (120, 80, 120))
+        title_text = render_text(title_font, "俄罗斯方块", True, (120, 80, 120))
         title_rect = title_text.get_rect(center=(WINDOW_WIDTH // 2, title_y + 20))
         self.surface.blit(title_text, title_rect)
         
@@ -613,7 +587,7 @@ class TetrisGame:
         
         # 最高分文字
         high_score_font = self.font_small
-        high_score_text = high_score_font.render(f"🏆 最高分: {self.high_score:,}", True, (180, 120, 0))
+        high_score_text = render_text(high_score_font, f"🏆 最高分: {self.high_score:,}", True, (180, 120, 0))
         high_score_rect = high_score_text.get_rect(center=(WINDOW_WIDTH // 2, badge_y + 22))
         self.surface.blit(high_score_text, high_score_rect)
         
@@ -688,13 +662,13 @@ class TetrisGame:
             # 难度星级
             stars = "⭐" * i
             star_font = self.font_medium
-            star_text = star_font.render(stars, True, (255, 200, 0))
+            star_text = render_text(star_font, stars, True, (255, 200, 0))
             self.surface.blit(star_text, (card_x + 30, card_y + 16))
             
             # 难度名称 - 居中显示
             name_font = self.font_medium
             name_color = (80, 60, 80) if is_selected else (100, 80, 100)
-            name_text = name_font.render(difficulty['name'], True, name_color)
+            name_text = render_text(name_font, difficulty['name'], True, name_color)
             name_rect = name_text.get_rect(center=(card_x + card_width // 2, card_y + card_height // 2))
             self.surface.blit(name_text, name_rect)
             
@@ -732,7 +706,7 @@ class TetrisGame:
         
         # 按钮文字
         button_font = self.font_medium
-        button_text = button_font.render("返回活动页面", True, (120, 80, 120))
+        button_text = render_text(button_font, "返回活动页面", True, (120, 80, 120))
         button_rect = button_text.get_rect(center=(WINDOW_WIDTH // 2, button_y + 25))
         self.surface.blit(button_text, button_rect)
     
@@ -750,15 +724,15 @@ class TetrisGame:
         pygame.draw.rect(pause_surface, (255, 255, 255, 50), (0, 0, 400, 300), 3, border_radius=20)
         self.surface.blit(pause_surface, pause_panel)
         
-        pause_text = self.font_large.render("游戏暂停", True, (255, 255, 255))
+        pause_text = render_text(self.font_large, "游戏暂停", True, (255, 255, 255))
         pause_rect = pause_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 80))
         self.surface.blit(pause_text, pause_rect)
         
-        continue_text = self.font_medium.render("按空格键继续", True, (255, 255, 255))
+        continue_text = render_text(self.font_medium, "按空格键继续", True, (255, 255, 255))
         continue_rect = continue_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
         self.surface.blit(continue_text, continue_rect)
         
-        exit_text = self.font_medium.render("按ESC键退出", True, (255, 255, 255))
+        exit_text = render_text(self.font_medium, "按ESC键退出", True, (255, 255, 255))
         exit_rect = exit_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 80))
         self.surface.blit(exit_text, exit_rect)
     
@@ -776,33 +750,33 @@ class TetrisGame:
         pygame.draw.rect(game_over_surface, (255, 0, 0, 100), (0, 0, 500, 400), 4, border_radius=25)
         self.surface.blit(game_over_surface, game_over_panel)
         
-        game_over_text = self.font_large.render("游戏结束", True, (255, 0, 0))
+        game_over_text = render_text(self.font_large, "游戏结束", True, (255, 0, 0))
         game_over_rect = game_over_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 120))
         self.surface.blit(game_over_text, game_over_rect)
         
-        final_score_text = self.font_medium.render(f"最终分数: {self.score:,}", True, (255, 215, 0))
+        final_score_text = render_text(self.font_medium, f"最终分数: {self.score:,}", True, (255, 215, 0))
         final_score_rect = final_score_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 80))
         self.surface.blit(final_score_text, final_score_rect)
         
         # 显示是否破纪录
         if self.score > self.high_score:
-            new_record_text = self.font_medium.render("新纪录！", True, (255, 255, 0))
+            new_record_text = render_text(self.font_medium, "新纪录！", True, (255, 255, 0))
             new_record_rect = new_record_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 40))
             self.surface.blit(new_record_text, new_record_rect)
         
-        final_difficulty_text = self.font_medium.render(f"难度: {DIFFICULTY_LEVELS[self.selected_difficulty]['name']}", True, (100, 200, 255))
+        final_difficulty_text = render_text(self.font_medium, f"难度: {DIFFICULTY_LEVELS[self.selected_difficulty]['name']}", True, (100, 200, 255))
         final_difficulty_rect = final_difficulty_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
         self.surface.blit(final_difficulty_text, final_difficulty_rect)
         
-        final_lines_text = self.font_medium.render(f"消除行数: {self.lines_cleared}", True, (255, 100, 100))
+        final_lines_text = render_text(self.font_medium, f"消除行数: {self.lines_cleared}", True, (255, 100, 100))
         final_lines_rect = final_lines_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 40))
         self.surface.blit(final_lines_text, final_lines_rect)
         
-        restart_text = self.font_medium.render("按R键重新开始", True, (255, 255, 255))
+        restart_text = render_text(self.font_medium, "按R键重新开始", True, (255, 255, 255))
         restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 80))
         self.surface.blit(restart_text, restart_rect)
         
-        exit_text = self.font_medium.render("按ESC键退出", True, (255, 255, 255))
+        exit_text = render_text(self.font_medium, "按ESC键退出", True, (255, 255, 255))
         exit_rect = exit_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 120))
         self.surface.blit(exit_text, exit_rect)
     
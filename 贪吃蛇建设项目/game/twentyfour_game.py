@@ -2,6 +2,7 @@ import pygame
 import random
 import math
 from .constants import *
+from .fonts import get_font, render_text
 from .ui_elements import Button
 from .player import player_data
 
@@ -324,18 +325,18 @@ class TwentyFourPage:
         # 标题
         left_margin = win_rect.x + 60
         y_cursor = 40
-        font = pygame.font.Font(FONT_NAME, 54)
-        title_shadow = font.render('24点游戏', True, (0,0,0))
+        font = get_font(FONT_NAME, 54)
+        title_shadow = render_text(font, '24点游戏', True, (0,0,0))
         title_rect = title_shadow.get_rect(topleft=(left_margin+2, y_cursor+2))
         self.surface.blit(title_shadow, title_rect)
-        title_text = font.render('24点游戏', True, (255,87,34))
+        title_text = render_text(font, '24点游戏', True, (255,87,34))
         title_rect_fg = title_text.get_rect(topleft=(left_margin, y_cursor))
         self.surface.blit(title_text, title_rect_fg)
         y_cursor = title_rect_fg.bottom
 
         # 简短提示（紧随标题下方）
-        sub_font = pygame.font.Font(FONT_NAME, 22)
-        tip = sub_font.render('选择两张牌后点运算符；也支持三/四张牌的加法或乘法合成', True, (255,255,255))
+        sub_font = get_font(FONT_NAME, 22)
+        tip = render_text(sub_font, '选择两张牌后点运算符；也支持三/四张牌的加法或乘法合成', True, (255,255,255))
         tip_bg = pygame.Surface((tip.get_width()+20, tip.get_height()+12), pygame.SRCALPHA)
         pygame.draw.rect(tip_bg, (0,0,0,100), tip_bg.get_rect(), border_radius=10)
         tip_pos = (left_margin-2, y_cursor + 10)
@@ -344,9 +345,9 @@ class TwentyFourPage:
         y_cursor = tip_pos[1] + tip_bg.get_height()
 
         # 顶部右侧：金币、进度与得分
-        info_font = pygame.font.Font(FONT_NAME, 28)
+        info_font = get_font(FONT_NAME, 28)
         coins = player_data.get_coins()
-        info_text = info_font.render(f'金币 {coins}｜已解 {self.solved_count}｜得分 {self.score}', True, (255,255,255))
+        info_text = render_text(info_font, f'金币 {coins}｜已解 {self.solved_count}｜得分 {self.score}', True, (255,255,255))
         info_rect = info_text.get_rect()
         pill_w, pill_h = info_rect.width + 28, info_rect.height + 12
         pill_x, pill_y = win_rect.right - pill_w - 40, 42
@@ -391,8 +392,8 @@ class TwentyFourPage:
                    timer_cy + (timer_radius-4) * math.sin(math.radians(angle)))
             pygame.draw.line(self.surface, c, start, end, 3)
         # 中心数字
-        tfont = pygame.font.Font(FONT_NAME, 24)
-        tnum = tfont.render(str(remain_sec), True, (255, 87, 34))
+        tfont = get_font(FONT_NAME, 24)
+        tnum = render_text(tfont, str(remain_sec), True, (255, 87, 34))
         trect = tnum.get_rect(center=(timer_cx, timer_cy))
         self.surface.blit(tnum, trect)
         # 时间到则提示并切换
@@ -403,7 +404,7 @@ class TwentyFourPage:
         # （移除旧的统计渐变条，避免与提示重叠）
         
         # 卡片区
-        card_font = pygame.font.Font(FONT_NAME, 72)
+        card_font = get_font(FONT_NAME, 72)
         card_w, card_h = int(win_rect.width*0.15), int(win_rect.height*0.18)
         card_gap = int(win_rect.width*0.05)
         total_cards_w = card_w * len(self.cards) + card_gap * (len(self.cards)-1)
@@ -449,7 +450,7 @@ class TwentyFourPage:
             card_surface.blit(highlight, (4, 4))
             
             # 绘制数字
-            text = card_font.render(str(card), True, (255, 87, 34))
+            text = render_text(card_font, str(card), True, (255, 87, 34))
             text_rect = text.get_rect(center=(card_w//2, card_h//2))
             card_surface.blit(text, text_rect)
             
@@ -489,8 +490,8 @@ class TwentyFourPage:
             self.surface.blit(scaled_glow, (scaled_result_x, scaled_result_y))
             
             # 绘制操作符
-            op_font = pygame.font.Font(FONT_NAME, 48)
-            op_text = op_font.render(self.operators[self.selected_op], True, (255, 87, 34))
+            op_font = get_font(FONT_NAME, 48)
+            op_text = render_text(op_font, self.operators[self.selected_op], True, (255, 87, 34))
             op_text_rect = op_text.get_rect(center=(scaled_result_x + scaled_result_w//2, 
                                                     scaled_result_y + scaled_result_h//2))
             self.surface.blit(op_text, op_text_rect)
@@ -498,8 +499,8 @@ class TwentyFourPage:
         
         # 结果展示
         if self.result is not None:
-            result_font = pygame.font.Font(FONT_NAME, 48)
-            result_text = result_font.render(f'结果: {self.result}', True, (255, 87, 34))
+            result_font = get_font(FONT_NAME, 48)
+            result_text = render_text(result_font, f'结果: {self.result}', True, (255, 87, 34))
             result_rect = result_text.get_rect()
             result_rect.midtop = (win_rect.centerx, flow_y + 12)
             
@@ -522,11 +523,11 @@ class TwentyFourPage:
 
         # 提示文本显示（多方案循环展示，跟随内容流）
         if getattr(self, 'hint_text', ''):
-            hint_font = pygame.font.Font(FONT_NAME, 28)
+            hint_font = get_font(FONT_NAME, 28)
             page_info = ''
             if self.hint_solutions:
                 page_info = f'  ({self.hint_index+1}/{len(self.hint_solutions)})'
-            hint_surf = hint_font.render(f'提示：{self.hint_text}{page_info}', True, (255, 213, 79))
+            hint_surf = render_text(hint_font, f'提示：{self.hint_text}{page_info}', True, (255, 213, 79))
             hint_bg = pygame.Surface((hint_surf.get_width()+20, hint_surf.get_height()+12), pygame.SRCALPHA)
             pygame.draw.rect(hint_bg, (0, 0, 0, 90), hint_bg.get_rect(), border_radius=10)
             hint_pos = (win_rect.centerx - hint_bg.get_width()//2, flow_y + 12)
@@ -553,7 +554,7 @@ class TwentyFourPage:
                 self.msg_alpha = 255
                 self.msg_timer = 0
 
-            msg_font = pygame.font.Font(FONT_NAME, 36)
+            msg_font = get_font(FONT_NAME, 36)
             msg_text = msg_font.render(self.msg, True, (0, 255, 0))
             msg_bg = pygame.Surface((msg_text.get_width()+24, msg_text.get_height()+16), pygame.SRCALPHA)
             pygame.draw.rect(msg_bg, (0, 0, 0, 100), msg_bg.get_rect(), border_radius=12)
@@ -627,13 +628,13 @@ class TwentyFourPage:
                 # 普通蓝色边框
                 pygame.draw.rect(self.surface, (33, 150, 243), grad_rect, 4, border_radius=18)
             # 运算符符号动画
-            op_font = pygame.font.Font(FONT_NAME, 44)
-            op_text = op_font.render(b.text, True, (40, 40, 40))  # 深色符号
+            op_font = get_font(FONT_NAME, 44)
+            op_text = render_text(op_font, b.text, True, (40, 40, 40))  # 深色符号
             op_text = pygame.transform.rotate(op_text, angle)
             op_rect = op_text.get_rect(center=b.rect.center)
             self.surface.blit(op_text, op_rect)
         # 复原、提示、换一组、返回按钮（渐变+阴影+圆角）
-        btn_font = pygame.font.Font(FONT_NAME, 36)
+        btn_font = get_font(FONT_NAME, 36)
         btn_y = int(win_rect.height * 0.85)
         btn_w, btn_h = 180, 64
         side_margin = int(win_rect.width * 0.06)
@@ -662,7 +663,7 @@ class TwentyFourPage:
             pygame.draw.rect(grad_btn, (255,255,255,80), (0,0,btn_w,btn_h//2), border_radius=18)
             self.surface.blit(grad_btn, (x,y))
             pygame.draw.rect(self.surface, color, (x,y,btn_w,btn_h), 3, border_radius=18)
-            text = btn_font.render(label, True, (255,255,255) if label!='返回' else (80,80,80))
+            text = render_text(btn_font, label, True, (255,255,255) if label!='返回' else (80,80,80))
             self.surface.blit(text, (x+38, y+10))
             btn_rects.append(pygame.Rect(x,y,btn_w,btn_h))
         self._undo_rect, self._hint_rect, self._new_rect, self._back_rect = btn_rects
@@ -707,7 +708,6 @@ class TwentyFourPage:
                                 self.msg = f'恭喜，算出24! +{points}分'
                                 self.solved_count += 1
                                 player_data.add_coins(100)
-                                player_data._save_data()
                                 self._auto_next_time = pygame.time.get_ticks() + 1000
                             else:
                                 self.msg = '未能算出24'
@@ -750,7 +750,6 @@ class TwentyFourPage:
                                 self.msg = f'恭喜，算出24! +{points}分'
                                 self.solved_count += 1
                                 player_data.add_coins(100)
-                                player_data._save_data()
                                 self._auto_next_time = pygame.time.get_ticks() + 1000
                             else:
                                 self.msg = '未能算出24'
@@ -825,7 +824,6 @@ class TwentyFourPage:
                                     self.msg = f'恭喜，算出24! +{points}分'
                                     self.solved_count += 1
                                     player_data.add_coins(100)
-                                    player_data._save_data()
                                     self._auto_next_time = pygame.time.get_ticks() + 1000
                                 else:
                                     self.msg = '未能算出24'
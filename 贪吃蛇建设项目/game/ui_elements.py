@@ -5,7 +5,7 @@ class Dropdown:
         self.selected = selected if selected is not None else (options[0] if options else None)
         self.is_open = False
         self.hovered_idx = None
-        self.font = pygame.font.Font(FONT_NAME, font_size)
+        self.font = get_font(FONT_NAME, font_size)
         self.color = color
         self.hover_color = hover_color
         self.max_visible = 30
@@ -16,7 +16,7 @@ class Dropdown:
     def draw(self, surface):
         # 主框
         pygame.draw.rect(surface, self.color, self.rect, border_radius=10)
-        sel_text = self.font.render(str(self.selected) if self.selected else "请选择", True, BUTTON_TEXT_COLOR)
+        sel_text = render_text(self.font, str(self.selected) if self.selected else "请选择", True, BUTTON_TEXT_COLOR)
         surface.blit(sel_text, (self.rect.x+12, self.rect.y+8))
         # 下拉箭头
         pygame.draw.polygon(surface, BUTTON_TEXT_COLOR, [
@@ -33,7 +33,7 @@ class Dropdown:
                 opt_rect = pygame.Rect(self.rect.x, self.rect.bottom+i*opt_h, self.rect.width, opt_h)
                 bg = self.hover_color if self.hovered_idx == self.scroll+i else self.color
                 pygame.draw.rect(surface, bg, opt_rect, border_radius=8)
-                txt = self.font.render(str(opt), True, BUTTON_TEXT_COLOR)
+                txt = render_text(self.font, str(opt), True, BUTTON_TEXT_COLOR)
                 surface.blit(txt, (opt_rect.x+12, opt_rect.y+8))
             # 底部空白区
             pygame.draw.rect(surface, self.color, (self.rect.x, self.rect.bottom+opt_h*len(visible_opts), self.rect.width, blank_space), border_radius=8)
@@ -104,6 +104,10 @@ class Dropdown:
 import pygame
 import math
 from .constants import *
+from .fonts import get_font, render_text
+from .game_loop import AnimationClock
+from .sprites import get_sprite
+from . import layers
 import threading
 import win32gui
 import win32con
@@ -120,7 +124,7 @@ class Button:
         self.hover_color = hover_color
         self.is_hovered = False
         self.is_pressed = False
-        self.font = pygame.font.Font(FONT_NAME, font_size)
+        self.font = get_font(FONT_NAME, font_size)
         self.animation_offset = 0
         self.animation_direction = 1
         self.scale = 1.0  # 添加缩放属性
@@ -166,20 +170,24 @@ class Button:
         
         # 添加文字阴影效果
         if self.text:
-            text_surface = self.font.render(self.text, True, BUTTON_TEXT_COLOR)
+            text_surface = render_text(self.font, self.text, True, BUTTON_TEXT_COLOR)
             text_rect = text_surface.get_rect(center=scaled_rect.center)
             
-            # 添加文字阴影
-            shadow_surface = pygame.Surface((text_surface.get_width() + 4, text_surface.get_height() + 4), pygame.SRCALPHA)
-            shadow_text = self.font.render(self.text, True, (0, 0, 0, 100))
-            shadow_rect = shadow_text.get_rect(center=(shadow_surface.get_width()//2, shadow_surface.get_height()//2))
-            shadow_surface.blit(shadow_text, shadow_rect)
+            # 添加文字阴影（文字不变，由精灵缓存）
+            shadow_surface = get_sprite(('text_shadow', self.font, self.text), self._draw_text_shadow, text_surface)
             
             # 绘制阴影
             surface.blit(shadow_surface, (text_rect.x - 2, text_rect.y - 2))
             # 绘制文字
             surface.blit(text_surface, text_rect)
 
+    def _draw_text_shadow(self, text_surface):
+        shadow_surface = pygame.Surface((text_surface.get_width() + 4, text_surface.get_height() + 4), pygame.SRCALPHA)
+        shadow_text = render_text(self.font, self.text, True, (0, 0, 0, 100))
+        shadow_rect = shadow_text.get_rect(center=(shadow_surface.get_width()//2, shadow_surface.get_height()//2))
+        shadow_surface.blit(shadow_text, shadow_rect)
+        return shadow_surface
+
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
             self.is_hovered = self.rect.collidepoint(event.pos)
@@ -218,6 +226,36 @@ def draw_rounded_rect(surface, rect, color, corner_radius):
 
     surface.blit(shape_surf, rect)
 
+def draw_round_rect_sprite(size, color, border_radius):
+    """在 size 大小的透明画布上画一个填满的圆角矩形（阴影、提示框背景等精灵）"""
+    s = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.rect(s, color, (0, 0, *size), border_radius=border_radius)
+    return s
+
+def draw_circle_sprite(size, center, radius, color, width=0):
+    """在 size 大小的透明画布上画一个圆（发光、高光等精灵），width 为 0 时填充"""
+    s = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.circle(s, color, center, radius, width)
+    return s
+
+def draw_wave_sprite(radius, alpha):
+    """音量、音乐图标旁边的一段音波弧线"""
+    s = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
+    pygame.draw.arc(s, (255,255,255,alpha), (0, 0, radius*2, radius*2), -0.5, 0.5, 2)
+    return s
+
+def draw_star_sprite():
+    """开始游戏按钮周围飘出的小星星（满透明度）"""
+    s = pygame.Surface((8, 8), pygame.SRCALPHA)
+    points = []
+    for i in range(5):
+        angle = math.radians(i * 72 - 90)
+        points.append((4 + 3 * math.cos(angle), 4 + 3 * math.sin(angle)))
+        angle = math.radians(i * 72 - 90 + 36)
+        points.append((4 + 1.5 * math.cos(angle), 4 + 1.5 * math.sin(angle)))
+    pygame.draw.polygon(s, (255, 255, 100), points)
+    return s
+
 class CircularButton(Button):
     def __init__(self, x, y, size, text):
         super().__init__(x, y, size, size, text)
@@ -236,10 +274,14 @@ class CircularButton(Button):
         ]
         self.current_color_index = 0
         self.color_transition = 0.0
+        # 图标旋转按经过的时间推进，空闲降帧时速度不变
+        self.anim_clock = AnimationClock()
+        self.frame_step = 1.0
 
     def draw(self, surface, next_bg_image=None, show_tip=False):
         # 更新动画
-        self.pulse_animation += 0.1
+        self.frame_step = self.anim_clock.frames(pygame.time.get_ticks())
+        self.pulse_animation += 0.1 * self.frame_step
         if self.is_hovered:
             self.target_scale = 1.15
             self.color_transition += 0.05
@@ -257,11 +299,8 @@ class CircularButton(Button):
         
         # 绘制外发光效果
         glow_radius = int(self.rect.width // 2 * self.hover_scale + 8)
-        glow_surf = pygame.Surface((glow_radius * 2 + 20, glow_radius * 2 + 20), pygame.SRCALPHA)
-        for i in range(3):
-            alpha = 60 - i * 20 if self.is_hovered else 20 - i * 5
-            pygame.draw.circle(glow_surf, (*current_color, alpha), 
-                             (glow_radius + 10, glow_radius + 10), glow_radius - i * 3)
+        glow_surf = get_sprite(('circle_glow', glow_radius, current_color, self.is_hovered),
+                               self._draw_glow, glow_radius, current_color)
         surface.blit(glow_surf, (self.rect.centerx - glow_radius - 10, self.rect.centery - glow_radius - 10))
         
         # 绘制主体圆形（带渐变效果）
@@ -270,23 +309,17 @@ class CircularButton(Button):
                               int(self.rect.height * (self.hover_scale - 1)))
         scaled_rect.center = self.rect.center
         
-        # 创建渐变表面
-        gradient_surf = pygame.Surface((scaled_rect.width, scaled_rect.height), pygame.SRCALPHA)
-        center_x, center_y = scaled_rect.width // 2, scaled_rect.height // 2
+        # 渐变圆（按尺寸和颜色缓存）
         radius = scaled_rect.width // 2
-        
-        for r in range(radius, 0, -1):
-            alpha = 255 - (radius - r) * 2
-            alpha = max(100, alpha)
-            color_with_alpha = (*current_color, alpha)
-            pygame.draw.circle(gradient_surf, color_with_alpha, (center_x, center_y), r)
-        
+        gradient_surf = get_sprite(('circle_gradient', scaled_rect.size, current_color),
+                                   self._draw_gradient_circle, scaled_rect.size, current_color)
         surface.blit(gradient_surf, scaled_rect.topleft)
         
         # 绘制内圈高光
         highlight_radius = int(radius * 0.6)
-        highlight_surf = pygame.Surface((highlight_radius * 2, highlight_radius * 2), pygame.SRCALPHA)
-        pygame.draw.circle(highlight_surf, (255, 255, 255, 80), (highlight_radius, highlight_radius), highlight_radius)
+        highlight_surf = get_sprite(('circle_highlight', highlight_radius), draw_circle_sprite,
+                                    (highlight_radius * 2, highlight_radius * 2), (highlight_radius, highlight_radius),
+                                    highlight_radius, (255, 255, 255, 80))
         surface.blit(highlight_surf, (scaled_rect.centerx - highlight_radius, scaled_rect.centery - highlight_radius))
         
         # 绘制现代化图标
@@ -300,6 +333,24 @@ class CircularButton(Button):
         if self.is_hovered and next_bg_image is not None:
             self._draw_preview(surface, next_bg_image)
     
+    def _draw_glow(self, glow_radius, color):
+        glow_surf = pygame.Surface((glow_radius * 2 + 20, glow_radius * 2 + 20), pygame.SRCALPHA)
+        for i in range(3):
+            alpha = 60 - i * 20 if self.is_hovered else 20 - i * 5
+            pygame.draw.circle(glow_surf, (*color, alpha), 
+                             (glow_radius + 10, glow_radius + 10), glow_radius - i * 3)
+        return glow_surf
+
+    def _draw_gradient_circle(self, size, color):
+        gradient_surf = pygame.Surface(size, pygame.SRCALPHA)
+        center_x, center_y = size[0] // 2, size[1] // 2
+        radius = size[0] // 2
+        for r in range(radius, 0, -1):
+            alpha = 255 - (radius - r) * 2
+            alpha = max(100, alpha)
+            pygame.draw.circle(gradient_surf, (*color, alpha), (center_x, center_y), r)
+        return gradient_surf
+
     def _draw_modern_icon(self, surface, rect):
         """绘制多彩三段式回收标志风格循环箭头"""
         import pygame.gfxdraw
@@ -307,7 +358,7 @@ class CircularButton(Button):
         outer_r = int(rect.width * 0.39)
         inner_r = int(rect.width * 0.22)
         arrow_width = outer_r - inner_r
-        self.rotation = (getattr(self, 'rotation', 0) + 2) % 360
+        self.rotation = (getattr(self, 'rotation', 0) + 2 * self.frame_step) % 360
         base_angle = math.radians(self.rotation)
         # 三段主色
         color_list = [
@@ -389,9 +440,9 @@ class CircularButton(Button):
 
     def _draw_tooltip(self, surface):
         """绘制美观的提示框"""
-        tip_font = pygame.font.Font(FONT_NAME, 20)
+        tip_font = get_font(FONT_NAME, 20)
         tip_text = "切换背景"
-        tip_surf = tip_font.render(tip_text, True, (255, 255, 255))
+        tip_surf = render_text(tip_font, tip_text, True, (255, 255, 255))
         
         # 创建带圆角的提示框背景
         padding = 12
@@ -401,8 +452,7 @@ class CircularButton(Button):
         tip_rect.midleft = (self.rect.right + 15, self.rect.centery)
         
         # 绘制提示框背景
-        tip_bg_surf = pygame.Surface((tip_rect.width, tip_rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(tip_bg_surf, (0, 0, 0, 180), tip_bg_surf.get_rect(), border_radius=8)
+        tip_bg_surf = get_sprite(('tooltip_bg', tip_rect.size), draw_round_rect_sprite, tip_rect.size, (0, 0, 0, 180), 8)
         surface.blit(tip_bg_surf, tip_rect.topleft)
         
         # 绘制文字
@@ -417,7 +467,12 @@ class CircularButton(Button):
     def _draw_preview(self, surface, next_bg_image):
         """绘制背景预览"""
         preview_size = int(self.rect.width * 0.8)
-        preview_img = pygame.transform.scale(next_bg_image, (preview_size, preview_size))
+        # 缩放后的预览图按原图缓存，悬停期间不再每帧缩放
+        cached = getattr(self, '_preview', None)
+        if cached is None or cached[0] is not next_bg_image:
+            cached = (next_bg_image, pygame.transform.scale(next_bg_image, (preview_size, preview_size)))
+            self._preview = cached
+        preview_img = cached[1]
         preview_rect = preview_img.get_rect(midbottom=(self.rect.centerx, self.rect.top - 15))
         # 绘制预览框背景和边框
         border_rect = preview_rect.inflate(10, 10)
@@ -426,8 +481,8 @@ class CircularButton(Button):
         # 绘制预览图片
         surface.blit(preview_img, preview_rect)
         # 添加"下一个"标签
-        label_font = pygame.font.Font(FONT_NAME, 16)
-        label_surf = label_font.render("下一个", True, (255, 255, 255))
+        label_font = get_font(FONT_NAME, 16)
+        label_surf = render_text(label_font, "下一个", True, (255, 255, 255))
         label_rect = label_surf.get_rect(midtop=(preview_rect.centerx, preview_rect.bottom + 5))
         # 标签背景
         label_bg_rect = label_rect.inflate(8, 4)
@@ -437,7 +492,7 @@ class CircularButton(Button):
 class TextInput:
     def __init__(self, x, y, width, height, font_size=24, text_color=BLACK, bg_color=WHITE, border_color=BLACK, max_length=20):
         self.rect = pygame.Rect(x, y, width, height)
-        self.font = pygame.font.Font(FONT_NAME, font_size)
+        self.font = get_font(FONT_NAME, font_size)
         self.text = ''
         self.text_color = text_color
         self.bg_color = bg_color
@@ -464,7 +519,7 @@ class TextInput:
     def draw(self, surface):
         pygame.draw.rect(surface, self.bg_color, self.rect, border_radius=6)
         pygame.draw.rect(surface, self.border_color, self.rect, 2, border_radius=6)
-        text_surf = self.font.render(self.text, True, self.text_color)
+        text_surf = render_text(self.font, self.text, True, self.text_color)
         surface.blit(text_surf, (self.rect.x + 8, self.rect.y + (self.rect.height - text_surf.get_height()) // 2))
         # 光标闪烁
         if self.active:
@@ -539,11 +594,15 @@ class CartoonButton(Button):
         self.click_pos = None
         self.star_particles = []
         self.particle_timer = 0
+        # 呼吸灯和星星粒子按经过的时间推进，空闲降帧时速度不变
+        self.anim_clock = AnimationClock()
 
     def draw(self, surface):
         # 更新动画
-        self.breath_animation += 0.08
-        self.particle_timer += 1
+        frames = self.anim_clock.frames(pygame.time.get_ticks())
+        self.breath_animation += 0.08 * frames
+        last_timer = self.particle_timer
+        self.particle_timer += frames
 
         # 呼吸灯效果（仅对开始游戏按钮）
         if self.text == "开始游戏":
@@ -571,7 +630,7 @@ class CartoonButton(Button):
             self.click_ripple_radius += 8
 
         # 星星粒子效果（仅对开始游戏按钮）
-        if self.text == "开始游戏" and self.particle_timer % 30 == 0:
+        if self.text == "开始游戏" and int(self.particle_timer) // 30 > int(last_timer) // 30:
             import random
             for _ in range(2):
                 self.star_particles.append({
@@ -585,9 +644,9 @@ class CartoonButton(Button):
         # 更新粒子
         self.star_particles = [p for p in self.star_particles if p['life'] > 0]
         for particle in self.star_particles:
-            particle['x'] += particle['vx']
-            particle['y'] += particle['vy']
-            particle['life'] -= 1
+            particle['x'] += particle['vx'] * frames
+            particle['y'] += particle['vy'] * frames
+            particle['life'] = max(0, particle['life'] - frames)
 
         # 计算最终矩形
         rect = self.rect.copy()
@@ -603,23 +662,17 @@ class CartoonButton(Button):
 
         # 绘制发光效果
         if self.glow_intensity > 0 or glow_alpha > 0:
-            glow_surface = pygame.Surface((rect.width + 40, rect.height + 40), pygame.SRCALPHA)
-            glow_alpha_final = max(self.glow_intensity, glow_alpha)
-
-            # 多层发光
-            for i in range(3):
-                glow_rect = pygame.Rect(20-i*5, 20-i*5, rect.width+i*10, rect.height+i*10)
-                glow_color = (*self.color, glow_alpha_final // (i+1))
-                pygame.draw.rect(glow_surface, glow_color, glow_rect, border_radius=self.radius+i*3)
-
+            # 发光精灵按满透明度画好，整体透明度用 set_alpha 调整
+            glow_surface = get_sprite(('button_glow', rect.size, self.color, self.radius), self._draw_glow, rect.size)
+            glow_surface.set_alpha(max(self.glow_intensity, glow_alpha))
             surface.blit(glow_surface, (rect.x-20, rect.y-20), special_flags=pygame.BLEND_ALPHA_SDL2)
 
         # 阴影（更柔和）
         shadow_rect = rect.copy()
         shadow_rect.x += self.shadow_offset
         shadow_rect.y += self.shadow_offset
-        shadow_surface = pygame.Surface((shadow_rect.width, shadow_rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(shadow_surface, (0, 0, 0, 100), (0, 0, shadow_rect.width, shadow_rect.height), border_radius=self.radius)
+        shadow_surface = get_sprite(('button_shadow', shadow_rect.size, self.radius), draw_round_rect_sprite,
+                                    shadow_rect.size, (0, 0, 0, 100), self.radius)
         surface.blit(shadow_surface, shadow_rect.topleft)
 
         # 渐变背景（仅对开始游戏按钮）
@@ -650,8 +703,9 @@ class CartoonButton(Button):
                 if self.text == "开始游戏":
                     # 发光笑脸
                     glow_radius = 20 + int(3 * math.sin(self.breath_animation * 2))
-                    glow_surface = pygame.Surface((glow_radius*2+10, glow_radius*2+10), pygame.SRCALPHA)
-                    pygame.draw.circle(glow_surface, (255, 255, 0, 100), (glow_radius//2+5, glow_radius//2+5), glow_radius)
+                    glow_surface = get_sprite(('smile_glow', glow_radius), draw_circle_sprite,
+                                              (glow_radius*2+10, glow_radius*2+10), (glow_radius//2+5, glow_radius//2+5),
+                                              glow_radius, (255, 255, 0, 100))
                     surface.blit(glow_surface, (icon_center[0]-glow_radius//2-5, icon_center[1]-glow_radius//2-5))
 
                 # 主笑脸
@@ -675,8 +729,8 @@ class CartoonButton(Button):
             elif self.icon_type == "help":
                 # 问号
                 pygame.draw.circle(surface, (66,165,245), icon_center, 16)
-                font = pygame.font.Font(FONT_NAME, 22)
-                qsurf = font.render("?", True, (255,255,255))
+                font = get_font(FONT_NAME, 22)
+                qsurf = render_text(font, "?", True, (255,255,255))
                 qrect = qsurf.get_rect(center=icon_center)
                 surface.blit(qsurf, qrect)
             elif self.icon_type == "settings":
@@ -733,8 +787,7 @@ class CartoonButton(Button):
                 # 音波
                 for i, r in enumerate([18, 22, 26]):
                     alpha = 150 - i * 30
-                    wave_surface = pygame.Surface((r*2, r*2), pygame.SRCALPHA)
-                    pygame.draw.arc(wave_surface, (255,255,255,alpha), (0, 0, r*2, r*2), -0.5, 0.5, 2)
+                    wave_surface = get_sprite(('icon_wave', r, alpha), draw_wave_sprite, r, alpha)
                     surface.blit(wave_surface, (icon_center[0] + 5 - r, icon_center[1] - r))
             elif self.icon_type == "group":
                 # 双人模式图标
@@ -759,55 +812,49 @@ class CartoonButton(Button):
                 ])
                 # 音波
                 for i, (radius, alpha) in enumerate([(16, 150), (20, 120), (24, 90)]):
-                    wave_surface = pygame.Surface((radius*2, radius*2), pygame.SRCALPHA)
-                    pygame.draw.arc(wave_surface, (255,255,255,alpha), (0, 0, radius*2, radius*2), -0.5, 0.5, 2)
+                    wave_surface = get_sprite(('icon_wave', radius, alpha), draw_wave_sprite, radius, alpha)
                     surface.blit(wave_surface, (icon_center[0] + 2 - radius, icon_center[1] - radius))
-        # 绘制星星粒子效果
+        # 绘制星星粒子效果（星星精灵按满透明度画好，逐个用 set_alpha 淡出）
+        star_surface = get_sprite('button_star', draw_star_sprite) if self.star_particles else None
         for particle in self.star_particles:
-            alpha = int(255 * (particle['life'] / 60))
-            star_surface = pygame.Surface((8, 8), pygame.SRCALPHA)
-            # 绘制小星星
-            points = []
-            for i in range(5):
-                angle = math.radians(i * 72 - 90)
-                x = 4 + 3 * math.cos(angle)
-                y = 4 + 3 * math.sin(angle)
-                points.append((x, y))
-                angle = math.radians(i * 72 - 90 + 36)
-                x = 4 + 1.5 * math.cos(angle)
-                y = 4 + 1.5 * math.sin(angle)
-                points.append((x, y))
-            pygame.draw.polygon(star_surface, (255, 255, 100, alpha), points)
+            star_surface.set_alpha(int(255 * (particle['life'] / 60)))
             surface.blit(star_surface, (particle['x']-4, particle['y']-4))
 
         # 文字（带阴影效果）
         if self.text:
             if self.text == "开始游戏":
                 # 文字阴影
-                shadow_surface = self.font.render(self.text, True, (0, 0, 0))
+                shadow_surface = render_text(self.font, self.text, True, (0, 0, 0))
                 shadow_rect = shadow_surface.get_rect(midleft=(rect.x + 66, rect.centery + 2))
                 surface.blit(shadow_surface, shadow_rect)
                 # 主文字
-                text_surface = self.font.render(self.text, True, self.text_color)
+                text_surface = render_text(self.font, self.text, True, self.text_color)
                 text_rect = text_surface.get_rect(midleft=(rect.x + 64, rect.centery))
                 surface.blit(text_surface, text_rect)
             elif rect.width <= 80 and rect.height <= 35:  # 只对小按钮居中显示
                 # 对于小按钮，文字居中显示
-                text_surface = self.font.render(self.text, True, self.text_color)
+                text_surface = render_text(self.font, self.text, True, self.text_color)
                 text_rect = text_surface.get_rect(center=rect.center)
                 surface.blit(text_surface, text_rect)
             else:
                 # 对于其他按钮，保持原有的偏左显示（为图标留空间）
-                text_surface = self.font.render(self.text, True, self.text_color)
+                text_surface = render_text(self.font, self.text, True, self.text_color)
                 text_rect = text_surface.get_rect(midleft=(rect.x + 64, rect.centery))
                 surface.blit(text_surface, text_rect)
 
     def _draw_gradient_rect(self, surface, rect, color1, color2):
         """绘制垂直渐变矩形"""
-        for y in range(rect.height):
-            blend = y / rect.height
-            color = tuple(int(color1[i] * (1-blend) + color2[i] * blend) for i in range(3))
-            pygame.draw.line(surface, color, (rect.x, rect.y + y), (rect.x + rect.width, rect.y + y))
+        # 原来逐行画线时包含终点，宽度多一列
+        surface.blit(layers.gradient((rect.width + 1, rect.height), [color1, color2]), rect.topleft)
+
+    def _draw_glow(self, size):
+        """多层发光（满透明度），绘制时用 set_alpha 调整"""
+        width, height = size
+        glow_surface = pygame.Surface((width + 40, height + 40), pygame.SRCALPHA)
+        for i in range(3):
+            glow_rect = pygame.Rect(20-i*5, 20-i*5, width+i*10, height+i*10)
+            pygame.draw.rect(glow_surface, (*self.color, 255 // (i+1)), glow_rect, border_radius=self.radius+i*3)
+        return glow_surface
 
     def handle_event(self, event):
         if event.type == pygame.MOUSEMOTION:
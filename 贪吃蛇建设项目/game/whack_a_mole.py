@@ -5,6 +5,7 @@ import datetime
 import math
 import os
 from .constants import *
+from .fonts import get_font, render_text
 from .player import player_data
 
 class WhackAMolePage:
@@ -87,23 +88,16 @@ class WhackAMolePage:
             self.hammer_img = None
 
     def _load_play_count(self):
-        data = player_data.data
-        if data.get('whack_a_mole_date') != self._today:
-            data['whack_a_mole_date'] = self._today
-            data['whack_a_mole_count'] = 0
-            player_data._save_data()
-        self.play_count = data.get('whack_a_mole_count', 0)
+        if player_data.get_str('whack_a_mole', 'date') != self._today:
+            player_data.set_values('whack_a_mole', {'date': self._today, 'count': 0})
+        self.play_count = player_data.get_int('whack_a_mole', 'count', 0)
 
     def _inc_play_count(self):
-        player_data.data['whack_a_mole_count'] = player_data.data.get('whack_a_mole_count', 0) + 1
-        player_data.data['whack_a_mole_date'] = self._today
-        player_data._save_data()
-        self.play_count = player_data.data['whack_a_mole_count']
+        self.play_count = player_data.get_int('whack_a_mole', 'count', 0) + 1
+        player_data.set_values('whack_a_mole', {'count': self.play_count, 'date': self._today})
 
     def reset_play_count(self):
-        player_data.data['whack_a_mole_count'] = 0
-        player_data.data['whack_a_mole_date'] = self._today
-        player_data._save_data()
+        player_data.set_values('whack_a_mole', {'count': 0, 'date': self._today})
         self.play_count = 0
 
     def generate_holes(self):
@@ -308,7 +302,6 @@ class WhackAMolePage:
             self.reward += self.max_combo * 10
         
         player_data.add_coins(self.reward)
-        player_data._save_data()
         self._inc_play_count()
         
         # 播放游戏结束音效
@@ -535,19 +528,19 @@ class WhackAMolePage:
         self.draw_title()
     
     def draw_title(self):
-        font = pygame.font.Font(FONT_NAME, 56)
+        font = get_font(FONT_NAME, 56)
         text = "打地鼠大冒险"
         cx = self.panel_x + self.panel_w // 2
         cy = self.panel_y + 75
         
         # 多重阴影效果
         for dx, dy, alpha in [(4, 4, 100), (2, 2, 150), (-2, -2, 80)]:
-            shadow = font.render(text, True, (0, 0, 0, alpha))
+            shadow = render_text(font, text, True, (0, 0, 0, alpha))
             shadow_rect = shadow.get_rect(center=(cx + dx, cy + dy))
             self.surface.blit(shadow, shadow_rect)
         
         # 渐变文字效果
-        title_surf = font.render(text, True, (66, 165, 245))
+        title_surf = render_text(font, text, True, (66, 165, 245))
         title_rect = title_surf.get_rect(center=(cx, cy))
         self.surface.blit(title_surf, title_rect)
         
@@ -583,37 +576,34 @@ class WhackAMolePage:
         pygame.draw.ellipse(self.surface, (255, 0, 0), (mole_x-4, mole_y+5, 8, 5))  # 鼻子
 
     def draw_ready(self):
-        font = pygame.font.Font(FONT_NAME, 28)
-        tip = font.render("点击开始，限时打地鼠，得金币奖励！", True, (80,80,80))
+        font = get_font(FONT_NAME, 28)
+        tip = render_text(font, "点击开始，限时打地鼠，得金币奖励！", True, (80,80,80))
         tip_rect = tip.get_rect(center=(self.panel_x+self.panel_w//2, self.panel_y+140))
         self.surface.blit(tip, tip_rect)
         # 次数提示
         count_tip = f"今日剩余次数：{max(0, self.limit_per_day - self.play_count)} / {self.limit_per_day}"
-        count_font = pygame.font.Font(FONT_NAME, 24)
-        count_text = count_font.render(count_tip, True, (255,140,0))
+        count_font = get_font(FONT_NAME, 24)
+        count_text = render_text(count_font, count_tip, True, (255,140,0))
         count_rect = count_text.get_rect(center=(self.panel_x+self.panel_w//2, self.panel_y+180))
         self.surface.blit(count_text, count_rect)
         # 按钮
         btn_rect = pygame.Rect(self.panel_x+self.panel_w//2-80, self.panel_y+self.panel_h//2-30, 160, 60)
         if self.play_count >= self.limit_per_day:
             pygame.draw.rect(self.surface, (180,180,180), btn_rect, border_radius=16)
-            btn_font = pygame.font.Font(FONT_NAME, 30)
-            btn_font.set_bold(True)
-            btn_text = btn_font.render("今日已达上限", True, (220,80,80))
+            btn_font = get_font(FONT_NAME, 30, bold=True)
+            btn_text = render_text(btn_font, "今日已达上限", True, (220,80,80))
         else:
             pygame.draw.rect(self.surface, (66, 165, 245), btn_rect, border_radius=16)
-            btn_font = pygame.font.Font(FONT_NAME, 30)
-            btn_font.set_bold(True)
-            btn_text = btn_font.render("开始游戏", True, (255,255,255))
+            btn_font = get_font(FONT_NAME, 30, bold=True)
+            btn_text = render_text(btn_font, "开始游戏", True, (255,255,255))
         btn_text_rect = btn_text.get_rect(center=btn_rect.center)
         self.surface.blit(btn_text, btn_text_rect)
         self._start_btn_rect = btn_rect
         # 返回按钮
         back_rect = pygame.Rect(self.panel_x+30, self.panel_y+self.panel_h-70, 120, 44)
         pygame.draw.rect(self.surface, (66, 165, 245), back_rect, border_radius=12)
-        back_font = pygame.font.Font(FONT_NAME, 24)
-        back_font.set_bold(True)
-        back_text = back_font.render("返回", True, (255,255,255))
+        back_font = get_font(FONT_NAME, 24, bold=True)
+        back_text = render_text(back_font, "返回", True, (255,255,255))
         back_text_rect = back_text.get_rect(center=back_rect.center)
         self.surface.blit(back_text, back_text_rect)
         self._back_btn_rect = back_rect
@@ -668,14 +658,14 @@ class WhackAMolePage:
                         (timer_x-50, timer_y-35, 100, 70), 4, border_radius=20)
         
         # 计时器数字
-        font = pygame.font.Font(FONT_NAME, 38)
-        timer_text = font.render(str(left), True, (66, 165, 245))
+        font = get_font(FONT_NAME, 38)
+        timer_text = render_text(font, str(left), True, (66, 165, 245))
         timer_rect = timer_text.get_rect(center=(timer_x, timer_y))
         self.surface.blit(timer_text, timer_rect)
         
         # 计时器标签
-        label_font = pygame.font.Font(FONT_NAME, 18)
-        label = label_font.render("剩余时间", True, (100, 100, 100))
+        label_font = get_font(FONT_NAME, 18)
+        label = render_text(label_font, "剩余时间", True, (100, 100, 100))
         label_rect = label.get_rect(center=(timer_x, timer_y+30))
         self.surface.blit(label, label_rect)
     
@@ -690,14 +680,14 @@ class WhackAMolePage:
                         (score_x-60, score_y-35, 120, 70), 4, border_radius=20)
         
         # 分数文本
-        font = pygame.font.Font(FONT_NAME, 38)
-        score_text = font.render(str(self.score), True, (255, 140, 0))
+        font = get_font(FONT_NAME, 38)
+        score_text = render_text(font, str(self.score), True, (255, 140, 0))
         score_rect = score_text.get_rect(center=(score_x, score_y))
         self.surface.blit(score_text, score_rect)
         
         # 分数标签
-        label_font = pygame.font.Font(FONT_NAME, 18)
-        label = label_font.render("得分", True, (150, 100, 0))
+        label_font = get_font(FONT_NAME, 18)
+        label = render_text(label_font, "得分", True, (150, 100, 0))
         label_rect = label.get_rect(center=(score_x, score_y+30))
         self.surface.blit(label, label_rect)
     
@@ -712,9 +702,9 @@ class WhackAMolePage:
                         (miss_x-60, miss_y-25, 120, 50), 3, border_radius=15)
         
         # Miss文本
-        font = pygame.font.Font(FONT_NAME, 28)
+        font = get_font(FONT_NAME, 28)
         miss_text = f"Miss: {self.miss}"
-        miss_surf = font.render(miss_text, True, (255, 99, 132))
+        miss_surf = render_text(font, miss_text, True, (255, 99, 132))
         miss_rect = miss_surf.get_rect(center=(miss_x, miss_y))
         self.surface.blit(miss_surf, miss_rect)
     
@@ -738,9 +728,9 @@ class WhackAMolePage:
                             (combo_x-80, combo_y-25, 160, 50), 3, border_radius=20)
             
             # Combo文本
-            font = pygame.font.Font(FONT_NAME, 32)
+            font = get_font(FONT_NAME, 32)
             combo_text = f"Combo! {self.combo}"
-            combo_surf = font.render(combo_text, True, (255, 140, 0))
+            combo_surf = render_text(font, combo_text, True, (255, 140, 0))
             combo_surf = pygame.transform.rotozoom(combo_surf, 0, scale)
             combo_rect = combo_surf.get_rect(center=(combo_x, combo_y))
             self.surface.blit(combo_surf, combo_rect)
@@ -752,7 +742,7 @@ class WhackAMolePage:
                 self.score_fly.remove(fly)
                 continue
             alpha = max(0, 255 - int(elapsed * 320))
-            font = pygame.font.Font(FONT_NAME, 32)
+            font = get_font(FONT_NAME, 32)
             surf = font.render(f"+{fly['value']}", True, (255, 213, 79))
             surf.set_alpha(alpha)
             self.surface.blit(surf, (fly['x'], fly['y'] - elapsed * 60))
@@ -827,9 +817,8 @@ class WhackAMolePage:
         pygame.draw.rect(self.surface, (66, 165, 245), back_rect, border_radius=12)
         
         # 按钮文字
-        back_font = pygame.font.Font(FONT_NAME, 24)
-        back_font.set_bold(True)
-        back_text = back_font.render("返回", True, (255, 255, 255))
+        back_font = get_font(FONT_NAME, 24, bold=True)
+        back_text = render_text(back_font, "返回", True, (255, 255, 255))
         back_text_rect = back_text.get_rect(center=back_rect.center)
         self.surface.blit(back_text, back_text_rect)
         
@@ -864,29 +853,26 @@ class WhackAMolePage:
             del self.hit_effects[i]
 
     def draw_finished(self):
-        font = pygame.font.Font(FONT_NAME, 36)
-        over = font.render("游戏结束！", True, (66, 165, 245))
+        font = get_font(FONT_NAME, 36)
+        over = render_text(font, "游戏结束！", True, (66, 165, 245))
         over_rect = over.get_rect(center=(self.panel_x+self.panel_w//2, self.panel_y+140))
         self.surface.blit(over, over_rect)
-        reward_font = pygame.font.Font(FONT_NAME, 30)
-        reward_font.set_bold(True)
-        reward_text = reward_font.render(f"奖励：{self.reward} 金币", True, (255,140,0))
+        reward_font = get_font(FONT_NAME, 30, bold=True)
+        reward_text = render_text(reward_font, f"奖励：{self.reward} 金币", True, (255,140,0))
         reward_rect = reward_text.get_rect(center=(self.panel_x+self.panel_w//2, self.panel_y+200))
         self.surface.blit(reward_text, reward_rect)
         btn_rect = pygame.Rect(self.panel_x+self.panel_w//2-80, self.panel_y+self.panel_h//2-30, 160, 60)
         pygame.draw.rect(self.surface, (66, 165, 245), btn_rect, border_radius=16)
-        btn_font = pygame.font.Font(FONT_NAME, 30)
-        btn_font.set_bold(True)
-        btn_text = btn_font.render("再玩一次", True, (255,255,255))
+        btn_font = get_font(FONT_NAME, 30, bold=True)
+        btn_text = render_text(btn_font, "再玩一次", True, (255,255,255))
         btn_text_rect = btn_text.get_rect(center=btn_rect.center)
         self.surface.blit(btn_text, btn_text_rect)
         self._start_btn_rect = btn_rect
         # 返回按钮
         back_rect = pygame.Rect(self.panel_x+30, self.panel_y+self.panel_h-70, 120, 44)
         pygame.draw.rect(self.surface, (66, 165, 245), back_rect, border_radius=12)
-        back_font = pygame.font.Font(FONT_NAME, 24)
-        back_font.set_bold(True)
-        back_text = back_font.render("返回", True, (255,255,255))
+        back_font = get_font(FONT_NAME, 24, bold=True)
+        back_text = render_text(back_font, "返回", True, (255,255,255))
         back_text_rect = back_text.get_rect(center=back_rect.center)
         self.surface.blit(back_text, back_text_rect)
         self._back_btn_rect = back_rect
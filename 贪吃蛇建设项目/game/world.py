@@ -0,0 +1,260 @@
+# -*- coding: utf-8 -*-
+"""
+贪吃蛇的无界面模拟核心
+只负责蛇、食物和障碍物的规则：不调用显示、音频或真实时间，随机数来自带种子的 RNG，
+同一个种子和同一串操作总能得到同样的结果。GameController 每个逻辑帧调用一次 step 并按当前状态绘制；
+也可以在没有窗口的情况下用它做基准测试、模糊测试或训练 AI。
+"""
+import random
+from collections import deque, namedtuple
+from .core_constants import GRID_WIDTH, GRID_HEIGHT, OBSTACLE_COUNT, FOOD_SAMPLE_ATTEMPTS
+from .occupancy import OccupancyGrid, SnakeBodyView
+
+# 各等级食物的分数（与 Food.set_properties_by_level 一致）
+FOOD_SCORES = {1: 1, 2: 3, 3: 5}
+
+# 不同分数段的食物等级权重：(分数上限, 等级, 权重)，上限为 None 表示其余所有分数
+# 平衡性调参时可以把另一张表传给 SnakeWorld / BatchSnakeWorld
+FOOD_LEVEL_WEIGHTS = [
+    (15, (1, 2), (0.9, 0.1)),               # 游戏早期: 90% 等级1, 10% 等级2
+    (50, (1, 2, 3), (0.6, 0.3, 0.1)),       # 游戏中期: 60% 等级1, 30% 等级2, 10% 等级3
+    (None, (1, 2, 3), (0.4, 0.4, 0.2)),     # 游戏后期: 40% 等级1, 40% 等级2, 20% 等级3
+]
+
+# step 的返回值：eaten 为本帧吃到的食物列表，death 为死亡原因（None/'self'/'wall'），board_full 表示棋盘已满
+StepResult = namedtuple('StepResult', ['eaten', 'death', 'board_full'])
+
+# snapshot 的返回值，全部是不可变数据，可以安全地交给渲染器或保存下来
+WorldSnapshot = namedtuple('WorldSnapshot', ['tick', 'snake', 'direction', 'length', 'score',
+                                             'foods', 'obstacles', 'done', 'death'])
+
+class SnakeState:
+    """蛇的规则部分（蛇身、方向、长度、分数），绘制相关的内容在 snake.Snake 中"""
+
+    def __init__(self, allow_cross_self=False, grid=None, start=None):
+        self.length = 1
+        # 蛇身用双端队列存储，配合占用表实现 O(1) 的移动和碰撞检测
+        self.grid = grid if grid is not None else OccupancyGrid()
+        self._body = deque()
+        self._positions_view = SnakeBodyView(self._body, self.grid)
+        self.reset_body([start or (self.grid.width // 2, self.grid.height // 2)])
+        self.direction = (1, 0)
+        self.next_direction = (1, 0)
+        self.score = 0
+        self.allow_cross_self = allow_cross_self
+
+    @property
+    def positions(self):
+        """蛇身坐标的只读视图（蛇头在前），修改请用 reset_body"""
+        return self._positions_view
+
+    def get_head_position(self):
+        return self._body[0]
+
+    def reset_body(self, cells):
+        """整体替换蛇身（蛇头在前），同步更新占用表"""
+        for cell in self._body:
+            self.grid.remove_body(cell)
+        self._body.clear()
+        for cell in cells:
+            self._body.append(tuple(cell))
+            self.grid.add_body(cell)
+
+    def occupies(self, cell, include_head=True):
+        """cell 是否在蛇身上（O(1)）"""
+        count = self.grid.body_count(cell)
+        if not include_head and self._body and self._body[0] == tuple(cell):
+            count -= 1
+        return count > 0
+
+    def move(self):
+        self.direction = self.next_direction
+        cur = self.get_head_position()
+        x, y = self.direction
+        # 计算新位置，实现穿墙效果
+        new = ((cur[0] + x) % self.grid.width, (cur[1] + y) % self.grid.height)
+        if not self.allow_cross_self:
+            # 检查是否撞到自己（不含蛇头）
+            if len(self._body) > 2 and self.occupies(new, include_head=False):
+                return False
+        # 允许穿过自己，直接插入新头部
+        self._body.appendleft(new)
+        self.grid.add_body(new)
+        if len(self._body) > self.length:
+            self.grid.remove_body(self._body.pop())
+        return True
+
+    def change_direction(self, new_direction):
+        # 如果上一个方向指令还未执行，则忽略新的指令
+        if self.direction != self.next_direction:
+            return
+        # 避免180度转身
+        if len(self._body) > 1 and (new_direction[0] * -1, new_direction[1] * -1) == self.direction:
+            return
+        self.next_direction = new_direction
+
+    def grow(self, score_increase=10):
+        self.length += 1
+        self.score += score_increase
+
+    def move_left(self):
+        self.change_direction((-1, 0))
+
+    def move_right(self):
+        self.change_direction((1, 0))
+
+    def move_up(self):
+        self.change_direction((0, -1))
+
+    def move_down(self):
+        self.change_direction((0, 1))
+
+class FoodState:
+    """食物的规则部分（等级、分数、位置），绘制相关的内容在 food.Food 中"""
+    __slots__ = ('level', 'score', 'position')
+
+    def __init__(self, level=1):
+        self.level = level
+        self.score = FOOD_SCORES.get(level, FOOD_SCORES[3])
+        self.position = (0, 0)
+
+def choose_food_level(score, rng=random, level_weights=None):
+    """根据当前分数按权重随机选择食物等级"""
+    for max_score, levels, weights in level_weights or FOOD_LEVEL_WEIGHTS:
+        if max_score is None or score < max_score:
+            return rng.choices(levels, weights=weights, k=1)[0]
+
+def sample_food_cell(free_cells, head=None, rng=random):
+    """从空闲格子索引取样，尽量避开蛇头3x3范围；没有空闲格子时返回 None"""
+    cell = None
+    # 蛇头附近最多9格，重试几次几乎总能避开；实在避不开（空位都在蛇头旁）就用最后一次的结果
+    for _ in range(FOOD_SAMPLE_ATTEMPTS):
+        cell = free_cells.sample(rng)
+        if cell is None:
+            return None
+        if head is None or abs(cell[0] - head[0]) > 1 or abs(cell[1] - head[1]) > 1:
+            break
+    return cell
+
+def generate_obstacles(grid, rng=random, snake_positions=None, count=OBSTACLE_COUNT):
+    """在占用表上随机放置障碍物，返回障碍物坐标列表"""
+    if snake_positions is None:
+        snake_positions = []
+    grid.clear_obstacles()
+    obstacles = []
+    attempts = 0
+    max_attempts = 200 # 增加尝试次数以确保生成足够数量
+    while len(obstacles) < count and attempts < max_attempts:
+        attempts += 1
+        pos = (rng.randint(1, grid.width - 2), # 避免在最边缘生成
+               rng.randint(1, grid.height - 2))
+
+        # 检查是否与蛇身重叠
+        if pos in snake_positions:
+            continue
+
+        # 检查是否与现有障碍物重叠或太近
+        if any(grid.is_obstacle((pos[0] + dx, pos[1] + dy)) for dx in (-1, 0, 1) for dy in (-1, 0, 1)):
+            continue
+
+        # 检查是否在蛇头3x3范围内
+        if snake_positions:
+            head_x, head_y = snake_positions[0]
+            if (abs(pos[0] - head_x) <= 2 and # 扩大安全区域
+                abs(pos[1] - head_y) <= 2):
+                continue
+
+        obstacles.append(pos)
+        grid.set_obstacle(pos)
+    return obstacles
+
+class SnakeWorld:
+    """
+    单人贪吃蛇的模拟世界
+    snake_factory / food_factory 用来创建蛇和食物对象：默认是纯数据的 SnakeState / FoodState，
+    GameController 传入可绘制的 Snake / Food，这样渲染直接读取世界里的对象。
+    """
+
+    def __init__(self, seed=None, width=GRID_WIDTH, height=GRID_HEIGHT, obstacle_count=OBSTACLE_COUNT,
+                 snake_factory=SnakeState, food_factory=FoodState, level_weights=None):
+        # 没有指定种子时随机取一个并记下来，录像只需保存这个种子就能复现整局
+        self.seed = seed if seed is not None else random.getrandbits(64)
+        self.level_weights = level_weights or FOOD_LEVEL_WEIGHTS
+        self.width = width
+        self.height = height
+        self.obstacle_count = obstacle_count
+        self.snake_factory = snake_factory
+        self.food_factory = food_factory
+        self.reset()
+
+    def reset(self, seed=None):
+        """重新开始一局；seed 为 None 时沿用构造时的种子"""
+        if seed is not None:
+            self.seed = seed
+        self.rng = random.Random(self.seed)
+        self.grid = OccupancyGrid(self.width, self.height)
+        self.snake = self.snake_factory(grid=self.grid)
+        self.obstacles = generate_obstacles(self.grid, self.rng, self.snake.positions, self.obstacle_count)
+        self.foods = []
+        self.tick = 0
+        self.done = False
+        self.death = None
+        self.board_full = False
+        self.spawn_food()
+
+    def spawn_food(self):
+        """生成一个新食物；棋盘已满时返回 False"""
+        cell = sample_food_cell(self.grid.free, self.snake.get_head_position(), self.rng)
+        if cell is None:
+            return False
+        food = self.food_factory(level=choose_food_level(self.snake.score, self.rng, self.level_weights))
+        food.position = cell
+        self.grid.set_food(cell)
+        self.foods.append(food)
+        return True
+
+    def step(self, actions=()):
+        """
+        推进一个逻辑帧：按顺序应用方向指令，移动蛇，结算吃食物和碰撞。
+        actions 为本帧收到的方向 (dx, dy) 序列（与按键顺序一致）；游戏已结束时不再变化。
+        """
+        if self.done:
+            return StepResult([], self.death, self.board_full)
+        snake = self.snake
+        for action in actions:
+            snake.change_direction(action)
+        self.tick += 1
+
+        if not snake.move():
+            return self._finish('self', [])
+
+        # 检查是否吃到食物
+        eaten = []
+        head = snake.get_head_position()
+        for food in self.foods[:]:
+            if food.position == head:
+                snake.grow(food.score)
+                self.foods.remove(food)
+                self.grid.remove_food(head)
+                eaten.append(food)
+                if not self.spawn_food() and not self.foods:
+                    # 棋盘已被占满，没有位置再放食物：游戏结束
+                    self.done = True
+                    self.board_full = True
+                    return StepResult(eaten, None, True)
+
+        if self.grid.is_obstacle(head):
+            return self._finish('wall', eaten)
+        return StepResult(eaten, None, False)
+
+    def _finish(self, death, eaten):
+        self.done = True
+        self.death = death
+        return StepResult(eaten, death, False)
+
+    def snapshot(self):
+        """当前状态的不可变快照"""
+        snake = self.snake
+        return WorldSnapshot(self.tick, tuple(snake.positions), snake.direction, snake.length, snake.score,
+                             tuple((food.position, food.level) for food in self.foods),
+                             tuple(self.obstacles), self.done, self.death)
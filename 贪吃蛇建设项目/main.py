@@ -1,10 +1,14 @@
 # -*- coding: utf-8 -*-
 import ctypes
-import pygame
-from game.game_controller import GameController
-from game.game_controller_dual import GameControllerDual  # 新增导入
-from game.splash_screen import SplashScreen  # 导入启动画面
+import sys
+import argparse
+# 录像和自动驾驶不依赖 pygame；界面模块（pygame、tkinter、pywin32）在 run_game 中才导入，
+# 这样 --bench 和 --replay --headless 在没有窗口、没有 pywin32 的机器上也能运行
+from game.replay import Replay
+from game.autopilot import run_benchmark
 def set_english_input_method():
+    if sys.platform != 'win32':
+        return
     try:
         # 0x0409 是英文(美国)输入法的LANGID
         # 0x04090409 是英文(美国)的HKL
@@ -13,8 +17,55 @@ def set_english_input_method():
         ctypes.windll.user32.ActivateKeyboardLayout(hkl, 0)
     except Exception as e:
         print("切换输入法失败：", e)
-set_english_input_method()
+def parse_args():
+    parser = argparse.ArgumentParser(description="贪吃蛇大冒险")
+    parser.add_argument('--replay', metavar='FILE', help="回放录像文件")
+    parser.add_argument('--speed', type=float, default=1.0, help="回放倍速（默认 1）")
+    parser.add_argument('--headless', action='store_true', help="不打开窗口，全速回放并输出结果")
+    parser.add_argument('--bots', type=int, default=0, help="双人模式中加入的电脑蛇数量（默认 0）")
+    parser.add_argument('--dirty-rects', action='store_true', help="脏矩形绘制：只提交画面中变化的区域（适合软件渲染）")
+    parser.add_argument('--bench', action='store_true', help="无界面运行自动驾驶基准测试")
+    parser.add_argument('--games', type=int, default=20, help="基准测试的局数（默认 20）")
+    parser.add_argument('--seed', type=int, default=0, help="基准测试的随机种子（默认 0）")
+    return parser.parse_args()
+
+def run_bench(games, seed):
+    """让自动驾驶无界面地玩若干局，输出核心循环的性能数据"""
+    stats = run_benchmark(games=games, seed=seed)
+    names = {'self': "撞到自己", 'wall': "撞到障碍物", 'board_full': "棋盘已满", 'timeout': "达到帧数上限"}
+    endings = ", ".join(f"{names.get(reason, reason)} {count}" for reason, count in sorted(stats['endings'].items()))
+    print(f"局数: {stats['games']}  总帧数: {stats['ticks']}  耗时: {stats['seconds']:.2f} 秒")
+    print(f"帧/秒: {stats['ticks_per_second']:.0f}  平均长度: {stats['average_length']:.1f}  "
+          f"寻路耗时: {stats['plan_ms_per_tick']:.3f} 毫秒/帧")
+    print(f"结束原因: {endings}")
+
+def run_headless_replay(path):
+    """无界面全速回放录像，核对最终分数并输出耗时"""
+    replay = Replay.load(path)
+    world, elapsed = replay.run_headless()
+    ticks_per_second = world.tick / elapsed if elapsed > 0 else float('inf')
+    print(f"回放完成: {world.tick} 帧, 分数 {world.snake.score} (录像记录 {replay.final_score}), "
+          f"耗时 {elapsed:.3f} 秒, {ticks_per_second:.0f} 帧/秒")
+    return world.snake.score == replay.final_score
+
 def main():
+    args = parse_args()
+    if args.bench:
+        run_bench(args.games, args.seed)
+        return
+    if args.replay and args.headless:
+        sys.exit(0 if run_headless_replay(args.replay) else 1)
+    run_game(args)
+
+def run_game(args):
+    """打开窗口，由场景栈运行主菜单（或带界面回放录像）"""
+    import pygame
+    from game.game_controller import GameController
+    from game.scene_manager import SceneManager
+    from game.scenes import MenuScene, ReplayScene
+    from game.splash_screen import SplashScreen  # 导入启动画面
+    set_english_input_method()
+
     # 初始化pygame
     pygame.init()
     screen = pygame.display.set_mode((800, 600))
@@ -25,30 +76,12 @@ def main():
     # if not splash.run():
     #     return  # 如果用户在启动画面关闭窗口，直接退出
     
-    game = GameController()
-    while True:
-        result = game.run_menu()
-        if result == "exit":
-            break
-            
-        if result == "start":
-            # 重新初始化游戏状态并开始播放音乐
-            game.reset_game(play_music=True)
-            result = game.run()
-            if result == "exit":
-                break
-        elif result == "dual":  # 新增双人模式入口
-            dual_game = GameControllerDual(game.screen)
-            dual_game.run()
-        elif result == "settings":
-            game.run_settings()
-        elif result == "help":
-            game.run_help()
-        elif result == "shop":
-            game.run_shop()
-        elif result == "backpack":
-            game.run_backpack()
-        elif result == "activity":
-            game.run_activity()
+    game = GameController(dirty_rects=args.dirty_rects)
+    # 所有界面由场景栈驱动，共用一个时钟和事件泵
+    manager = SceneManager(game.screen, clock=game.clock)
+    if args.replay:
+        manager.run(ReplayScene(game, Replay.load(args.replay), speed=args.speed))
+        return
+    manager.run(MenuScene(game, bots=args.bots))
 if __name__ == "__main__":
     main()
\ No newline at end of file